@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark the geometry kernels: scalar helpers vs NumPy array kernels.
+
+Loads VATSpy FIR boundaries (a local ``Boundaries.geojson`` with --geojson,
+otherwise downloaded into --cache-dir through VatspyFirSource), takes the
+outer rings of the FIRs with the most vertices and measures random points in
+each ring's bbox with both paths:
+
+- point in ring:      point_in_ring per point vs points_in_ring
+- distance to ring:   a point_to_segment_nm loop per point (the scalar
+                      min_distance_point_to_multipolygon_nm) vs
+                      min_distance_points_to_multipolygon_nm
+- point to segments:  point_to_segment_nm per (point, edge) vs points_to_segments_nm
+- haversine matrix:   haversine_nm per pair of ring vertices vs haversine_matrix_nm
+
+Both paths are checked to agree (exactly for containment, to 1e-9 nm for
+distances).
+
+Usage:
+    python benchmarks/bench_geometry.py --geojson Boundaries.geojson
+    python benchmarks/bench_geometry.py --cache-dir cache --firs 50 --points 2000
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from euro_aip.sources.vatspy_fir import VatspyFirSource
+from euro_aip.utils.geometry import (
+    as_coord_array,
+    bbox_of_ring,
+    haversine_matrix_nm,
+    haversine_nm,
+    min_distance_points_to_multipolygon_nm,
+    point_in_ring,
+    point_to_segment_nm,
+    points_in_ring,
+    points_to_segments_nm,
+)
+
+Ring = List[Tuple[float, float]]
+
+
+def load_rings(geojson: str, cache_dir: str, count: int) -> List[Tuple[str, Ring]]:
+    """Outer rings of the ``count`` FIRs with the most vertices."""
+    source = VatspyFirSource(cache_dir, local_path=geojson)
+    rings = [
+        (fir.icao, [tuple(c) for c in poly[0]])
+        for fir in source.get_firs()
+        for poly in fir.polygons if poly and len(poly[0]) >= 3
+    ]
+    rings.sort(key=lambda item: len(item[1]), reverse=True)
+    return rings[:count]
+
+
+def random_points(ring: Ring, count: int, rng: random.Random) -> Tuple[np.ndarray, np.ndarray]:
+    min_lon, min_lat, max_lon, max_lat = bbox_of_ring(ring)
+    lons = np.array([rng.uniform(min_lon, max_lon) for _ in range(count)])
+    lats = np.array([rng.uniform(min_lat, max_lat) for _ in range(count)])
+    return lons, lats
+
+
+def scalar_min_distance(lon: float, lat: float, ring: Ring) -> float:
+    """The scalar loop of min_distance_point_to_multipolygon_nm, without array dispatch."""
+    best = float("inf")
+    n = len(ring)
+    for i in range(n):
+        alon, alat = ring[i]
+        blon, blat = ring[(i + 1) % n]
+        best = min(best, point_to_segment_nm(lon, lat, alon, alat, blon, blat))
+    return best
+
+
+def timed(func: Callable, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def report(name: str, scalar_time: float, array_time: float, units: int, unit: str) -> None:
+    print(f"{name:<19} scalar {scalar_time:8.3f}s ({scalar_time / units * 1e6:8.2f} us/{unit})  "
+          f"array {array_time:8.3f}s ({array_time / units * 1e6:8.2f} us/{unit}, "
+          f"{scalar_time / array_time:6.1f}x)")
+
+
+def bench_rings(rings: Sequence[Tuple[str, Ring]], points: int, seed: int) -> None:
+    rng = random.Random(seed)
+    totals = {"point in ring": [0.0, 0.0], "distance to ring": [0.0, 0.0], "point to segments": [0.0, 0.0]}
+    pairs = 0
+    for _, ring in rings:
+        lons, lats = random_points(ring, points, rng)
+        coords = as_coord_array(ring)
+        # The scalar path gets plain floats, as its callers pass
+        points_list = list(zip(lons.tolist(), lats.tolist()))
+
+        scalar_time, expected = timed(lambda: [point_in_ring(x, y, ring) for x, y in points_list])
+        array_time, actual = timed(points_in_ring, lons, lats, coords)
+        assert list(actual) == expected, "points_in_ring differs from point_in_ring"
+        totals["point in ring"][0] += scalar_time
+        totals["point in ring"][1] += array_time
+
+        scalar_time, expected = timed(lambda: [scalar_min_distance(x, y, ring) for x, y in points_list])
+        array_time, actual = timed(min_distance_points_to_multipolygon_nm, lons, lats, [[coords]])
+        assert np.allclose(actual, expected, rtol=0, atol=1e-9), "distance kernels differ"
+        totals["distance to ring"][0] += scalar_time
+        totals["distance to ring"][1] += array_time
+
+        # A few points against every edge: the matrix is (points, edges)
+        sub = slice(0, max(1, points // 20))
+        ends = np.roll(coords, -1, axis=0)
+        edges = list(zip(ring, ring[1:] + ring[:1]))
+        scalar_time, expected = timed(lambda: [
+            [point_to_segment_nm(x, y, a[0], a[1], b[0], b[1]) for a, b in edges]
+            for x, y in points_list[sub]
+        ])
+        array_time, actual = timed(points_to_segments_nm, lons[sub], lats[sub], coords, ends)
+        assert np.allclose(actual, expected, rtol=0, atol=1e-9), "segment kernels differ"
+        totals["point to segments"][0] += scalar_time
+        totals["point to segments"][1] += array_time
+        pairs += len(lons[sub]) * len(coords)
+
+    vertices = sum(len(ring) for _, ring in rings)
+    print(f"rings: {len(rings)} ({vertices} vertices), {points} points per ring")
+    report("point in ring", *totals["point in ring"], len(rings) * points, "point")
+    report("distance to ring", *totals["distance to ring"], len(rings) * points, "point")
+    report("point to segments", *totals["point to segments"], pairs, "pair")
+
+
+def bench_haversine(rings: Sequence[Tuple[str, Ring]]) -> None:
+    # Ring vertices stand in for a cloud of points spread over the FIRs
+    points = np.concatenate([as_coord_array(ring)[::10] for _, ring in rings])[:2000]
+    points_list = points.tolist()
+    scalar_time, expected = timed(lambda: [
+        [haversine_nm(a[1], a[0], b[1], b[0]) for b in points_list] for a in points_list
+    ])
+    array_time, actual = timed(haversine_matrix_nm, points)
+    assert np.allclose(actual, expected, rtol=0, atol=1e-9), "haversine kernels differ"
+    report("haversine matrix", scalar_time, array_time, len(points) ** 2, "pair")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--geojson", help="Local VATSpy Boundaries.geojson")
+    parser.add_argument("--cache-dir", default="cache", help="Cache directory for the download")
+    parser.add_argument("--firs", type=int, default=20, help="Number of rings (largest first)")
+    parser.add_argument("--points", type=int, default=1000, help="Random points per ring")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    rings = load_rings(args.geojson, args.cache_dir, args.firs)
+    if not rings:
+        sys.exit("No FIR rings loaded")
+    bench_rings(rings, args.points, args.seed)
+    bench_haversine(rings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark DatabaseStorage airport loading: bulk table scans vs per-airport queries.
+
+Builds a synthetic database (or uses an existing one with --database) and
+times loading every airport with ``_load_airports`` (one ordered scan per
+table, used by ``load_model``) against the previous path, which called
+``_load_airport`` for each ICAO code (four queries per airport). Both paths
+are checked to produce identical airports. Also reports the full load_model
+time and the warm start time from a binary snapshot.
+
+Usage:
+    python benchmarks/bench_load_model.py --airports 5000
+    python benchmarks/bench_load_model.py --database airports.db
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from euro_aip.models import EuroAipModel, Airport, Runway, Procedure, AIPEntry
+from euro_aip.storage import DatabaseStorage
+
+
+def build_model(count: int, seed: int = 0) -> EuroAipModel:
+    """Build a model with ``count`` airports, each with runways, procedures and AIP entries."""
+    rng = random.Random(seed)
+    model = EuroAipModel()
+    airports = []
+    for i in range(count):
+        ident = f"{chr(65 + i // 26 ** 3 % 26)}{chr(65 + i // 26 ** 2 % 26)}{chr(65 + i // 26 % 26)}{chr(65 + i % 26)}"
+        airport = Airport(
+            ident=ident,
+            name=f"Airport {ident}",
+            type=rng.choice(["small_airport", "medium_airport", "large_airport"]),
+            latitude_deg=rng.uniform(35.0, 70.0),
+            longitude_deg=rng.uniform(-20.0, 40.0),
+            elevation_ft=rng.randint(0, 5000),
+            iso_country=rng.choice(["FR", "GB", "DE", "IT", "ES"]),
+        )
+        airport.add_source("worldairports")
+        for r in range(rng.randint(1, 3)):
+            airport.add_runway(Runway(
+                airport_ident=ident, le_ident=f"{r * 9 + 1:02d}", he_ident=f"{r * 9 + 19:02d}",
+                length_ft=rng.randint(1500, 12000), width_ft=rng.randint(50, 200),
+                surface=rng.choice(["ASP", "GRS", "CON"]), lighted=rng.random() < 0.5, closed=False,
+            ))
+        for p in range(rng.randint(0, 6)):
+            airport.add_procedure(Procedure(
+                name=f"RNAV RWY{p:02d}", procedure_type="approach", approach_type="RNAV",
+                runway_ident=f"{p:02d}", source="uk_eaip",
+            ))
+        for f in range(rng.randint(10, 60)):
+            airport.add_aip_entry(AIPEntry(
+                ident=ident, section=rng.choice(["admin", "operational", "handling", "passenger"]),
+                field=f"field {f}", value=f"value {rng.random():.6f}", std_field_id=200 + f,
+                source="uk_eaip",
+            ))
+        airports.append(airport)
+    model.bulk_add_airports(airports, validate=False)
+    return model
+
+
+def _snapshot(airports):
+    """Comparable view of loaded airports, ignoring load-time timestamps."""
+    def strip(value):
+        if isinstance(value, dict):
+            return {k: strip(v) for k, v in value.items() if k not in ("created_at", "updated_at")}
+        if isinstance(value, list):
+            return [strip(v) for v in value]
+        return value
+    return [strip(airport.to_dict()) for airport in airports]
+
+
+def load_per_airport(storage: DatabaseStorage):
+    with storage._get_connection() as conn:
+        codes = [row['icao_code'] for row in conn.execute('SELECT icao_code FROM airports')]
+        return [storage._load_airport(conn, icao) for icao in codes if len(icao) == 4]
+
+
+def load_bulk(storage: DatabaseStorage):
+    with storage._get_connection() as conn:
+        return storage._load_airports(conn)
+
+
+def timed(fn, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--airports", type=int, default=5000, help="Synthetic airport count")
+    parser.add_argument("--database", help="Existing database to load instead of a synthetic one")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per path (best time reported)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database:
+            storage = DatabaseStorage(args.database)
+        else:
+            storage = DatabaseStorage(str(Path(tmp) / "bench.db"))
+            print(f"Building database with {args.airports} airports...")
+            storage.save_model(build_model(args.airports))
+
+        per_airport_time, per_airport = timed(lambda: load_per_airport(storage), args.repeat)
+        bulk_time, bulk = timed(lambda: load_bulk(storage), args.repeat)
+        assert _snapshot(per_airport) == _snapshot(bulk), "bulk load differs from per-airport load"
+
+        print(f"airports loaded:   {len(bulk)}")
+        print(f"per-airport:       {per_airport_time:8.3f}s")
+        print(f"bulk:              {bulk_time:8.3f}s  ({per_airport_time / bulk_time:.1f}x)")
+
+        start = time.perf_counter()
+        model = storage.load_model()
+        print(f"load_model total:  {time.perf_counter() - start:8.3f}s")
+
+        snapshot_path = str(Path(tmp) / "bench.snap")
+        storage.save_snapshot(model, snapshot_path)
+        snapshot_time, _ = timed(lambda: storage.load_model_snapshot(snapshot_path), args.repeat)
+        print(f"from snapshot:     {snapshot_time:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
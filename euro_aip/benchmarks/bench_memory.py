@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark resident memory of DatabaseStorage.load_model.
+
+Builds a synthetic database with airports (runways, procedures, AIP entries)
+and waypoints, or uses an existing one with --database, then loads the full
+model in a fresh subprocess and reports how much the process RSS grew. With
+--baseline the same database is also loaded by another copy of the package
+(for example the previous revision extracted with
+``git archive <rev> euro_aip | tar -x -C /tmp/base``) for a before/after
+comparison. With --mapped the current package also opens the model as a
+MappedModel over a snapshot of the database and iterates every airport and
+waypoint. Anonymous memory (the process heap, which cannot be shared) is
+reported next to the RSS, since the RSS also counts the page cache pages of
+the mapped snapshot, which every process mapping the file shares.
+
+Usage:
+    python benchmarks/bench_memory.py --airports 5000 --waypoints 200000
+    python benchmarks/bench_memory.py --database airports.db --baseline /tmp/base
+    python benchmarks/bench_memory.py --mapped
+"""
+
+import argparse
+import json
+import logging
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PACKAGE_DIR))
+
+from euro_aip.models import Waypoint
+from euro_aip.storage import DatabaseStorage
+
+from bench_load_model import build_model
+
+# Run in the subprocess: RSS and anonymous memory before and after loading
+# the model (load_model, or a MappedModel when a snapshot path is given), in bytes
+MEASURE = """
+import gc, json, os, resource, sys
+sys.path.insert(0, sys.argv[1])
+
+def rss():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        # ru_maxrss is in kB on Linux, bytes on macOS
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+def anonymous():
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            return sum(int(line.split()[1]) * 1024 for line in f if line.startswith('Anonymous:'))
+    except OSError:
+        return rss()
+
+from euro_aip.storage import DatabaseStorage
+storage = DatabaseStorage(sys.argv[2])
+gc.collect()
+before, before_anonymous = rss(), anonymous()
+if len(sys.argv) > 3:
+    model = storage.load_model_snapshot(sys.argv[3], mapped=True)
+    airports = sum(1 for _ in model.airports)
+    waypoints = sum(1 for _ in model.waypoints)
+else:
+    model = storage.load_model()
+    airports = len(model._airports)
+    waypoints = sum(len(candidates) for candidates in model._waypoints.values())
+gc.collect()
+print(json.dumps({
+    'rss': rss() - before,
+    'anonymous': anonymous() - before_anonymous,
+    'airports': airports,
+    'waypoints': waypoints,
+}))
+"""
+
+
+def add_waypoints(model, count: int, seed: int = 0) -> None:
+    """Add ``count`` synthetic waypoints with distinct names to the model."""
+    rng = random.Random(seed)
+    waypoints = []
+    for i in range(count):
+        name = "".join(chr(65 + i // 26 ** k % 26) for k in range(5))
+        waypoints.append(Waypoint(
+            name=name,
+            latitude_deg=rng.uniform(35.0, 70.0),
+            longitude_deg=rng.uniform(-20.0, 40.0),
+            point_type=rng.choice(["5LNC", "VOR", "NDB"]),
+            fir_codes=rng.choice(["LFFF", "EGTT", "EDGG,EDMM"]),
+            source="eurocontrol_fra",
+            source_id=f"fra:{i}",
+        ))
+    model.bulk_add_waypoints(waypoints)
+
+
+def measure(package_dir: Path, database: str, snapshot: Optional[str] = None) -> dict:
+    """Load the database with the euro_aip package found in ``package_dir``, in a subprocess."""
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE, str(package_dir), database] + ([snapshot] if snapshot else []),
+        check=True, capture_output=True, text=True, cwd=package_dir,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--airports", type=int, default=5000, help="Synthetic airport count")
+    parser.add_argument("--waypoints", type=int, default=200000, help="Synthetic waypoint count")
+    parser.add_argument("--database", help="Existing database to load instead of a synthetic one")
+    parser.add_argument("--baseline", help="Directory containing the euro_aip package of another revision")
+    parser.add_argument("--mapped", action="store_true", help="Also measure a MappedModel over a snapshot")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = args.database
+        if database is None:
+            database = str(Path(tmp) / "bench.db")
+            print(f"Building database with {args.airports} airports and {args.waypoints} waypoints...")
+            model = build_model(args.airports)
+            add_waypoints(model, args.waypoints)
+            DatabaseStorage(database).save_model(model)
+
+        runs = [("current", PACKAGE_DIR)]
+        if args.baseline:
+            runs.insert(0, ("baseline", Path(args.baseline).resolve()))
+        if args.mapped:
+            snapshot = str(Path(tmp) / "bench.snap")
+            storage = DatabaseStorage(database)
+            storage.save_snapshot(storage.load_model(), snapshot)
+            runs.append(("mapped", PACKAGE_DIR, snapshot))
+        results = {}
+        for label, package_dir, *snapshot in runs:
+            results[label] = measure(package_dir, database, *snapshot)
+            result = results[label]
+            print(f"{label:9s} {result['airports']} airports, {result['waypoints']} waypoints: "
+                  f"RSS +{result['rss'] / 2 ** 20:8.1f} MB, anonymous +{result['anonymous'] / 2 ** 20:8.1f} MB")
+
+        if "baseline" in results:
+            saved = results["baseline"]["rss"] - results["current"]["rss"]
+            print(f"saved:    {saved / 2 ** 20:8.1f} MB "
+                  f"({saved / results['baseline']['rss']:.0%} of baseline)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark DatabaseStorage read helpers: pooled connections vs a connection per call.
+
+Builds a synthetic database with change history and border crossing points
+(or uses an existing one with --database) and times the helpers an API calls
+per request (get_changes_for_airport, get_border_crossing_statistics,
+get_airac_updates, get_country_coverage, model_fingerprint). The pooled
+storage reuses a read-only connection per thread and its prepared
+statements; the baseline opens, configures and closes a new connection for
+every call, as DatabaseStorage did before the pool. Both are checked to
+return the same results. With --threads the calls are spread over a thread
+pool.
+
+Usage:
+    python benchmarks/bench_read_helpers.py --airports 5000 --calls 2000
+    python benchmarks/bench_read_helpers.py --database airports.db --threads 8
+"""
+
+import argparse
+import logging
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from euro_aip.models import BorderCrossingEntry
+from euro_aip.storage import DatabaseStorage
+
+from bench_load_model import build_model
+
+
+class PerCallStorage(DatabaseStorage):
+    """DatabaseStorage opening a new connection on every call (the previous behaviour)."""
+
+    @contextmanager
+    def _get_connection(self, write: bool = True):
+        conn = sqlite3.connect(str(self.database_path))
+        conn.row_factory = sqlite3.Row
+        if self.journal_mode:
+            conn.execute(f'PRAGMA journal_mode = {self.journal_mode}')
+        if self.synchronous:
+            conn.execute(f'PRAGMA synchronous = {self.synchronous}')
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def build_database(path: str, count: int) -> None:
+    """Save a synthetic model twice, with edits in between so there is change history."""
+    storage = DatabaseStorage(path, journal_mode="WAL", synchronous="NORMAL")
+    model = build_model(count)
+    storage.airac_date = "2026-01-22"
+    storage.save_model(model)
+    for i, airport in enumerate(model.airports):
+        if i % 5 == 0:
+            airport.name = f"{airport.name} (renamed)"
+            for runway in airport.runways:
+                runway.length_ft += 100
+        if i % 10 == 0:
+            model.add_border_crossing_entry(BorderCrossingEntry(
+                airport_name=airport.name, country_iso=airport.iso_country, icao_code=airport.ident,
+                is_airport=True, source="synthetic", extraction_method="benchmark"))
+    storage.airac_date = "2026-02-19"
+    storage.save_model(model)
+    storage.close()
+
+
+def read_helpers(storage: DatabaseStorage, idents, calls: int):
+    """Run ``calls`` rounds of the read helpers, cycling through airports."""
+    results = []
+    for i in range(calls):
+        icao = idents[i % len(idents)]
+        results.append((
+            storage.get_changes_for_airport(icao, days=30),
+            storage.get_border_crossing_statistics(),
+            storage.get_airac_updates(),
+            storage.get_country_coverage(),
+            storage.model_fingerprint(),
+        ))
+    return results
+
+
+def timed(storage: DatabaseStorage, idents, calls: int, threads: int):
+    start = time.perf_counter()
+    if threads > 1:
+        per_thread = max(1, calls // threads)
+        with ThreadPoolExecutor(threads) as executor:
+            futures = [executor.submit(read_helpers, storage, idents[t::threads] or idents, per_thread)
+                       for t in range(threads)]
+            results = [r for future in futures for r in future.result()]
+    else:
+        results = read_helpers(storage, idents, calls)
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--airports", type=int, default=5000, help="Synthetic airport count")
+    parser.add_argument("--database", help="Existing database to read instead of a synthetic one")
+    parser.add_argument("--calls", type=int, default=2000, help="Rounds of read helper calls")
+    parser.add_argument("--threads", type=int, default=1, help="Threads sharing the calls")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = args.database
+        if not database:
+            database = str(Path(tmp) / "bench.db")
+            print(f"Building database with {args.airports} airports...")
+            build_database(database, args.airports)
+
+        pooled = DatabaseStorage(database)
+        per_call = PerCallStorage(database)
+        with pooled._get_connection(write=False) as conn:
+            idents = [row[0] for row in conn.execute(
+                "SELECT DISTINCT airport_icao FROM airports_changes ORDER BY airport_icao")]
+            if not idents:
+                idents = [row[0] for row in conn.execute("SELECT icao_code FROM airports LIMIT 1000")]
+
+        # Warm the page cache so both runs read from memory
+        read_helpers(pooled, idents, 10)
+
+        per_call_time, per_call_results = timed(per_call, idents, args.calls, args.threads)
+        pooled_time, pooled_results = timed(pooled, idents, args.calls, args.threads)
+        assert per_call_results == pooled_results, "pooled results differ"
+
+        rounds = len(pooled_results)
+        print(f"helper rounds:     {rounds} ({args.threads} thread(s), 5 helpers each)")
+        print(f"connection/call:   {per_call_time:8.3f}s  ({per_call_time / rounds * 1e6:7.0f} us/round)")
+        print(f"pooled:            {pooled_time:8.3f}s  ({pooled_time / rounds * 1e6:7.0f} us/round, "
+              f"{per_call_time / pooled_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
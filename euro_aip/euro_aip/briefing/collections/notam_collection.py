@@ -1,11 +1,12 @@
 """Queryable collection for NOTAM filtering."""
 
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Callable, Any, TYPE_CHECKING
+from typing import List, Dict, Optional, Tuple, Callable, Any, Union, TYPE_CHECKING
 import re
 
 from euro_aip.models.queryable_collection import QueryableCollection
 from euro_aip.models.navpoint import NavPoint
+from euro_aip.utils.route_geometry import RouteGeometry
 from euro_aip.briefing.models.notam import Notam, NotamCategory
 
 if TYPE_CHECKING:
@@ -322,16 +323,19 @@ class NotamCollection(QueryableCollection[Notam]):
 
     def along_route(
         self,
-        route: 'Route',
+        route: Union['Route', RouteGeometry],
         corridor_nm: float = 25
     ) -> 'NotamCollection':
         """
         Filter NOTAMs along a route corridor.
 
         Checks if NOTAM coordinates fall within corridor_nm of any route segment.
+        Only NOTAMs inside the corridor boxes of some leg are measured, all at
+        once against every leg.
 
         Args:
-            route: Route object with waypoints
+            route: Route object with waypoints, or its RouteGeometry (reused
+                across queries for the same route)
             corridor_nm: Corridor width in nautical miles (default 25nm each side)
 
         Returns:
@@ -340,27 +344,24 @@ class NotamCollection(QueryableCollection[Notam]):
         Example:
             enroute = notams.along_route(briefing.route, corridor_nm=25)
         """
-        route_points = route.get_route_navpoints()
-        if len(route_points) < 2:
+        geometry = RouteGeometry.of(route)
+        if len(geometry) < 2:
             return self._new_collection([])
 
-        def is_along_route(notam: Notam) -> bool:
-            if not notam.coordinates:
-                return False
-            point = NavPoint(
-                latitude=notam.coordinates[0],
-                longitude=notam.coordinates[1]
-            )
-            # Check distance to each route segment
-            for i in range(len(route_points) - 1):
-                dist = point.distance_to_segment(route_points[i], route_points[i + 1])
-                if dist <= corridor_nm:
-                    return True
-            return False
-
-        return self._new_collection([
+        candidates = [
             n for n in self._items
-            if is_along_route(n)
+            if n.coordinates
+            and geometry.legs_near_point(n.coordinates[1], n.coordinates[0], corridor_nm)
+        ]
+        if not candidates:
+            return self._new_collection([])
+        distances, _, _ = geometry.corridor.measure(
+            [n.coordinates[1] for n in candidates],
+            [n.coordinates[0] for n in candidates],
+        )
+        return self._new_collection([
+            n for n, distance in zip(candidates, distances)
+            if distance <= corridor_nm
         ])
 
     def near_airports(
@@ -10,9 +10,12 @@ stages, cheapest first:
    altitude band.
 2. **FIR prefilter** — the FIRs the route crosses (``model.firs_along_route``)
    give a cheap candidate test against each SIGMET's ``fir_id``.
-3. **Geometry refine** — densely sample the route and measure each sample
-   against the SIGMET polygon (bbox prefilter, then containment + corridor
-   distance) to confirm and to record the enroute extent affected.
+3. **Geometry refine** — intersect the route legs near the SIGMET exactly
+   with its polygon and corridor (bbox prefilter first) to confirm and to
+   record the enroute extent affected.
+
+The route is resolved once into a :class:`RouteGeometry`, which callers that
+also query NOTAMs, FIRs or airports for the same route can pass in and share.
 
 The result carries enough metadata (matched FIRs, perpendicular distance,
 enroute span) for a client to order and present SIGMETs along the route.
@@ -23,14 +26,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Tuple, TYPE_CHECKING
 
-from euro_aip.utils.geometry import (
-    bbox_intersects,
-    bbox_pad,
-    haversine_nm,
-    min_distance_point_to_multipolygon_nm,
-    point_in_multipolygon,
-    sample_polyline,
-)
+from euro_aip.utils.route_geometry import RouteGeometry
 
 if TYPE_CHECKING:
     from euro_aip.briefing.sources.avwx import AvWxSource
@@ -86,13 +82,6 @@ class RouteSigmetResult:
     sigmets: List[RouteSigmet] = field(default_factory=list)
 
 
-@dataclass
-class _RouteSample:
-    lon: float
-    lat: float
-    enroute_nm: float
-
-
 class RouteSigmetService:
     """Orchestrates SIGMET discovery for a route corridor.
 
@@ -137,6 +126,7 @@ class RouteSigmetService:
         hazard: Optional[str] = None,
         region: str = "eur",
         sample_step_nm: float = 5.0,
+        route_geometry: Optional[RouteGeometry] = None,
     ) -> RouteSigmetResult:
         """
         Find SIGMETs that affect a route.
@@ -157,16 +147,20 @@ class RouteSigmetService:
             region: SIGMET region code, forwarded to the source. AWC currently
                 ignores it (returns the global set); geographic filtering here is
                 done by route geometry, so this rarely matters.
-            sample_step_nm: Route sampling interval for geometry refinement.
+            sample_step_nm: Kept for compatibility; route legs are intersected
+                exactly, so it does not change the result.
+            route_geometry: Geometry of the route, if the caller already built
+                one; resolved from ``route_icaos`` through the model otherwise.
 
         Returns:
             RouteSigmetResult with matched SIGMETs sorted by enroute distance.
         """
         low_ft, high_ft = altitude_band_ft
         time_window = (from_datetime, to_datetime)
-        route_points = self._resolve_route_points(route_icaos, model)
+        if route_geometry is None:
+            route_geometry = RouteGeometry(self._resolve_route_points(route_icaos, model))
 
-        if not route_points:
+        if not len(route_geometry):
             logger.warning("No resolvable coordinates for route %s", "-".join(route_icaos))
             return RouteSigmetResult(
                 route_icaos=route_icaos,
@@ -176,12 +170,7 @@ class RouteSigmetService:
             )
 
         # Stage 2 (FIR prefilter) inputs: which FIRs does the corridor cross?
-        route_firs = set(model.firs_along_route(route_points, corridor_nm=corridor_nm))
-
-        # Dense route samples (with along-track distance) for geometry refine.
-        samples = self._sample_route(route_points, sample_step_nm)
-        route_bbox = self._samples_bbox(samples)
-        route_bbox_padded = bbox_pad(route_bbox, corridor_nm)
+        route_firs = set(model.firs_along_route(route_geometry, corridor_nm=corridor_nm))
 
         source = self._get_source()
         sigmets = source.fetch_isigmet(region=region, hazard=hazard)
@@ -203,9 +192,7 @@ class RouteSigmetService:
 
             if polygons:
                 # Stage 3: geometry refine (authoritative when geometry exists).
-                geom = self._intersect(
-                    samples, route_bbox_padded, sigmet, corridor_nm,
-                )
+                geom = self._intersect(route_geometry, sigmet, corridor_nm)
                 if geom is None:
                     continue
                 min_dist, d_from, d_to = geom
@@ -254,68 +241,24 @@ class RouteSigmetService:
             points.append(navpoint)
         return points
 
-    @staticmethod
-    def _sample_route(route_points: list, step_nm: float) -> List[_RouteSample]:
-        """Sample the route polyline, tagging each sample with along-track distance."""
-        polyline = [(p.longitude, p.latitude) for p in route_points]
-        if len(polyline) == 1:
-            return [_RouteSample(polyline[0][0], polyline[0][1], 0.0)]
-
-        sampled = sample_polyline(polyline, step_nm)
-        out: List[_RouteSample] = []
-        cumulative = 0.0
-        prev: Optional[Tuple[float, float]] = None
-        for lon, lat in sampled:
-            if prev is not None:
-                cumulative += haversine_nm(prev[1], prev[0], lat, lon)
-            out.append(_RouteSample(lon, lat, cumulative))
-            prev = (lon, lat)
-        return out
-
-    @staticmethod
-    def _samples_bbox(samples: List[_RouteSample]) -> Tuple[float, float, float, float]:
-        lons = [s.lon for s in samples]
-        lats = [s.lat for s in samples]
-        return (min(lons), min(lats), max(lons), max(lats))
-
     @staticmethod
     def _intersect(
-        samples: List[_RouteSample],
-        route_bbox_padded: Tuple[float, float, float, float],
+        route_geometry: RouteGeometry,
         sigmet: "SigmetReport",
         corridor_nm: float,
     ) -> Optional[Tuple[float, float, float]]:
         """Corridor ∩ SIGMET polygon test.
 
-        Returns ``(min_distance_nm, enroute_from_nm, enroute_to_nm)`` if any
-        route sample lies inside the polygon or within ``corridor_nm`` of its
-        boundary, else None. A bbox prefilter (SIGMET bbox padded by the
-        corridor) short-circuits non-overlapping SIGMETs.
+        Returns ``(min_distance_nm, enroute_from_nm, enroute_to_nm)`` if the
+        route enters the polygon or passes within ``corridor_nm`` of its
+        boundary, else None. A bbox prefilter (SIGMET bbox against the route
+        bbox, both padded by the corridor) short-circuits non-overlapping
+        SIGMETs; the rest are measured on the legs near the SIGMET with
+        :meth:`RouteGeometry.polygon_extent`.
         """
         sigmet_bbox = sigmet.bbox
         if sigmet_bbox is None:
             return None
-        if not bbox_intersects(bbox_pad(sigmet_bbox, corridor_nm), route_bbox_padded):
-            return None
-
-        polygons = sigmet.polygons
-        min_dist = float("inf")
-        d_from: Optional[float] = None
-        d_to: Optional[float] = None
-
-        for s in samples:
-            if point_in_multipolygon(s.lon, s.lat, polygons):
-                dist = 0.0
-            else:
-                dist = min_distance_point_to_multipolygon_nm(s.lon, s.lat, polygons)
-                if dist > corridor_nm:
-                    continue
-            min_dist = min(min_dist, dist)
-            if d_from is None or s.enroute_nm < d_from:
-                d_from = s.enroute_nm
-            if d_to is None or s.enroute_nm > d_to:
-                d_to = s.enroute_nm
-
-        if d_from is None:
+        if not route_geometry.intersects_bbox(sigmet_bbox, corridor_nm):
             return None
-        return (min_dist, d_from, d_to)
+        return route_geometry.polygon_extent(sigmet.polygons, corridor_nm, sigmet_bbox)
@@ -10,6 +10,7 @@ from euro_aip.briefing.weather.models import WeatherReport, WeatherType
 if TYPE_CHECKING:
     from euro_aip.briefing.sources.avwx import AvWxSource
     from euro_aip.models.euro_aip_model import EuroAipModel
+    from euro_aip.utils.route_geometry import RouteGeometry
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +117,7 @@ class RouteWeatherService:
         corridor_nm: float,
         model: 'EuroAipModel',
         metar_hours: float = 3,
+        route_geometry: Optional['RouteGeometry'] = None,
     ) -> RouteWeatherResult:
         """
         Find airports along a route and fetch their weather.
@@ -125,12 +127,17 @@ class RouteWeatherService:
             corridor_nm: Corridor width in nautical miles from route centerline.
             model: EuroAipModel with airport database for spatial queries.
             metar_hours: Hours of METAR history to fetch.
+            route_geometry: Geometry of the route, if the caller already built
+                one; the airport search then reuses it instead of ``route_icaos``.
 
         Returns:
             RouteWeatherResult with airports sorted by enroute distance.
         """
         # 1. Find airports near the route
-        nearby = model.find_airports_near_route(route_icaos, distance_nm=corridor_nm)
+        nearby = model.find_airports_near_route(
+            route_geometry if route_geometry is not None else route_icaos,
+            distance_nm=corridor_nm,
+        )
         logger.info(
             "Found %d airports within %dnm of route %s",
             len(nearby), corridor_nm, "-".join(route_icaos),
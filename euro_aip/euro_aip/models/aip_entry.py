@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class AIPEntry:
     """Data class for storing parsed AIP information with standardized field mapping."""
     
@@ -1,5 +1,5 @@
-from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Set, Any, TYPE_CHECKING
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Dict, Set, Any, Iterable, TYPE_CHECKING
 from datetime import datetime
 from euro_aip.models.runway import Runway
 from euro_aip.models.aip_entry import AIPEntry
@@ -57,10 +57,60 @@ class Airport:
     aip_entries: List['AIPEntry'] = field(default_factory=list)
     procedures: List['Procedure'] = field(default_factory=list)
 
+    # Relationships a storage backend may defer until first access
+    LAZY_RELATIONSHIPS = ('aip_entries', 'procedures')
+
+    def defer_relationships(self, names: Iterable[str], loader: Any) -> None:
+        """
+        Defer loading of relationships until they are first accessed.
+
+        The relationship attributes are removed from the instance; on first
+        access ``loader.load(airport, name)`` is called and the list it
+        returns is stored on the airport, after which access is a plain
+        attribute lookup again. Assigning the attribute also ends deferral.
+
+        Args:
+            names: Relationships to defer, from LAZY_RELATIONSHIPS
+            loader: Object providing ``load(airport, name) -> list``
+        """
+        for name in names:
+            if name not in self.LAZY_RELATIONSHIPS:
+                raise ValueError(f"Relationship {name!r} cannot be deferred")
+            self.__dict__.pop(name, None)
+        self._relationship_loader = loader
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether a relationship is loaded (False while it is deferred)."""
+        return name in self.__dict__
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Copies and pickles do not belong to the model of the original
+        state = self.__dict__.copy()
+        state.pop('_model', None)
+        return state
+
+    def _changed(self) -> None:
+        """Bump updated_at and tell the model holding this airport (see EuroAipModel.mark_airport_changed)."""
+        self.updated_at = datetime.now()
+        model = self.__dict__.get('_model')
+        if model is not None:
+            model._airport_changed(self)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails, i.e. for deferred relationships
+        loader = self.__dict__.get('_relationship_loader')
+        if loader is not None and name in self.LAZY_RELATIONSHIPS:
+            value = loader.load(self, name)
+            self.__dict__[name] = value
+            return value
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
     @property
     def navpoint(self) -> Optional[NavPoint]:
         """Get NavPoint representation of this airport."""
-        if not hasattr(self, '_navpoint') or self._navpoint is None:
+        navpoint = self.__dict__.get('_navpoint')
+        if navpoint is None or (navpoint.latitude, navpoint.longitude) != (self.latitude_deg, self.longitude_deg):
+            # Not built yet, or the coordinates were changed since
             if self.latitude_deg is not None and self.longitude_deg is not None:
                 self._navpoint = NavPoint(
                     latitude=self.latitude_deg,
@@ -78,6 +128,7 @@ class Airport:
         if value:
             self.latitude_deg = value.latitude
             self.longitude_deg = value.longitude
+            self._changed()
 
     @property
     def procedures_query(self) -> 'ProcedureCollection':
@@ -206,7 +257,13 @@ class Airport:
         
         Currently updates:
         - Fuel types (avgas, jet_a) from field ID 402 ("Fuel and oil types")
+
+        Skipped while AIP entries are deferred: the storage that deferred
+        them sets these fields when loading the airport.
         """
+        if not self.is_loaded('aip_entries'):
+            return
+
         # Update fuel types from AIP field 402
         fuel_entry = self.get_aip_entry_for_field(402)  # "Fuel and oil types"
         if fuel_entry and fuel_entry.value:
@@ -238,19 +295,21 @@ class Airport:
     def add_source(self, source_name: str):
         """Add a source to the tracking set."""
         self.sources.add(source_name)
-        self.updated_at = datetime.now()
+        self._changed()
     
     def add_runway(self, runway: 'Runway'):
         """Add a runway to the airport."""
         # Check if runway already exists
         existing_runway = next((r for r in self.runways if r.le_ident == runway.le_ident and r.he_ident == runway.he_ident), None)
         if existing_runway:
-            # Update existing runway with new data
-            for field, value in runway.__dict__.items():
-                if value is not None and field != 'created_at':
-                    setattr(existing_runway, field, value)
+            # Update existing runway with new data (Runway uses slots, no __dict__)
+            for runway_field in fields(runway):
+                value = getattr(runway, runway_field.name)
+                if value is not None and runway_field.name != 'created_at':
+                    setattr(existing_runway, runway_field.name, value)
         else:
             self.runways.append(runway)
+        self._changed()
     
     def add_aip_entry(self, entry: 'AIPEntry'):
         """Add an AIP entry to the airport."""
@@ -269,6 +328,7 @@ class Airport:
                 existing_entry.mapping_score = entry.mapping_score
         else:
             self.aip_entries.append(entry)
+        self._changed()
     
     def add_aip_entries(self, entries: List['AIPEntry']):
         """Add multiple AIP entries to the airport."""
@@ -338,6 +398,7 @@ class Airport:
             existing_procedure.updated_at = datetime.now()
         else:
             self.procedures.append(procedure)
+        self._changed()
     
     def get_procedures_by_type(self, procedure_type: str) -> List['Procedure']:
         """Get all procedures of a specific type."""
@@ -631,4 +692,5 @@ class Airport:
             for procedure in self.procedures:
                 airport_info += f"\n{str(procedure)}"
                 
-        return airport_info 
\ No newline at end of file
+        return airport_info
+
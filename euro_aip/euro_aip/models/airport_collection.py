@@ -5,11 +5,13 @@ Provides domain-specific filtering methods for common airport queries
 while maintaining the composability of the base QueryableCollection.
 """
 
-from typing import Optional, List, Set, TYPE_CHECKING
+from itertools import islice
+from typing import Optional, List, Set, Dict, Union, Iterable, Any, Callable, TYPE_CHECKING
 from .queryable_collection import QueryableCollection
 
 if TYPE_CHECKING:
     from .airport import Airport
+    from .euro_aip_model import EuroAipModel
 
 
 class AirportCollection(QueryableCollection['Airport']):
@@ -36,8 +38,167 @@ class AirportCollection(QueryableCollection['Airport']):
         .first()    # Get first airport or None
         .count()    # Get count
         .exists()   # Check if any match
+
+    Dict-style access (``airports['EGLL']``, ``'EGLL' in airports``,
+    ``airports.get('EGLL')``) goes through an ident -> Airport index. The
+    model passes its own ``_airports`` dict so lookups on ``model.airports``
+    are O(1) without copying, and such a view always reflects the model's
+    current airports; filtered collections build their index lazily on the
+    first string lookup.
+
+    Collections obtained from ``model.airports`` also answer filters on
+    indexed attributes (``by_country``, ``by_source``, ``with_hard_runway``,
+    ``with_fuel``, ``border_crossings``, ...) from the model's attribute
+    index, so chains of those filters are set intersections.
     """
 
+    def __init__(
+        self,
+        items: Union[List['Airport'], Iterable['Airport'], None] = None,
+        index: Optional[Dict[str, 'Airport']] = None,
+        model: Optional['EuroAipModel'] = None,
+        idents: Optional[Set[str]] = None,
+    ):
+        """
+        Initialize an airport collection.
+
+        Args:
+            items: List or iterable of airports to wrap. If omitted, the
+                collection is a view over ``index`` (or over ``idents`` of
+                ``model``) and the item list is only materialised when needed
+                (iteration, filtering, indexing).
+            index: Optional ident -> Airport mapping covering exactly the
+                airports in the collection. When it is the model's live dict,
+                lookups reflect the model at the time of the lookup.
+            model: Optional model the airports belong to. Filters on indexed
+                attributes (country, region, source, type, runway/fuel/entry
+                flags) are then answered from the model's attribute index.
+            idents: With ``model``, the idents of the airports in the
+                collection; None means every airport in the model.
+        """
+        super().__init__(items)
+        self._index: Optional[Dict[str, 'Airport']] = index
+        # A view over ``index`` alone (e.g. the model's live dict) never
+        # caches its item list, so len(), lookups and iteration always agree
+        self._live_view = items is None and index is not None and idents is None
+        self._model: Optional['EuroAipModel'] = model
+        self._member_idents: Optional[Set[str]] = idents
+
+    @property
+    def _items(self) -> List['Airport']:
+        # A copy of the model's airports: positional access on a live view
+        # (first(), last(), [i], repr()) reads the dict directly instead
+        if self._live_view:
+            return list(self._index.values())
+        return QueryableCollection._items.fget(self)
+
+    @_items.setter
+    def _items(self, value: List['Airport']) -> None:
+        self._live_view = False
+        self._list = value
+
+    def _live_item(self, position: int) -> 'Airport':
+        """The airport at ``position`` of a live view, walking the dict from the nearer end."""
+        values = self._index.values()
+        if position < 0:
+            values, position = reversed(values), -position - 1
+        airport = next(islice(values, position, None), None)
+        if airport is None:
+            raise IndexError("AirportCollection index out of range")
+        return airport
+
+    def first(self) -> Optional['Airport']:
+        if self._live_view:
+            return next(iter(self._index.values()), None)
+        return super().first()
+
+    def last(self) -> Optional['Airport']:
+        if self._live_view:
+            return next(reversed(self._index.values()), None)
+        return super().last()
+
+    def __repr__(self):
+        if not self._live_view:
+            return super().__repr__()
+        count = len(self._index)
+        if count == 0:
+            return f"{self.__class__.__name__}([])"
+        preview = [repr(airport.ident) for airport in islice(self._index.values(), 3)]
+        if count > 3:
+            preview.append('...')
+        return f"{self.__class__.__name__}([{', '.join(preview)}], count={count})"
+
+    def _materialize(self) -> List['Airport']:
+        """Build the item list of a lazy plan or index view."""
+        if self._plan is not None:
+            return super()._materialize()
+        if self._member_idents is not None and self._model is not None:
+            return self._model_airports(self._member_idents)
+        if self._index is not None:
+            return list(self._index.values())
+        return []
+
+    def _model_airports(self, idents: Set[str]) -> List['Airport']:
+        """Return the model's airports for ``idents``, in model order."""
+        airports = self._model._airports
+        ordered = self._model.get_airport_index().ordered(idents)
+        return [airports[ident] for ident in ordered if ident in airports]
+
+    def _plan_index_lookup(self):
+        """Answer lazy plan index steps from the model's attribute index."""
+        if self._model is None:
+            return None
+
+        def lookup(index_keys):
+            index = self._model.get_airport_index()
+            idents: Optional[Set[str]] = self._member_idents
+            for attribute, keys in index_keys:
+                matched = index.lookup(attribute, keys)
+                idents = matched if idents is None else idents & matched
+            return self._model_airports(idents)
+
+        return lookup
+
+    def _ident_index(self) -> Dict[str, 'Airport']:
+        """
+        Return the ident -> Airport index, building it on first use.
+
+        When several airports share an ident the first one wins, matching the
+        order a linear scan would find them in.
+        """
+        if self._index is None:
+            index: Dict[str, 'Airport'] = {}
+            for airport in self._items:
+                index.setdefault(airport.ident, airport)
+            self._index = index
+        return self._index
+
+    def _filter_indexed(
+        self,
+        attribute: str,
+        keys: Iterable[Any],
+        predicate: Callable[['Airport'], bool],
+    ) -> 'AirportCollection':
+        """
+        Filter on an indexed attribute.
+
+        Uses the model's attribute index when the collection is backed by a
+        model, otherwise falls back to scanning with ``predicate``.
+
+        Args:
+            attribute: Indexed attribute name (see ``INDEXED_ATTRIBUTES``)
+            keys: Index keys to match (any of)
+            predicate: Equivalent per-airport test used for the scan fallback
+        """
+        if self._plan is not None:
+            return self._with_plan(self._plan.where_indexed(attribute, keys, predicate))
+        if self._model is None:
+            return self.filter(predicate)
+        idents = self._model.get_airport_index().lookup(attribute, keys)
+        if self._member_idents is not None:
+            idents &= self._member_idents
+        return AirportCollection(model=self._model, idents=idents)
+
     def by_country(self, country_code: str) -> 'AirportCollection':
         """
         Filter airports by ISO country code.
@@ -55,10 +216,10 @@ class AirportCollection(QueryableCollection['Airport']):
             # Chain with other filters
             french_with_ils = airports.by_country("FR").with_procedures("approach")
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.iso_country == country_code
-        ])
+        return self._filter_indexed(
+            'iso_country', (country_code,),
+            lambda a: a.iso_country == country_code
+        )
 
     def by_countries(self, country_codes: List[str]) -> 'AirportCollection':
         """
@@ -75,10 +236,10 @@ class AirportCollection(QueryableCollection['Airport']):
             schengen = airports.by_countries(["FR", "DE", "ES", "IT"])
         """
         country_set = set(country_codes)
-        return AirportCollection([
-            a for a in self._items
-            if a.iso_country in country_set
-        ])
+        return self._filter_indexed(
+            'iso_country', country_set,
+            lambda a: a.iso_country in country_set
+        )
 
     def by_source(self, source: str) -> 'AirportCollection':
         """
@@ -94,10 +255,10 @@ class AirportCollection(QueryableCollection['Airport']):
             # Get airports from UK eAIP
             uk_eaip = airports.by_source("uk_eaip")
         """
-        return AirportCollection([
-            a for a in self._items
-            if source in a.sources
-        ])
+        return self._filter_indexed(
+            'sources', (source,),
+            lambda a: source in a.sources
+        )
 
     def by_sources(self, sources: List[str]) -> 'AirportCollection':
         """
@@ -114,10 +275,29 @@ class AirportCollection(QueryableCollection['Airport']):
             eaip_airports = airports.by_sources(["uk_eaip", "france_eaip"])
         """
         source_set = set(sources)
-        return AirportCollection([
-            a for a in self._items
-            if bool(a.sources & source_set)
-        ])
+        return self._filter_indexed(
+            'sources', source_set,
+            lambda a: bool(a.sources & source_set)
+        )
+
+    def by_type(self, airport_type: str) -> 'AirportCollection':
+        """
+        Filter airports by type.
+
+        Args:
+            airport_type: Airport type (e.g., "large_airport", "small_airport", "heliport")
+
+        Returns:
+            New AirportCollection with airports of the type
+
+        Examples:
+            # Major airports in France
+            major = airports.by_country("FR").by_type("large_airport")
+        """
+        return self._filter_indexed(
+            'type', (airport_type,),
+            lambda a: a.type == airport_type
+        )
 
     def with_runways(self) -> 'AirportCollection':
         """
@@ -133,10 +313,7 @@ class AirportCollection(QueryableCollection['Airport']):
             # Chain with other filters
             french_with_runways = airports.by_country("FR").with_runways()
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.runways
-        ])
+        return self.filter(lambda a: a.runways)
 
     def with_procedures(self, procedure_type: Optional[str] = None) -> 'AirportCollection':
         """
@@ -160,14 +337,10 @@ class AirportCollection(QueryableCollection['Airport']):
         """
         if procedure_type:
             proc_type_lower = procedure_type.lower()
-            return AirportCollection([
-                a for a in self._items
-                if any(p.procedure_type.lower() == proc_type_lower for p in a.procedures)
-            ])
-        return AirportCollection([
-            a for a in self._items
-            if a.procedures
-        ])
+            return self.filter(lambda a: any(
+                p.procedure_type.lower() == proc_type_lower for p in a.procedures
+            ))
+        return self.filter(lambda a: a.procedures)
 
     def with_aip_data(self) -> 'AirportCollection':
         """
@@ -180,10 +353,7 @@ class AirportCollection(QueryableCollection['Airport']):
             # Airports with AIP data
             with_aip = airports.with_aip_data()
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.aip_entries
-        ])
+        return self.filter(lambda a: a.aip_entries)
 
     def with_standardized_aip_data(self) -> 'AirportCollection':
         """
@@ -196,10 +366,7 @@ class AirportCollection(QueryableCollection['Airport']):
             # Airports with standardized AIP data
             standardized = airports.with_standardized_aip_data()
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.get_standardized_entries()
-        ])
+        return self.filter(lambda a: a.get_standardized_entries())
 
     def with_hard_runway(self) -> 'AirportCollection':
         """
@@ -215,10 +382,10 @@ class AirportCollection(QueryableCollection['Airport']):
             # French airports with paved runways
             french_paved = airports.by_country("FR").with_hard_runway()
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.has_hard_runway
-        ])
+        return self._filter_indexed(
+            'has_hard_runway', (True,),
+            lambda a: bool(a.has_hard_runway)
+        )
 
     def with_soft_runway(self) -> 'AirportCollection':
         """
@@ -227,10 +394,7 @@ class AirportCollection(QueryableCollection['Airport']):
         Returns:
             New AirportCollection with airports that have soft runways
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.has_soft_runway
-        ])
+        return self.filter(lambda a: a.has_soft_runway)
 
     def with_water_runway(self) -> 'AirportCollection':
         """
@@ -239,10 +403,7 @@ class AirportCollection(QueryableCollection['Airport']):
         Returns:
             New AirportCollection with seaplane bases
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.has_water_runway
-        ])
+        return self.filter(lambda a: a.has_water_runway)
 
     def with_lighted_runway(self) -> 'AirportCollection':
         """
@@ -255,10 +416,10 @@ class AirportCollection(QueryableCollection['Airport']):
             # Airports suitable for night operations
             night_ops = airports.with_lighted_runway()
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.has_lighted_runway
-        ])
+        return self._filter_indexed(
+            'has_lighted_runway', (True,),
+            lambda a: bool(a.has_lighted_runway)
+        )
 
     def with_fuel(self, avgas: bool = False, jet_a: bool = False) -> 'AirportCollection':
         """
@@ -281,12 +442,14 @@ class AirportCollection(QueryableCollection['Airport']):
             # Airports with both
             full_service = airports.with_fuel(avgas=True, jet_a=True)
         """
-        result = list(self._items)
+        result = self
         if avgas:
-            result = [a for a in result if a.avgas]
+            result = result._filter_indexed('avgas', (True,), lambda a: bool(a.avgas))
         if jet_a:
-            result = [a for a in result if a.jet_a]
-        return AirportCollection(result)
+            result = result._filter_indexed('jet_a', (True,), lambda a: bool(a.jet_a))
+        if result is self:
+            return self.filter(lambda a: True)
+        return result
 
     def border_crossings(self) -> 'AirportCollection':
         """
@@ -302,10 +465,10 @@ class AirportCollection(QueryableCollection['Airport']):
             # Points of entry in France
             french_entry = airports.by_country("FR").border_crossings()
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.point_of_entry
-        ])
+        return self._filter_indexed(
+            'point_of_entry', (True,),
+            lambda a: bool(a.point_of_entry)
+        )
 
     def with_min_runway_length(self, min_length_ft: int) -> 'AirportCollection':
         """
@@ -324,10 +487,7 @@ class AirportCollection(QueryableCollection['Airport']):
             # Large aircraft capable (8000+ ft)
             heavy_capable = airports.with_min_runway_length(8000)
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.longest_runway_length_ft and a.longest_runway_length_ft >= min_length_ft
-        ])
+        return self.filter(lambda a: a.longest_runway_length_ft and a.longest_runway_length_ft >= min_length_ft)
 
     def with_approach_type(self, approach_type: str) -> 'AirportCollection':
         """
@@ -347,13 +507,10 @@ class AirportCollection(QueryableCollection['Airport']):
             french_rnav = airports.by_country("FR").with_approach_type("RNAV")
         """
         approach_upper = approach_type.upper()
-        return AirportCollection([
-            a for a in self._items
-            if any(
-                p.is_approach() and p.approach_type and p.approach_type.upper() == approach_upper
-                for p in a.procedures
-            )
-        ])
+        return self.filter(lambda a: any(
+            p.is_approach() and p.approach_type and p.approach_type.upper() == approach_upper
+            for p in a.procedures
+        ))
 
     def in_region(self, region_code: str) -> 'AirportCollection':
         """
@@ -369,10 +526,10 @@ class AirportCollection(QueryableCollection['Airport']):
             # Airports in England
             england = airports.in_region("GB-ENG")
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.iso_region == region_code
-        ])
+        return self._filter_indexed(
+            'iso_region', (region_code,),
+            lambda a: a.iso_region == region_code
+        )
 
     def with_coordinates(self) -> 'AirportCollection':
         """
@@ -381,10 +538,7 @@ class AirportCollection(QueryableCollection['Airport']):
         Returns:
             New AirportCollection with airports that have lat/lon data
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.latitude_deg is not None and a.longitude_deg is not None
-        ])
+        return self.filter(lambda a: a.latitude_deg is not None and a.longitude_deg is not None)
 
     def with_scheduled_service(self) -> 'AirportCollection':
         """
@@ -393,10 +547,7 @@ class AirportCollection(QueryableCollection['Airport']):
         Returns:
             New AirportCollection with airports that have scheduled service
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.scheduled_service == 'yes'
-        ])
+        return self.filter(lambda a: a.scheduled_service == 'yes')
 
     def by_continent(self, continent: str) -> 'AirportCollection':
         """
@@ -412,10 +563,7 @@ class AirportCollection(QueryableCollection['Airport']):
             # All European airports
             europe = airports.by_continent("EU")
         """
-        return AirportCollection([
-            a for a in self._items
-            if a.continent == continent
-        ])
+        return self.filter(lambda a: a.continent == continent)
 
     # Grouping methods that return dictionaries
 
@@ -494,10 +642,12 @@ class AirportCollection(QueryableCollection['Airport']):
         """
         if isinstance(key, str):
             # Dict-style: lookup by ICAO code
-            for airport in self._items:
-                if airport.ident == key:
-                    return airport
-            raise KeyError(f"Airport with ICAO code '{key}' not found")
+            airport = self._ident_index().get(key)
+            if airport is None:
+                raise KeyError(f"Airport with ICAO code '{key}' not found")
+            return airport
+        if self._live_view and isinstance(key, int):
+            return self._live_item(key)
         # List-style: use parent implementation
         return super().__getitem__(key)
 
@@ -523,7 +673,7 @@ class AirportCollection(QueryableCollection['Airport']):
                 print("Heathrow found")
         """
         if isinstance(key, str):
-            return any(airport.ident == key for airport in self._items)
+            return key in self._ident_index()
         # For non-string keys, check item membership
         return key in self._items
 
@@ -546,7 +696,10 @@ class AirportCollection(QueryableCollection['Airport']):
             if airport := airports.get('EGLL'):
                 print(f"Found {airport.name}")
         """
-        try:
-            return self[icao]
-        except KeyError:
-            return default
+        return self._ident_index().get(icao, default)
+
+    def __len__(self):
+        """Return count of airports without materialising an index view."""
+        if self._live_view:
+            return len(self._index)
+        return super().__len__()
@@ -0,0 +1,138 @@
+"""
+Secondary attribute indexes over the airports of an EuroAipModel.
+
+Maps selected airport attributes (country, region, sources, type and the
+derived runway/fuel/entry flags) to the set of airport idents carrying each
+value, so AirportCollection filters on those attributes become set lookups
+and intersections instead of full scans.
+
+The index is owned by EuroAipModel, which keeps it current in its write API
+(add_airport, bulk_add_airports, remove_airports_by_country), when the
+airports it holds are changed through their mutators (add_source, ...) and
+in mark_airport_changed, so airports edited directly, as the sources do, are
+re-indexed at once.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .airport import Airport
+
+
+def _value(attribute: str) -> Callable[['Airport'], Tuple[Any, ...]]:
+    """Index an attribute by its value (matches ``airport.<attribute> == value``)."""
+    def keys(airport: 'Airport') -> Tuple[Any, ...]:
+        return (getattr(airport, attribute),)
+    return keys
+
+
+def _flag(attribute: str) -> Callable[['Airport'], Tuple[Any, ...]]:
+    """Index an attribute under ``True`` only when it is truthy."""
+    def keys(airport: 'Airport') -> Tuple[Any, ...]:
+        return (True,) if getattr(airport, attribute) else ()
+    return keys
+
+
+# Indexed attribute name -> function returning the index keys of an airport
+INDEXED_ATTRIBUTES: Dict[str, Callable[['Airport'], Tuple[Any, ...]]] = {
+    'iso_country': _value('iso_country'),
+    'iso_region': _value('iso_region'),
+    'type': _value('type'),
+    'sources': lambda airport: tuple(airport.sources),
+    'has_hard_runway': _flag('has_hard_runway'),
+    'has_lighted_runway': _flag('has_lighted_runway'),
+    'avgas': _flag('avgas'),
+    'jet_a': _flag('jet_a'),
+    'point_of_entry': _flag('point_of_entry'),
+}
+
+
+class AirportAttributeIndex:
+    """
+    Inverted index from airport attribute values to airport idents.
+
+    Also records the insertion position of every ident so that results can
+    be returned in the same order as the model's airport dict (and therefore
+    in the same order a linear scan would produce).
+
+    Examples:
+        index = AirportAttributeIndex(model._airports.values())
+        french = index.lookup('iso_country', ['FR'])
+        paved = index.lookup('has_hard_runway', [True])
+        ordered = index.ordered(french & paved)
+    """
+
+    def __init__(self, airports: Iterable['Airport'] = ()):
+        self._values: Dict[str, Dict[Any, Set[str]]] = {
+            attribute: {} for attribute in INDEXED_ATTRIBUTES
+        }
+        self._keys_by_ident: Dict[str, Dict[str, Tuple[Any, ...]]] = {}
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+        for airport in airports:
+            self.add(airport)
+
+    def add(self, airport: 'Airport') -> None:
+        """Index an airport, replacing any entries previously indexed for its ident."""
+        ident = airport.ident
+        if ident in self._keys_by_ident:
+            self._unindex(ident)
+        else:
+            self._positions[ident] = self._next_position
+            self._next_position += 1
+
+        indexed: Dict[str, Tuple[Any, ...]] = {}
+        for attribute, keys_of in INDEXED_ATTRIBUTES.items():
+            keys = keys_of(airport)
+            values = self._values[attribute]
+            for key in keys:
+                values.setdefault(key, set()).add(ident)
+            indexed[attribute] = keys
+        self._keys_by_ident[ident] = indexed
+
+    def remove(self, ident: str) -> None:
+        """Remove an airport from the index (no-op if not indexed)."""
+        if ident in self._keys_by_ident:
+            self._unindex(ident)
+            del self._keys_by_ident[ident]
+            del self._positions[ident]
+
+    def _unindex(self, ident: str) -> None:
+        for attribute, keys in self._keys_by_ident[ident].items():
+            values = self._values[attribute]
+            for key in keys:
+                idents = values.get(key)
+                if idents is not None:
+                    idents.discard(ident)
+                    if not idents:
+                        del values[key]
+
+    def lookup(self, attribute: str, keys: Iterable[Any]) -> Set[str]:
+        """
+        Return the idents of airports matching any of the given keys.
+
+        Args:
+            attribute: Name of an indexed attribute (see INDEXED_ATTRIBUTES)
+            keys: Values to match; flag attributes are only indexed under ``True``
+
+        Returns:
+            New set of matching airport idents
+        """
+        values = self._values[attribute]
+        result: Set[str] = set()
+        for key in keys:
+            idents = values.get(key)
+            if idents:
+                result |= idents
+        return result
+
+    def ordered(self, idents: Iterable[str]) -> List[str]:
+        """Return idents sorted by their position in the model."""
+        positions = self._positions
+        return sorted(idents, key=positions.__getitem__)
+
+    def __contains__(self, ident: str) -> bool:
+        return ident in self._keys_by_ident
+
+    def __len__(self) -> int:
+        return len(self._keys_by_ident)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Any, Callable, Union, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Set, Any, Callable, Union, TYPE_CHECKING
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -15,12 +15,15 @@ from .navpoint import NavPoint
 from .waypoint import Waypoint
 from .fir import FIR
 from .airport_collection import AirportCollection
+from .airport_index import AirportAttributeIndex
 from .procedure_collection import ProcedureCollection
 from .waypoint_collection import WaypointCollection
 from .fir_collection import FIRCollection
 from .model_transaction import ModelTransaction
 from .airport_builder import AirportBuilder
 from .validation import ValidationResult, ModelValidationError
+from ..utils.geometry import GridIndex, PolygonIndex
+from ..utils.route_geometry import RouteGeometry
 
 if TYPE_CHECKING:
     from ..interp.base import BaseInterpreter, InterpretationResult
@@ -28,21 +31,10 @@ if TYPE_CHECKING:
 
 import math
 
-logger = logging.getLogger(__name__)
-
+import numpy as np
 
-def _extract_latlon(point: Any) -> tuple:
-    """Best-effort (lat, lon) extraction from NavPoint, Airport, or similar.
+logger = logging.getLogger(__name__)
 
-    Returns ``(None, None)`` if neither pattern is found.
-    """
-    lat = getattr(point, "latitude", None)
-    if lat is None:
-        lat = getattr(point, "latitude_deg", None)
-    lon = getattr(point, "longitude", None)
-    if lon is None:
-        lon = getattr(point, "longitude_deg", None)
-    return lat, lon
 
 @dataclass
 class EuroAipModel:
@@ -73,7 +65,28 @@ class EuroAipModel:
     
     # Field standardization service
     field_service: Optional['FieldStandardizationService'] = None
-    
+
+    # Secondary attribute index over airports, built lazily by get_airport_index()
+    _airport_index: Optional[AirportAttributeIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    # Spatial indexes over airports and waypoints, built lazily by
+    # get_airport_spatial_index() / get_waypoint_spatial_index()
+    _airport_spatial_index: Optional[GridIndex] = field(default=None, init=False, repr=False, compare=False)
+    _waypoint_spatial_index: Optional[GridIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    # Point-location index over FIRs, built lazily by get_fir_index()
+    _fir_index: Optional[PolygonIndex] = field(default=None, init=False, repr=False, compare=False)
+
+    # Idents of airports added or changed through the model since they were
+    # last saved or loaded, for DatabaseStorage.save_airports()
+    _changed_airports: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    # What a partial DatabaseStorage.load_model() read: the parts of
+    # MODEL_PARTS and the airport filter ({'countries': ..., 'bbox': ...}).
+    # None when everything was loaded; saving leaves the rest alone.
+    _loaded_parts: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    _loaded_scope: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Initialize field standardization service if not provided."""
         if self.field_service is None:
@@ -119,8 +132,12 @@ class EuroAipModel:
             first_french = model.airports.by_country("FR").first()
             count = model.airports.with_runways().count()
             has_ils = model.airports.with_approach_type("ILS").exists()
+
+            # Dict-style lookups are O(1) against the model's own index
+            if "EGLL" in model.airports:
+                heathrow = model.airports["EGLL"]
         """
-        return AirportCollection(list(self._airports.values()))
+        return AirportCollection(index=self._airports, model=self)
 
     @property
     def procedures(self) -> ProcedureCollection:
@@ -179,7 +196,141 @@ class EuroAipModel:
         all_wps = []
         for candidates in self._waypoints.values():
             all_wps.extend(candidates)
-        return WaypointCollection(all_wps)
+        return WaypointCollection(all_wps, spatial_index=self.get_waypoint_spatial_index())
+
+    def get_airport_index(self) -> AirportAttributeIndex:
+        """
+        Get the secondary attribute index over airports, building it on first use.
+
+        The index maps country, region, sources, type and the derived
+        runway/fuel/entry flags to airport idents. It is kept current by
+        add_airport, bulk_add_airports and remove_airports_by_country, by
+        the mutators of the airports the model holds (add_source,
+        add_runway, add_aip_entry, add_procedure, the navpoint setter) and
+        by mark_airport_changed, which must be called after assigning an
+        indexed field such as ``airport.iso_country`` on its own.
+
+        Returns:
+            AirportAttributeIndex over all airports in the model
+        """
+        if self._airport_index is None:
+            self._airport_index = AirportAttributeIndex(self._airports.values())
+        return self._airport_index
+
+    def get_airport_spatial_index(self) -> GridIndex:
+        """
+        Get the spatial index over airports with coordinates, building it on first use.
+
+        Items are Airport objects keyed by ident. Kept current like the
+        attribute index (see get_airport_index): setting an airport's
+        navpoint moves it, but after assigning latitude_deg/longitude_deg
+        directly call mark_airport_changed, or radius and route queries keep
+        finding it at its old position.
+
+        Returns:
+            GridIndex supporting radius, nearest and corridor queries
+
+        Examples:
+            index = model.get_airport_spatial_index()
+            nearby = index.within_radius(lon=-0.46, lat=51.47, radius_nm=20)
+        """
+        if self._airport_spatial_index is None:
+            index = GridIndex()
+            for airport in self._airports.values():
+                if airport.latitude_deg is not None and airport.longitude_deg is not None:
+                    index.insert(airport.ident, airport.longitude_deg, airport.latitude_deg, airport)
+            self._airport_spatial_index = index
+        return self._airport_spatial_index
+
+    def get_waypoint_spatial_index(self) -> GridIndex:
+        """
+        Get the spatial index over waypoint candidates, building it on first use.
+
+        Items are Waypoint objects keyed by (name, source_id). Kept current by
+        add_waypoint and bulk_add_waypoints.
+
+        Returns:
+            GridIndex supporting radius, nearest and corridor queries
+        """
+        if self._waypoint_spatial_index is None:
+            index = GridIndex()
+            for candidates in self._waypoints.values():
+                for wp in candidates:
+                    index.insert((wp.name, wp.source_id), wp.longitude_deg, wp.latitude_deg, wp)
+            self._waypoint_spatial_index = index
+        return self._waypoint_spatial_index
+
+    def _reindex_airport(self, airport: Airport) -> None:
+        """Refresh an airport's entries in the indexes that have been built."""
+        if self._airport_index is not None:
+            self._airport_index.add(airport)
+        if self._airport_spatial_index is not None:
+            if airport.latitude_deg is not None and airport.longitude_deg is not None:
+                self._airport_spatial_index.insert(
+                    airport.ident, airport.longitude_deg, airport.latitude_deg, airport
+                )
+            else:
+                self._airport_spatial_index.remove(airport.ident)
+
+    def _unindex_airport(self, icao: str) -> None:
+        """Remove an airport from the indexes that have been built."""
+        if self._airport_index is not None:
+            self._airport_index.remove(icao)
+        if self._airport_spatial_index is not None:
+            self._airport_spatial_index.remove(icao)
+
+    def _adopt_airport(self, airport: Airport) -> None:
+        """
+        Record on an airport the model now holds that its mutators should
+        report to this model (see Airport._changed). Copies and pickles of
+        the airport do not keep the reference.
+        """
+        airport._model = self
+
+    def _release_airport(self, airport: Airport) -> None:
+        """Stop an airport the model no longer holds from reporting to it."""
+        if airport.__dict__.get('_model') is self:
+            del airport._model
+
+    def _airport_changed(self, airport: Airport) -> None:
+        """Called by an airport the model holds when one of its mutators changed it."""
+        if self._airports.get(airport.ident) is airport:
+            self.mark_airport_changed(airport.ident)
+
+    def _invalidate_airport_index(self) -> None:
+        """Drop the attribute index; it is rebuilt on next use."""
+        self._airport_index = None
+
+    def mark_airport_changed(self, icao: str) -> None:
+        """
+        Record that an airport changed, so the next incremental save includes it.
+
+        The airport is also re-indexed (attribute and spatial indexes), so
+        filters and radius/route queries see the change.
+
+        Airports added or updated through the model (add_airport,
+        add_aip_entries_to_airport, bulk_add_procedures, transactions) are
+        recorded automatically, and so are airports the model holds when
+        add_source, add_runway, add_aip_entry, add_procedure or the navpoint
+        setter is called on them. Call this after assigning an airport's
+        fields directly (e.g. airport.iso_country = 'FR') or mutating its
+        lists or their items in place (e.g. airport.runways[0].length_ft = ...).
+        """
+        self._changed_airports.add(icao)
+        airport = self._airports.get(icao)
+        if airport is not None:
+            self._reindex_airport(airport)
+
+    def changed_airports(self) -> Set[str]:
+        """Idents of the airports changed since they were last saved or loaded."""
+        return set(self._changed_airports)
+
+    def clear_changed_airports(self, idents: Optional[Iterable[str]] = None) -> None:
+        """Forget the changes of ``idents`` (all airports if None), e.g. once saved."""
+        if idents is None:
+            self._changed_airports.clear()
+        else:
+            self._changed_airports.difference_update(idents)
 
     # ========================================================================
     # Waypoint API
@@ -217,9 +368,16 @@ class EuroAipModel:
                     setattr(existing, attr, new_val)
             existing.updated_at = datetime.now()
             existing._navpoint = None  # Reset cached navpoint
+            indexed = existing
         else:
             candidates.append(waypoint)
             self._waypoints[waypoint.name] = candidates
+            indexed = waypoint
+
+        if self._waypoint_spatial_index is not None:
+            self._waypoint_spatial_index.insert(
+                (indexed.name, indexed.source_id), indexed.longitude_deg, indexed.latitude_deg, indexed
+            )
 
         self.updated_at = datetime.now()
 
@@ -263,7 +421,25 @@ class EuroAipModel:
             model.firs.containing_point(lon=2.5, lat=49.0)
             "EGTT" in model.firs
         """
-        return FIRCollection(list(self._firs.values()))
+        return FIRCollection(list(self._firs.values()), spatial_index=self.get_fir_index())
+
+    def get_fir_index(self) -> PolygonIndex:
+        """
+        Get the point-location index over FIRs, building it on first use.
+
+        An R-tree over FIR bboxes; each FIR prepares its polygons the first
+        time a point is tested against it. Dropped by add_fir and
+        bulk_add_firs, so it is rebuilt after FIRs change.
+
+        Returns:
+            PolygonIndex over all FIRs in the model
+
+        Examples:
+            model.get_fir_index().containing(lon=2.5, lat=49.0)
+        """
+        if self._fir_index is None:
+            self._fir_index = PolygonIndex(self._firs.values())
+        return self._fir_index
 
     def add_fir(self, fir: FIR) -> None:
         """Add or replace a FIR boundary in the model (keyed by ICAO)."""
@@ -271,6 +447,7 @@ class EuroAipModel:
         fir.created_at = (existing.created_at if existing else fir.created_at) or datetime.now()
         fir.updated_at = datetime.now()
         self._firs[fir.icao] = fir
+        self._fir_index = None
         if fir.source:
             self.sources_used.add(fir.source)
         self.updated_at = datetime.now()
@@ -298,69 +475,41 @@ class EuroAipModel:
 
     def firs_along_route(
         self,
-        route_points: List[Union[NavPoint, "Airport"]],
+        route_points: Union[List[Union[NavPoint, "Airport"]], RouteGeometry],
         corridor_nm: float = 25.0,
         sample_step_nm: float = 5.0,
     ) -> List[str]:
         """Find FIRs whose boundaries the route corridor traverses.
 
-        Samples the route polyline at ``sample_step_nm`` intervals and tests each
-        sample against FIR polygons (with bbox prefilter padded by ``corridor_nm``
-        so a route that clips a FIR's edge still counts).
+        The route is walked leg by leg through the FIR index, and each leg is
+        intersected exactly with the FIRs whose bbox it overlaps, so a FIR
+        clipped between two sample points is still reported.
+
+        The result is memoised on a RouteGeometry until the FIRs change.
 
         Args:
             route_points: list of NavPoints or Airport objects (anything with
-                ``latitude``/``longitude`` or ``latitude_deg``/``longitude_deg``).
-            corridor_nm: corridor half-width used to expand each FIR's bbox for
-                the prefilter — does NOT widen the polygon test itself, just the
-                bbox candidate set.
-            sample_step_nm: spacing between sampled route points.
+                ``latitude``/``longitude`` or ``latitude_deg``/``longitude_deg``),
+                or a RouteGeometry.
+            corridor_nm: corridor half-width. Kept for compatibility: it only
+                ever widened the bbox prefilter, which the per-leg index
+                lookup makes unnecessary, so it does not change the result.
+            sample_step_nm: kept for compatibility; legs are no longer
+                sampled, so it does not change the result.
 
         Returns:
             Sorted list of unique FIR ICAO codes intersected by the route.
         """
-        from ..utils.geometry import sample_polyline, bbox_pad, bbox_intersects
-
-        # Normalise to (lon, lat) pairs
-        polyline: List[tuple] = []
-        for p in route_points:
-            lat, lon = _extract_latlon(p)
-            if lat is None or lon is None:
-                continue
-            polyline.append((lon, lat))
-
-        if not polyline:
+        geometry = RouteGeometry.of(route_points)
+        if not len(geometry):
             return []
 
-        # Single-point "route" (e.g. a query for one airport): just test the point
-        if len(polyline) == 1:
-            lon, lat = polyline[0]
-            return sorted({fir.icao for fir in self._firs.values() if fir.contains(lon, lat)})
-
-        samples = sample_polyline(polyline, sample_step_nm)
-
-        # Compute the route bbox padded by corridor_nm; FIRs whose own bbox
-        # doesn't intersect this can be skipped entirely.
-        lons = [p[0] for p in samples]
-        lats = [p[1] for p in samples]
-        route_bbox = (min(lons), min(lats), max(lons), max(lats))
-        padded = bbox_pad(route_bbox, corridor_nm)
-
-        candidate_firs = [
-            fir for fir in self._firs.values()
-            if fir.bbox and bbox_intersects(fir.bbox, padded)
-        ]
-        if not candidate_firs:
-            return []
-
-        hit: Set[str] = set()
-        for lon, lat in samples:
-            for fir in candidate_firs:
-                if fir.icao in hit:
-                    continue  # already accounted for
-                if fir.contains(lon, lat):
-                    hit.add(fir.icao)
-        return sorted(hit)
+        # Keyed by the index, which is replaced whenever the FIRs change
+        index = self.get_fir_index()
+        return list(geometry.memo(
+            ("firs_along_route", index),
+            lambda: sorted({fir.icao for fir in index.along_polyline(geometry.polyline)}),
+        ))
 
     def dedup_waypoints(
         self,
@@ -428,6 +577,8 @@ class EuroAipModel:
             kept += len(survivors)
             dropped += len(candidates) - len(survivors)
 
+        if dropped:
+            self._waypoint_spatial_index = None
         return {"kept": kept, "dropped": dropped}
 
     # ========================================================================
@@ -447,7 +598,8 @@ class EuroAipModel:
             
             # Update basic fields if new data is available
             for field_name, value in airport.__dict__.items():
-                if value is not None and field_name not in ['runways', 'aip_entries', 'procedures', 'sources', 'created_at', 'updated_at']:
+                if (value is not None and not field_name.startswith('_')
+                        and field_name not in ['runways', 'aip_entries', 'procedures', 'sources', 'created_at', 'updated_at']):
                     setattr(existing, field_name, value)
             
             # Add runways
@@ -468,12 +620,17 @@ class EuroAipModel:
                 self.sources_used.add(source)
             
             existing.updated_at = datetime.now()
+            self._reindex_airport(existing)
+            self._changed_airports.add(airport.ident)
             logger.debug(f"Updated airport {airport.ident} with data from {list(airport.sources)}")
         else:
             # Add new airport
             self._airports[airport.ident] = airport
+            self._adopt_airport(airport)
             for source in airport.sources:
                 self.sources_used.add(source)
+            self._reindex_airport(airport)
+            self._changed_airports.add(airport.ident)
             logger.debug(f"Added new airport {airport.ident} with data from {list(airport.sources)}")
         
         self.updated_at = datetime.now()
@@ -491,6 +648,8 @@ class EuroAipModel:
             logger.warning(f"Airport {icao} not found in model, creating new airport")
             airport = Airport(ident=icao)
             self._airports[icao] = airport
+            self._adopt_airport(airport)
+            self._reindex_airport(airport)
         
         airport = self._airports[icao]
         
@@ -498,6 +657,7 @@ class EuroAipModel:
             entries = self.field_service.standardize_aip_entries(entries)
         
         airport.add_aip_entries(entries)
+        self._changed_airports.add(icao)
         logger.debug(f"Added {len(entries)} AIP entries to {icao}")
     
     def get_airports_with_standardized_aip_data(self) -> List[Airport]:
@@ -622,7 +782,8 @@ class EuroAipModel:
         if airports_to_remove:
             removed_count = len(airports_to_remove)
             for icao in airports_to_remove:
-                del self._airports[icao]
+                self._release_airport(self._airports.pop(icao))
+                self._unindex_airport(icao)
             self.updated_at = datetime.now()
             logger.info(f"Removed {removed_count} airports for country {country_code}")
         else:
@@ -1180,6 +1341,7 @@ class EuroAipModel:
             airport = self._airports[icao]
             for procedure in procedures:
                 airport.add_procedure(procedure)
+            self._changed_airports.add(icao)
 
             summary[icao] = len(procedures)
 
@@ -1427,6 +1589,10 @@ class EuroAipModel:
         connections and derived information are properly set.
         """
         logger.info("Updating all derived fields...")
+
+        # Derived flags may change on any airport: rebuild the attribute index
+        # on next use rather than update it airport by airport
+        self._invalidate_airport_index()
         
         # Step 1: Update model-level derived fields (requires access to model data)
         self._update_border_crossing_airports()
@@ -1454,6 +1620,8 @@ class EuroAipModel:
                 airport.point_of_entry = True
                 airport.add_source('border_crossing')
                 updated_count += 1
+
+        self._invalidate_airport_index()
         
         logger.info(f"Updated {updated_count} airports with border crossing information")
     
@@ -1464,14 +1632,19 @@ class EuroAipModel:
         """
         self._update_border_crossing_airports() 
 
-    def find_airports_near_route(self, route_airports: List[Union[str, NavPoint]], distance_nm: float = 50.0) -> List[Dict[str, Any]]:
+    def find_airports_near_route(
+        self,
+        route_airports: Union[List[Union[str, NavPoint]], RouteGeometry],
+        distance_nm: float = 50.0,
+    ) -> List[Dict[str, Any]]:
         """
         Find all airports within a specified distance from a route defined by airport ICAO codes
         or precomputed NavPoints.
         For single airports, treats them as a point search within the specified distance.
         
         Args:
-            route_airports: List of ICAO airport codes or NavPoint objects defining the route
+            route_airports: List of ICAO airport codes or NavPoint objects defining the route,
+                or a RouteGeometry (its corridor boxes and vectorised legs are reused)
             distance_nm: Distance in nautical miles from the route (default: 50.0)
             
         Returns:
@@ -1481,81 +1654,58 @@ class EuroAipModel:
             - enroute_distance_nm: Distance along the route to the closest point in nautical miles
             - closest_segment: Tuple of (start_airport_name, end_airport_name) for the closest segment
         """
-        if len(route_airports) < 1:
-            logger.warning("Route must contain at least 1 airport")
-            return []
-        
-        # Convert route inputs to NavPoints
-        route_points = []
-        for item in route_airports:
-            if isinstance(item, NavPoint):
-                route_points.append(item)
-                continue
-            # Assume string ICAO
-            icao = str(item).upper()
-            airport = self._airports.get(icao)
-            if not airport or not airport.latitude_deg or not airport.longitude_deg:
-                logger.warning(f"Airport {icao} not found or missing coordinates, skipping")
-                continue
-            if airport.navpoint:
-                route_points.append(airport.navpoint)
-        
+        if isinstance(route_airports, RouteGeometry):
+            geometry = route_airports
+        else:
+            if len(route_airports) < 1:
+                logger.warning("Route must contain at least 1 airport")
+                return []
+
+            # Convert route inputs to NavPoints
+            route_points = []
+            for item in route_airports:
+                if isinstance(item, NavPoint):
+                    route_points.append(item)
+                    continue
+                # Assume string ICAO
+                icao = str(item).upper()
+                airport = self._airports.get(icao)
+                if not airport or not airport.latitude_deg or not airport.longitude_deg:
+                    logger.warning(f"Airport {icao} not found or missing coordinates, skipping")
+                    continue
+                if airport.navpoint:
+                    route_points.append(airport.navpoint)
+            geometry = RouteGeometry(route_points)
+
+        route_points = geometry.navpoints
         if len(route_points) < 1:
             logger.warning("No valid airports in route")
             return []
         
-        # Calculate cumulative distances along the route (distance from start to each segment start)
-        cumulative_distances = [0.0]  # Start at 0
-        for i in range(len(route_points) - 1):
-            _, segment_length = route_points[i].haversine_distance(route_points[i + 1])
-            cumulative_distances.append(cumulative_distances[-1] + segment_length)
-        
-        # Find airports near the route
+        # Only the spatial index's corridor candidates are measured, in one
+        # vectorised pass against every leg of the route
+        candidates = [
+            airport for airport in self.get_airport_spatial_index().near_boxes(
+                geometry.corridor_boxes(), distance_nm
+            )
+            if airport.navpoint
+        ]
         nearby_airports = []
-        
-        for airport in self._airports.values():
-            
-            airport_point = airport.navpoint
-            if not airport_point:
-                continue  # Skip airports without coordinates
-            
-            # Calculate minimum distance to the route
-            min_distance = float('inf')
-            closest_segment = None
-            enroute_distance = None
-            
-            if len(route_points) == 1:
-                # Single airport: calculate direct distance to the point
-                _, min_distance = airport_point.haversine_distance(route_points[0])
-                closest_segment = (route_points[0].name, route_points[0].name)
-                enroute_distance = 0.0  # At the starting point
-            else:
-                # Multiple airports: calculate minimum distance to any segment of the route
-                for i in range(len(route_points) - 1):
-                    segment_start = route_points[i]
-                    segment_end = route_points[i + 1]
-                    
-                    # Calculate perpendicular distance to segment
-                    segment_distance = airport_point.distance_to_segment(
-                        segment_start, segment_end
-                    )
-                    
-                    if segment_distance < min_distance:
-                        min_distance = segment_distance
-                        closest_segment = (segment_start.name, segment_end.name)
-                        closest_segment_index = i
-                        
-                        # Calculate along-track distance within this segment
-                        _, dist_AP = segment_start.haversine_distance(airport_point)
-                        enroute_distance = cumulative_distances[i] + dist_AP  # At segment start
-                        
-            
-            # Check if airport is within the specified distance
-            if min_distance <= distance_nm:
+        if candidates:
+            distances, enroute_distances, legs = geometry.corridor.measure(
+                np.fromiter((a.longitude_deg for a in candidates), dtype=np.float64, count=len(candidates)),
+                np.fromiter((a.latitude_deg for a in candidates), dtype=np.float64, count=len(candidates)),
+            )
+            for i in np.flatnonzero(distances <= distance_nm):
+                if len(route_points) == 1:
+                    closest_segment = (route_points[0].name, route_points[0].name)
+                else:
+                    leg = int(legs[i])
+                    closest_segment = (route_points[leg].name, route_points[leg + 1].name)
                 nearby_airports.append({
-                    'airport': airport,
-                    'segment_distance_nm': round(min_distance, 2),
-                    'enroute_distance_nm': round(enroute_distance, 2) if enroute_distance is not None else None,
+                    'airport': candidates[i],
+                    'segment_distance_nm': round(float(distances[i]), 2),
+                    'enroute_distance_nm': round(float(enroute_distances[i]), 2),
                     'closest_segment': closest_segment
                 })
         
@@ -3,7 +3,14 @@
 A FIR is a large block of airspace identified by an ICAO code (e.g. ``LFFF``
 for Paris, ``EGTT`` for London). Boundaries come from VATSpy's
 ``Boundaries.geojson`` and are stored as MultiPolygons in (lon, lat) decimal
-degrees. A precomputed bounding box enables cheap spatial prefiltering.
+degrees. A precomputed bounding box enables cheap spatial prefiltering, and
+point and route-leg tests use a prepared copy of the polygons built on first
+use.
+
+FIRs also carry simplified copies of their polygons at a few tolerances in
+nm (``simplified``), for coarse prefilters and map output. The prepared
+polygons test the ``PREPARED_TOLERANCE_NM`` level first and only walk the
+full-resolution boundary near it.
 """
 
 from dataclasses import dataclass, field
@@ -11,10 +18,13 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 
 from euro_aip.utils.geometry import (
+    PreparedMultiPolygon,
     bbox_of_ring,
     bbox_union,
-    point_in_multipolygon,
     bbox_contains_point,
+    match_ring_indices,
+    simplify_multipolygon,
+    simplify_ring_indices,
 )
 
 
@@ -40,6 +50,16 @@ class FIR:
     bbox: Optional[Tuple[float, float, float, float]] = None  # (min_lon, min_lat, max_lon, max_lat)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    # Simplified polygons by tolerance (nm), same polygons and rings as ``polygons``
+    simplified: Dict[float, MultiPolygon] = field(default_factory=dict, repr=False, compare=False)
+    # Prepared polygons and the polygons list they were built from
+    _prepared: Optional[Tuple[MultiPolygon, PreparedMultiPolygon]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    # Tolerances (nm) of the simplified levels built by build_simplified()
+    SIMPLIFY_TOLERANCES_NM = (1.0, 5.0, 20.0)
+    # Level the prepared polygons use as their coarse first test
+    PREPARED_TOLERANCE_NM = 5.0
 
     def __post_init__(self):
         if self.bbox is None and self.polygons:
@@ -49,11 +69,65 @@ class FIR:
         outer_bboxes = [bbox_of_ring(poly[0]) for poly in self.polygons if poly]
         return bbox_union(outer_bboxes) if outer_bboxes else (0.0, 0.0, 0.0, 0.0)
 
+    def simplified_polygons(self, tolerance_nm: float) -> MultiPolygon:
+        """Polygons simplified to ``tolerance_nm``, computed and kept on first use."""
+        if tolerance_nm not in self.simplified:
+            self.simplified[tolerance_nm] = simplify_multipolygon(self.polygons, tolerance_nm)
+        return self.simplified[tolerance_nm]
+
+    def build_simplified(self, tolerances_nm=SIMPLIFY_TOLERANCES_NM) -> None:
+        """Compute any missing simplified levels."""
+        for tolerance in tolerances_nm:
+            self.simplified_polygons(tolerance)
+
+    def coarsest_polygons(self, max_tolerance_nm: float) -> MultiPolygon:
+        """The stored level with the largest tolerance not above ``max_tolerance_nm``.
+
+        Falls back to the full-resolution polygons when no level is coarse
+        enough to help.
+        """
+        usable = [t for t in self.simplified if t <= max_tolerance_nm]
+        return self.simplified[max(usable)] if usable else self.polygons
+
+    def _coarse_indices(self) -> List[List[List[int]]]:
+        """Vertex indices of the ``PREPARED_TOLERANCE_NM`` level, ring by ring."""
+        tolerance = self.PREPARED_TOLERANCE_NM
+        level = self.simplified.get(tolerance)
+        if level is not None and len(level) == len(self.polygons):
+            indices = [
+                [match_ring_indices(ring, coarse) for ring, coarse in zip(poly, coarse_poly)]
+                for poly, coarse_poly in zip(self.polygons, level)
+                if len(poly) == len(coarse_poly)
+            ]
+            if len(indices) == len(self.polygons) and all(
+                    keep is not None for poly in indices for keep in poly):
+                return indices
+        # No stored level, or one computed from an older boundary
+        indices = [[simplify_ring_indices(ring, tolerance) for ring in poly] for poly in self.polygons]
+        self.simplified[tolerance] = [
+            [[ring[i] for i in keep] for ring, keep in zip(poly, poly_keep)]
+            for poly, poly_keep in zip(self.polygons, indices)
+        ]
+        return indices
+
+    @property
+    def prepared(self) -> PreparedMultiPolygon:
+        """Polygons prepared for point and leg tests, rebuilt if ``polygons`` is replaced."""
+        if self._prepared is None or self._prepared[0] is not self.polygons:
+            self._prepared = (self.polygons, PreparedMultiPolygon(self.polygons, keep=self._coarse_indices()))
+        return self._prepared[1]
+
     def contains(self, lon: float, lat: float) -> bool:
         """True if (lon, lat) is inside this FIR's geometry."""
         if self.bbox and not bbox_contains_point(self.bbox, lon, lat):
             return False
-        return point_in_multipolygon(lon, lat, self.polygons)
+        return self.prepared.contains(lon, lat)
+
+    def segment_intervals(self, a: Coord, b: Coord) -> List[Tuple[float, float]]:
+        """Intervals of t in [0, 1] where the segment a→b is inside this FIR."""
+        if not self.bbox:
+            return []
+        return self.prepared.segment_intervals(a, b)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
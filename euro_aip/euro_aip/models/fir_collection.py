@@ -1,10 +1,11 @@
 """FIRCollection — fluent queries over FIR objects."""
 
-from typing import Optional, TYPE_CHECKING
+from typing import Iterable, List, Optional, TYPE_CHECKING, Union
 from .queryable_collection import QueryableCollection
 
 if TYPE_CHECKING:
     from .fir import FIR
+    from ..utils.geometry import PolygonIndex
 
 
 class FIRCollection(QueryableCollection['FIR']):
@@ -17,30 +18,49 @@ class FIRCollection(QueryableCollection['FIR']):
         collection.containing_point(lon=2.5, lat=49.0)
     """
 
+    def __init__(
+        self,
+        items: Union[List['FIR'], Iterable['FIR'], None] = None,
+        spatial_index: Optional['PolygonIndex'] = None,
+    ):
+        """
+        Initialize a FIR collection.
+
+        Args:
+            items: FIRs to wrap
+            spatial_index: Optional polygon index covering exactly ``items``
+                (the model passes its FIR index for ``model.firs``), used by
+                ``containing_point`` instead of testing every FIR.
+        """
+        super().__init__(items)
+        self._spatial_index = spatial_index
+
     def by_icao(self, icao: str) -> 'FIRCollection':
         upper = icao.upper()
-        return FIRCollection([f for f in self._items if f.icao.upper() == upper])
+        return self.filter(lambda f: f.icao.upper() == upper)
 
     def by_region(self, region: str) -> 'FIRCollection':
         upper = region.upper()
-        return FIRCollection([f for f in self._items if (f.region or '').upper() == upper])
+        return self.filter(lambda f: (f.region or '').upper() == upper)
 
     def by_source(self, source: str) -> 'FIRCollection':
-        return FIRCollection([f for f in self._items if f.source == source])
+        return self.filter(lambda f: f.source == source)
 
     def land(self) -> 'FIRCollection':
-        return FIRCollection([f for f in self._items if not f.is_oceanic])
+        return self.filter(lambda f: not f.is_oceanic)
 
     def oceanic(self) -> 'FIRCollection':
-        return FIRCollection([f for f in self._items if f.is_oceanic])
+        return self.filter(lambda f: f.is_oceanic)
 
     def containing_point(self, lon: float, lat: float) -> 'FIRCollection':
         """FIRs whose geometry contains (lon, lat)."""
-        return FIRCollection([f for f in self._items if f.contains(lon, lat)])
+        if self._spatial_index is not None and self._pending_plan() is None:
+            return FIRCollection(self._spatial_index.containing(lon, lat))
+        return self.filter(lambda f: f.contains(lon, lat))
 
     def __getitem__(self, key):
         if isinstance(key, str):
-            for f in self._items:
+            for f in self:
                 if f.icao == key.upper():
                     return f
             raise KeyError(f"FIR '{key}' not found")
@@ -48,12 +68,12 @@ class FIRCollection(QueryableCollection['FIR']):
 
     def __contains__(self, item) -> bool:
         if isinstance(item, str):
-            return any(f.icao == item.upper() for f in self._items)
+            return any(f.icao == item.upper() for f in self)
         return super().__contains__(item)
 
     def get(self, icao: str) -> Optional['FIR']:
         upper = icao.upper()
-        for f in self._items:
+        for f in self:
             if f.icao == upper:
                 return f
         return None
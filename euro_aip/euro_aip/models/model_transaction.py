@@ -219,6 +219,7 @@ class ModelTransaction:
         """Create snapshot of current model state for rollback."""
         return {
             '_airports': copy.deepcopy(self.model._airports),
+            '_changed_airports': set(self.model._changed_airports),
             'border_crossing_points': copy.deepcopy(self.model.border_crossing_points),
             'sources_used': copy.copy(self.model.sources_used),
             'updated_at': self.model.updated_at
@@ -227,6 +228,11 @@ class ModelTransaction:
     def _restore_snapshot(self, snapshot: Dict[str, Any]) -> None:
         """Restore model to snapshot state."""
         self.model._airports = snapshot['_airports']
+        for airport in self.model._airports.values():
+            self.model._adopt_airport(airport)
+        self.model._changed_airports = snapshot['_changed_airports']
+        self.model._invalidate_airport_index()
+        self.model._airport_spatial_index = None
         self.model.border_crossing_points = snapshot['border_crossing_points']
         self.model.sources_used = snapshot['sources_used']
         self.model.updated_at = snapshot['updated_at']
@@ -380,6 +386,7 @@ class ModelTransaction:
         airport = self.model._airports[icao]
         for procedure in procedures:
             airport.add_procedure(procedure)
+        self.model.mark_airport_changed(icao)
 
         if self.track_changes:
             self._change_summary['added_procedures'] += len(procedures)
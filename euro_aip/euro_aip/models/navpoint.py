@@ -4,7 +4,7 @@ import math
 from typing import Optional, Tuple, Union
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class NavPoint:
     """
     A navigation point with coordinates and optional name.
@@ -6,11 +6,101 @@ Python's functional programming capabilities for clean, chainable queries on
 in-memory data.
 """
 
-from typing import TypeVar, Generic, Callable, List, Dict, Optional, Any, Union
-from collections.abc import Iterable
+from typing import TypeVar, Generic, Callable, List, Dict, Optional, Any, Union, Tuple, Sequence
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence as SequenceABC
+from itertools import islice
 
 T = TypeVar('T')
 
+# (attribute, keys) pair a plan step can be answered with from an index
+IndexKey = Tuple[str, Tuple[Any, ...]]
+
+# Given the index keys of a plan, return the matching items in collection order
+IndexLookup = Callable[[Sequence[IndexKey]], Iterable[Any]]
+
+_MISSING = object()
+
+
+class QueryPlan(Generic[T]):
+    """
+    Deferred filter chain behind a lazy QueryableCollection.
+
+    Each chained filter appends a step (a predicate, optionally with the
+    index key it is equivalent to) without touching the data. Executing the
+    plan streams the source once and applies every predicate to each item
+    in turn, so a chain of filters costs a single pass and no intermediate
+    lists. When the source collection provides an index lookup, steps with
+    an index key are answered up front by that lookup and only the
+    remaining predicates are evaluated on the (smaller) candidate set.
+
+    Examples:
+        plan = QueryPlan(airports).where(lambda a: a.runways)
+        first = next(plan.execute(), None)
+    """
+
+    def __init__(
+        self,
+        source: Iterable[T],
+        index_lookup: Optional[IndexLookup] = None,
+        steps: Tuple[Tuple[Callable[[T], bool], Optional[IndexKey]], ...] = (),
+    ):
+        """
+        Initialize a query plan.
+
+        Args:
+            source: Items the plan filters
+            index_lookup: Optional function answering index keys for ``source``
+            steps: (predicate, index key or None) pairs, in chain order
+        """
+        self._source = source
+        self._index_lookup = index_lookup
+        self._steps = steps
+
+    def where(self, predicate: Callable[[T], bool]) -> 'QueryPlan[T]':
+        """Return a new plan with an extra predicate step."""
+        return QueryPlan(self._source, self._index_lookup, self._steps + ((predicate, None),))
+
+    def where_indexed(
+        self,
+        attribute: str,
+        keys: Iterable[Any],
+        predicate: Callable[[T], bool],
+    ) -> 'QueryPlan[T]':
+        """
+        Return a new plan with a step that can be pushed down to an index.
+
+        Args:
+            attribute: Indexed attribute name
+            keys: Index keys to match (any of)
+            predicate: Equivalent per-item test, used when no index is available
+        """
+        index_key = (attribute, tuple(keys))
+        return QueryPlan(self._source, self._index_lookup, self._steps + ((predicate, index_key),))
+
+    def execute(self) -> Iterator[T]:
+        """Stream the items matching every step, in source order."""
+        index_keys = [key for _, key in self._steps if key is not None]
+        if index_keys and self._index_lookup is not None:
+            candidates = self._index_lookup(index_keys)
+            predicates = [predicate for predicate, key in self._steps if key is None]
+        else:
+            candidates = self._source
+            predicates = [predicate for predicate, _ in self._steps]
+
+        if not predicates:
+            yield from candidates
+            return
+        for item in candidates:
+            for predicate in predicates:
+                if not predicate(item):
+                    break
+            else:
+                yield item
+
+    def __repr__(self):
+        indexed = sum(1 for _, key in self._steps if key is not None)
+        return f"QueryPlan(steps={len(self._steps)}, indexed={indexed})"
+
 
 class QueryableCollection(Generic[T]):
     """
@@ -35,16 +125,90 @@ class QueryableCollection(Generic[T]):
 
         # Sorting
         collection.order_by(lambda x: x.created_at, reverse=True).take(10).all()
+
+        # Lazy mode: filters build a plan executed once, on the terminal call
+        collection.lazy().filter(is_active).where(category='A').first()
     """
 
-    def __init__(self, items: Union[List[T], Iterable[T]]):
+    def __init__(self, items: Union[List[T], Iterable[T], None] = None):
         """
         Initialize a queryable collection.
 
         Args:
-            items: List or iterable of items to wrap
+            items: List or iterable of items to wrap. If None, the items are
+                produced on first access (e.g. by executing a lazy plan).
+                Lists and read-only sequences (such as the rows of a
+                memory-mapped snapshot) are wrapped without copying; other
+                iterables are copied into a list.
+        """
+        self._list: Optional[List[T]] = None
+        self._plan: Optional[QueryPlan[T]] = None
+        if items is not None:
+            if isinstance(items, list) or (isinstance(items, SequenceABC)
+                                           and not isinstance(items, (MutableSequence, str))):
+                self._list = items
+            else:
+                self._list = list(items)
+
+    @property
+    def _items(self) -> List[T]:
+        """Item list, materialised on first access for lazy collections."""
+        if self._list is None:
+            self._list = self._materialize()
+        return self._list
+
+    @_items.setter
+    def _items(self, value: List[T]) -> None:
+        self._list = value
+
+    def _materialize(self) -> List[T]:
+        """Build the item list of a collection created without one."""
+        if self._plan is not None:
+            return list(self._plan.execute())
+        return []
+
+    def _pending_plan(self) -> Optional[QueryPlan[T]]:
+        """Return the lazy plan if it has not been materialised yet."""
+        return self._plan if self._list is None else None
+
+    def _plan_index_lookup(self) -> Optional[IndexLookup]:
+        """Index lookup lazy plans over this collection can push steps down to."""
+        return None
+
+    def _with_plan(self, plan: QueryPlan[T]) -> 'QueryableCollection[T]':
+        """Return a new lazy collection of the same class executing ``plan``."""
+        collection = self.__class__([])
+        collection._list = None
+        collection._plan = plan
+        return collection
+
+    def lazy(self) -> 'QueryableCollection[T]':
+        """
+        Return a lazy view of this collection.
+
+        Filters chained on a lazy collection (``filter``, ``where`` and the
+        domain-specific filters of subclasses) only record a plan. The plan
+        runs when a terminal is called (``all``, ``first``, ``count``,
+        ``exists``, iteration, ...): all predicates are applied in a single
+        pass, ``first``/``exists`` stop at the first match, and filters on
+        indexed attributes are answered from model-level indexes when the
+        collection comes from a model. Other operations (``order_by``,
+        ``group_by``, ...) execute the plan and return eager results.
+
+        Returns:
+            Lazy collection over the same items
+
+        Examples:
+            # One pass, no intermediate lists, stops at the first match
+            airport = model.airports.lazy() \\
+                                    .by_country("FR") \\
+                                    .with_hard_runway() \\
+                                    .with_min_runway_length(3000) \\
+                                    .first()
         """
-        self._items: List[T] = list(items) if not isinstance(items, list) else items
+        if self._pending_plan() is not None:
+            return self
+        return self._with_plan(QueryPlan(self, self._plan_index_lookup()))
 
     def filter(self, predicate: Callable[[T], bool]) -> 'QueryableCollection[T]':
         """
@@ -63,6 +227,8 @@ class QueryableCollection(Generic[T]):
             # Filter procedures with specific characteristics
             procedures.filter(lambda p: p.is_approach() and p.approach_type == 'ILS')
         """
+        if self._plan is not None:
+            return self._with_plan(self._plan.where(predicate))
         return self.__class__([item for item in self._items if predicate(item)])
 
     def where(self, **kwargs) -> 'QueryableCollection[T]':
@@ -101,6 +267,9 @@ class QueryableCollection(Generic[T]):
             # Get first airport in collection
             airport = airports.where(ident='EGLL').first()
         """
+        plan = self._pending_plan()
+        if plan is not None:
+            return next(plan.execute(), None)
         return self._items[0] if self._items else None
 
     def first_or_raise(self, exception: Optional[Exception] = None) -> T:
@@ -116,11 +285,12 @@ class QueryableCollection(Generic[T]):
         Raises:
             Exception if collection is empty
         """
-        if not self._items:
+        item = self.first()
+        if item is None and self.is_empty():
             if exception:
                 raise exception
             raise ValueError("Collection is empty")
-        return self._items[0]
+        return item
 
     def last(self) -> Optional[T]:
         """
@@ -142,7 +312,8 @@ class QueryableCollection(Generic[T]):
             # Get all filtered airports as a list
             french_airports = airports.where(iso_country='FR').all()
         """
-        return self._items
+        items = self._items
+        return items if isinstance(items, list) else list(items)
 
     def count(self) -> int:
         """
@@ -155,7 +326,7 @@ class QueryableCollection(Generic[T]):
             # Count airports with procedures
             count = airports.filter(lambda a: len(a.procedures) > 0).count()
         """
-        return len(self._items)
+        return len(self)
 
     def exists(self) -> bool:
         """
@@ -168,7 +339,10 @@ class QueryableCollection(Generic[T]):
             # Check if any ILS approaches exist
             has_ils = procedures.where(approach_type='ILS').exists()
         """
-        return len(self._items) > 0
+        plan = self._pending_plan()
+        if plan is not None:
+            return next(plan.execute(), _MISSING) is not _MISSING
+        return len(self) > 0
 
     def is_empty(self) -> bool:
         """
@@ -177,7 +351,7 @@ class QueryableCollection(Generic[T]):
         Returns:
             True if collection is empty
         """
-        return len(self._items) == 0
+        return not self.exists()
 
     def any(self, predicate: Callable[[T], bool]) -> bool:
         """
@@ -193,7 +367,7 @@ class QueryableCollection(Generic[T]):
             # Check if any airport has ILS
             has_ils = airports.any(lambda a: any(p.approach_type == 'ILS' for p in a.procedures))
         """
-        return any(predicate(item) for item in self._items)
+        return any(predicate(item) for item in self)
 
     def all_match(self, predicate: Callable[[T], bool]) -> bool:
         """
@@ -205,7 +379,7 @@ class QueryableCollection(Generic[T]):
         Returns:
             True if all items match
         """
-        return all(predicate(item) for item in self._items)
+        return all(predicate(item) for item in self)
 
     def group_by(self, key_func: Callable[[T], str]) -> Dict[str, List[T]]:
         """
@@ -266,6 +440,9 @@ class QueryableCollection(Generic[T]):
             # Get top 10 airports by runway length
             top_10 = airports.order_by(lambda a: a.longest_runway_length_ft or 0, reverse=True).take(10)
         """
+        plan = self._pending_plan()
+        if plan is not None:
+            return self.__class__(list(islice(plan.execute(), n)))
         return self.__class__(self._items[:n])
 
     def skip(self, n: int) -> 'QueryableCollection[T]':
@@ -351,11 +528,17 @@ class QueryableCollection(Generic[T]):
 
     # Make the collection behave like a list
     def __iter__(self):
-        """Allow iteration over items."""
+        """Allow iteration over items (streams a pending lazy plan)."""
+        plan = self._pending_plan()
+        if plan is not None:
+            return plan.execute()
         return iter(self._items)
 
     def __len__(self):
         """Return count of items."""
+        plan = self._pending_plan()
+        if plan is not None:
+            return sum(1 for _ in plan.execute())
         return len(self._items)
 
     def __getitem__(self, index):
@@ -398,7 +581,7 @@ class QueryableCollection(Generic[T]):
 
     def __bool__(self):
         """Return True if collection is not empty."""
-        return len(self._items) > 0
+        return self.exists()
 
     def __reversed__(self):
         """
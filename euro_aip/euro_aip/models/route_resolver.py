@@ -7,11 +7,15 @@ by looking up each token in the airport and waypoint databases.
 When multiple waypoint candidates share the same name (e.g. MID in UK vs Mexico),
 the resolver picks the candidate closest to the route context (departure/destination
 midpoint, or the previously resolved point for progressive resolution).
+
+Name lookups are memoised per resolver, so a single resolver (or
+resolve_many) can parse large batches of routes without repeating the
+airport/waypoint lookup for tokens it has already seen.
 """
 
 import logging
 from dataclasses import replace
-from typing import Optional, List, TYPE_CHECKING
+from typing import Dict, Iterable, Optional, List, Tuple, TYPE_CHECKING
 
 from euro_aip.briefing.models.route import Route, RoutePoint
 from euro_aip.models.navpoint import NavPoint
@@ -24,9 +28,14 @@ from euro_aip.utils.dms_parser import is_icao_coordinate, parse_icao_coordinate
 
 if TYPE_CHECKING:
     from euro_aip.models.euro_aip_model import EuroAipModel
+    from euro_aip.models.waypoint import Waypoint
 
 logger = logging.getLogger(__name__)
 
+# Memoised lookup for one name: the point it resolves to unambiguously
+# (inline coordinate or airport), and its waypoint candidates otherwise
+_NameEntry = Tuple[Optional[RoutePoint], Tuple['Waypoint', ...]]
+
 
 class RouteResolver:
     """Resolves route strings to Route objects with coordinates.
@@ -40,6 +49,11 @@ class RouteResolver:
         model = storage.load_model()
         resolver = RouteResolver(model)
         route = resolver.resolve("EGTF POGOL REM VESAN LSGS")
+        routes = resolver.resolve_many(["EGTF POGOL LSGS", "LSGS REM EGTF"])
+
+    Lookups are memoised by name for the lifetime of the resolver. If the
+    model's airports or waypoints change afterwards, call clear_cache() (or
+    create a new resolver).
     """
 
     # Default detour-filter thresholds (nautical miles). The leg here is
@@ -74,6 +88,45 @@ class RouteResolver:
         self.detour_floor_nm = detour_floor_nm
         self.detour_coef = detour_coef
         self.detour_cap_nm = detour_cap_nm
+        self._names: Dict[str, _NameEntry] = {}
+
+    def clear_cache(self) -> None:
+        """Forget memoised name lookups (call after modifying the model)."""
+        self._names.clear()
+
+    def _lookup(self, name_upper: str) -> _NameEntry:
+        """Look up a normalised name, memoising the result.
+
+        Inline coordinates win, then airports (unique by ICAO, and only if
+        they have coordinates), then waypoint candidates.
+        """
+        entry = self._names.get(name_upper)
+        if entry is None:
+            point = self._coord_point(name_upper)
+            candidates: Tuple['Waypoint', ...] = ()
+            if point is None:
+                airport = self.model.airports.get(name_upper)
+                if airport and airport.latitude_deg is not None and airport.longitude_deg is not None:
+                    point = RoutePoint(
+                        name=name_upper,
+                        latitude=airport.latitude_deg,
+                        longitude=airport.longitude_deg,
+                        point_type="airport",
+                    )
+                else:
+                    candidates = tuple(self.model.get_waypoint_candidates(name_upper))
+            entry = (point, candidates)
+            self._names[name_upper] = entry
+        return entry
+
+    @staticmethod
+    def _waypoint_point(name_upper: str, waypoint: 'Waypoint') -> RoutePoint:
+        return RoutePoint(
+            name=name_upper,
+            latitude=waypoint.latitude_deg,
+            longitude=waypoint.longitude_deg,
+            point_type=waypoint.point_type or "waypoint",
+        )
 
     def _detour_threshold_nm(self, leg_nm: float) -> float:
         return min(
@@ -96,30 +149,14 @@ class RouteResolver:
         """
         name_upper = name.upper().strip()
 
-        # Inline coordinate — geometry, no DB lookup
-        coord_point = self._coord_point(name_upper)
-        if coord_point is not None:
-            return coord_point
-
-        # Try airport first
-        airport = self.model.airports.where(ident=name_upper).first()
-        if airport and airport.latitude_deg is not None and airport.longitude_deg is not None:
-            return RoutePoint(
-                name=name_upper,
-                latitude=airport.latitude_deg,
-                longitude=airport.longitude_deg,
-                point_type="airport",
-            )
+        point, candidates = self._lookup(name_upper)
+        if point is not None:
+            # Copy so callers never mutate the memoised point
+            return replace(point)
 
-        # Try waypoint — return first candidate
-        waypoint = self.model.get_waypoint(name_upper)
-        if waypoint:
-            return RoutePoint(
-                name=name_upper,
-                latitude=waypoint.latitude_deg,
-                longitude=waypoint.longitude_deg,
-                point_type=waypoint.point_type or "waypoint",
-            )
+        # Waypoint — return first candidate
+        if candidates:
+            return self._waypoint_point(name_upper, candidates[0])
 
         return None
 
@@ -170,23 +207,12 @@ class RouteResolver:
         """
         name_upper = name.upper().strip()
 
-        # Inline coordinate — geometry, no candidates to disambiguate
-        coord_point = self._coord_point(name_upper)
-        if coord_point is not None:
-            return coord_point
-
-        # Try airport first (airports are unique by ICAO)
-        airport = self.model.airports.where(ident=name_upper).first()
-        if airport and airport.latitude_deg is not None and airport.longitude_deg is not None:
-            return RoutePoint(
-                name=name_upper,
-                latitude=airport.latitude_deg,
-                longitude=airport.longitude_deg,
-                point_type="airport",
-            )
+        # Inline coordinate or airport — nothing to disambiguate
+        point, candidates = self._lookup(name_upper)
+        if point is not None:
+            return replace(point)
 
-        # Try waypoint — pick best candidate
-        candidates = self.model.get_waypoint_candidates(name_upper)
+        # Waypoint — pick best candidate
         if not candidates:
             return None
 
@@ -217,12 +243,21 @@ class RouteResolver:
                 name_upper, len(candidates), wp.source_id, chosen_dist,
             )
 
-        return RoutePoint(
-            name=name_upper,
-            latitude=wp.latitude_deg,
-            longitude=wp.longitude_deg,
-            point_type=wp.point_type or "waypoint",
-        )
+        return self._waypoint_point(name_upper, wp)
+
+    def resolve_many(self, route_strings: Iterable[str]) -> List[Route]:
+        """Resolve a batch of route strings, sharing name lookups across them.
+
+        Args:
+            route_strings: Route strings as accepted by resolve()
+
+        Returns:
+            One Route per route string, in order
+
+        Raises:
+            ValueError: If any route string has fewer than 2 points
+        """
+        return [self.resolve(route_string) for route_string in route_strings]
 
     def resolve(self, route_string: str) -> Route:
         """Resolve a space-separated route string into a Route with coordinates.
@@ -12,13 +12,16 @@ from typing import Optional, Dict, Any
 from euro_aip.models.navpoint import NavPoint
 
 
-@dataclass
+@dataclass(slots=True)
 class Waypoint:
     """A named navigation waypoint with coordinates.
 
     Waypoints come from sources like Eurocontrol's FRA (Free Route Airspace)
     points list. They have a `.navpoint` property for distance calculations,
     just like Airport does.
+
+    Slotted, since hundreds of thousands are loaded at once. ``updated_at``
+    defaults to the same datetime object as ``created_at``.
     """
 
     name: str  # "BILGO", "REM", "ABADI"
@@ -30,10 +33,14 @@ class Waypoint:
     source: str = "eurocontrol_fra"
     source_id: str = ""  # Unique per candidate, e.g. "fra:LFFF", "opennav:UK", "ourairports:GB"
     created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    updated_at: Optional[datetime] = None
 
     _navpoint: Optional[NavPoint] = field(default=None, init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        if self.updated_at is None:
+            self.updated_at = self.created_at
+
     @property
     def navpoint(self) -> NavPoint:
         """Get NavPoint representation for distance calculations."""
@@ -92,7 +99,7 @@ class Waypoint:
             source=data.get("source", "eurocontrol_fra"),
             source_id=data.get("source_id", ""),
             created_at=created_at or datetime.now(),
-            updated_at=updated_at or datetime.now(),
+            updated_at=updated_at,
         )
 
     def __repr__(self):
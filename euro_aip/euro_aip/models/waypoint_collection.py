@@ -5,12 +5,14 @@ Provides domain-specific filtering methods for querying named navigation
 waypoints (5-letter codes, VORs, DMEs, NDBs, etc.).
 """
 
-from typing import Optional, List, TYPE_CHECKING
+import heapq
+from typing import Optional, List, Union, Iterable, TYPE_CHECKING
 from .queryable_collection import QueryableCollection
 
 if TYPE_CHECKING:
     from .waypoint import Waypoint
     from .navpoint import NavPoint
+    from ..utils.geometry import GridIndex
 
 
 class WaypointCollection(QueryableCollection['Waypoint']):
@@ -25,53 +27,60 @@ class WaypointCollection(QueryableCollection['Waypoint']):
         collection.nearest(navpoint, count=10)
     """
 
+    def __init__(
+        self,
+        items: Union[List['Waypoint'], Iterable['Waypoint'], None] = None,
+        spatial_index: Optional['GridIndex'] = None,
+    ):
+        """
+        Initialize a waypoint collection.
+
+        Args:
+            items: List or iterable of waypoints to wrap
+            spatial_index: Optional spatial index covering exactly ``items``
+                (the model passes its waypoint index for ``model.waypoints``),
+                used by ``nearest`` instead of measuring every waypoint.
+        """
+        super().__init__(items)
+        self._spatial_index = spatial_index
+
     def by_type(self, point_type: str) -> 'WaypointCollection':
         """Filter waypoints by point type (e.g., "VOR", "DME", "NDB", "5LNC")."""
         upper = point_type.upper()
-        return WaypointCollection([
-            w for w in self._items
-            if w.point_type and w.point_type.upper() == upper
-        ])
+        return self.filter(lambda w: w.point_type and w.point_type.upper() == upper)
 
     def by_fir(self, fir_code: str) -> 'WaypointCollection':
         """Filter waypoints by FIR code (checks comma-separated fir_codes field)."""
         upper = fir_code.upper()
-        return WaypointCollection([
-            w for w in self._items
-            if w.fir_codes and upper in [f.strip().upper() for f in w.fir_codes.split(",")]
-        ])
+        return self.filter(
+            lambda w: w.fir_codes and upper in [f.strip().upper() for f in w.fir_codes.split(",")]
+        )
 
     def navaids(self) -> 'WaypointCollection':
         """Filter to only NAVAID waypoints (VOR, DME, NDB, etc.)."""
-        return WaypointCollection([w for w in self._items if w.is_navaid])
+        return self.filter(lambda w: w.is_navaid)
 
     def five_letter_codes(self) -> 'WaypointCollection':
         """Filter to only 5-letter name code waypoints."""
-        return WaypointCollection([
-            w for w in self._items
-            if w.point_type is None or w.point_type == "5LNC"
-        ])
+        return self.filter(lambda w: w.point_type is None or w.point_type == "5LNC")
 
     def by_source(self, source: str) -> 'WaypointCollection':
         """Filter waypoints by data source."""
-        return WaypointCollection([
-            w for w in self._items
-            if w.source == source
-        ])
+        return self.filter(lambda w: w.source == source)
 
     def nearest(self, point: 'NavPoint', count: int = 10) -> 'WaypointCollection':
         """Return the nearest waypoints to a given NavPoint, sorted by distance."""
-        with_dist = []
-        for w in self._items:
-            _, dist = point.haversine_distance(w.navpoint)
-            with_dist.append((dist, w))
-        with_dist.sort(key=lambda x: x[0])
-        return WaypointCollection([w for _, w in with_dist[:count]])
+        if self._spatial_index is not None and self._pending_plan() is None:
+            found = self._spatial_index.nearest(point.longitude, point.latitude, count)
+            return WaypointCollection([w for _, w in found])
+        return WaypointCollection(heapq.nsmallest(
+            count, self, key=lambda w: point.haversine_distance(w.navpoint)[1]
+        ))
 
     def __getitem__(self, key):
         """Support dict-style lookup by waypoint name."""
         if isinstance(key, str):
-            for w in self._items:
+            for w in self:
                 if w.name == key:
                     return w
             raise KeyError(f"Waypoint '{key}' not found")
@@ -80,12 +89,12 @@ class WaypointCollection(QueryableCollection['Waypoint']):
     def __contains__(self, item) -> bool:
         """Support 'name' in collection checks."""
         if isinstance(item, str):
-            return any(w.name == item for w in self._items)
+            return any(w.name == item for w in self)
         return super().__contains__(item)
 
     def get(self, name: str) -> Optional['Waypoint']:
         """Get a waypoint by name, or None if not found."""
-        for w in self._items:
+        for w in self:
             if w.name == name:
                 return w
         return None
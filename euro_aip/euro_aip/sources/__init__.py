@@ -12,6 +12,7 @@ from .worldairports import WorldAirportsSource
 from .database import DatabaseSource
 from .point_de_passage import PointDePassageJournalOfficielSource
 from .border_crossing import BorderCrossingSource
+from .parallel import IngestReport, AirportParseResult
 
 __all__ = [
     'AutorouterSource',
@@ -20,5 +21,7 @@ __all__ = [
     'WorldAirportsSource',
     'DatabaseSource',
     'PointDePassageJournalOfficielSource',
-    'BorderCrossingSource'
+    'BorderCrossingSource',
+    'IngestReport',
+    'AirportParseResult'
 ]
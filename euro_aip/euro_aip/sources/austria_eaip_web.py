@@ -11,12 +11,13 @@ Covers PRI (primary airports), SRY (secondary airfields), and MIL (military).
 import logging
 import re
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import requests
 from bs4 import BeautifulSoup
 
 from .cached import CachedSource
+from .fetcher import HttpFetcher, default_fetcher
 from euro_aip.sources.base import SourceInterface
 from ..parsers.aip_factory import AIPParserFactory
 from ..parsers.procedure_factory import ProcedureParserFactory
@@ -47,9 +48,10 @@ class AustriaEAIPWebSource(CachedSource, SourceInterface):
     AUTHORITY = "LOC"
     SOURCE_NAME = "austria_eaip_pdf"
 
-    def __init__(self, cache_dir: str, airac_date: str):
+    def __init__(self, cache_dir: str, airac_date: str, fetcher: Optional[HttpFetcher] = None):
         super().__init__(cache_dir)
         self.airac_date = airac_date
+        self.fetcher = fetcher or default_fetcher()
         self._airac_code = self._date_to_code(airac_date)
         self._validate_airac_date()
 
@@ -80,6 +82,10 @@ class AustriaEAIPWebSource(CachedSource, SourceInterface):
             return f"{self.airac_date}_{resource_type}_{identifier}.{suffix}"
         return f"{self.airac_date}_{resource_type}.{suffix}"
 
+    def _get_airport_cache_file(self, icao: str) -> Path:
+        """Get the cache file holding an airport document."""
+        return self.cache_path / self._get_cache_key('airport', icao)
+
     def _fetch_with_cache(self, resource_type: str, identifier: str = None, url: str = None) -> bytes:
         cache_key = self._get_cache_key(resource_type, identifier)
 
@@ -89,28 +95,7 @@ class AustriaEAIPWebSource(CachedSource, SourceInterface):
             else:
                 raise ValueError(f"URL required for resource_type={resource_type}")
 
-        cache_file = self.cache_path / cache_key
-
-        if cache_file.exists():
-            file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if file_age.days <= 7:
-                logger.info(f"Using cached {cache_key}")
-                with open(cache_file, 'rb') as f:
-                    return f.read()
-
-        logger.info(f"Downloading {url}")
-        content = self._download(url)
-
-        with open(cache_file, 'wb') as f:
-            f.write(content)
-        logger.info(f"Cached {cache_key}")
-
-        return content
-
-    def _download(self, url: str) -> bytes:
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
-        return resp.content
+        return self._fetch_url(url, self.cache_path / cache_key, max_age_days=7)
 
     def _parse_index_for_airports(self, index_html: bytes) -> Dict[str, Dict[str, str]]:
         """Return mapping of ICAO -> {url, category}."""
@@ -167,7 +152,8 @@ class AustriaEAIPWebSource(CachedSource, SourceInterface):
         if not pdf_data:
             return None
         parser = AIPParserFactory.get_parser(self.AUTHORITY, 'pdf')
-        parsed_data = parser.parse(pdf_data, icao)
+        parsed_data = self._parse_cached(self._get_airport_cache_file(icao), 'aip',
+                                         lambda: parser.parse(pdf_data, icao))
         return {
             'icao': icao,
             'authority': self.AUTHORITY,
@@ -203,6 +189,11 @@ class AustriaEAIPWebSource(CachedSource, SourceInterface):
 
         parser = AIPParserFactory.get_parser(self.AUTHORITY, 'pdf')
 
+        # Download the PDFs concurrently, then parse them in order
+        indexed = [icao for icao in airports_to_process if icao in airport_info]
+        pdfs = dict(zip(indexed, self.fetcher.map(
+            lambda icao: self.fetch_airport_pdf(icao, url=airport_info[icao]['url']), indexed)))
+
         for icao in airports_to_process:
             try:
                 info = airport_info.get(icao)
@@ -210,7 +201,7 @@ class AustriaEAIPWebSource(CachedSource, SourceInterface):
                     logger.debug(f"Skipping {icao} — not in Austria eAIP index")
                     continue
 
-                pdf_data = self.fetch_airport_pdf(icao, url=info['url'])
+                pdf_data = pdfs.get(icao)
                 if not pdf_data:
                     continue
 
@@ -219,7 +210,8 @@ class AustriaEAIPWebSource(CachedSource, SourceInterface):
 
                 airport = model.airports[icao]
 
-                parsed_data = parser.parse(pdf_data, icao)
+                parsed_data = self._parse_cached(self._get_airport_cache_file(icao), 'aip',
+                                                 lambda: parser.parse(pdf_data, icao))
                 if parsed_data:
                     entries = field_service.create_aip_entries_from_parsed_data(icao, parsed_data)
                     if entries:
@@ -230,3 +222,5 @@ class AustriaEAIPWebSource(CachedSource, SourceInterface):
 
             except Exception as e:
                 logger.error(f"Error updating {icao} from Austria eAIP: {e}")
+
+        self.write_cache_manifest()
@@ -10,6 +10,7 @@ from datetime import datetime
 from .cached import CachedSource
 from ..utils.autorouter_credentials import AutorouterCredentialManager
 from euro_aip.sources.base import SourceInterface
+from .parallel import IngestReport, ingest_airports, parse_part
 from ..utils.field_standardization_service import FieldStandardizationService
 from ..parsers import ProcedureParserFactory
 
@@ -310,7 +311,33 @@ class AutorouterSource(CachedSource, SourceInterface):
         
         return result
 
-    def update_model(self, model: 'EuroAipModel', airports: Optional[List[str]] = None) -> None:
+    def parse_airport(self, icao: str) -> Dict[str, Any]:
+        """
+        Fetch and parse an airport's AIP and procedures into plain data.
+
+        This is the slow part of update_model() (downloads when not cached,
+        then CPU-bound PDF table extraction), so update_model(workers=...)
+        runs it in worker processes. Give the source a token or credentials
+        up front when documents still need downloading: workers cannot ask
+        for them.
+
+        Args:
+            icao: ICAO airport code
+
+        Returns:
+            Dictionary with the 'aip' data (see fetch_airport_aip) and the
+            'procedures' list. A part that fails, including a missing file,
+            is left empty and reported under 'errors' (see parse_part), so
+            the other part is still merged.
+        """
+        data: Dict[str, Any] = {}
+        # Parse AIP data from PDF (richer than the pre-parsed JSON)
+        parse_part(data, 'aip', lambda: self.fetch_airport_aip(icao))
+        parse_part(data, 'procedures', lambda: self.get_procedures(icao) or [], default=[])
+        return data
+
+    def update_model(self, model: 'EuroAipModel', airports: Optional[List[str]] = None,
+                     workers: Optional[int] = None) -> Optional[IngestReport]:
         """
         Update the EuroAipModel with data from this source.
         
@@ -318,8 +345,13 @@ class AutorouterSource(CachedSource, SourceInterface):
             model: The EuroAipModel to update
             airports: Optional list of specific airports to process. If None, 
                      the source will process all available airports.
+            workers: Parse airports in this many worker processes; results
+                     are still merged in the order of ``airports``
+
+        Returns:
+            Per-airport timings and failures, None if there was nothing to do
         """
-        from ..models import Airport, Procedure
+        from ..models import Procedure
         
         # Initialize field standardization service
         field_service = FieldStandardizationService()
@@ -330,58 +362,44 @@ class AutorouterSource(CachedSource, SourceInterface):
         
         if not airports:
             logger.warning("No airports found to process")
-            return
+            return None
         
         logger.info(f"Updating model with {len(airports)} airports from Autorouter") 
-        for icao in airports:
-            try:
-                # Get or create airport in model
-                if icao not in model.airports:
-                    model.add_airport(Airport(ident=icao))
 
-                airport = model.airports[icao]
-                
-                # Parse AIP data from PDF (richer than the pre-parsed JSON)
-                aip_data = self.fetch_airport_aip(icao)
-                if aip_data and 'parsed_data' in aip_data:
-                    # Create AIPEntry objects from parsed data
-                    entries = field_service.create_aip_entries_from_parsed_data(icao, aip_data['parsed_data'])
-                    
-                    if entries:
-                        airport.add_aip_entries(entries)
-                        airport.add_source('autorouter')
-                        logger.debug(f"Added {len(entries)} AIP entries for {icao}")
-                
-                # Get procedures
-                procedures_data = self.get_procedures(icao)
-                if procedures_data:
-                    for proc_data in procedures_data:
-                        if proc_data:
-                            proc_type = proc_data.get('type', 'unknown')
-                            if proc_type != 'approach':
-                                continue
+        def merge(airport: 'Airport', data: Dict[str, Any]) -> None:
+            icao = airport.ident
+            aip_data = data['aip']
+            if aip_data and 'parsed_data' in aip_data:
+                # Create AIPEntry objects from parsed data
+                entries = field_service.create_aip_entries_from_parsed_data(icao, aip_data['parsed_data'])
+                if entries:
+                    airport.add_aip_entries(entries)
+                    airport.add_source('autorouter')
+                    logger.debug(f"Added {len(entries)} AIP entries for {icao}")
 
-                            authority = airport.get_authority()
-                            procedure_parser = ProcedureParserFactory.get_parser(authority)
-                            parsed_procedure = procedure_parser.parse(proc_data.get('heading', ''), icao)
-                            
-                            if parsed_procedure:
-                                procedure = Procedure(
-                                    name=parsed_procedure.get('name', ''),
-                                    procedure_type=proc_data.get('type', 'unknown'),
-                                    approach_type=parsed_procedure.get('approach_type', ''),
-                                    runway_ident=parsed_procedure.get('runway_ident'),
-                                    runway_letter=parsed_procedure.get('runway_letter'),
-                                    runway_number=parsed_procedure.get('runway_number'),
-                                    source='autorouter',
-                                    authority=authority,
-                                    raw_name=proc_data.get('heading', ''),
-                                    data=proc_data
-                                )
-                                airport.add_procedure(procedure)
+            for proc_data in data['procedures']:
+                if proc_data:
+                    proc_type = proc_data.get('type', 'unknown')
+                    if proc_type != 'approach':
+                        continue
 
-                
-                logger.debug(f"Updated {icao} with Autorouter data")
-                
-            except Exception as e:
-                logger.error(f"Error updating {icao} with Autorouter data: {e}")
+                    authority = airport.get_authority()
+                    procedure_parser = ProcedureParserFactory.get_parser(authority)
+                    parsed_procedure = procedure_parser.parse(proc_data.get('heading', ''), icao)
+
+                    if parsed_procedure:
+                        procedure = Procedure(
+                            name=parsed_procedure.get('name', ''),
+                            procedure_type=proc_data.get('type', 'unknown'),
+                            approach_type=parsed_procedure.get('approach_type', ''),
+                            runway_ident=parsed_procedure.get('runway_ident'),
+                            runway_letter=parsed_procedure.get('runway_letter'),
+                            runway_number=parsed_procedure.get('runway_number'),
+                            source='autorouter',
+                            authority=authority,
+                            raw_name=proc_data.get('heading', ''),
+                            data=proc_data
+                        )
+                        airport.add_procedure(procedure)
+
+        return ingest_airports(self, model, airports, merge, 'autorouter', workers)
@@ -1,15 +1,56 @@
 from abc import ABC, abstractmethod
 import os
 import json
+import hashlib
+import threading
 import pandas as pd
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Union, Tuple, TypeVar
 from pathlib import Path
 import inspect
 import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Guards CacheStats counters, which fetcher threads update concurrently
+_stats_lock = threading.Lock()
+
+
+@dataclass
+class CacheStats:
+    """
+    Counts of what the cache did during one run of a source.
+
+    Reading a cache file again after it was fetched or read earlier in the
+    run is not another hit: a page fetched by a prefetch and read again by
+    the parsers counts as one miss.
+    """
+    hits: int = 0           # fresh cache file used as is
+    misses: int = 0         # nothing cached, fetched
+    revalidated: int = 0    # expired, server answered 304 Not Modified
+    unchanged: int = 0      # expired, fetched again with the same content hash
+    changed: int = 0        # expired, fetched content differs
+    parse_skipped: int = 0  # parsed result reused because the content hash matched
+
+    # Cache files counted this run
+    _counted: Set[Path] = field(default_factory=set, init=False, repr=False)
+
+    def count(self, outcome: str, cache_file: Optional[Path] = None) -> None:
+        """Count ``outcome`` for ``cache_file``; hits on a file already counted this run are skipped."""
+        with _stats_lock:
+            if cache_file is not None:
+                if outcome == 'hits' and cache_file in self._counted:
+                    return
+                self._counted.add(cache_file)
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+
 class CachedSource(ABC):
     """
     Base class for sources that implement caching.
@@ -18,6 +59,12 @@ class CachedSource(ABC):
     - Caching data to disk in various formats (JSON, CSV, PDF)
     - Checking cache validity based on age
     - Automatically fetching and caching new data when needed
+    - Revalidating expired URLs with conditional requests (ETag/Last-Modified)
+      and reusing parsed results while the content hash is unchanged
+    
+    Metadata for each cached file (URL, ETag, Last-Modified, SHA-256) lives in
+    ``.meta/`` next to the cached files; ``cache_stats`` counts hits, misses and
+    revalidations until write_cache_manifest() appends them to ``manifest.json``.
     
     Key Format:
     The cache key should follow the format: `{base_key}_{parameter}`
@@ -48,6 +95,7 @@ class CachedSource(ABC):
         self.cache_path.mkdir(parents=True, exist_ok=True)
         self._force_refresh = False
         self._never_refresh = False
+        self.cache_stats = CacheStats()
 
     def set_force_refresh(self, force_refresh: bool = True) -> None:
         """
@@ -96,6 +144,155 @@ class CachedSource(ABC):
             return True, None
         return False, "expired"
 
+    def _meta_file(self, cache_file: Path, suffix: str = 'meta') -> Path:
+        """Path of a metadata file kept for ``cache_file``."""
+        return cache_file.parent / '.meta' / f"{cache_file.name}.{suffix}.json"
+
+    def _read_cache_meta(self, cache_file: Path) -> Dict[str, Any]:
+        """Metadata recorded when ``cache_file`` was fetched, or {} if none."""
+        try:
+            with open(self._meta_file(cache_file), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_json(self, path: Path, data: Any) -> None:
+        """Write JSON atomically, so readers never see a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    @staticmethod
+    def _content_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def _record_content(self, cache_file: Path, previous: Optional[Dict[str, Any]], **meta: Any) -> None:
+        """
+        Record ``cache_file``'s hash and metadata after a fetch.
+        
+        ``previous`` is the metadata from before the fetch (None if nothing was
+        cached), used to count the fetch as a miss, a change or no change.
+        """
+        sha256 = self._content_hash(cache_file.read_bytes())
+        if previous is None:
+            self.cache_stats.count('misses', cache_file)
+        elif previous.get('sha256') == sha256:
+            self.cache_stats.count('unchanged', cache_file)
+        else:
+            self.cache_stats.count('changed', cache_file)
+        self._write_json(self._meta_file(cache_file), {
+            **meta, 'sha256': sha256, 'fetched': datetime.now().isoformat(timespec='seconds'),
+        })
+
+    def _fetch_url(self, url: str, cache_file: Path, max_age_days: Optional[int] = None, **kwargs: Any) -> bytes:
+        """
+        Get the content of ``url``, cached in ``cache_file``.
+        
+        A fresh cache file is returned as is. An expired one is revalidated
+        with If-None-Match/If-Modified-Since from its last response, and on
+        304 Not Modified is kept and its age reset. Keyword arguments go to
+        the source's fetcher (``self.fetcher`` or the shared default).
+        
+        Raises:
+            requests.HTTPError: If the server answers with an error status
+        """
+        is_valid, reason = self._is_cache_valid(cache_file, max_age_days)
+        if is_valid:
+            self.cache_stats.count('hits', cache_file)
+            logger.info(f"Using cached {cache_file.name}")
+            return cache_file.read_bytes()
+
+        from .fetcher import default_fetcher
+        fetcher = getattr(self, 'fetcher', None) or default_fetcher()
+        previous = self._read_cache_meta(cache_file) if cache_file.exists() else None
+        headers = dict(kwargs.pop('headers', None) or {})
+        if reason == 'expired' and previous:
+            if previous.get('etag'):
+                headers['If-None-Match'] = previous['etag']
+            if previous.get('last_modified'):
+                headers['If-Modified-Since'] = previous['last_modified']
+
+        logger.info(f"Downloading {url} [{reason}]")
+        response = fetcher.get(url, headers=headers, **kwargs)
+        if response.status_code == 304:
+            cache_file.touch()
+            self.cache_stats.count('revalidated', cache_file)
+            logger.info(f"{cache_file.name} not modified upstream")
+            return cache_file.read_bytes()
+        response.raise_for_status()
+
+        content = response.content
+        if previous and previous.get('sha256') == self._content_hash(content):
+            # Same bytes: keep the file (and parsed results), just reset its age
+            cache_file.touch()
+        else:
+            tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(content)
+            os.replace(tmp, cache_file)
+            logger.info(f"Cached {cache_file.name}")
+        self._record_content(cache_file, previous, url=url,
+                             etag=response.headers.get('ETag'),
+                             last_modified=response.headers.get('Last-Modified'))
+        return content
+
+    def _parse_cached(self, cache_file: Path, name: str, parse: Callable[[], T]) -> T:
+        """
+        Return ``parse()``, reusing the stored result while ``cache_file``'s content hash is unchanged.
+        
+        Results are stored as JSON under ``name``; ones that cannot be
+        serialised are just not stored. A forced refresh always parses.
+        """
+        sha256 = self._read_cache_meta(cache_file).get('sha256')
+        parsed_file = self._meta_file(cache_file, name)
+        if sha256 and not self._force_refresh:
+            try:
+                with open(parsed_file, 'r') as f:
+                    stored = json.load(f)
+                if stored.get('sha256') == sha256:
+                    self.cache_stats.count('parse_skipped')
+                    return stored['data']
+            except (OSError, ValueError, KeyError):
+                pass
+
+        data = parse()
+        if sha256:
+            try:
+                self._write_json(parsed_file, {'sha256': sha256, 'data': data})
+            except TypeError as e:
+                logger.debug(f"Not storing {name} result for {cache_file.name}: {e}")
+        return data
+
+    def write_cache_manifest(self, max_runs: int = 100) -> Path:
+        """
+        Append this run's cache_stats to ``manifest.json`` in the cache directory and reset them.
+        
+        Args:
+            max_runs: Number of most recent runs kept in the manifest
+            
+        Returns:
+            Path of the manifest
+        """
+        manifest_file = self.cache_path / 'manifest.json'
+        try:
+            with open(manifest_file, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {'source': self.source_name, 'runs': []}
+        stats = self.cache_stats.to_dict()
+        manifest['runs'] = (manifest.get('runs', []) + [
+            {'time': datetime.now().isoformat(timespec='seconds'), **stats}
+        ])[-max_runs:]
+        self._write_json(manifest_file, manifest)
+        logger.info(f"{self.source_name} cache: " + ", ".join(f"{k} {v}" for k, v in stats.items()))
+        self.cache_stats = CacheStats()
+        return manifest_file
+
     def _save_to_cache(self, data: Any, key: str, ext: str) -> None:
         """Save data to cache with the specified extension."""
         cache_file = self._get_cache_file(key, ext)
@@ -169,8 +366,10 @@ class CachedSource(ABC):
         
         is_valid, reason = self._is_cache_valid(cache_file, max_age_days)
         if is_valid:
+            self.cache_stats.count('hits', cache_file)
             logger.info(f"{cache_file.name} retrieved from cache {self.source_name}")
             return self._load_from_cache(cache_key, ext)
+        previous = self._read_cache_meta(cache_file) if cache_file.exists() else None
             
         # Validate that the fetch method exists
         self._validate_fetch_method(key)
@@ -189,6 +388,7 @@ class CachedSource(ABC):
         
         # Save to cache
         self._save_to_cache(data, cache_key, ext)
+        self._record_content(cache_file, previous)
         logger.info(f"{cache_file.name} [{reason}] fetched using {fetch_method.__name__}")
         
         return data
@@ -1,11 +1,10 @@
 #!/usr/bin/env python3
 
-import sqlite3
 from pathlib import Path
 from typing import Optional, Dict, List
-from contextlib import contextmanager
 from ..models.airport import Airport
 from ..models.runway import Runway
+from ..storage.connection_pool import ConnectionPool
 
 class DatabaseSource:
     """
@@ -26,11 +25,14 @@ class DatabaseSource:
         self.database_path = Path(database_path)
         if not self.database_path.exists():
             raise FileNotFoundError(f"Database file not found: {database_path}")
+        self._pool = ConnectionPool(self.database_path, read_only=True)
 
-    @contextmanager
     def get_connection(self):
         """
         Get a database connection.
+
+        Each thread reuses its own read-only connection from a pool, so
+        repeated queries skip reconnecting and recompiling their statements.
         
         Yields:
             sqlite3.Connection: A connection to the database
@@ -41,12 +43,11 @@ class DatabaseSource:
                 cursor.execute("SELECT * FROM airports")
                 rows = cursor.fetchall()
         """
-        conn = sqlite3.connect(str(self.database_path))
-        conn.row_factory = sqlite3.Row  # Enable row factory for named access
-        try:
-            yield conn
-        finally:
-            conn.close()
+        return self._pool.reader()
+
+    def close(self) -> None:
+        """Close the pooled connections; they are reopened when next needed."""
+        self._pool.close()
 
     def get_table_info(self, table_name: str) -> Optional[dict]:
         """
@@ -0,0 +1,251 @@
+"""
+Shared HTTP fetch layer for the web sources.
+
+HttpFetcher wraps ``requests`` with what fetching a whole AIRAC needs:
+
+- pooled keep-alive connections (one Session per thread, reused across calls)
+- bounded concurrency: map() runs a function over items on a thread pool
+  kept for the fetcher's lifetime, so its threads and their sessions are
+  reused by later calls
+- per-host rate limits and a per-host cap on requests in flight
+- retries with exponential backoff on connection errors, timeouts and
+  429/5xx responses, honouring ``Retry-After``
+
+Sources take an optional ``fetcher`` and otherwise share default_fetcher(),
+so their limits apply across sources fetching from the same host.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class _HostLimit:
+    """Spaces requests to one host at least ``interval`` seconds apart, at most ``concurrency`` at once."""
+
+    def __init__(self, interval: float, concurrency: int):
+        self.interval = interval
+        self.slots = threading.BoundedSemaphore(concurrency)
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class HttpFetcher:
+    """
+    Pooled, rate-limited HTTP client with retries.
+
+    Example:
+        fetcher = HttpFetcher(max_workers=8, rate_limits={'www.aurora.nats.co.uk': 4})
+        pages = fetcher.map(lambda url: fetcher.fetch(url), urls)
+    """
+
+    # Responses worth retrying; others (404, 403, ...) are returned or raised at once
+    RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, max_workers: int = 8, max_per_host: int = 4,
+                 requests_per_second: Optional[float] = 5.0,
+                 rate_limits: Optional[Dict[str, float]] = None,
+                 retries: int = 3, backoff: float = 0.5, max_backoff: float = 30.0,
+                 timeout: float = 30.0, headers: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            max_workers: Threads used by map()
+            max_per_host: Requests in flight to one host at a time
+            requests_per_second: Default rate limit per host (None for no limit)
+            rate_limits: Requests per second for specific hosts, overriding the default
+            retries: Retries after the first attempt for retryable failures
+            backoff: First retry delay in seconds, doubled on each retry
+            max_backoff: Longest delay between retries, also caps Retry-After
+            timeout: Default request timeout in seconds
+            headers: Headers sent with every request
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_per_host = max(1, max_per_host)
+        self.requests_per_second = requests_per_second
+        self.rate_limits = dict(rate_limits or {})
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, _HostLimit] = {}
+        self._local = threading.local()
+        self._sessions: Dict[threading.Thread, requests.Session] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pool_thread = threading.local()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.max_per_host, pool_maxsize=self.max_per_host)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update(self.headers)
+            self._local.session = session
+            # Threads come and go (callers' own, or pools that were shut
+            # down): close the sessions of those that have exited
+            with self._lock:
+                stale = [thread for thread in self._sessions if not thread.is_alive()]
+                closing = [self._sessions.pop(thread) for thread in stale]
+                self._sessions[threading.current_thread()] = session
+            for old in closing:
+                old.close()
+        return session
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='fetch',
+                                                    initializer=self._mark_pool_thread)
+            return self._executor
+
+    def _mark_pool_thread(self) -> None:
+        self._pool_thread.active = True
+
+    def _host_limit(self, url: str) -> _HostLimit:
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            limit = self._hosts.get(host)
+            if limit is None:
+                rate = self.rate_limits.get(host, self.requests_per_second)
+                limit = self._hosts[host] = _HostLimit(1.0 / rate if rate else 0.0, self.max_per_host)
+            return limit
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        delay = self.backoff * (2 ** attempt)
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    pass
+        return min(max(delay, 0.0), self.max_backoff)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through the pool, waiting for the host's rate limit and retrying.
+
+        Keyword arguments go to ``requests.Session.request`` (``timeout``
+        defaults to the fetcher's). The last response is returned even if
+        its status is an error; connection errors are raised after the
+        last retry.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        limit = self._host_limit(url)
+        attempt = 0
+        while True:
+            response = None
+            error: Optional[requests.RequestException] = None
+            with limit.slots:
+                limit.wait()
+                try:
+                    response = self._session().request(method, url, **kwargs)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    error = e
+            if error is None and response.status_code not in self.RETRY_STATUS:
+                return response
+            if attempt >= self.retries:
+                if error is not None:
+                    raise error
+                return response
+            delay = self._retry_delay(attempt, response)
+            reason = error or f"HTTP {response.status_code}"
+            logger.warning(f"{method} {url} failed ({reason}), retry {attempt + 1}/{self.retries} in {delay:.1f}s")
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """GET ``url`` (see request())."""
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        """HEAD ``url`` (see request())."""
+        return self.request('HEAD', url, **kwargs)
+
+    def fetch(self, url: str, **kwargs: Any) -> bytes:
+        """GET ``url`` and return its content, raising ``requests.HTTPError`` for error statuses."""
+        response = self.get(url, **kwargs)
+        response.raise_for_status()
+        return response.content
+
+    def map(self, func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """
+        Call ``func`` on every item over the thread pool, returning results in item order.
+
+        Meant for functions that fetch through this fetcher (concurrency per
+        host is still capped by ``max_per_host``). The first exception raised
+        by ``func`` is re-raised once all calls are done. The pool is shared
+        by all calls; a map() from inside ``func`` runs in the calling thread.
+        """
+        items = list(items)
+        if self.max_workers == 1 or len(items) <= 1 or getattr(self._pool_thread, 'active', False):
+            return [func(item) for item in items]
+        executor = self._pool()
+        futures = [executor.submit(func, item) for item in items]
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Stop the thread pool and close the pooled connections; both are reopened when needed."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+            self._local = threading.local()
+        for session in sessions.values():
+            session.close()
+
+    def __reduce__(self):
+        # Sessions, threads and locks stay behind; the copy opens its own
+        return (_rebuild, (self.__class__, {
+            'max_workers': self.max_workers, 'max_per_host': self.max_per_host,
+            'requests_per_second': self.requests_per_second, 'rate_limits': self.rate_limits,
+            'retries': self.retries, 'backoff': self.backoff, 'max_backoff': self.max_backoff,
+            'timeout': self.timeout, 'headers': self.headers,
+        }))
+
+
+def _rebuild(cls: type, kwargs: Dict[str, Any]) -> HttpFetcher:
+    return cls(**kwargs)
+
+
+_default_fetcher: Optional[HttpFetcher] = None
+_default_lock = threading.Lock()
+
+
+def default_fetcher() -> HttpFetcher:
+    """The fetcher shared by sources created without one."""
+    global _default_fetcher
+    with _default_lock:
+        if _default_fetcher is None:
+            _default_fetcher = HttpFetcher()
+        return _default_fetcher
@@ -5,11 +5,12 @@ import re
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin, urldefrag
 from datetime import datetime
+from pathlib import Path
 
-import requests
 from bs4 import BeautifulSoup
 
 from .cached import CachedSource
+from .fetcher import HttpFetcher, default_fetcher
 from euro_aip.sources.base import SourceInterface
 from ..parsers.aip_factory import AIPParserFactory
 from ..parsers.procedure_factory import ProcedureParserFactory
@@ -37,7 +38,8 @@ class FranceEAIPWebSource(CachedSource, SourceInterface):
     BASE_URL = "https://www.sia.aviation-civile.gouv.fr/media/dvd"
     FRANCE_PATH = "FRANCE"
 
-    def __init__(self, cache_dir: str, airac_date: str, eaip_date: str = None):
+    def __init__(self, cache_dir: str, airac_date: str, eaip_date: str = None,
+                 fetcher: Optional[HttpFetcher] = None):
         """
         Initialize France eAIP web source.
         
@@ -45,10 +47,12 @@ class FranceEAIPWebSource(CachedSource, SourceInterface):
             cache_dir: Directory for caching files
             airac_date: AIRAC effective date in YYYY-MM-DD format
             eaip_date: eAIP date in YYYY-MM-DD format (defaults to airac_date if not provided)
+            fetcher: HTTP fetcher to use (defaults to the shared one)
         """
         super().__init__(cache_dir)
         self.airac_date = airac_date
         self.eaip_date = eaip_date if eaip_date is not None else airac_date
+        self.fetcher = fetcher or default_fetcher()
         self._validate_airac_date()
         self._validate_eaip_date()
 
@@ -123,6 +127,10 @@ class FranceEAIPWebSource(CachedSource, SourceInterface):
         else:
             return f"{self.airac_date}_{resource_type}.html"
 
+    def _get_airport_cache_file(self, icao: str) -> Path:
+        """Get the cache file holding an airport page."""
+        return self.cache_path / self._get_cache_key('airport', icao)
+
     def _fetch_with_cache(self, resource_type: str, identifier: str = None, url: str = None) -> bytes:
         """
         Fetch content with caching using human-readable keys.
@@ -151,35 +159,7 @@ class FranceEAIPWebSource(CachedSource, SourceInterface):
         
         logger.debug(f"Fetching {resource_type} {identifier or ''} from {url}")
         
-        # Simple file-based caching
-        cache_file = self.cache_path / cache_key
-        
-        # Check if cache is valid (7 days)
-        if cache_file.exists():
-            file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if file_age.days <= 7:
-                logger.info(f"Using cached {cache_key}")
-                with open(cache_file, 'rb') as f:
-                    return f.read()
-        
-        # Download and cache
-        logger.info(f"Downloading {url}")
-        content = self._download(url)
-        
-        # Save to cache
-        with open(cache_file, 'wb') as f:
-            f.write(content)
-        logger.info(f"Cached {cache_key}")
-        
-        return content
-
-    def _download(self, url: str) -> bytes:
-        """Download content from URL."""
-        logger.info(f"Downloading {url}")
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
-        return resp.content
-
+        return self._fetch_url(url, self.cache_path / cache_key, max_age_days=7)
 
     def _parse_index_for_airports(self, index_html: bytes) -> Dict[str, str]:
         """Return mapping of ICAO -> absolute airport page URL (no fragment)."""
@@ -294,7 +274,8 @@ class FranceEAIPWebSource(CachedSource, SourceInterface):
         if not html_bytes:
             return None
         parser = AIPParserFactory.get_parser('LFC', 'html')
-        parsed_data = parser.parse(html_bytes, icao)
+        parsed_data = self._parse_cached(self._get_airport_cache_file(icao), 'aip',
+                                         lambda: parser.parse(html_bytes, icao))
         return {
             'icao': icao,
             'authority': 'LFC',
@@ -306,7 +287,8 @@ class FranceEAIPWebSource(CachedSource, SourceInterface):
         if not html_bytes:
             return []
         parser = AIPParserFactory.get_parser('LFC', 'html')
-        return parser.extract_procedures(html_bytes, icao)
+        return self._parse_cached(self._get_airport_cache_file(icao), 'procedures',
+                                  lambda: parser.extract_procedures(html_bytes, icao))
 
     def get_airport_aip(self, icao: str, max_age_days: int = 28) -> Optional[Dict[str, Any]]:
         # Use caching keyed by URL for index and airport pages via _http_get.
@@ -334,6 +316,9 @@ class FranceEAIPWebSource(CachedSource, SourceInterface):
 
         logger.info(f"Updating model from France eAIP web source for {len(airports)} airports")
 
+        # Download airport pages concurrently into the cache; parsing below reads them back
+        self.fetcher.map(self.fetch_airport_html, airports)
+
         for icao in airports:
             try:
                 if icao not in model.airports:
@@ -373,4 +358,6 @@ class FranceEAIPWebSource(CachedSource, SourceInterface):
             except Exception as e:
                 logger.error(f"Error updating {icao} from France eAIP web source: {e}")
 
+        self.write_cache_manifest()
+
 
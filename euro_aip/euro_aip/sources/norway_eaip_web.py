@@ -10,11 +10,12 @@ import logging
 import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+from pathlib import Path
 
-import requests
 from bs4 import BeautifulSoup
 
 from .cached import CachedSource
+from .fetcher import HttpFetcher, default_fetcher
 from euro_aip.sources.base import SourceInterface
 from ..parsers.aip_factory import AIPParserFactory
 from ..parsers.procedure_factory import ProcedureParserFactory
@@ -42,16 +43,18 @@ class NorwayEAIPWebSource(CachedSource, SourceInterface):
     AIP_ROOT_URL = "https://aim-prod.avinor.no/no/AIP/"
     AIP_HOST = "https://aim-prod.avinor.no"
 
-    def __init__(self, cache_dir: str, airac_date: str):
+    def __init__(self, cache_dir: str, airac_date: str, fetcher: Optional[HttpFetcher] = None):
         """
         Initialize Norway eAIP web source.
 
         Args:
             cache_dir: Directory for caching files
             airac_date: AIRAC effective date in YYYY-MM-DD format
+            fetcher: HTTP fetcher to use (defaults to the shared one)
         """
         super().__init__(cache_dir)
         self.airac_date = airac_date
+        self.fetcher = fetcher or default_fetcher()
         self._base_url = None
         self._validate_airac_date()
 
@@ -68,7 +71,7 @@ class NorwayEAIPWebSource(CachedSource, SourceInterface):
         https://aim-prod.avinor.no/no/AIP/ redirects to /no/AIP/View/Index/{N}
         where {N} is the current publication index (changes each AIRAC cycle).
         """
-        resp = requests.head(self.AIP_ROOT_URL, allow_redirects=False, timeout=10)
+        resp = self.fetcher.head(self.AIP_ROOT_URL, allow_redirects=False, timeout=10)
         if resp.status_code in (301, 302) and 'Location' in resp.headers:
             location = resp.headers['Location']
             # Location is relative like /no/AIP/View/Index/152
@@ -76,7 +79,7 @@ class NorwayEAIPWebSource(CachedSource, SourceInterface):
                 return f"{self.AIP_HOST}{location}"
             return location
         # Fallback: try GET if HEAD is not allowed
-        resp = requests.get(self.AIP_ROOT_URL, allow_redirects=False, timeout=10)
+        resp = self.fetcher.get(self.AIP_ROOT_URL, allow_redirects=False, timeout=10)
         if resp.status_code in (301, 302) and 'Location' in resp.headers:
             location = resp.headers['Location']
             if location.startswith('/'):
@@ -129,6 +132,10 @@ class NorwayEAIPWebSource(CachedSource, SourceInterface):
         else:
             return f"{self.airac_date}_{resource_type}.html"
 
+    def _get_airport_cache_file(self, icao: str) -> Path:
+        """Get the cache file holding an airport document."""
+        return self.cache_path / self._get_cache_key('airport', icao)
+
     def _fetch_with_cache(self, resource_type: str, identifier: str = None, url: str = None) -> bytes:
         """
         Fetch content with caching using human-readable keys.
@@ -153,33 +160,7 @@ class NorwayEAIPWebSource(CachedSource, SourceInterface):
 
         logger.debug(f"Fetching {resource_type} {identifier or ''} from {url}")
 
-        # Simple file-based caching
-        cache_file = self.cache_path / cache_key
-
-        # Check if cache is valid (7 days)
-        if cache_file.exists():
-            file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if file_age.days <= 7:
-                logger.info(f"Using cached {cache_key}")
-                with open(cache_file, 'rb') as f:
-                    return f.read()
-
-        # Download and cache
-        logger.info(f"Downloading {url}")
-        content = self._download(url)
-
-        # Save to cache
-        with open(cache_file, 'wb') as f:
-            f.write(content)
-        logger.info(f"Cached {cache_key}")
-
-        return content
-
-    def _download(self, url: str) -> bytes:
-        """Download content from URL."""
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
-        return resp.content
+        return self._fetch_url(url, self.cache_path / cache_key, max_age_days=7)
 
     def _parse_index_for_airports(self, index_html: bytes) -> Dict[str, str]:
         """Return mapping of ICAO -> absolute airport page URL."""
@@ -223,7 +204,8 @@ class NorwayEAIPWebSource(CachedSource, SourceInterface):
             return None
         # Use ENC parser (which uses same format as EGC)
         parser = AIPParserFactory.get_parser('ENC', 'html')
-        parsed_data = parser.parse(html_bytes, icao)
+        parsed_data = self._parse_cached(self._get_airport_cache_file(icao), 'aip',
+                                         lambda: parser.parse(html_bytes, icao))
         return {
             'icao': icao,
             'authority': 'ENC',
@@ -236,7 +218,8 @@ class NorwayEAIPWebSource(CachedSource, SourceInterface):
         if not html_bytes:
             return []
         parser = AIPParserFactory.get_parser('ENC', 'html')
-        return parser.extract_procedures(html_bytes, icao)
+        return self._parse_cached(self._get_airport_cache_file(icao), 'procedures',
+                                  lambda: parser.extract_procedures(html_bytes, icao))
 
     def get_airport_aip(self, icao: str, max_age_days: int = 28) -> Optional[Dict[str, Any]]:
         """Get AIP data for an airport (SourceInterface method)."""
@@ -265,10 +248,12 @@ class NorwayEAIPWebSource(CachedSource, SourceInterface):
 
         logger.info(f"Updating model from Norway eAIP web source for {len(airports)} airports")
 
+        # Fetch HTML once per airport, concurrently, for both AIP and procedures
+        pages = dict(zip(airports, self.fetcher.map(self.fetch_airport_html, airports)))
+
         for icao in airports:
             try:
-                # Fetch HTML once for both AIP and procedures
-                html_bytes = self.fetch_airport_html(icao)
+                html_bytes = pages[icao]
                 if not html_bytes:
                     continue
 
@@ -279,7 +264,8 @@ class NorwayEAIPWebSource(CachedSource, SourceInterface):
 
                 # Parse AIP entries
                 parser = AIPParserFactory.get_parser('ENC', 'html')
-                parsed_data = parser.parse(html_bytes, icao)
+                parsed_data = self._parse_cached(self._get_airport_cache_file(icao), 'aip',
+                                                 lambda: parser.parse(html_bytes, icao))
                 if parsed_data:
                     entries = field_service.create_aip_entries_from_parsed_data(icao, parsed_data)
                     if entries:
@@ -287,7 +273,8 @@ class NorwayEAIPWebSource(CachedSource, SourceInterface):
                         airport.add_source('norway_eaip_html')
 
                 # Parse procedures from same HTML
-                procedures_data = parser.extract_procedures(html_bytes, icao)
+                procedures_data = self._parse_cached(self._get_airport_cache_file(icao), 'procedures',
+                                                     lambda: parser.extract_procedures(html_bytes, icao))
                 if procedures_data:
                     for proc_data in procedures_data:
                         parsed = proc_data
@@ -309,3 +296,5 @@ class NorwayEAIPWebSource(CachedSource, SourceInterface):
 
             except Exception as e:
                 logger.error(f"Error updating {icao} from Norway eAIP web source: {e}")
+
+        self.write_cache_manifest()
@@ -20,6 +20,7 @@ from ..models.waypoint import Waypoint
 from ..utils.dms_parser import parse_dms
 from .base import SourceInterface
 from .cached import CachedSource
+from .fetcher import HttpFetcher, default_fetcher
 
 logger = logging.getLogger(__name__)
 
@@ -82,14 +83,17 @@ class OpenNavSource(CachedSource, SourceInterface):
     All waypoints on a country page are on a single page (no pagination).
     """
 
-    def __init__(self, cache_dir: str, countries: Optional[List[str]] = None):
+    def __init__(self, cache_dir: str, countries: Optional[List[str]] = None,
+                 fetcher: Optional[HttpFetcher] = None):
         """
         Args:
             cache_dir: Directory for caching downloaded pages.
             countries: List of country codes to fetch. Defaults to EUROPEAN_COUNTRIES.
+            fetcher: HTTP fetcher to use. Defaults to the shared one.
         """
         super().__init__(cache_dir)
         self.countries = countries or EUROPEAN_COUNTRIES
+        self.fetcher = fetcher or default_fetcher()
 
     def update_model(self, model: EuroAipModel, airports: Optional[List[str]] = None) -> None:
         """Update the model with OpenNav waypoints for all configured countries."""
@@ -106,15 +110,19 @@ class OpenNavSource(CachedSource, SourceInterface):
         Keeps all candidates — duplicate names from different countries are
         stored separately and resolved by proximity at query time.
         """
-        all_waypoints: List[Waypoint] = []
-
-        for country in self.countries:
+        def fetch(country: str) -> List[Waypoint]:
             try:
                 country_wps = self._get_country_waypoints(country, max_age_days)
-                all_waypoints.extend(country_wps)
                 logger.info("OpenNav %s: %d waypoints", country, len(country_wps))
+                return country_wps
             except Exception as e:
                 logger.warning("OpenNav %s: failed to fetch: %s", country, e)
+                return []
+
+        # Countries are fetched concurrently; results keep the configured order
+        all_waypoints: List[Waypoint] = []
+        for country_wps in self.fetcher.map(fetch, self.countries):
+            all_waypoints.extend(country_wps)
 
         logger.info("OpenNav total: %d waypoints from %d countries",
                      len(all_waypoints), len(self.countries))
@@ -142,7 +150,7 @@ class OpenNavSource(CachedSource, SourceInterface):
         """Download the waypoint page for a country."""
         url = f"{BASE_URL}/{country}"
         try:
-            response = requests.get(url, timeout=30)
+            response = self.fetcher.get(url)
             if response.status_code == 404:
                 logger.debug("OpenNav: no page for %s", country)
                 return None
@@ -0,0 +1,252 @@
+"""
+Parallel per-airport parsing for AIP sources.
+
+Parsing an airport's AD 2 document (camelot/pdfplumber table extraction in
+the AIP parsers) is CPU-bound and takes seconds per document, so sources that
+parse one document per airport split update_model() in two steps:
+
+1. ``source.parse_airport(icao)`` reads and parses the airport's documents and
+   returns plain data (dicts and lists), so it can run in a worker process.
+   Documents parsed separately (AIP, procedures) go through parse_part(), so
+   one failing part leaves the others to be merged.
+2. The source merges each result into the model, on the main process, in the
+   order the airports were given.
+
+parse_airports() runs step 1 sequentially or over a process pool and yields
+an AirportParseResult per airport, in order. ingest_airports() drives both
+steps and returns an IngestReport with per-airport timings and failures.
+"""
+
+import logging
+import multiprocessing
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from ..models.airport import Airport
+from ..models.euro_aip_model import EuroAipModel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AirportParseResult:
+    """Outcome of parsing one airport's documents."""
+
+    icao: str
+    data: Optional[Dict[str, Any]] = None   # what parse_airport() returned
+    missing: bool = False                   # the source has no document for the airport
+    error: Optional[str] = None             # exception message when parsing failed
+    seconds: float = 0.0                    # parse time, in the process that parsed it
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing and self.error is None
+
+    @property
+    def mergeable(self) -> bool:
+        """True if there is data to merge, possibly with some parts failed."""
+        return not self.missing and self.data is not None
+
+
+@dataclass
+class IngestReport:
+    """Per-airport timings and failures of one update_model() run."""
+
+    source: str
+    workers: int = 1
+    results: List[AirportParseResult] = field(default_factory=list)
+    seconds: float = 0.0                    # wall time, parsing and merging
+
+    @property
+    def failed(self) -> List[AirportParseResult]:
+        return [result for result in self.results if result.error is not None]
+
+    @property
+    def missing(self) -> List[AirportParseResult]:
+        return [result for result in self.results if result.missing]
+
+    @property
+    def parse_seconds(self) -> float:
+        """Parse time summed over airports (more than ``seconds`` when parallel)."""
+        return sum(result.seconds for result in self.results)
+
+    def slowest(self, count: int = 10) -> List[AirportParseResult]:
+        return sorted(self.results, key=lambda result: result.seconds, reverse=True)[:count]
+
+    def log_summary(self) -> None:
+        logger.info(
+            f"{self.source}: {len(self.results)} airports in {self.seconds:.1f}s "
+            f"({self.parse_seconds:.1f}s parsing, {self.workers} worker(s)), "
+            f"{len(self.missing)} missing, {len(self.failed)} failed"
+        )
+        for result in self.slowest(3):
+            logger.debug(f"{self.source}: {result.icao} took {result.seconds:.2f}s")
+
+
+def parse_part(data: Dict[str, Any], part: str, parse: Callable[[], Any], default: Any = None) -> None:
+    """
+    Set ``data[part]`` to ``parse()``, or to ``default`` if it raises.
+
+    For parse_airport() implementations: the error is recorded under
+    ``data['errors'][part]`` and reported on the airport's result, while the
+    parts that did parse are still merged.
+    """
+    try:
+        data[part] = parse()
+    except Exception as e:
+        data[part] = default
+        data.setdefault('errors', {})[part] = str(e) or type(e).__name__
+        logger.debug(f"Parsing {part} failed:\n{traceback.format_exc()}")
+
+
+def _parse_one(source: Any, icao: str) -> AirportParseResult:
+    start = time.perf_counter()
+    result = AirportParseResult(icao)
+    try:
+        result.data = source.parse_airport(icao)
+        errors = result.data.get('errors') if isinstance(result.data, dict) else None
+        if errors:
+            result.error = '; '.join(f"{part}: {message}" for part, message in errors.items())
+    except FileNotFoundError:
+        result.missing = True
+    except Exception as e:
+        result.error = str(e) or type(e).__name__
+        logger.debug(f"Parsing {icao} failed:\n{traceback.format_exc()}")
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+# The source each worker process parses with, set once by the pool initializer
+_worker_source: Any = None
+# Flags in shared memory, one per airport of the run, set by the worker that
+# starts parsing it: after a worker dies they tell which airports it may have
+# been parsing
+_worker_started: Any = None
+
+
+def _init_worker(source: Any, started: Any) -> None:
+    global _worker_source, _worker_started
+    _worker_source = source
+    _worker_started = started
+
+
+def _parse_in_worker(index: int, icao: str) -> AirportParseResult:
+    _worker_started[index] = 1
+    return _parse_one(_worker_source, icao)
+
+
+def _parse_alone(source: Any, icao: str) -> AirportParseResult:
+    """Parse one airport in a pool of its own, so a worker dying only fails this airport."""
+    started = multiprocessing.Array('b', 1, lock=False)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=1, initializer=_init_worker, initargs=(source, started)) as executor:
+        try:
+            return executor.submit(_parse_in_worker, 0, icao).result()
+        except BrokenProcessPool as e:
+            return AirportParseResult(icao, error=f"worker process died: {e}",
+                                      seconds=time.perf_counter() - start)
+
+
+def parse_airports(source: Any, airports: List[str], workers: Optional[int] = None) -> Iterator[AirportParseResult]:
+    """
+    Parse airports with ``source.parse_airport``, yielding results in the order of ``airports``.
+
+    Exceptions do not stop the run: a FileNotFoundError marks the airport as
+    missing, any other error is recorded on its result, as are the parts
+    that failed (see parse_part) of an airport that otherwise parsed.
+
+    A worker process dying (out of memory, a crash in the PDF libraries)
+    does not stop it either. The airports that had not started are parsed
+    in a fresh pool; those that had are parsed again one at a time in a
+    pool of their own, and the one that kills its worker again is recorded
+    as failed.
+
+    Args:
+        source: Source with a parse_airport(icao) method returning plain data;
+                it is pickled once per worker process
+        airports: ICAO codes to parse
+        workers: Number of worker processes; None or 1 parses in this process
+    """
+    if not workers or workers <= 1 or len(airports) <= 1:
+        for icao in airports:
+            yield _parse_one(source, icao)
+        return
+    results: Dict[int, AirportParseResult] = {}
+    position = 0  # next result to yield
+    queue = list(range(len(airports)))
+    while queue:
+        started = multiprocessing.Array('b', len(airports), lock=False)
+        retry: List[int] = []
+        suspects: List[int] = []
+        with ProcessPoolExecutor(max_workers=min(workers, len(queue)),
+                                 initializer=_init_worker, initargs=(source, started)) as executor:
+            # Workers take airports as they free up; results are yielded in order
+            futures = [(index, executor.submit(_parse_in_worker, index, airports[index])) for index in queue]
+            for index, future in futures:
+                try:
+                    results[index] = future.result()
+                except BrokenProcessPool:
+                    (suspects if started[index] else retry).append(index)
+                while position in results:
+                    yield results.pop(position)
+                    position += 1
+        if suspects:
+            logger.warning(f"A worker process died while parsing {', '.join(airports[i] for i in suspects)}; "
+                           f"parsing them again one at a time")
+        for index in suspects:
+            results[index] = _parse_alone(source, airports[index])
+        if retry and len(retry) == len(queue):
+            # The pool broke before parsing anything (e.g. the source failed to unpickle)
+            for index in retry:
+                results[index] = AirportParseResult(airports[index], error="worker pool failed to start")
+            retry = []
+        while position in results:
+            yield results.pop(position)
+            position += 1
+        queue = retry
+
+
+def ingest_airports(source: Any, model: EuroAipModel, airports: List[str],
+                    merge: Callable[[Airport, Dict[str, Any]], None], source_name: str,
+                    workers: Optional[int] = None) -> IngestReport:
+    """
+    Parse airports (in parallel with ``workers``) and merge each into the model in order.
+
+    Every airport is added to the model if absent, as the sequential loops
+    did, then ``merge(airport, data)`` is called on the main process for the
+    airports that parsed, including those with some failed parts (their
+    ``data[part]`` is the part's default). Errors, in parsing or merging,
+    are logged and recorded on the report instead of stopping the run.
+
+    Args:
+        source: Source with a parse_airport(icao) method
+        model: Model to update
+        airports: ICAO codes, in the order to merge them
+        merge: Adds one airport's parsed data to its Airport
+        source_name: Name used in logs and the report, e.g. 'france_eaip'
+        workers: Worker processes for parsing; None or 1 parses in this process
+    """
+    report = IngestReport(source_name, workers=max(workers or 1, 1))
+    start = time.perf_counter()
+    for result in parse_airports(source, airports, workers):
+        report.results.append(result)
+        icao = result.icao
+        try:
+            if icao not in model.airports:
+                model.add_airport(Airport(ident=icao))
+            if result.mergeable:
+                merge(model.airports[icao], result.data)
+                logger.debug(f"Updated {icao} with {source_name} data in {result.seconds:.2f}s")
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+        if result.error is not None:
+            logger.error(f"Error updating {icao} with {source_name} data: {result.error}")
+    report.seconds = time.perf_counter() - start
+    if report.missing:
+        logger.info(f"{len(report.missing)}/{len(airports)} Airports not found in {source_name} source")
+    report.log_summary()
+    return report
@@ -11,12 +11,13 @@ Covers both AD-2 (IFR aerodromes) and AD-4 (VFR aerodromes).
 import logging
 import re
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import requests
 from bs4 import BeautifulSoup
 
 from .cached import CachedSource
+from .fetcher import HttpFetcher, default_fetcher
 from euro_aip.sources.base import SourceInterface
 from ..parsers.aip_factory import AIPParserFactory
 from ..parsers.procedure_factory import ProcedureParserFactory
@@ -46,9 +47,10 @@ class SloveniaEAIPWebSource(CachedSource, SourceInterface):
     AUTHORITY = "ENC"
     SOURCE_NAME = "slovenia_eaip_html"
 
-    def __init__(self, cache_dir: str, airac_date: str):
+    def __init__(self, cache_dir: str, airac_date: str, fetcher: Optional[HttpFetcher] = None):
         super().__init__(cache_dir)
         self.airac_date = airac_date
+        self.fetcher = fetcher or default_fetcher()
         self._validate_airac_date()
 
     def supported_icao_prefixes(self) -> List[str]:
@@ -75,6 +77,10 @@ class SloveniaEAIPWebSource(CachedSource, SourceInterface):
             return f"{self.airac_date}_{resource_type}_{identifier}.html"
         return f"{self.airac_date}_{resource_type}.html"
 
+    def _get_airport_cache_file(self, icao: str) -> Path:
+        """Get the cache file holding an airport document."""
+        return self.cache_path / self._get_cache_key('airport', icao)
+
     def _fetch_with_cache(self, resource_type: str, identifier: str = None, url: str = None) -> bytes:
         cache_key = self._get_cache_key(resource_type, identifier)
 
@@ -86,29 +92,8 @@ class SloveniaEAIPWebSource(CachedSource, SourceInterface):
             else:
                 raise ValueError(f"Cannot construct URL for resource_type={resource_type}, identifier={identifier}")
 
-        cache_file = self.cache_path / cache_key
-
-        if cache_file.exists():
-            file_age = datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if file_age.days <= 7:
-                logger.info(f"Using cached {cache_key}")
-                with open(cache_file, 'rb') as f:
-                    return f.read()
-
-        logger.info(f"Downloading {url}")
-        content = self._download(url)
-
-        with open(cache_file, 'wb') as f:
-            f.write(content)
-        logger.info(f"Cached {cache_key}")
-
-        return content
-
-    def _download(self, url: str) -> bytes:
         # Slovenia Control's SSL cert may have issues; verify=False is needed
-        resp = requests.get(url, timeout=30, verify=False)
-        resp.raise_for_status()
-        return resp.content
+        return self._fetch_url(url, self.cache_path / cache_key, max_age_days=7, verify=False)
 
     def _parse_index_for_airports(self, index_html: bytes) -> Dict[str, Dict[str, str]]:
         """Return mapping of ICAO -> {url, ad_section}."""
@@ -188,7 +173,8 @@ class SloveniaEAIPWebSource(CachedSource, SourceInterface):
         if not html_bytes:
             return None
         parser = AIPParserFactory.get_parser(self.AUTHORITY, 'html')
-        parsed_data = parser.parse(html_bytes, icao)
+        parsed_data = self._parse_cached(self._get_airport_cache_file(icao), 'aip',
+                                         lambda: parser.parse(html_bytes, icao))
         return {
             'icao': icao,
             'authority': self.AUTHORITY,
@@ -200,7 +186,8 @@ class SloveniaEAIPWebSource(CachedSource, SourceInterface):
         if not html_bytes:
             return []
         parser = AIPParserFactory.get_parser(self.AUTHORITY, 'html')
-        return parser.extract_procedures(html_bytes, icao)
+        return self._parse_cached(self._get_airport_cache_file(icao), 'procedures',
+                                  lambda: parser.extract_procedures(html_bytes, icao))
 
     def get_airport_aip(self, icao: str, max_age_days: int = 28) -> Optional[Dict[str, Any]]:
         return self.fetch_airport_aip(icao)
@@ -229,12 +216,18 @@ class SloveniaEAIPWebSource(CachedSource, SourceInterface):
 
         logger.info(f"Updating model from Slovenia eAIP web source for {len(airports_to_process)} airports")
 
+        def section(icao: str) -> str:
+            return airport_info.get(icao, {'ad_section': 'AD-2'})['ad_section']
+
+        # Download the airport pages concurrently, then parse them in order
+        pages = dict(zip(airports_to_process, self.fetcher.map(
+            lambda icao: self.fetch_airport_html(icao, section(icao)), airports_to_process)))
+
         for icao in airports_to_process:
             try:
-                info = airport_info.get(icao, {'ad_section': 'AD-2'})
-                ad_section = info['ad_section']
+                ad_section = section(icao)
 
-                html_bytes = self.fetch_airport_html(icao, ad_section)
+                html_bytes = pages[icao]
                 if not html_bytes:
                     continue
 
@@ -248,14 +241,16 @@ class SloveniaEAIPWebSource(CachedSource, SourceInterface):
                 airport = model.airports[icao]
 
                 parser = AIPParserFactory.get_parser(self.AUTHORITY, 'html')
-                parsed_data = parser.parse(html_bytes, icao)
+                parsed_data = self._parse_cached(self._get_airport_cache_file(icao), 'aip',
+                                                 lambda: parser.parse(html_bytes, icao))
                 if parsed_data:
                     entries = field_service.create_aip_entries_from_parsed_data(icao, parsed_data)
                     if entries:
                         airport.add_aip_entries(entries)
                         airport.add_source(self.SOURCE_NAME)
 
-                procedures_data = parser.extract_procedures(html_bytes, icao)
+                procedures_data = self._parse_cached(self._get_airport_cache_file(icao), 'procedures',
+                                                     lambda: parser.extract_procedures(html_bytes, icao))
                 if procedures_data:
                     for proc_data in procedures_data:
                         procedure = Procedure(
@@ -276,3 +271,5 @@ class SloveniaEAIPWebSource(CachedSource, SourceInterface):
 
             except Exception as e:
                 logger.error(f"Error updating {icao} from Slovenia eAIP: {e}")
+
+        self.write_cache_manifest()
@@ -34,6 +34,7 @@ from .cached import CachedSource
 from ..parsers.aip_factory import AIPParserFactory
 from ..parsers.procedure_factory import ProcedureParserFactory
 from euro_aip.sources.base import SourceInterface
+from .parallel import IngestReport, ingest_airports, parse_part
 
 logger = logging.getLogger(__name__)
 
@@ -265,7 +266,40 @@ class UKEAIPSource(CachedSource, SourceInterface):
         """
         return self.get_data('procedures', 'json', icao, max_age_days=max_age_days)
     
-    def update_model(self, model: 'EuroAipModel', airports: Optional[List[str]] = None) -> None:
+    def parse_airport(self, icao: str) -> Dict[str, Any]:
+        """
+        Parse an airport's AIP and procedures into plain data.
+
+        This is the slow, CPU-bound part of update_model(); it only reads the
+        eAIP and the cache, so update_model(workers=...) runs it in worker
+        processes.
+
+        Args:
+            icao: ICAO airport code
+
+        Returns:
+            Dictionary with the 'aip' data (see get_airport_aip) and the
+            'procedures' list. Procedures that fail to parse are left empty
+            and reported under 'errors' (see parse_part), so the AIP data is
+            still merged.
+
+        Raises:
+            FileNotFoundError: If the eAIP has no airport file for ``icao``
+        """
+        data = {'aip': self.get_airport_aip(icao)}
+
+        def procedures() -> List[Dict[str, Any]]:
+            try:
+                return self.get_procedures(icao) or []
+            except FileNotFoundError:
+                logger.debug(f"No procedures found for {icao} in UK eAIP source")
+                return []
+
+        parse_part(data, 'procedures', procedures, default=[])
+        return data
+
+    def update_model(self, model: 'EuroAipModel', airports: Optional[List[str]] = None,
+                     workers: Optional[int] = None) -> Optional[IngestReport]:
         """
         Update the EuroAipModel with data from this source.
         
@@ -273,10 +307,14 @@ class UKEAIPSource(CachedSource, SourceInterface):
             model: The EuroAipModel to update
             airports: Optional list of specific airports to process. If None, 
                      the source will process all available airports.
+            workers: Parse airports in this many worker processes; results
+                     are still merged in the order of ``airports``
+
+        Returns:
+            Per-airport timings and failures, None if there was nothing to do
         """
-        from ..models import Airport, Procedure
+        from ..models import Procedure
         from ..utils.field_standardization_service import FieldStandardizationService
-        from ..parsers.procedure_default import DefaultProcedureParser
         
         # Initialize field standardization service and procedure parser
         field_service = FieldStandardizationService()
@@ -288,70 +326,41 @@ class UKEAIPSource(CachedSource, SourceInterface):
         
         if not airports:
             logger.warning("No airports found to process")
-            return
+            return None
         
         logger.info(f"Updating model with {len(airports)} airports from UK eAIP")
-        
-        skipped = []
-        
-        for icao in airports:
-            try:
-                # Get or create airport in model
-                if icao not in model.airports:
-                    model.add_airport(Airport(ident=icao))
 
-                airport = model.airports[icao]
-                
-                # Get AIP data and convert to AIPEntry objects
-                try:
-                    aip_data = self.get_airport_aip(icao)
-                    if aip_data and 'parsed_data' in aip_data:
-                        # Create AIPEntry objects from parsed data
-                        entries = field_service.create_aip_entries_from_parsed_data(icao, aip_data['parsed_data'])
-                        
-                        if entries:
-                            airport.add_aip_entries(entries)
-                            airport.add_source('uk_eaip')
-                            logger.debug(f"Added {len(entries)} AIP entries for {icao}")
-                except FileNotFoundError:
-                    skipped.append(icao)
-                    continue
-                
-                # Get procedures and create enhanced Procedure objects
-                try:
-                    procedures_data = self.get_procedures(icao)
-                    if procedures_data:
-                        for proc_data in procedures_data:
-                            if proc_data:
-                                # Use the DefaultProcedureParser to parse procedure name
-                                parsed_procedure = procedure_parser.parse(proc_data.get('name', ''), icao)
-                                
-                                if parsed_procedure:
-                                    procedure = Procedure(
-                                        name=proc_data.get('name', ''),
-                                        procedure_type=proc_data.get('type', 'unknown'),
-                                        approach_type=parsed_procedure.get('approach_type', ''),
-                                        runway_ident=parsed_procedure.get('runway_ident'),
-                                        runway_letter=parsed_procedure.get('runway_letter'),
-                                        runway_number=parsed_procedure.get('runway_number'),
-                                        source='uk_eaip',
-                                        authority='EGC',
-                                        raw_name=proc_data.get('name', ''),
-                                        data=proc_data
-                                    )
-                                    airport.add_procedure(procedure)
-                        
-                        logger.debug(f"Added {len(procedures_data)} procedures for {icao}")
-                except FileNotFoundError:
-                    logger.debug(f"No procedures found for {icao} in UK eAIP source")
-                
-                logger.debug(f"Updated {icao} with UK eAIP data")
-                
-            except Exception as e:
-                logger.error(f"Error updating {icao} with UK eAIP data: {e}")
-                # Continue with next airport instead of failing completely
-    
-        if len(skipped) > 0:
-            logger.info(f"{len(skipped)}/{len(airports)} Airports not found in UK eAIP source")
-        
- 
\ No newline at end of file
+        def merge(airport: 'Airport', data: Dict[str, Any]) -> None:
+            icao = airport.ident
+            aip_data = data['aip']
+            if aip_data and 'parsed_data' in aip_data:
+                # Create AIPEntry objects from parsed data
+                entries = field_service.create_aip_entries_from_parsed_data(icao, aip_data['parsed_data'])
+                if entries:
+                    airport.add_aip_entries(entries)
+                    airport.add_source('uk_eaip')
+                    logger.debug(f"Added {len(entries)} AIP entries for {icao}")
+
+            procedures_data = data['procedures']
+            for proc_data in procedures_data:
+                if proc_data:
+                    # Parse the procedure name (cheap, so done here rather than in the workers)
+                    parsed_procedure = procedure_parser.parse(proc_data.get('name', ''), icao)
+                    if parsed_procedure:
+                        procedure = Procedure(
+                            name=proc_data.get('name', ''),
+                            procedure_type=proc_data.get('type', 'unknown'),
+                            approach_type=parsed_procedure.get('approach_type', ''),
+                            runway_ident=parsed_procedure.get('runway_ident'),
+                            runway_letter=parsed_procedure.get('runway_letter'),
+                            runway_number=parsed_procedure.get('runway_number'),
+                            source='uk_eaip',
+                            authority='EGC',
+                            raw_name=proc_data.get('name', ''),
+                            data=proc_data
+                        )
+                        airport.add_procedure(procedure)
+            if procedures_data:
+                logger.debug(f"Added {len(procedures_data)} procedures for {icao}")
+
+        return ingest_airports(self, model, airports, merge, 'uk_eaip', workers)
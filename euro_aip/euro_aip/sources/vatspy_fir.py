@@ -105,6 +105,7 @@ class VatspyFirSource(CachedSource, SourceInterface):
                 label_lat=_safe_float(props.get("label_lat")),
                 source="vatspy",
             ))
+            firs[-1].build_simplified()
         logger.info("Parsed %d parent FIRs from VATSpy boundaries", len(firs))
         return firs
 
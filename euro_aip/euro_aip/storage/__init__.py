@@ -1,4 +1,8 @@
 from .base import StorageInterface
 from .database_storage import DatabaseStorage
+from .snapshot import ModelSnapshot, SnapshotError
+from .mapped_model import MappedModel
+from .export import ModelExporter
+from .tiles import TileGenerator
 
-__all__ = ['StorageInterface', 'DatabaseStorage']
+__all__ = ['StorageInterface', 'DatabaseStorage', 'ModelSnapshot', 'SnapshotError', 'MappedModel', 'ModelExporter', 'TileGenerator']
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Pragma values are interpolated into the statement, so only plain numbers and words
+_PRAGMA_VALUE = re.compile(r'^-?\w+$')
+
+
+class ConnectionPool:
+    """
+    Reusable SQLite connections for one database file.
+
+    Each thread gets its own read-only connection, opened on first use and
+    kept until close(). Writes go through a single shared connection, one
+    thread at a time. Keeping connections open avoids reconnecting and
+    re-applying pragmas on every call, and keeps both SQLite's page cache and
+    each connection's prepared statement cache warm, so helpers that run the
+    same (parameterised) SQL many times only compile it once per connection.
+
+    Readers see every committed write. In WAL mode they also run while a
+    write transaction is open; with the other journal modes they wait for it
+    (see ``busy_timeout``). A pool used in a forked child process opens new
+    connections instead of sharing the parent's.
+    """
+
+    # Applied to every connection; values are in SQLite pragma units
+    DEFAULT_PRAGMAS = {
+        'cache_size': -32768,      # 32 MiB of page cache per connection
+        'mmap_size': 268435456,    # read up to 256 MiB of the file through mmap
+        'temp_store': 'MEMORY',    # sorts and temporary indexes in memory
+        'busy_timeout': 5000,      # wait up to 5s for a lock instead of failing
+    }
+
+    def __init__(self, database_path: str, journal_mode: Optional[str] = None,
+                 synchronous: Optional[str] = None, pragmas: Optional[Dict[str, Any]] = None,
+                 cached_statements: int = 256, read_only: bool = False):
+        """
+        Initialize the pool; connections are opened when first needed.
+
+        Args:
+            database_path: Path to the SQLite database file
+            journal_mode: Optional journal mode set by the writer connection
+            synchronous: Optional synchronous level set by the writer connection
+            pragmas: Pragmas overriding or adding to DEFAULT_PRAGMAS
+            cached_statements: Prepared statements kept per connection
+            read_only: Refuse writer() (for pools over precomputed databases)
+        """
+        self.database_path = Path(database_path)
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.pragmas = dict(self.DEFAULT_PRAGMAS, **(pragmas or {}))
+        for name, value in self.pragmas.items():
+            if not name.isidentifier() or not _PRAGMA_VALUE.match(str(value)):
+                raise ValueError(f"Invalid pragma {name} = {value!r}")
+        self.cached_statements = cached_statements
+        self.read_only = read_only
+        self._reset()
+
+    def _reset(self) -> None:
+        """Forget all connections (without closing them)."""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+        self._writer: Optional[sqlite3.Connection] = None
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+
+    def _check_process(self) -> None:
+        # Connections must not be used across fork(); the child opens its own
+        if self._pid != os.getpid():
+            self._reset()
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        if read_only:
+            uri = f"{self.database_path.resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                                   cached_statements=self.cached_statements)
+        else:
+            conn = sqlite3.connect(str(self.database_path), check_same_thread=False,
+                                   cached_statements=self.cached_statements)
+        conn.row_factory = sqlite3.Row
+        if not read_only:
+            if self.journal_mode:
+                conn.execute(f'PRAGMA journal_mode = {self.journal_mode}')
+            if self.synchronous:
+                conn.execute(f'PRAGMA synchronous = {self.synchronous}')
+        for name, value in self.pragmas.items():
+            conn.execute(f'PRAGMA {name} = {value}')
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yield the calling thread's read-only connection.
+
+        A transaction left open by the caller is rolled back on exit, so
+        the connection does not hold on to an old view of the database.
+        """
+        self._check_process()
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect(read_only=True)
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yield the writer connection, holding it for the calling thread.
+
+        Nested calls from the same thread get the same connection. Changes
+        not committed when the outermost call exits are rolled back, as they
+        were when each call closed its own connection.
+        """
+        if self.read_only:
+            raise PermissionError(f"Connection pool for {self.database_path} is read-only")
+        self._check_process()
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._connect(read_only=False)
+            conn = self._writer
+            self._write_depth += 1
+            try:
+                yield conn
+            finally:
+                self._write_depth -= 1
+                if self._write_depth == 0 and conn.in_transaction:
+                    conn.rollback()
+
+    def close(self) -> None:
+        """Close all connections of this process; new ones are opened when needed."""
+        if self._pid != os.getpid():
+            self._reset()
+            return
+        with self._lock:
+            connections, self._connections = self._connections, []
+        with self._write_lock:
+            self._writer = None
+            self._local = threading.local()
+            for conn in connections:
+                conn.close()
+
+    def __reduce__(self):
+        # Connections and locks stay behind; the copy opens its own
+        return (self.__class__, (str(self.database_path), self.journal_mode, self.synchronous,
+                                 self.pragmas, self.cached_statements, self.read_only))
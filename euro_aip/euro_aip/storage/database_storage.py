@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 
 import sqlite3
+import hashlib
 import json
 import logging
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Sequence, Tuple
 from datetime import datetime
-from contextlib import contextmanager
 
 from ..models.euro_aip_model import EuroAipModel
 from ..models.airport import Airport
@@ -18,9 +19,18 @@ from ..models.border_crossing_change import BorderCrossingChange
 from ..models.waypoint import Waypoint
 from ..models.fir import FIR
 from .field_definitions import AirportFields, RunwayFields, SchemaManager, ProcedureFields, WaypointFields
+from .connection_pool import ConnectionPool
+from .snapshot import ModelSnapshot, SnapshotError
+from .mapped_model import MappedModel
 
 logger = logging.getLogger(__name__)
 
+
+def _intern(value: Any) -> Any:
+    """Intern a repetitive text column value so loaded objects share one copy."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class DatabaseStorage:
     """
     Unified database storage for EuroAipModel with change tracking.
@@ -29,7 +39,12 @@ class DatabaseStorage:
     automatic change detection and history tracking.
     """
     
-    def __init__(self, database_path: str, save_only_std_fields: bool = True):
+    JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+    SYNCHRONOUS_MODES = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+    def __init__(self, database_path: str, save_only_std_fields: bool = True,
+                 journal_mode: Optional[str] = None, synchronous: Optional[str] = None,
+                 pragmas: Optional[Dict[str, Any]] = None):
         """
         Initialize the database storage.
 
@@ -37,11 +52,25 @@ class DatabaseStorage:
             database_path: Path to the SQLite database file
             save_only_std_fields: If True, only save AIP entries with std_field_id.
                                  If False, save all AIP entries. Defaults to True.
+            journal_mode: Optional SQLite journal mode set on the writer connection
+                          (e.g. "WAL", which lets reads run during saves).
+                          None keeps the database's current mode.
+            synchronous: Optional SQLite synchronous level set on the writer connection
+                         (e.g. "NORMAL", a good match for WAL). None keeps the default.
+            pragmas: Pragmas overriding ConnectionPool.DEFAULT_PRAGMAS
+                     (cache_size, mmap_size, temp_store, busy_timeout)
         """
+        if journal_mode is not None and journal_mode.upper() not in self.JOURNAL_MODES:
+            raise ValueError(f"Invalid journal_mode {journal_mode!r}, expected one of {self.JOURNAL_MODES}")
+        if synchronous is not None and synchronous.upper() not in self.SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid synchronous {synchronous!r}, expected one of {self.SYNCHRONOUS_MODES}")
         self.database_path = Path(database_path)
         self.schema_manager = SchemaManager()
         self.save_only_std_fields = save_only_std_fields
+        self.journal_mode = journal_mode.upper() if journal_mode else None
+        self.synchronous = synchronous.upper() if synchronous else None
         self._airac_date: Optional[str] = None
+        self._pool = ConnectionPool(self.database_path, self.journal_mode, self.synchronous, pragmas)
         self._ensure_database_exists()
 
     @property
@@ -53,6 +82,18 @@ class DatabaseStorage:
     def airac_date(self, value: Optional[str]):
         self._airac_date = value
     
+    # Covering indexes for get_change_history: the AIRAC cycle, then the change
+    # id for keyset pagination, then the filtered columns, so that a page is one
+    # index range scan and only matching rows are read from the table
+    _CHANGE_HISTORY_INDEXES = {
+        'airports_changes': 'airac_date, id, airport_icao, field_name, source',
+        'runways_changes': 'airac_date, id, airport_icao, field_name, source',
+        'procedures_changes': 'airac_date, id, airport_icao, field_name, source',
+        'aip_entries_changes': 'airac_date, id, airport_icao, field, source',
+        'waypoints_changes': 'airac_date, id, waypoint_name, field_name, source',
+        'border_crossing_points_changes': 'airac_date, id, country_iso, icao_code, source',
+    }
+
     def _ensure_database_exists(self):
         """Ensure the database file exists and has the correct schema."""
         if not self.database_path.exists():
@@ -212,7 +253,8 @@ class DatabaseStorage:
                     country_iso TEXT NOT NULL,
                     action TEXT NOT NULL,
                     source TEXT NOT NULL,
-                    changed_at TEXT
+                    changed_at TEXT,
+                    airac_date TEXT
                 )
             ''')
             
@@ -295,13 +337,15 @@ class DatabaseStorage:
             conn.execute('CREATE INDEX idx_border_crossing_source ON border_crossing_points (source)')
             conn.execute('CREATE INDEX idx_border_crossing_points_changes_time ON border_crossing_points_changes (changed_at)')
 
-            # FIRs table — polygons stored as GeoJSON-coordinate JSON; bbox columns
-            # for cheap spatial prefilter (no spatial extension required).
+            # FIRs table — polygons stored as GeoJSON-coordinate JSON, plus the
+            # simplified levels keyed by tolerance (nm); bbox columns for cheap
+            # spatial prefilter (no spatial extension required).
             conn.execute('''
                 CREATE TABLE firs (
                     icao TEXT NOT NULL PRIMARY KEY,
                     name TEXT,
                     polygons_json TEXT NOT NULL,
+                    simplified_json TEXT,
                     bbox_min_lon REAL NOT NULL,
                     bbox_min_lat REAL NOT NULL,
                     bbox_max_lon REAL NOT NULL,
@@ -325,6 +369,8 @@ class DatabaseStorage:
             conn.execute('CREATE INDEX idx_waypoints_changes_time ON waypoints_changes (changed_at)')
             conn.execute('CREATE INDEX idx_waypoints_changes_name ON waypoints_changes (waypoint_name)')
 
+            self._create_change_history_indexes(conn)
+
             conn.commit()
             logger.info(f"Created database schema at {self.database_path}")
     
@@ -380,7 +426,7 @@ class DatabaseStorage:
             
             # Add airac_date column to _changes tables if missing
             for table_name in ['aip_entries_changes', 'airports_changes', 'runways_changes',
-                               'procedures_changes']:
+                               'procedures_changes', 'border_crossing_points_changes']:
                 cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}'")
                 if cursor.fetchone():
                     cursor.execute(f"PRAGMA table_info({table_name})")
@@ -461,6 +507,7 @@ class DatabaseStorage:
                         icao TEXT NOT NULL PRIMARY KEY,
                         name TEXT,
                         polygons_json TEXT NOT NULL,
+                        simplified_json TEXT,
                         bbox_min_lon REAL NOT NULL,
                         bbox_min_lat REAL NOT NULL,
                         bbox_max_lon REAL NOT NULL,
@@ -477,6 +524,15 @@ class DatabaseStorage:
                 cursor.execute('CREATE INDEX idx_firs_bbox ON firs (bbox_min_lon, bbox_min_lat, bbox_max_lon, bbox_max_lat)')
                 cursor.execute('CREATE INDEX idx_firs_source ON firs (source)')
                 conn.commit()
+            else:
+                cursor.execute("PRAGMA table_info(firs)")
+                if 'simplified_json' not in [col[1] for col in cursor.fetchall()]:
+                    logger.info("Adding simplified_json column to firs table")
+                    cursor.execute('ALTER TABLE firs ADD COLUMN simplified_json TEXT')
+                    conn.commit()
+
+            # Create change history indexes if missing
+            self._create_change_history_indexes(conn)
 
             # Migrate if needed
             new_version = self.schema_manager.migrate_schema(conn, current_version)
@@ -489,6 +545,16 @@ class DatabaseStorage:
                 conn.commit()
                 logger.info(f"Migrated schema from version {current_version} to {new_version}")
     
+    def _create_change_history_indexes(self, conn: sqlite3.Connection) -> None:
+        """Create the get_change_history indexes of the change tables that exist."""
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        for table, columns in self._CHANGE_HISTORY_INDEXES.items():
+            if table in tables:
+                conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_airac ON {table} ({columns})')
+        # Covers the country filter's airport subquery
+        if 'iso_country' in [row[1] for row in conn.execute('PRAGMA table_info(airports)')]:
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_airports_country ON airports (iso_country, icao_code)')
+    
     def _recreate_schema(self):
         """Drop all tables and recreate the schema."""
         with self._get_connection() as conn:
@@ -505,37 +571,48 @@ class DatabaseStorage:
         # Recreate the schema
         self._create_schema()
     
-    @contextmanager
-    def _get_connection(self):
-        """Get a database connection with proper configuration."""
-        conn = sqlite3.connect(str(self.database_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+    def _get_connection(self, write: bool = True):
+        """
+        Get a pooled database connection, as a context manager.
+
+        Args:
+            write: Use the shared writer connection. Read-only helpers pass
+                   False to use the calling thread's read connection instead.
+        """
+        return self._pool.writer() if write else self._pool.reader()
+
+    def close(self) -> None:
+        """Close the pooled connections; they are reopened when next needed."""
+        self._pool.close()
     
     def save_model(self, model: EuroAipModel) -> None:
         """
         Save the entire EuroAipModel to the database with change tracking.
 
+        For a model loaded with only some parts or airports (see
+        load_model), the relationships that were not loaded are left as they
+        are in the database rather than saved as empty, the saved airports'
+        rows are read through the airport_icao indexes, and the model
+        statistics are not rewritten. Deferred relationships of a lazily
+        loaded model are read in one scan per table before the diff.
+
         Args:
             model: The EuroAipModel to save
         """
         logger.info(f"Saving model with {len(model._airports)} airports to database")
+        airports = list(model._airports.values())
+        scope = model._loaded_scope
+        partial = model._loaded_parts is not None or scope is not None
+        self._load_deferred_relationships(airports)
 
         with self._get_connection() as conn:
             # Count changes before save to compute delta
-            changes_before = {}
-            for table in ['aip_entries_changes', 'airports_changes', 'runways_changes', 'procedures_changes', 'waypoints_changes']:
-                try:
-                    row = conn.execute(f'SELECT COUNT(*) as cnt FROM {table}').fetchone()
-                    changes_before[table] = row['cnt']
-                except sqlite3.OperationalError:
-                    changes_before[table] = 0
+            changes_before = self._count_changes(conn)
 
-            for airport in model._airports.values():
-                self._save_airport(conn, airport)
+            # All writes below happen in one transaction, committed at the end
+            changed_airports = self._save_airports(conn, airports, scoped=scope is not None,
+                                                   relationships=self._loaded_relationships(model))
+            self._record_last_save(conn, changed_airports)
 
             # Save waypoints
             if model._waypoints:
@@ -550,331 +627,499 @@ class DatabaseStorage:
             if border_crossing_points:
                 self.save_border_crossing_data(border_crossing_points, conn)
 
-            # Update metadata
-            self._update_metadata(conn, model)
+            # Update metadata; the statistics of a partial model would only
+            # describe what it loaded
+            if not partial:
+                self._update_metadata(conn, model)
 
             # Record AIRAC update if airac_date is set
             if self._airac_date:
-                total_changes = 0
-                for table in changes_before:
-                    row = conn.execute(f'SELECT COUNT(*) as cnt FROM {table}').fetchone()
-                    total_changes += row['cnt'] - changes_before[table]
-                now = datetime.now().isoformat()
-                for source in model.sources_used:
-                    source_airports = model.airports.by_source(source)
-                    airports_count = source_airports.count()
-                    conn.execute('''
-                        INSERT OR REPLACE INTO airac_updates
-                        (airac_date, source, fetched_at, airports_updated, changes_count, status)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (self._airac_date, source, now,
-                          airports_count, total_changes, 'success'))
-
-                # Update per-country AIP coverage from actual aip_entries timestamps
-                self._update_country_coverage(conn)
+                countries = None
+                if scope is not None:
+                    countries = sorted({airport.iso_country for airport in airports if airport.iso_country})
+                self._record_airac_update(conn, changes_before, {
+                    source: model.airports.by_source(source).count() for source in model.sources_used
+                }, countries)
 
             conn.commit()
 
+        model.clear_changed_airports()
         logger.info(f"Successfully saved model to database")
-    
-    def _save_airport(self, conn: sqlite3.Connection, airport: Airport) -> None:
-        """Save a single airport with all its data."""
-        # Save airport basic info
-        self._save_airport_basic(conn, airport)
-        
-        # Save runways
-        self._save_airport_runways(conn, airport)
-        
-        # Save procedures
-        self._save_airport_procedures(conn, airport)
-        
-        # Save AIP entries
-        self._save_airport_aip_entries(conn, airport)
-    
-    def _save_airport_basic(self, conn: sqlite3.Connection, airport: Airport) -> None:
-        """Save basic airport information using field definitions."""
-        # Check for changes in basic fields
-        current_airport = self._get_current_airport(conn, airport.ident)
-        changes = []
-        
-        if current_airport is None:
-            # New airport
-            changes = self._detect_airport_changes(None, airport)
+
+    def save_airports(self, model: EuroAipModel, idents: Optional[Iterable[str]] = None,
+                      since: Optional[datetime] = None) -> int:
+        """
+        Save only some of the model's airports, with change tracking.
+
+        Only the rows of the saved airports (and of their runways, procedures
+        and AIP entries) are read, diffed and written, so a single-country
+        refresh leaves the other airports and their change history alone.
+        Waypoints, FIRs, border crossing points and the model statistics are
+        not saved; the save is recorded in model_metadata, so snapshots
+        written before it go stale. As with save_model, relationships a
+        partial model did not load are left alone.
+
+        The airports saved are ``idents`` when given, else the airports whose
+        ``updated_at`` is later than ``since``, else the airports the model
+        recorded as changed (see EuroAipModel.changed_airports()). Saved
+        airports are removed from the model's changed set.
+
+        Args:
+            model: Model holding the airports
+            idents: ICAO codes of the airports to save
+            since: Save the airports updated after this time
+
+        Returns:
+            Number of airports saved
+        """
+        if idents is not None:
+            airports = [model._airports[icao] for icao in idents if icao in model._airports]
+        elif since is not None:
+            airports = [airport for airport in model._airports.values()
+                        if airport.updated_at and airport.updated_at > since]
         else:
-            # Existing airport - check for changes
-            changes = self._detect_airport_changes(current_airport, airport)
-        
-        # Save changes to history
-        for change in changes:
+            changed = model.changed_airports()
+            airports = [airport for icao, airport in model._airports.items() if icao in changed]
+        if not airports:
+            logger.info("No airports to save")
+            return 0
+
+        logger.info(f"Saving {len(airports)} airports to database")
+        countries = sorted({airport.iso_country for airport in airports if airport.iso_country})
+        self._load_deferred_relationships(airports)
+        with self._get_connection() as conn:
+            changes_before = self._count_changes(conn)
+            changed_airports = self._save_airports(conn, airports, scoped=True,
+                                                   relationships=self._loaded_relationships(model))
+            self._record_last_save(conn, changed_airports)
             conn.execute('''
-                INSERT INTO airports_changes
-                (airport_icao, field_name, old_value, new_value, field_type, source, changed_at, airac_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                airport.ident, change['field_name'], change['old_value'],
-                change['new_value'], change['field_type'], change['source'], change['changed_at'],
-                self._airac_date
-            ))
-        
-        # Build dynamic INSERT/REPLACE statement using field definitions
-        fields = AirportFields.get_all_fields()
-        field_names = [field.name for field in fields]
-        placeholders = ','.join(['?' for _ in fields])
-        
-        # Prepare values using field definitions for proper formatting
+                INSERT OR REPLACE INTO model_metadata (key, value, updated_at)
+                VALUES (?, ?, ?)
+            ''', ('last_airports_save', json.dumps({'airports': len(airports), 'countries': countries}),
+                  datetime.now().isoformat()))
+            if self._airac_date:
+                source_counts: Dict[str, int] = {}
+                for airport in airports:
+                    for source in airport.sources:
+                        source_counts[source] = source_counts.get(source, 0) + 1
+                self._record_airac_update(conn, changes_before, source_counts, countries)
+            conn.commit()
+
+        model.clear_changed_airports(airport.ident for airport in airports)
+        return len(airports)
+
+    def save_country(self, model: EuroAipModel, country_code: str) -> int:
+        """
+        Save the model's airports of one country (see save_airports).
+
+        Returns:
+            Number of airports saved
+        """
+        country_code = country_code.upper()
+        idents = [airport.ident for airport in model._airports.values()
+                  if airport.iso_country == country_code]
+        return self.save_airports(model, idents=idents)
+
+    def load_country(self, model: EuroAipModel, country_code: str, ignore_non_icao: bool = True) -> int:
+        """
+        Replace the model's airports of one country with those in the database.
+
+        The country's airports are removed from the model and reloaded with
+        their runways, procedures and AIP entries; other airports, waypoints,
+        FIRs and border crossing points are left as they are.
+
+        Args:
+            model: Model to update
+            country_code: ISO country code, e.g. "GB"
+            ignore_non_icao: Skip airports whose code is not 4 characters
+
+        Returns:
+            Number of airports loaded
+        """
+        country_code = country_code.upper()
+        with self._get_connection(write=False) as conn:
+            airports = self._load_airports(conn, ignore_non_icao,
+                                           airport_filter=self._airport_filter([country_code], None))
+
+        model.remove_airports_by_country(country_code)
+        if airports:
+            model.bulk_add_airports(airports, validate=False, update_derived=False)
+        model._update_border_crossing_airports()
+        for airport in airports:
+            airport.update_all_derived_fields()
+        model._invalidate_airport_index()
+        # The model now matches the database for these airports
+        model.clear_changed_airports(airport.ident for airport in airports)
+        logger.info(f"Loaded {len(airports)} airports for country {country_code}")
+        return len(airports)
+
+    # Change history tables counted to report the changes of a save
+    _CHANGE_TABLES = ('aip_entries_changes', 'airports_changes', 'runways_changes', 'procedures_changes', 'waypoints_changes')
+
+    def _count_changes(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        """Row count of each change history table."""
+        counts = {}
+        for table in self._CHANGE_TABLES:
+            try:
+                row = conn.execute(f'SELECT COUNT(*) as cnt FROM {table}').fetchone()
+                counts[table] = row['cnt']
+            except sqlite3.OperationalError:
+                counts[table] = 0
+        return counts
+
+    # Airport relationships saved by _save_airports
+    _AIRPORT_RELATIONSHIPS = ('runways', 'procedures', 'aip_entries')
+
+    def _loaded_relationships(self, model: EuroAipModel) -> Tuple[str, ...]:
+        """The airport relationships a model loaded, which a save may rewrite."""
+        parts = model._loaded_parts
+        return tuple(name for name in self._AIRPORT_RELATIONSHIPS if parts is None or name in parts)
+
+    @staticmethod
+    def _load_deferred_relationships(airports: List[Airport]) -> None:
+        """
+        Load the deferred relationships of lazily loaded airports before a save.
+
+        Loaders that can (AirportRelationshipLoader.load_many) read each
+        relationship of all their airports in one scan; otherwise the diff
+        loads them one airport at a time on access.
+        """
+        pending: Dict[Tuple[int, str], Tuple[Any, List[Airport]]] = {}
+        for airport in airports:
+            loader = airport.__dict__.get('_relationship_loader')
+            if loader is None or not hasattr(loader, 'load_many'):
+                continue
+            for name in Airport.LAZY_RELATIONSHIPS:
+                if not airport.is_loaded(name):
+                    pending.setdefault((id(loader), name), (loader, []))[1].append(airport)
+        for (_, name), (loader, deferred) in pending.items():
+            loader.load_many(deferred, name)
+
+    def _record_airac_update(self, conn: sqlite3.Connection, changes_before: Dict[str, int],
+                             source_counts: Dict[str, int], countries: Optional[List[str]] = None) -> None:
+        """
+        Record a save in airac_updates for the current AIRAC date.
+
+        A source's row sums the airports and changes of every save of the
+        cycle, so a per-country save adds to an earlier full save rather
+        than overwriting it.
+
+        Args:
+            conn: Open database connection (the caller commits)
+            changes_before: _count_changes() before the save
+            source_counts: Number of airports saved per source
+            countries: Only refresh the AIP coverage of these countries (all if None)
+        """
+        changes_after = self._count_changes(conn)
+        total_changes = sum(changes_after[table] - changes_before[table] for table in changes_before)
+        now = datetime.now().isoformat()
+        for source, airports_count in source_counts.items():
+            conn.execute('''
+                INSERT INTO airac_updates
+                (airac_date, source, fetched_at, airports_updated, changes_count, status)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(airac_date, source) DO UPDATE SET
+                    fetched_at = excluded.fetched_at,
+                    airports_updated = airports_updated + excluded.airports_updated,
+                    changes_count = changes_count + excluded.changes_count,
+                    status = excluded.status
+            ''', (self._airac_date, source, now,
+                  airports_count, total_changes, 'success'))
+
+        # Update per-country AIP coverage from actual aip_entries timestamps
+        self._update_country_coverage(conn, countries)
+    
+    def _save_airports(self, conn: sqlite3.Connection, airports: List[Airport],
+                       scoped: bool = False,
+                       relationships: Iterable[str] = _AIRPORT_RELATIONSHIPS) -> List[str]:
+        """
+        Save airports with their runways, procedures and AIP entries, with change tracking.
+
+        The current state of each table is read in one scan, diffed against
+        the airports in memory, and written back with one executemany per
+        statement. The rows written (including the *_changes history) are the
+        same as saving the airports one at a time, in the same order.
+
+        Args:
+            conn: Open database connection (the caller commits)
+            airports: Airports to save
+            scoped: Only read the current rows of ``airports`` (through the
+                    airport_icao indexes) instead of scanning whole tables;
+                    cheaper when saving a small part of the database
+            relationships: Which of runways, procedures and aip_entries to
+                           save for airports already in the database; the
+                           others are neither read nor written. New airports
+                           are saved with all of them.
+
+        Returns:
+            ICAO codes of the airports that were new or changed, in save order
+        """
+        now = datetime.now().isoformat()
+        scope, params = '', []
+        if scoped:
+            scope = 'WHERE {} IN (SELECT value FROM json_each(?))'
+            params = [json.dumps([airport.ident for airport in airports])]
+        current_airports = {
+            row['icao_code']: dict(row)
+            for row in conn.execute(f"SELECT * FROM airports {scope.format('icao_code')}", params)
+        }
+        relationships = set(relationships)
+        current_runways, current_procedures = {}, {}
+        if 'runways' in relationships:
+            current_runways = self._current_rows_by_airport(
+                conn, f"SELECT * FROM runways {scope.format('airport_icao')} ORDER BY id", params)
+        if 'procedures' in relationships:
+            current_procedures = self._current_rows_by_airport(
+                conn, f"SELECT * FROM procedures {scope.format('airport_icao')} ORDER BY id", params)
+        # AIP entries are the bulk of the data: only read what the diff needs,
+        # as plain tuples, keyed by (section, field, source) -> (id, value)
+        current_aip_entries: Dict[str, Dict[Tuple, Tuple[int, Any]]] = {}
+        if 'aip_entries' in relationships:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            for entry_id, icao, section, field, source, value in cursor.execute(
+                'SELECT id, airport_icao, section, field, source, value FROM aip_entries '
+                f"{scope.format('airport_icao')} ORDER BY airport_icao, section, id", params
+            ):
+                current_aip_entries.setdefault(icao, {})[(section, field, source)] = (entry_id, value)
+
+        airport_fields = AirportFields.get_all_fields()
+        runway_fields = RunwayFields.get_all_fields()
+        runway_update_fields = [
+            f for f in RunwayFields.get_change_tracked_fields()
+            if f.name not in ['airport_icao', 'le_ident', 'he_ident']
+        ]
+        procedure_fields = ProcedureFields.get_all_fields()
+
+        airport_changes, airport_rows = [], []
+        runway_changes, runway_updates, runway_inserts = [], [], []
+        procedure_changes, procedure_deletes, procedure_inserts = [], [], []
+        aip_changes, aip_updates, aip_inserts = [], [], []
+        changed_airports = []
+
+        for airport in airports:
+            icao = airport.ident
+            written = (len(airport_changes), len(runway_changes), len(runway_inserts),
+                       len(procedure_changes), len(aip_changes), len(aip_inserts))
+
+            # Basic airport info
+            for change in self._detect_airport_changes(current_airports.get(icao), airport):
+                airport_changes.append((
+                    icao, change['field_name'], change['old_value'],
+                    change['new_value'], change['field_type'], change['source'], change['changed_at'],
+                    self._airac_date
+                ))
+            airport_rows.append(self._airport_values(airport, airport_fields))
+
+            # Relationships a partial model did not load are left alone
+            saved = relationships if icao in current_airports else self._AIRPORT_RELATIONSHIPS
+
+            # Runways: match on (le_ident, he_ident), then update or insert
+            if 'runways' in saved:
+                airport_runways = current_runways.get(icao, [])
+                for runway in airport.runways:
+                    current_runway = next(
+                        (curr for curr in airport_runways
+                         if curr['le_ident'] == runway.le_ident and curr['he_ident'] == runway.he_ident),
+                        None
+                    )
+                    for change in self._detect_runway_changes(current_runway, runway):
+                        runway_changes.append((
+                            icao, change.get('runway_id'), change['field_name'],
+                            change['old_value'], change['new_value'], change['field_type'],
+                            change['source'], change['changed_at'], self._airac_date
+                        ))
+                    if current_runway:
+                        runway_updates.append(
+                            [f.format_for_storage(getattr(runway, f.name, None)) for f in runway_update_fields]
+                            + [now, current_runway['id']]
+                        )
+                    else:
+                        runway_inserts.append(self._runway_values(icao, runway, runway_fields, now))
+
+            # Procedures: record ADDED/REMOVED, then replace the airport's procedures
+            if 'procedures' in saved:
+                airport_procedures = current_procedures.get(icao, [])
+                current_procedure_names = {(curr['name'], curr['procedure_type']) for curr in airport_procedures}
+                new_procedure_names = {(proc.name, proc.procedure_type) for proc in airport.procedures}
+
+                # Record ADDED procedures if we had existing ones, for the first insert we don't need to record them
+                if airport_procedures:
+                    for name, proc_type in new_procedure_names - current_procedure_names:
+                        procedure_changes.append((
+                            icao, None, 'PROCEDURE_ADDED', None, f"{name} ({proc_type})",
+                            'unknown', now, self._airac_date
+                        ))
+                for name, proc_type in current_procedure_names - new_procedure_names:
+                    proc_id = next(
+                        (curr['id'] for curr in airport_procedures
+                         if curr['name'] == name and curr['procedure_type'] == proc_type),
+                        None
+                    )
+                    procedure_changes.append((
+                        icao, proc_id, 'PROCEDURE_REMOVED', f"{name} ({proc_type})", None,
+                        'unknown', now, self._airac_date
+                    ))
+                if airport_procedures:
+                    procedure_deletes.append((icao,))
+                for procedure in airport.procedures:
+                    procedure_inserts.append(self._procedure_values(icao, procedure, procedure_fields, now))
+
+            # AIP entries: insert new ones, update changed values with history
+            if 'aip_entries' in saved:
+                airport_entries = current_aip_entries.get(icao, {})
+                for entry in airport.aip_entries:
+                    # Skip entries without std_field_id if save_only_std_fields is True
+                    if self.save_only_std_fields and entry.std_field_id is None:
+                        continue
+                    current_entry = airport_entries.get((entry.section, entry.field, entry.source))
+                    if current_entry is None:
+                        aip_inserts.append((
+                            icao, entry.section, entry.field, entry.value,
+                            entry.std_field, entry.std_field_id, entry.mapping_score,
+                            entry.alt_field, entry.alt_value, entry.source, 0,  # Default priority
+                            entry.created_at.isoformat(), now
+                        ))
+                    elif current_entry[1] != entry.value:
+                        aip_changes.append((
+                            icao, entry.section, entry.field,
+                            current_entry[1], entry.value, entry.std_field,
+                            entry.std_field_id, entry.mapping_score,
+                            entry.source, now, self._airac_date
+                        ))
+                        aip_updates.append((
+                            entry.value, entry.std_field, entry.std_field_id, entry.mapping_score,
+                            entry.alt_field, entry.alt_value, now, current_entry[0]
+                        ))
+
+            if icao not in current_airports or written != (
+                    len(airport_changes), len(runway_changes), len(runway_inserts),
+                    len(procedure_changes), len(aip_changes), len(aip_inserts)):
+                changed_airports.append(icao)
+
+        conn.executemany('''
+            INSERT INTO airports_changes
+            (airport_icao, field_name, old_value, new_value, field_type, source, changed_at, airac_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', airport_changes)
+        conn.executemany(f'''
+            INSERT OR REPLACE INTO airports
+            ({','.join(f.name for f in airport_fields)})
+            VALUES ({','.join('?' for _ in airport_fields)})
+        ''', airport_rows)
+
+        conn.executemany('''
+            INSERT INTO runways_changes
+            (airport_icao, runway_id, field_name, old_value, new_value, field_type, source, changed_at, airac_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', runway_changes)
+        conn.executemany(f'''
+            UPDATE runways SET
+            {', '.join(f"{f.name} = ?" for f in runway_update_fields)}, updated_at = ?
+            WHERE id = ?
+        ''', runway_updates)
+        conn.executemany(f'''
+            INSERT INTO runways
+            ({','.join(f.name for f in runway_fields)})
+            VALUES ({','.join('?' for _ in runway_fields)})
+        ''', runway_inserts)
+
+        conn.executemany('''
+            INSERT INTO procedures_changes
+            (airport_icao, procedure_id, field_name, old_value, new_value, source, changed_at, airac_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', procedure_changes)
+        conn.executemany('DELETE FROM procedures WHERE airport_icao = ?', procedure_deletes)
+        conn.executemany(f'''
+            INSERT INTO procedures
+            ({','.join(f.name for f in procedure_fields)})
+            VALUES ({','.join('?' for _ in procedure_fields)})
+        ''', procedure_inserts)
+
+        conn.executemany('''
+            INSERT INTO aip_entries_changes
+            (airport_icao, section, field, old_value, new_value, std_field,
+             std_field_id, mapping_score, source, changed_at, airac_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', aip_changes)
+        conn.executemany('''
+            UPDATE aip_entries SET
+            value = ?, std_field = ?, std_field_id = ?, mapping_score = ?,
+            alt_field = ?, alt_value = ?, updated_at = ?
+            WHERE id = ?
+        ''', aip_updates)
+        conn.executemany('''
+            INSERT INTO aip_entries
+            (airport_icao, section, field, value, std_field, std_field_id,
+             mapping_score, alt_field, alt_value, source, source_priority,
+             created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', aip_inserts)
+
+        logger.debug(
+            f"Saved {len(airport_rows)} airports: {len(airport_changes)} airport, "
+            f"{len(runway_changes)} runway, {len(procedure_changes)} procedure and "
+            f"{len(aip_changes)} AIP entry changes"
+        )
+        return changed_airports
+
+    @staticmethod
+    def _current_rows_by_airport(conn: sqlite3.Connection, sql: str,
+                                 params: Sequence[Any] = ()) -> Dict[str, List[Dict]]:
+        """Run a query over a per-airport table and group the rows by airport_icao."""
+        rows: Dict[str, List[Dict]] = {}
+        for row in conn.execute(sql, params):
+            rows.setdefault(row['airport_icao'], []).append(dict(row))
+        return rows
+
+    @staticmethod
+    def _airport_values(airport: Airport, fields: List[Any]) -> List[Any]:
+        """Values of an airports row, in field definition order."""
         values = []
         for field in fields:
             if field.name == 'icao_code':
                 values.append(airport.ident)
             elif field.name == 'sources':
-                values.append(','.join(airport.sources))
+                values.append(','.join(sorted(airport.sources)))
             elif field.name == 'created_at':
                 values.append(airport.created_at.isoformat())
             elif field.name == 'updated_at':
                 values.append(airport.updated_at.isoformat())
             else:
                 # Get value from airport object and format it
-                value = getattr(airport, field.name, None)
-                formatted_value = field.format_for_storage(value)
-                values.append(formatted_value)
-        
-        # Execute INSERT OR REPLACE
-        sql = f'''
-            INSERT OR REPLACE INTO airports 
-            ({','.join(field_names)})
-            VALUES ({placeholders})
-        '''
-        conn.execute(sql, values)
-    
-    def _save_airport_runways(self, conn: sqlite3.Connection, airport: Airport) -> None:
-        """Save airport runways with change tracking using field definitions."""
-        current_runways = self._get_current_runways(conn, airport.ident)
-        
-        for runway in airport.runways:
-            # Find matching current runway
-            current_runway = None
-            for curr in current_runways:
-                if (curr['le_ident'] == runway.le_ident and 
-                    curr['he_ident'] == runway.he_ident):
-                    current_runway = curr
-                    break
-            
-            # Detect changes using field definitions
-            changes = self._detect_runway_changes(current_runway, runway)
-            
-            # Save changes to history
-            for change in changes:
-                conn.execute('''
-                    INSERT INTO runways_changes
-                    (airport_icao, runway_id, field_name, old_value, new_value, field_type, source, changed_at, airac_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    airport.ident, change.get('runway_id'), change['field_name'],
-                    change['old_value'], change['new_value'], change['field_type'],
-                    change['source'], change['changed_at'], self._airac_date
-                ))
-            
-            # Insert or update runway using field definitions
-            if current_runway:
-                # Update existing runway
-                self._update_runway(conn, current_runway['id'], runway)
-            else:
-                # Insert new runway
-                self._insert_runway(conn, airport.ident, runway)
-    
-    def _insert_runway(self, conn: sqlite3.Connection, airport_icao: str, runway: Runway) -> None:
-        """Insert a new runway using field definitions."""
-        fields = RunwayFields.get_all_fields()
-        field_names = [field.name for field in fields]
-        placeholders = ','.join(['?' for _ in fields])
-        
-        # Prepare values using field definitions
+                values.append(field.format_for_storage(getattr(airport, field.name, None)))
+        return values
+
+    @staticmethod
+    def _runway_values(airport_icao: str, runway: Runway, fields: List[Any], now: str) -> List[Any]:
+        """Values of a new runways row, in field definition order."""
         values = []
         for field in fields:
             if field.name == 'airport_icao':
                 values.append(airport_icao)
             elif field.name == 'created_at':
-                values.append(getattr(runway, 'created_at', datetime.now()).isoformat() if hasattr(runway, 'created_at') else datetime.now().isoformat())
+                values.append(runway.created_at.isoformat() if hasattr(runway, 'created_at') else now)
             elif field.name == 'updated_at':
-                values.append(datetime.now().isoformat())
+                values.append(now)
             else:
-                value = getattr(runway, field.name, None)
-                values.append(field.format_for_storage(value))
-        
-        sql = f'''
-            INSERT INTO runways 
-            ({','.join(field_names)})
-            VALUES ({placeholders})
-        '''
-        conn.execute(sql, values)
-    
-    def _update_runway(self, conn: sqlite3.Connection, runway_id: int, runway: Runway) -> None:
-        """Update an existing runway using field definitions."""
-        # Get change-tracked fields (exclude metadata and identifiers)
-        fields = [f for f in RunwayFields.get_change_tracked_fields() if f.name not in ['airport_icao', 'le_ident', 'he_ident']]
-        
-        set_clauses = []
-        values = []
-        
-        for field in fields:
-            set_clauses.append(f"{field.name} = ?")
-            value = getattr(runway, field.name, None)
-            values.append(field.format_for_storage(value))
-        
-        # Add updated_at
-        set_clauses.append("updated_at = ?")
-        values.append(datetime.now().isoformat())
-        
-        # Add runway_id for WHERE clause
-        values.append(runway_id)
-        
-        sql = f'''
-            UPDATE runways SET
-            {', '.join(set_clauses)}
-            WHERE id = ?
-        '''
-        conn.execute(sql, values)
-    
-    def _save_airport_procedures(self, conn: sqlite3.Connection, airport: Airport) -> None:
-        """Save airport procedures with change tracking at procedure level."""
-        current_procedures = self._get_current_procedures(conn, airport.ident)
-        
-        # Create sets for efficient comparison
-        current_procedure_names = {(curr['name'], curr['procedure_type']) for curr in current_procedures}
-        new_procedure_names = {(proc.name, proc.procedure_type) for proc in airport.procedures}
-        
-        # Detect procedure-level changes (ADDED/REMOVED)
-        added_procedures = new_procedure_names - current_procedure_names
-        removed_procedures = current_procedure_names - new_procedure_names
-        
-        # Record ADDED procedures if we had existing ones, for the first insert we don't need to record them
-        if current_procedures:
-            for name, proc_type in added_procedures:
-                conn.execute('''
-                    INSERT INTO procedures_changes
-                    (airport_icao, procedure_id, field_name, old_value, new_value, source, changed_at, airac_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    airport.ident, None, 'PROCEDURE_ADDED', None, f"{name} ({proc_type})",
-                    'unknown', datetime.now().isoformat(), self._airac_date
-                ))
+                values.append(field.format_for_storage(getattr(runway, field.name, None)))
+        return values
 
-        # Record REMOVED procedures
-        for name, proc_type in removed_procedures:
-            # Find the procedure ID for the removed procedure
-            proc_id = None
-            for curr in current_procedures:
-                if curr['name'] == name and curr['procedure_type'] == proc_type:
-                    proc_id = curr['id']
-                    break
-
-            conn.execute('''
-                INSERT INTO procedures_changes
-                (airport_icao, procedure_id, field_name, old_value, new_value, source, changed_at, airac_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                airport.ident, proc_id, 'PROCEDURE_REMOVED', f"{name} ({proc_type})", None,
-                'unknown', datetime.now().isoformat(), self._airac_date
-            ))
-        
-        # Clear all current procedures and insert new ones
-        if current_procedures:
-            conn.execute('DELETE FROM procedures WHERE airport_icao = ?', (airport.ident,))
-        
-        # Insert all new procedures using field definitions
-        for procedure in airport.procedures:
-            self._insert_procedure(conn, airport.ident, procedure)
-    
-    def _insert_procedure(self, conn: sqlite3.Connection, airport_icao: str, procedure: Procedure) -> None:
-        """Insert a new procedure using field definitions."""
-        fields = ProcedureFields.get_all_fields()
-        field_names = [field.name for field in fields]
-        placeholders = ','.join(['?' for _ in fields])
-        
-        # Prepare values using field definitions
+    @staticmethod
+    def _procedure_values(airport_icao: str, procedure: Procedure, fields: List[Any], now: str) -> List[Any]:
+        """Values of a new procedures row, in field definition order."""
         values = []
         for field in fields:
             if field.name == 'airport_icao':
                 values.append(airport_icao)
             elif field.name == 'created_at':
-                values.append(getattr(procedure, 'created_at', datetime.now()).isoformat() if hasattr(procedure, 'created_at') else datetime.now().isoformat())
+                values.append(procedure.created_at.isoformat() if hasattr(procedure, 'created_at') else now)
             elif field.name == 'updated_at':
-                values.append(datetime.now().isoformat())
+                values.append(now)
             else:
-                value = getattr(procedure, field.name, None)
-                values.append(field.format_for_storage(value))
-        
-        sql = f'''
-            INSERT INTO procedures 
-            ({','.join(field_names)})
-            VALUES ({placeholders})
-        '''
-        conn.execute(sql, values)
-    
-    def _save_airport_aip_entries(self, conn: sqlite3.Connection, airport: Airport) -> None:
-        """Save AIP entries with change tracking and conflict resolution."""
-        current_entries = self._get_current_aip_entries(conn, airport.ident)
-        
-        for entry in airport.aip_entries:
-            # Skip entries without std_field_id if save_only_std_fields is True
-            if self.save_only_std_fields and entry.std_field_id is None:
-                logger.debug(f"Skipping non-standardized AIP entry: {entry.section}.{entry.field} for {airport.ident}")
-                continue
-            
-            # Check for existing entry
-            key = (entry.section, entry.field, entry.source)
-            current_entry = current_entries.get(key)
-            
-            if current_entry is None:
-                # New entry
-                self._save_new_aip_entry(conn, airport.ident, entry)
-            elif current_entry['value'] != entry.value:
-                # Value changed - save to history and update
-                self._save_aip_change(conn, airport.ident, current_entry, entry)
-                self._update_aip_entry(conn, current_entry['id'], entry)
-    
-    def _save_new_aip_entry(self, conn: sqlite3.Connection, airport_icao: str, entry: AIPEntry) -> None:
-        """Save a new AIP entry."""
-        cursor = conn.execute('''
-            INSERT INTO aip_entries 
-            (airport_icao, section, field, value, std_field, std_field_id,
-             mapping_score, alt_field, alt_value, source, source_priority,
-             created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            airport_icao, entry.section, entry.field, entry.value,
-            entry.std_field, entry.std_field_id, entry.mapping_score,
-            entry.alt_field, entry.alt_value, entry.source, 0,  # Default priority
-            entry.created_at.isoformat(), datetime.now().isoformat()
-        ))
-    
-    def _save_aip_change(self, conn: sqlite3.Connection, airport_icao: str,
-                        old_entry: Dict, new_entry: AIPEntry) -> None:
-        """Save an AIP field change to history."""
-        conn.execute('''
-            INSERT INTO aip_entries_changes
-            (airport_icao, section, field, old_value, new_value, std_field,
-             std_field_id, mapping_score, source, changed_at, airac_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            airport_icao, new_entry.section, new_entry.field,
-            old_entry['value'], new_entry.value, new_entry.std_field,
-            new_entry.std_field_id, new_entry.mapping_score,
-            new_entry.source, datetime.now().isoformat(), self._airac_date
-        ))
-    
-    def _update_aip_entry(self, conn: sqlite3.Connection, entry_id: int, entry: AIPEntry) -> None:
-        """Update an existing AIP entry."""
-        conn.execute('''
-            UPDATE aip_entries SET
-            value = ?, std_field = ?, std_field_id = ?, mapping_score = ?,
-            alt_field = ?, alt_value = ?, updated_at = ?
-            WHERE id = ?
-        ''', (
-            entry.value, entry.std_field, entry.std_field_id, entry.mapping_score,
-            entry.alt_field, entry.alt_value, datetime.now().isoformat(), entry_id
-        ))
-    
+                values.append(field.format_for_storage(getattr(procedure, field.name, None)))
+        return values
+
     def _detect_airport_changes(self, current: Optional[Dict], new: Airport) -> List[Dict]:
         """Detect changes in airport basic fields using field definitions."""
         changes = []
@@ -902,7 +1147,7 @@ class DatabaseStorage:
                         'old_value': str(old_formatted) if old_formatted is not None else None,
                         'new_value': str(new_formatted) if new_formatted is not None else None,
                         'field_type': field.field_type.value,
-                        'source': list(new.sources)[0] if new.sources else 'unknown',
+                        'source': sorted(new.sources)[0] if new.sources else 'unknown',
                         'changed_at': now
                     })
         
@@ -981,18 +1226,21 @@ class DatabaseStorage:
         field_names = [f.name for f in fields]
         placeholders = ",".join(["?" for _ in fields])
 
+        # Current state keyed by the composite key (name, source_id)
+        current_waypoints = {
+            (row['name'], row['source_id']): dict(row)
+            for row in conn.execute('SELECT * FROM waypoints')
+        }
+
+        waypoint_changes = []
+        waypoint_rows = []
         for candidates in waypoints.values():
             for waypoint in candidates:
-                # Detect changes using composite key (name, source_id)
-                current = self._get_current_waypoint(conn, waypoint.name, waypoint.source_id)
-                changes = self._detect_waypoint_changes(current, waypoint)
+                key = (waypoint.name, waypoint.source_id)
+                changes = self._detect_waypoint_changes(current_waypoints.get(key), waypoint)
 
                 for change in changes:
-                    conn.execute('''
-                        INSERT INTO waypoints_changes
-                        (waypoint_name, field_name, old_value, new_value, field_type, source, changed_at, airac_date)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
+                    waypoint_changes.append((
                         waypoint.name, change['field_name'], change['old_value'],
                         change['new_value'], change['field_type'], change['source'],
                         change['changed_at'], self._airac_date
@@ -1010,13 +1258,20 @@ class DatabaseStorage:
                     else:
                         value = getattr(waypoint, f.name, None)
                         values.append(f.format_for_storage(value))
-
-                sql = f'''
-                    INSERT OR REPLACE INTO waypoints
-                    ({",".join(field_names)})
-                    VALUES ({placeholders})
-                '''
-                conn.execute(sql, values)
+                waypoint_rows.append(values)
+                # A repeated (name, source_id) diffs against the row just written
+                current_waypoints[key] = dict(zip(field_names, values))
+
+        conn.executemany('''
+            INSERT INTO waypoints_changes
+            (waypoint_name, field_name, old_value, new_value, field_type, source, changed_at, airac_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', waypoint_changes)
+        conn.executemany(f'''
+            INSERT OR REPLACE INTO waypoints
+            ({",".join(field_names)})
+            VALUES ({placeholders})
+        ''', waypoint_rows)
 
     def _load_waypoints(self, conn: sqlite3.Connection) -> List['Waypoint']:
         """Load all waypoints from the database."""
@@ -1027,32 +1282,37 @@ class DatabaseStorage:
 
         cursor = conn.execute('SELECT * FROM waypoints')
         waypoints = []
-        for row in cursor.fetchall():
-            row_dict = dict(row)
-            created_at = row_dict.get('created_at')
-            if isinstance(created_at, str):
-                try:
-                    created_at = datetime.fromisoformat(created_at)
-                except ValueError:
-                    created_at = datetime.now()
-            updated_at = row_dict.get('updated_at')
-            if isinstance(updated_at, str):
+        # Rows written together share timestamps: parse each distinct value
+        # once so the waypoints share the datetime objects
+        timestamps: Dict[str, datetime] = {}
+
+        def parse_timestamp(value: Any) -> datetime:
+            if not isinstance(value, str):
+                return value or datetime.now()
+            parsed = timestamps.get(value)
+            if parsed is None:
                 try:
-                    updated_at = datetime.fromisoformat(updated_at)
+                    parsed = datetime.fromisoformat(value)
                 except ValueError:
-                    updated_at = datetime.now()
+                    return datetime.now()
+                timestamps[value] = parsed
+            return parsed
 
+        # Iterate the cursor rather than fetchall() so the rows are not all
+        # held in memory next to the waypoints built from them
+        for row in cursor:
+            row_dict = dict(row)
             waypoint = Waypoint(
                 name=row_dict['name'],
                 latitude_deg=self._safe_convert_value(row_dict['latitude_deg'], 'REAL'),
                 longitude_deg=self._safe_convert_value(row_dict['longitude_deg'], 'REAL'),
-                point_type=row_dict.get('point_type'),
-                fir_codes=row_dict.get('fir_codes'),
-                level_availability=row_dict.get('level_availability'),
-                source=row_dict.get('source', 'unknown'),
+                point_type=_intern(row_dict.get('point_type')),
+                fir_codes=_intern(row_dict.get('fir_codes')),
+                level_availability=_intern(row_dict.get('level_availability')),
+                source=_intern(row_dict.get('source', 'unknown')),
                 source_id=row_dict.get('source_id', ''),
-                created_at=created_at or datetime.now(),
-                updated_at=updated_at or datetime.now(),
+                created_at=parse_timestamp(row_dict.get('created_at')),
+                updated_at=parse_timestamp(row_dict.get('updated_at')),
             )
             waypoints.append(waypoint)
 
@@ -1067,21 +1327,25 @@ class DatabaseStorage:
         """Save FIRs to the database (full overwrite per ICAO; no change tracking).
 
         FIR boundaries change rarely; we store the polygons as JSON and rely on
-        the bbox columns for cheap spatial prefilter. Updates are idempotent
-        via INSERT OR REPLACE keyed on icao.
+        the bbox columns for cheap spatial prefilter. The simplified levels
+        (``FIR.SIMPLIFY_TOLERANCES_NM``, computed here if missing) are stored
+        alongside so loading a model does not simplify again. Updates are
+        idempotent via INSERT OR REPLACE keyed on icao.
         """
         for fir in firs.values():
             bbox = fir.bbox or fir._compute_bbox()
             polygons_json = json.dumps(fir.polygons)
+            fir.build_simplified()
+            simplified_json = json.dumps({str(t): level for t, level in sorted(fir.simplified.items())})
             conn.execute('''
                 INSERT OR REPLACE INTO firs
-                (icao, name, polygons_json,
+                (icao, name, polygons_json, simplified_json,
                  bbox_min_lon, bbox_min_lat, bbox_max_lon, bbox_max_lat,
                  is_oceanic, region, label_lon, label_lat,
                  source, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
-                fir.icao, fir.name, polygons_json,
+                fir.icao, fir.name, polygons_json, simplified_json,
                 bbox[0], bbox[1], bbox[2], bbox[3],
                 1 if fir.is_oceanic else 0,
                 fir.region, fir.label_lon, fir.label_lat,
@@ -1105,6 +1369,12 @@ class DatabaseStorage:
             except (TypeError, json.JSONDecodeError):
                 logger.warning("Failed to decode polygons for FIR %s", row_dict.get('icao'))
                 continue
+            try:
+                simplified = {float(t): level for t, level in
+                              json.loads(row_dict.get('simplified_json') or '{}').items()}
+            except (AttributeError, TypeError, ValueError):
+                logger.warning("Failed to decode simplified polygons for FIR %s", row_dict.get('icao'))
+                simplified = {}
 
             bbox = (
                 row_dict['bbox_min_lon'], row_dict['bbox_min_lat'],
@@ -1136,17 +1406,12 @@ class DatabaseStorage:
                 bbox=bbox,
                 created_at=created_at or datetime.now(),
                 updated_at=updated_at or datetime.now(),
+                simplified=simplified,
             ))
 
         logger.debug("Loaded %d FIRs from database", len(firs))
         return firs
 
-    def _get_current_waypoint(self, conn: sqlite3.Connection, name: str, source_id: str = "") -> Optional[Dict]:
-        """Get current waypoint data by composite key (name, source_id)."""
-        cursor = conn.execute('SELECT * FROM waypoints WHERE name = ? AND source_id = ?', (name, source_id))
-        row = cursor.fetchone()
-        return dict(row) if row else None
-
     def _detect_waypoint_changes(self, current: Optional[Dict], new: 'Waypoint') -> List[Dict]:
         """Detect changes in waypoint fields using field definitions."""
         changes = []
@@ -1173,50 +1438,30 @@ class DatabaseStorage:
 
         return changes
 
-    def _get_current_airport(self, conn: sqlite3.Connection, icao: str) -> Optional[Dict]:
-        """Get current airport data."""
-        cursor = conn.execute('SELECT * FROM airports WHERE icao_code = ?', (icao,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
-    
-    def _get_current_runways(self, conn: sqlite3.Connection, icao: str) -> List[Dict]:
-        """Get current runways for an airport."""
-        cursor = conn.execute('SELECT * FROM runways WHERE airport_icao = ?', (icao,))
-        return [dict(row) for row in cursor.fetchall()]
-    
-    def _get_current_procedures(self, conn: sqlite3.Connection, icao: str) -> List[Dict]:
-        """Get current procedures for an airport."""
-        cursor = conn.execute('SELECT * FROM procedures WHERE airport_icao = ?', (icao,))
-        return [dict(row) for row in cursor.fetchall()]
-    
-    def _get_current_aip_entries(self, conn: sqlite3.Connection, icao: str) -> Dict[Tuple, Dict]:
-        """Get current AIP entries for an airport, indexed by (section, field, source)."""
-        cursor = conn.execute('SELECT * FROM aip_entries WHERE airport_icao = ?', (icao,))
-        entries = {}
-        for row in cursor.fetchall():
-            key = (row['section'], row['field'], row['source'])
-            entries[key] = dict(row)
-        return entries
-    
-    def _update_country_coverage(self, conn: sqlite3.Connection) -> None:
+    def _update_country_coverage(self, conn: sqlite3.Connection, countries: Optional[List[str]] = None) -> None:
         """Update per-country AIP data coverage from aip_entries timestamps.
 
         For each country that has AIP entries, records the effective AIRAC date
         derived from the latest aip_entries.updated_at timestamp.  Countries
         without AIP entries are not included — they only have basic metadata.
+        With ``countries``, only those countries are refreshed.
         """
         from euro_aip.utils.airac_date_calculator import AIRACDateCalculator
         calc = AIRACDateCalculator()
 
-        rows = conn.execute('''
+        country_filter, params = '', []
+        if countries is not None:
+            country_filter = f"AND a.iso_country IN ({','.join('?' for _ in countries)})"
+            params = list(countries)
+        rows = conn.execute(f'''
             SELECT a.iso_country,
                    COUNT(DISTINCT a.icao_code) AS airports_with_aip,
                    MAX(ae.updated_at) AS latest_update
             FROM airports a
             JOIN aip_entries ae ON a.icao_code = ae.airport_icao
-            WHERE a.iso_country IS NOT NULL
+            WHERE a.iso_country IS NOT NULL {country_filter}
             GROUP BY a.iso_country
-        ''').fetchall()
+        ''', params).fetchall()
 
         for row in rows:
             latest_date = row['latest_update'][:10]  # YYYY-MM-DD
@@ -1228,6 +1473,31 @@ class DatabaseStorage:
             ''', (row['iso_country'], airac_date, 'aip_data',
                   row['airports_with_aip'], row['latest_update']))
 
+    def _record_last_save(self, conn: sqlite3.Connection, changed_airports: List[str]) -> None:
+        """Record which airports the save changed, for get_airports_changed_in_last_save()."""
+        conn.execute('''
+            INSERT OR REPLACE INTO model_metadata (key, value, updated_at)
+            VALUES (?, ?, ?)
+        ''', ('last_save_changed_airports', json.dumps(changed_airports), datetime.now().isoformat()))
+
+    def get_airports_changed_in_last_save(self) -> List[str]:
+        """
+        ICAO codes of the airports new or changed by the last save_model() or save_airports().
+
+        An airport counts as changed when the save recorded a change to it,
+        its runways, procedures or AIP entries, or added a runway or AIP
+        entry; airports saved for the first time are all included. Used to
+        regenerate only the affected map tiles (see TileGenerator).
+
+        Returns:
+            ICAO codes in save order, empty if nothing was saved yet
+        """
+        with self._get_connection(write=False) as conn:
+            row = conn.execute(
+                "SELECT value FROM model_metadata WHERE key = 'last_save_changed_airports'"
+            ).fetchone()
+        return json.loads(row[0]) if row else []
+
     def _update_metadata(self, conn: sqlite3.Connection, model: EuroAipModel) -> None:
         """Update model metadata."""
         stats = model.get_statistics()
@@ -1266,7 +1536,7 @@ class DatabaseStorage:
 
     def get_airac_updates(self) -> List[Dict]:
         """Return all recorded AIRAC updates, most recent first."""
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             cursor = conn.execute('''
                 SELECT airac_date, source, fetched_at, airports_updated, changes_count, status
                 FROM airac_updates ORDER BY airac_date DESC, source
@@ -1279,7 +1549,7 @@ class DatabaseStorage:
         Returns a list of dicts with keys: country_iso, airac_date, source,
         airports_count, updated_at. Ordered by country_iso.
         """
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             # Check if table exists (for older databases)
             cursor = conn.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name='airac_country_coverage'"
@@ -1293,32 +1563,68 @@ class DatabaseStorage:
             ''')
             return [dict(row) for row in cursor.fetchall()]
 
-    def load_model(self,ignore_non_icao: bool = True) -> EuroAipModel:
+    # Parts of the model load_model can include
+    MODEL_PARTS = ('runways', 'procedures', 'aip_entries', 'waypoints', 'firs', 'border_crossings')
+
+    def load_model(self, ignore_non_icao: bool = True, include: Optional[Iterable[str]] = None,
+                   countries: Optional[Iterable[str]] = None,
+                   bbox: Optional[Tuple[float, float, float, float]] = None,
+                   lazy: bool = False) -> EuroAipModel:
         """
-        Load the entire EuroAipModel from the database.
-        
+        Load the EuroAipModel from the database, optionally only part of it.
+
+        Args:
+            ignore_non_icao: Skip airports whose code is not 4 characters
+            include: Parts to load, from MODEL_PARTS. Airports are always
+                     loaded; None loads everything. For example
+                     ``include={'runways'}`` is enough for map tiles.
+            countries: Only load airports with one of these ISO country codes
+            bbox: Only load airports inside (min_lon, min_lat, max_lon, max_lat)
+            lazy: Load each airport's procedures and AIP entries (when
+                  included) from the database on first access instead of
+                  up front. Derived fuel fields are still set at load time.
+
+        A model loaded with ``include``, ``countries`` or ``bbox`` remembers
+        it: save_model() and save_airports() then leave the parts and
+        airports that were not loaded as they are in the database.
+
         Returns:
             EuroAipModel instance
         """
+        parts = set(self.MODEL_PARTS if include is None else include)
+        unknown = parts - set(self.MODEL_PARTS)
+        if unknown:
+            raise ValueError(f"Unknown model parts {sorted(unknown)}, expected some of {self.MODEL_PARTS}")
+        if countries is not None:
+            countries = sorted({country.upper() for country in countries})
+        airport_filter = self._airport_filter(countries, bbox)
+        deferred = [name for name in Airport.LAZY_RELATIONSHIPS if name in parts] if lazy else []
+
         logger.info("Loading model from database")
         
         model = EuroAipModel()
-
-        with self._get_connection() as conn:
-            # Load all airports
-            cursor = conn.execute('SELECT icao_code FROM airports')
-            airport_codes = [row['icao_code'] for row in cursor.fetchall()]
-
-            # Collect airports for bulk add
-            airports_to_load = []
-            for icao in airport_codes:
-                if ignore_non_icao and not len(icao) == 4:
-                    continue
-                airport = self._load_airport(conn, icao)
-                if airport:
-                    airports_to_load.append(airport)
-                    for source in airport.sources:
-                        model.sources_used.add(source)
+        if parts != set(self.MODEL_PARTS):
+            model._loaded_parts = frozenset(parts)
+        if countries is not None or bbox is not None:
+            model._loaded_scope = {'countries': countries, 'bbox': bbox}
+
+        with self._get_connection(write=False) as conn:
+            # Load airports with the requested relationships
+            airports_to_load = self._load_airports(
+                conn, ignore_non_icao,
+                relationships=[name for name in ('runways', 'procedures', 'aip_entries')
+                               if name in parts and name not in deferred],
+                airport_filter=airport_filter,
+            )
+            if deferred:
+                if 'aip_entries' in deferred:
+                    self._load_fuel_fields(conn, airports_to_load, airport_filter)
+                loader = AirportRelationshipLoader(self)
+                for airport in airports_to_load:
+                    airport.defer_relationships(deferred, loader)
+            for airport in airports_to_load:
+                for source in airport.sources:
+                    model.sources_used.add(source)
 
             # Bulk add all loaded airports
             if airports_to_load:
@@ -1331,16 +1637,19 @@ class DatabaseStorage:
                 logger.debug(f"Loaded {result['added']} airports from database")
 
             # Load waypoints
-            waypoints = self._load_waypoints(conn)
-            if waypoints:
-                model.bulk_add_waypoints(waypoints)
+            if 'waypoints' in parts:
+                waypoints = self._load_waypoints(conn)
+                if waypoints:
+                    model.bulk_add_waypoints(waypoints)
 
             # Load FIRs
-            firs = self._load_firs(conn)
-            if firs:
-                model.bulk_add_firs(firs)
+            if 'firs' in parts:
+                firs = self._load_firs(conn)
+                if firs:
+                    model.bulk_add_firs(firs)
 
-            # Load border crossing data
+        # Load border crossing data
+        if 'border_crossings' in parts:
             border_crossing_points = self.load_border_crossing_data()
             if border_crossing_points:
                 model.add_border_crossing_points(border_crossing_points)
@@ -1349,33 +1658,310 @@ class DatabaseStorage:
         
         # Update all derived fields after loading
         model.update_all_derived_fields()
+        # Freshly loaded airports match the database
+        model.clear_changed_airports()
         
         return model
+
+    @staticmethod
+    def _airport_filter(countries: Optional[Iterable[str]],
+                        bbox: Optional[Tuple[float, float, float, float]]) -> Tuple[str, List[Any]]:
+        """
+        Build a WHERE condition on the airports table for load_model filters.
+
+        Returns:
+            (condition, parameters); the condition is empty when there is no filter
+        """
+        conditions = []
+        params: List[Any] = []
+        if countries is not None:
+            countries = [country.upper() for country in countries]
+            conditions.append(f"iso_country IN ({','.join('?' for _ in countries)})")
+            params.extend(countries)
+        if bbox is not None:
+            min_lon, min_lat, max_lon, max_lat = bbox
+            conditions.append('longitude_deg BETWEEN ? AND ? AND latitude_deg BETWEEN ? AND ?')
+            params.extend([min_lon, max_lon, min_lat, max_lat])
+        return ' AND '.join(conditions), params
+
+    def _load_fuel_fields(self, conn: sqlite3.Connection, airports: List[Airport],
+                          airport_filter: Tuple[str, List[Any]] = ('', [])) -> None:
+        """
+        Set the fuel fields derived from AIP entries without loading all entries.
+
+        Only the rows sharing (section, field) with a fuel entry (field 402)
+        are read; they are merged exactly as a full load would merge them, so
+        the derived avgas/jet_a values are the same.
+        """
+        by_icao = {airport.ident: airport for airport in airports}
+        condition, params = airport_filter
+        where = f"AND e.airport_icao IN (SELECT icao_code FROM airports WHERE {condition})" if condition else ''
+        columns = ', '.join(f'e.{column}' for column in self._AIP_ENTRY_COLUMNS)
+        scratch: Dict[str, Airport] = {}
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        for row in cursor.execute(f'''
+            SELECT {columns} FROM aip_entries e
+            WHERE EXISTS (
+                SELECT 1 FROM aip_entries f
+                WHERE f.airport_icao = e.airport_icao AND f.section = e.section
+                AND f.field = e.field AND f.std_field_id = 402
+            ) {where}
+            ORDER BY e.airport_icao, e.section, e.id
+        ''', params):
+            if row[0] in by_icao:
+                entries = scratch.setdefault(row[0], Airport(ident=row[0]))
+                entries.add_aip_entry(self._aip_entry_from_row(row[0], row))
+        for icao, entries in scratch.items():
+            entries.update_aip_derived_fields()
+            by_icao[icao].avgas = entries.avgas
+            by_icao[icao].jet_a = entries.jet_a
+
+    def _load_relationship(self, conn: sqlite3.Connection, icao: str, name: str) -> List[Any]:
+        """Load one relationship (procedures or aip_entries) of an airport."""
+        scratch = Airport(ident=icao)
+        if name == 'procedures':
+            self._load_airport_procedures(conn, scratch)
+        elif name == 'aip_entries':
+            self._load_airport_aip_entries(conn, scratch)
+        else:
+            raise ValueError(f"Cannot load relationship {name!r}")
+        return getattr(scratch, name)
     
+    def model_fingerprint(self) -> Optional[str]:
+        """
+        Fingerprint of the saved model, from the model_metadata table.
+
+        It changes on every save_model (which rewrites the statistics and
+        schema version rows), so it tells whether a snapshot written from
+        this database is still current. None if nothing was saved yet.
+        """
+        with self._get_connection(write=False) as conn:
+            rows = conn.execute('SELECT key, value, updated_at FROM model_metadata ORDER BY key').fetchall()
+        if not any(row['key'] == 'statistics' for row in rows):
+            return None
+        digest = hashlib.sha256()
+        for row in rows:
+            digest.update(json.dumps([row['key'], row['value'], row['updated_at']]).encode('utf-8'))
+        return digest.hexdigest()
+
+    def save_snapshot(self, model: EuroAipModel, snapshot_path: str) -> str:
+        """
+        Write a binary snapshot of a model saved to or loaded from this database.
+
+        The snapshot records the database fingerprint so load_model_snapshot
+        can tell when it has gone stale. Call it after save_model at the end
+        of an ingest, with a model whose derived fields are up to date.
+
+        Returns:
+            The snapshot content hash
+        """
+        return ModelSnapshot.write(model, snapshot_path, metadata={
+            'database': str(self.database_path),
+            'fingerprint': self.model_fingerprint(),
+        })
+
+    def load_model_snapshot(self, snapshot_path: str, refresh: bool = True,
+                            mapped: bool = False) -> EuroAipModel:
+        """
+        Load the model from a snapshot, falling back to the database if it is stale.
+
+        The snapshot is used when it exists, has the current format version
+        and was written for the database's current fingerprint. Otherwise the
+        model is loaded with load_model() and, if ``refresh`` is set, a new
+        snapshot is written for the next process.
+
+        Args:
+            snapshot_path: Snapshot file path
+            refresh: Rewrite the snapshot after falling back to the database
+            mapped: Return a read-only MappedModel over the memory-mapped
+                    snapshot instead of building the model, so that worker
+                    processes share one copy of it. A stale snapshot is
+                    always rewritten first in this mode.
+
+        Returns:
+            EuroAipModel instance (a MappedModel when ``mapped`` is set)
+        """
+        fingerprint = self.model_fingerprint()
+        try:
+            snapshot = ModelSnapshot.open(snapshot_path)
+        except SnapshotError as e:
+            logger.info(f"Snapshot not usable ({e}), loading model from database")
+        else:
+            if fingerprint is not None and snapshot.metadata.get('fingerprint') == fingerprint:
+                if mapped:
+                    return MappedModel(snapshot)
+                with snapshot:
+                    return snapshot.to_model()
+            snapshot.close()
+            logger.info(f"Snapshot {snapshot_path} is stale, loading model from database")
+
+        model = self.load_model()
+        if refresh or mapped:
+            self.save_snapshot(model, snapshot_path)
+        if mapped:
+            return MappedModel.open(snapshot_path)
+        return model
+
+    # Columns read for AIP entries, in the order _aip_entry_from_row expects
+    _AIP_ENTRY_COLUMNS = (
+        'airport_icao', 'section', 'field', 'value', 'std_field', 'std_field_id',
+        'mapping_score', 'alt_field', 'alt_value', 'source',
+    )
+
+    def _load_airports(self, conn: sqlite3.Connection, ignore_non_icao: bool = True,
+                       relationships: Iterable[str] = ('runways', 'procedures', 'aip_entries'),
+                       airport_filter: Tuple[str, List[Any]] = ('', [])) -> List[Airport]:
+        """
+        Load all airports with their runways, procedures and AIP entries.
+
+        Reads each table in a single ordered scan and attaches the rows to
+        their airport in memory, instead of querying every table once per
+        airport. Airports come back sorted by ICAO code and child rows in the
+        same order as the per-airport queries of _load_airport.
+
+        Args:
+            conn: Open database connection
+            ignore_non_icao: Skip airports whose code is not 4 characters
+            relationships: Which of runways, procedures and aip_entries to load
+            airport_filter: (condition, parameters) on the airports table, as
+                            built by _airport_filter; child tables are limited
+                            to the matching airports
+
+        Returns:
+            List of loaded airports
+        """
+        relationships = set(relationships)
+        condition, params = airport_filter
+        where = f'WHERE {condition}' if condition else ''
+        child_where = f'WHERE airport_icao IN (SELECT icao_code FROM airports {where})' if condition else ''
+
+        # Plain tuples are much cheaper than sqlite3.Row for full-table scans
+        cursor = conn.cursor()
+        cursor.row_factory = None
+
+        airport_fields = self._field_types(AirportFields.get_all_fields())
+        airports: Dict[str, Airport] = {}
+        for row in cursor.execute(
+            f'SELECT {self._columns(airport_fields)} FROM airports {where} ORDER BY icao_code', params
+        ):
+            icao = row[0]
+            if ignore_non_icao and not len(icao) == 4:
+                continue
+            airports[icao] = self._airport_from_row(row, airport_fields)
+
+        if 'runways' in relationships:
+            runway_fields = self._field_types(RunwayFields.get_all_fields())
+            for row in cursor.execute(
+                f'SELECT {self._columns(runway_fields)} FROM runways {child_where} ORDER BY id', params
+            ):
+                airport = airports.get(row[0])
+                if airport is not None:
+                    airport.add_runway(self._runway_from_row(airport.ident, row, runway_fields))
+
+        if 'procedures' in relationships:
+            procedure_fields = self._field_types(ProcedureFields.get_all_fields())
+            for row in cursor.execute(
+                f'SELECT {self._columns(procedure_fields)} FROM procedures {child_where} ORDER BY id', params
+            ):
+                airport = airports.get(row[0])
+                if airport is not None:
+                    airport.add_procedure(self._procedure_from_row(row, procedure_fields))
+
+        if 'aip_entries' not in relationships:
+            return list(airports.values())
+
+        # Same (airport_icao, section) index order as the per-airport query.
+        # Rows are grouped per airport; when an airport has no repeated
+        # (section, field) the entries are attached directly, otherwise they
+        # go through add_aip_entry so duplicates merge as before.
+        entries: List[AIPEntry] = []
+        keys = set()
+        current: Optional[Airport] = None
+        for row in cursor.execute(
+            f"SELECT {', '.join(self._AIP_ENTRY_COLUMNS)} FROM aip_entries {child_where} "
+            "ORDER BY airport_icao, section, id", params
+        ):
+            airport = airports.get(row[0])
+            if airport is not current:
+                self._attach_aip_entries(current, entries, len(keys) == len(entries))
+                current, entries, keys = airport, [], set()
+            if airport is not None:
+                entries.append(self._aip_entry_from_row(airport.ident, row))
+                keys.add((row[1], row[2]))
+        self._attach_aip_entries(current, entries, len(keys) == len(entries))
+
+        return list(airports.values())
+
+    @staticmethod
+    def _attach_aip_entries(airport: Optional[Airport], entries: List[AIPEntry], unique: bool) -> None:
+        """Attach freshly loaded AIP entries to an airport that has none yet."""
+        if airport is None:
+            return
+        if unique:
+            airport.aip_entries.extend(entries)
+        else:
+            for entry in entries:
+                airport.add_aip_entry(entry)
+
     def _load_airport(self, conn: sqlite3.Connection, icao: str) -> Optional[Airport]:
         """Load a single airport with all its data using field definitions."""
         # Load basic airport info
-        cursor = conn.execute('SELECT * FROM airports WHERE icao_code = ?', (icao,))
+        airport_fields = self._field_types(AirportFields.get_all_fields())
+        cursor = conn.execute(f'SELECT {self._columns(airport_fields)} FROM airports WHERE icao_code = ?', (icao,))
         row = cursor.fetchone()
         if not row:
             return None
-        
-        # Create airport object using field definitions for proper type conversion
-        airport_data = {}
-        for field in AirportFields.get_all_fields():
-            value = row[field.name]
-            
-            # Use safe conversion to handle string "nan" values
-            airport_data[field.name] = self._safe_convert_value(value, field.field_type.value)
-            
-            # Special handling for datetime fields
-            if field.field_type.value == "TEXT" and field.name in ['created_at', 'updated_at'] and airport_data[field.name]:
-                try:
-                    airport_data[field.name] = datetime.fromisoformat(airport_data[field.name])
-                except ValueError:
-                    pass  # Keep as string if parsing fails
-        
-        # Create airport object
+        airport = self._airport_from_row(row, airport_fields)
+
+        # Load runways using field definitions
+        runway_fields = self._field_types(RunwayFields.get_all_fields())
+        cursor = conn.execute(f'SELECT {self._columns(runway_fields)} FROM runways WHERE airport_icao = ?', (icao,))
+        for row in cursor.fetchall():
+            airport.add_runway(self._runway_from_row(icao, row, runway_fields))
+
+        self._load_airport_procedures(conn, airport)
+        self._load_airport_aip_entries(conn, airport)
+
+        return airport
+
+    def _load_airport_procedures(self, conn: sqlite3.Connection, airport: Airport) -> None:
+        """Load the procedures of one airport."""
+        procedure_fields = self._field_types(ProcedureFields.get_all_fields())
+        cursor = conn.execute(
+            f'SELECT {self._columns(procedure_fields)} FROM procedures WHERE airport_icao = ? ORDER BY id',
+            (airport.ident,)
+        )
+        for row in cursor.fetchall():
+            airport.add_procedure(self._procedure_from_row(row, procedure_fields))
+
+    def _load_airport_aip_entries(self, conn: sqlite3.Connection, airport: Airport) -> None:
+        """Load the AIP entries of one airport."""
+        cursor = conn.execute(
+            f"SELECT {', '.join(self._AIP_ENTRY_COLUMNS)} FROM aip_entries WHERE airport_icao = ? "
+            "ORDER BY section, id", (airport.ident,)
+        )
+        for row in cursor.fetchall():
+            airport.add_aip_entry(self._aip_entry_from_row(airport.ident, row))
+
+    @staticmethod
+    def _field_types(fields: List[Any]) -> List[Tuple[str, str]]:
+        """Return (name, SQL type) pairs for a list of field definitions."""
+        return [(field.name, field.field_type.value) for field in fields]
+
+    @staticmethod
+    def _columns(field_types: List[Tuple[str, str]]) -> str:
+        """Column list selecting the given fields, in order."""
+        return ', '.join(name for name, _ in field_types)
+
+    def _convert_row(self, row: Tuple[Any, ...], field_types: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """Convert a row selected with _columns(field_types) to a dict, handling string "nan" values."""
+        convert = self._safe_convert_value
+        return {name: convert(value, field_type) for (name, field_type), value in zip(field_types, row)}
+
+    def _airport_from_row(self, row: Tuple[Any, ...], field_types: List[Tuple[str, str]]) -> Airport:
+        """Build an Airport (without runways, procedures or AIP entries) from an airports row."""
+        airport_data = self._convert_row(row, field_types)
         airport = Airport(
             ident=airport_data['icao_code'],
             name=airport_data['name'],
@@ -1400,80 +1986,63 @@ class DatabaseStorage:
         if airport_data['sources']:
             for source in airport_data['sources'].split(','):
                 airport.add_source(source)
-        
-        # Load runways using field definitions
-        cursor = conn.execute('SELECT * FROM runways WHERE airport_icao = ?', (icao,))
-        for row in cursor.fetchall():
-            runway_data = {}
-            for field in RunwayFields.get_all_fields():
-                value = row[field.name]
-                
-                # Use safe conversion to handle string "nan" values
-                runway_data[field.name] = self._safe_convert_value(value, field.field_type.value)
-            
-            runway = Runway(
-                airport_ident=icao,
-                le_ident=runway_data['le_ident'],
-                he_ident=runway_data['he_ident'],
-                length_ft=runway_data['length_ft'],
-                width_ft=runway_data['width_ft'],
-                surface=runway_data['surface'],
-                lighted=runway_data['lighted'],
-                closed=runway_data['closed'],
-                le_latitude_deg=runway_data['le_latitude_deg'],
-                le_longitude_deg=runway_data['le_longitude_deg'],
-                le_elevation_ft=runway_data['le_elevation_ft'],
-                le_heading_degT=runway_data['le_heading_degT'],
-                le_displaced_threshold_ft=runway_data['le_displaced_threshold_ft'],
-                he_latitude_deg=runway_data['he_latitude_deg'],
-                he_longitude_deg=runway_data['he_longitude_deg'],
-                he_elevation_ft=runway_data['he_elevation_ft'],
-                he_heading_degT=runway_data['he_heading_degT'],
-                he_displaced_threshold_ft=runway_data['he_displaced_threshold_ft']
-            )
-            airport.add_runway(runway)
-        
-        # Load procedures using field definitions
-        cursor = conn.execute('SELECT * FROM procedures WHERE airport_icao = ?', (icao,))
-        for row in cursor.fetchall():
-            procedure_data = {}
-            for field in ProcedureFields.get_all_fields():
-                value = row[field.name]
-                
-                # Use safe conversion to handle string "nan" values
-                procedure_data[field.name] = self._safe_convert_value(value, field.field_type.value)
-            
-            procedure = Procedure(
-                name=procedure_data['name'],
-                procedure_type=procedure_data['procedure_type'],
-                approach_type=procedure_data['approach_type'],
-                runway_ident=procedure_data['runway_ident'],
-                runway_letter=procedure_data['runway_letter'],
-                runway_number=procedure_data['runway_number'],
-                source=procedure_data['source'],
-                authority=procedure_data['authority'],
-                raw_name=procedure_data['raw_name']
-            )
-            airport.add_procedure(procedure)
-        
-        # Load AIP entries
-        cursor = conn.execute('SELECT * FROM aip_entries WHERE airport_icao = ?', (icao,))
-        for row in cursor.fetchall():
-            entry = AIPEntry(
-                ident=icao,
-                section=row['section'],
-                field=row['field'],
-                value=row['value'],
-                std_field=row['std_field'],
-                std_field_id=row['std_field_id'],
-                mapping_score=row['mapping_score'],
-                alt_field=row['alt_field'],
-                alt_value=row['alt_value'],
-                source=row['source']
-            )
-            airport.add_aip_entry(entry)
-        
         return airport
+
+    def _runway_from_row(self, icao: str, row: Tuple[Any, ...], field_types: List[Tuple[str, str]]) -> Runway:
+        """Build a Runway from a runways row."""
+        runway_data = self._convert_row(row, field_types)
+        return Runway(
+            airport_ident=icao,
+            le_ident=runway_data['le_ident'],
+            he_ident=runway_data['he_ident'],
+            length_ft=runway_data['length_ft'],
+            width_ft=runway_data['width_ft'],
+            surface=runway_data['surface'],
+            lighted=runway_data['lighted'],
+            closed=runway_data['closed'],
+            le_latitude_deg=runway_data['le_latitude_deg'],
+            le_longitude_deg=runway_data['le_longitude_deg'],
+            le_elevation_ft=runway_data['le_elevation_ft'],
+            le_heading_degT=runway_data['le_heading_degT'],
+            le_displaced_threshold_ft=runway_data['le_displaced_threshold_ft'],
+            he_latitude_deg=runway_data['he_latitude_deg'],
+            he_longitude_deg=runway_data['he_longitude_deg'],
+            he_elevation_ft=runway_data['he_elevation_ft'],
+            he_heading_degT=runway_data['he_heading_degT'],
+            he_displaced_threshold_ft=runway_data['he_displaced_threshold_ft']
+        )
+
+    def _procedure_from_row(self, row: Tuple[Any, ...], field_types: List[Tuple[str, str]]) -> Procedure:
+        """Build a Procedure from a procedures row."""
+        procedure_data = self._convert_row(row, field_types)
+        return Procedure(
+            name=procedure_data['name'],
+            procedure_type=procedure_data['procedure_type'],
+            approach_type=procedure_data['approach_type'],
+            runway_ident=procedure_data['runway_ident'],
+            runway_letter=procedure_data['runway_letter'],
+            runway_number=procedure_data['runway_number'],
+            source=procedure_data['source'],
+            authority=procedure_data['authority'],
+            raw_name=procedure_data['raw_name']
+        )
+
+    @staticmethod
+    def _aip_entry_from_row(icao: str, row: Tuple[Any, ...]) -> AIPEntry:
+        """Build an AIPEntry from a row selected with _AIP_ENTRY_COLUMNS."""
+        _, section, field, value, std_field, std_field_id, mapping_score, alt_field, alt_value, source = row
+        return AIPEntry(
+            ident=icao,
+            section=_intern(section),
+            field=_intern(field),
+            value=value,
+            std_field=_intern(std_field),
+            std_field_id=std_field_id,
+            mapping_score=mapping_score,
+            alt_field=_intern(alt_field),
+            alt_value=alt_value,
+            source=_intern(source)
+        )
     
     def get_changes_for_airport(self, icao: str, days: int = 30) -> Dict[str, List[Dict]]:
         """
@@ -1492,22 +2061,24 @@ class DatabaseStorage:
             'procedures': [],
             'aip_entries': []
         }
+        # Bound rather than formatted into the SQL, so the statements are reused
+        since = f'-{int(days)} days'
         
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             # Get airport field changes
             cursor = conn.execute('''
                 SELECT * FROM airports_changes 
-                WHERE airport_icao = ? AND changed_at >= date('now', '-{} days')
+                WHERE airport_icao = ? AND changed_at >= date('now', ?)
                 ORDER BY changed_at DESC
-            '''.format(days), (icao,))
+            ''', (icao, since))
             changes['airport'] = [dict(row) for row in cursor.fetchall()]
             
             # Get AIP field changes
             cursor = conn.execute('''
                 SELECT * FROM aip_entries_changes 
-                WHERE airport_icao = ? AND changed_at >= date('now', '-{} days')
+                WHERE airport_icao = ? AND changed_at >= date('now', ?)
                 ORDER BY changed_at DESC
-            '''.format(days), (icao,))
+            ''', (icao, since))
             changes['aip_entries'] = [dict(row) for row in cursor.fetchall()]
             
             # Get runway changes
@@ -1515,24 +2086,149 @@ class DatabaseStorage:
                 SELECT rc.*, r.le_ident, r.he_ident 
                 FROM runways_changes rc
                 LEFT JOIN runways r ON rc.runway_id = r.id
-                WHERE rc.airport_icao = ? AND rc.changed_at >= date('now', '-{} days')
+                WHERE rc.airport_icao = ? AND rc.changed_at >= date('now', ?)
                 ORDER BY rc.changed_at DESC
-            '''.format(days), (icao,))
+            ''', (icao, since))
             changes['runways'] = [dict(row) for row in cursor.fetchall()]
             
             # Get procedure changes
             cursor = conn.execute('''
                 SELECT *
                 FROM procedures_changes 
-                WHERE airport_icao = ? AND changed_at >= date('now', '-{} days')
-            '''.format(days), (icao,))
+                WHERE airport_icao = ? AND changed_at >= date('now', ?)
+            ''', (icao, since))
             changes['procedures'] = [dict(row) for row in cursor.fetchall()]
         
         return changes
     
+    # Change history tables for get_change_history: name -> (table, ident column,
+    # field column, condition selecting a country's changes)
+    _AIRPORT_COUNTRY = 'airport_icao IN (SELECT icao_code FROM airports WHERE iso_country = ?)'
+    CHANGE_HISTORY_TABLES = {
+        'airports': ('airports_changes', 'airport_icao', 'field_name', _AIRPORT_COUNTRY),
+        'runways': ('runways_changes', 'airport_icao', 'field_name', _AIRPORT_COUNTRY),
+        'procedures': ('procedures_changes', 'airport_icao', 'field_name', _AIRPORT_COUNTRY),
+        'aip_entries': ('aip_entries_changes', 'airport_icao', 'field', _AIRPORT_COUNTRY),
+        'waypoints': ('waypoints_changes', 'waypoint_name', 'field_name', None),
+        'border_crossing_points': ('border_crossing_points_changes', 'icao_code', None, 'country_iso = ?'),
+    }
+
+    def _change_history_query(self, table: str, airac_date: Optional[str], country: Optional[str],
+                              ident: Optional[str], field: Optional[str], source: Optional[str],
+                              since: Optional[Any]) -> Optional[Tuple[str, List[Any]]]:
+        """SQL (without the keyset condition) and parameters for a change history
+        query, or None if the table cannot apply one of the filters."""
+        if table not in self.CHANGE_HISTORY_TABLES:
+            raise ValueError(f"Unknown change table {table!r}, expected one of {list(self.CHANGE_HISTORY_TABLES)}")
+        table_name, ident_column, field_column, country_condition = self.CHANGE_HISTORY_TABLES[table]
+        if (country is not None and country_condition is None) or (field is not None and field_column is None):
+            return None
+        conditions, params = [], []
+        if airac_date is not None:
+            conditions.append('airac_date = ?')
+            params.append(airac_date)
+        if country is not None:
+            conditions.append(country_condition)
+            params.append(country.upper())
+        if ident is not None:
+            conditions.append(f'{ident_column} = ?')
+            params.append(ident)
+        if field is not None:
+            conditions.append(f'{field_column} = ?')
+            params.append(field)
+        if source is not None:
+            conditions.append('source = ?')
+            params.append(source)
+        if since is not None:
+            conditions.append('changed_at >= ?')
+            params.append(since.isoformat() if isinstance(since, datetime) else since)
+        conditions.append('id > ?')
+        return f"SELECT * FROM {table_name} WHERE {' AND '.join(conditions)} ORDER BY id LIMIT ?", params
+
+    def get_change_history(self, table: str, airac_date: Optional[str] = None,
+                           country: Optional[str] = None, ident: Optional[str] = None,
+                           field: Optional[str] = None, source: Optional[str] = None,
+                           since: Optional[Any] = None, after_id: int = 0,
+                           limit: int = 500) -> List[Dict]:
+        """
+        Get one page of a change history table, oldest change first.
+
+        Pages are keyed on the change id: pass the ``id`` of the last row
+        of a page as ``after_id`` to get the next one. With ``airac_date``
+        each page is a range scan of the table's AIRAC index, however far
+        into the history it is.
+
+        Args:
+            table: One of CHANGE_HISTORY_TABLES ('airports', 'runways',
+                   'procedures', 'aip_entries', 'waypoints', 'border_crossing_points')
+            airac_date: Only changes saved for this AIRAC cycle (YYYY-MM-DD)
+            country: Only changes of airports (or border crossing points) in
+                     this ISO country; not available for waypoints
+            ident: Only changes of this airport ICAO code (or waypoint name)
+            field: Only changes of this field (the AIP field for aip_entries);
+                   not available for border crossing points
+            source: Only changes from this source
+            since: Only changes made at or after this time (datetime or ISO string)
+            after_id: Only changes with a larger id
+            limit: Maximum number of changes returned
+
+        Returns:
+            List of change rows as dictionaries
+
+        Raises:
+            ValueError: If the table is unknown or cannot apply a filter
+        """
+        query = self._change_history_query(table, airac_date, country, ident, field, source, since)
+        if query is None:
+            raise ValueError(f"Change table {table!r} cannot be filtered by "
+                             f"{'country' if country is not None else 'field'}")
+        sql, params = query
+        with self._get_connection(write=False) as conn:
+            cursor = conn.execute(sql, params + [after_id, limit])
+            return [dict(row) for row in cursor.fetchall()]
+
+    def iter_change_history(self, tables: Optional[Iterable[str]] = None,
+                            airac_date: Optional[str] = None, country: Optional[str] = None,
+                            ident: Optional[str] = None, field: Optional[str] = None,
+                            source: Optional[str] = None, since: Optional[Any] = None,
+                            page_size: int = 500) -> Iterator[Dict]:
+        """
+        Iterate over the changes of several tables matching the filters.
+
+        Changes are read a page at a time with get_change_history, so only
+        one page is in memory and no read transaction is held between pages.
+        Each change gets a ``table`` key with its table name. Tables that
+        cannot apply a filter are skipped, e.g. waypoints for ``country``.
+
+        Example:
+            for change in storage.iter_change_history(airac_date='2026-10-02', country='FR'):
+                print(change['table'], change['airport_icao'], change['new_value'])
+
+        Args:
+            tables: Names from CHANGE_HISTORY_TABLES, all of them by default
+            page_size: Changes read per query
+            Other arguments filter as in get_change_history.
+        """
+        for table in (self.CHANGE_HISTORY_TABLES if tables is None else tables):
+            query = self._change_history_query(table, airac_date, country, ident, field, source, since)
+            if query is None:
+                continue
+            sql, params = query
+            after_id = 0
+            while True:
+                with self._get_connection(write=False) as conn:
+                    rows = conn.execute(sql, params + [after_id, page_size]).fetchall()
+                for row in rows:
+                    change = dict(row)
+                    change['table'] = table
+                    yield change
+                if len(rows) < page_size:
+                    break
+                after_id = rows[-1]['id']
+
     def get_database_info(self) -> Dict[str, Any]:
         """Get information about the database."""
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             cursor = conn.cursor()
             
             # Get table information
@@ -1655,11 +2351,11 @@ class DatabaseStorage:
         for change in changes:
             conn.execute('''
                 INSERT INTO border_crossing_points_changes 
-                (icao_code, country_iso, action, source, changed_at)
-                VALUES (?, ?, ?, ?, ?)
+                (icao_code, country_iso, action, source, changed_at, airac_date)
+                VALUES (?, ?, ?, ?, ?, ?)
             ''', (
                 change.icao_code, change.country_iso, change.action,
-                change.source, change.changed_at.isoformat()
+                change.source, change.changed_at.isoformat(), self._airac_date
             ))
         
         logger.info(f"Saved {len(entries)} border crossing entries with {len(changes)} changes")
@@ -1730,7 +2426,7 @@ class DatabaseStorage:
         logger.info("Loading border crossing entries from database")
         
         entries = []
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             try:
                 cursor = conn.execute('SELECT * FROM border_crossing_points')
                 for row in cursor.fetchall():
@@ -1754,12 +2450,13 @@ class DatabaseStorage:
             List of border crossing changes
         """
         changes = []
-        with self._get_connection() as conn:
+        since = f'-{int(days)} days'
+        with self._get_connection(write=False) as conn:
             cursor = conn.execute('''
                 SELECT * FROM border_crossing_points_changes 
-                WHERE changed_at >= date('now', '-{} days')
+                WHERE changed_at >= date('now', ?)
                 ORDER BY changed_at DESC
-            '''.format(days))
+            ''', (since,))
             
             for row in cursor.fetchall():
                 change = BorderCrossingChange.from_dict(dict(row))
@@ -1775,7 +2472,7 @@ class DatabaseStorage:
             List of dictionaries with airport and border crossing info
         """
         airports = []
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             cursor = conn.execute('''
                 SELECT a.*, b.airport_name as border_crossing_name, b.source, b.match_score
                 FROM airports a
@@ -1799,7 +2496,7 @@ class DatabaseStorage:
             List of border crossing entries for the country
         """
         entries = []
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             cursor = conn.execute('''
                 SELECT * FROM border_crossing_points 
                 WHERE country_iso = ?
@@ -1819,7 +2516,7 @@ class DatabaseStorage:
             Dictionary with statistics
         """
         stats = {}
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             # Total entries
             cursor = conn.execute('SELECT COUNT(*) as count FROM border_crossing_points')
             stats['total_entries'] = cursor.fetchone()['count']
@@ -1889,7 +2586,7 @@ class DatabaseStorage:
             List of dictionaries with airport border crossing info
         """
         airports = []
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             cursor = conn.execute('''
                 SELECT * FROM border_crossing_points 
                 WHERE is_airport = 1
@@ -1909,7 +2606,7 @@ class DatabaseStorage:
             List of dictionaries with non-airport border crossing info
         """
         non_airports = []
-        with self._get_connection() as conn:
+        with self._get_connection(write=False) as conn:
             cursor = conn.execute('''
                 SELECT * FROM border_crossing_points 
                 WHERE is_airport = 0
@@ -1963,4 +2660,51 @@ class DatabaseStorage:
             except (ValueError, TypeError):
                 return None
         else:
-            return value 
\ No newline at end of file
+            return value 
+
+
+class AirportRelationshipLoader:
+    """
+    Loads deferred airport relationships from the database on first access.
+
+    Created by DatabaseStorage.load_model(lazy=True) and shared by all the
+    airports of the model. Reads go through the storage's connection pool,
+    so airports can be used from several threads, each with its own
+    read-only connection. Copies of an airport share the loader; a pickled
+    loader reopens the database on the other side.
+    """
+
+    def __init__(self, storage: 'DatabaseStorage'):
+        self._storage = storage
+
+    def load(self, airport: Airport, name: str) -> List[Any]:
+        """Load relationship ``name`` of ``airport``."""
+        with self._storage._get_connection(write=False) as conn:
+            return self._storage._load_relationship(conn, airport.ident, name)
+
+    def load_many(self, airports: List[Airport], name: str) -> None:
+        """Load relationship ``name`` of several airports with one scan of its table."""
+        airport_filter = ('icao_code IN (SELECT value FROM json_each(?))',
+                          [json.dumps([airport.ident for airport in airports])])
+        with self._storage._get_connection(write=False) as conn:
+            loaded = {
+                scratch.ident: scratch
+                for scratch in self._storage._load_airports(conn, ignore_non_icao=False, relationships=[name],
+                                                            airport_filter=airport_filter)
+            }
+        for airport in airports:
+            scratch = loaded.get(airport.ident)
+            airport.__dict__[name] = getattr(scratch, name) if scratch is not None else []
+
+    def close(self) -> None:
+        """Close the storage's pooled connections; they are reopened if needed again."""
+        self._storage.close()
+
+    def __copy__(self) -> 'AirportRelationshipLoader':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'AirportRelationshipLoader':
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (self._storage,))
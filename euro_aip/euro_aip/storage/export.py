@@ -0,0 +1,394 @@
+"""
+Streaming export of airports, runways, procedures, waypoints and FIRs.
+
+ModelExporter reads rows one at a time, either from a loaded EuroAipModel or
+straight from a DatabaseStorage (one SQL scan per layer, without building
+the model), and writes them as GeoJSON, CSV or Parquet, optionally one file
+per country. Rows are flat dictionaries with the columns of LAYER_COLUMNS,
+so memory use does not grow with the number of rows (Parquet buffers one
+row group at a time).
+
+Geometries: airports, waypoints and procedures (at their airport) are
+points, runways a line between their thresholds when both are known, and
+FIRs MultiPolygons, which CSV and Parquet carry as GeoJSON text in the
+``geometry`` column.
+
+Parquet needs ``pyarrow`` (``pip install euro_aip[export]``).
+"""
+
+import csv
+import json
+import logging
+import math
+import os
+import tempfile
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from ..models.euro_aip_model import EuroAipModel
+from .database_storage import DatabaseStorage
+
+logger = logging.getLogger(__name__)
+
+# Columns of each layer, with their type: 'str', 'float' or 'bool'
+LAYER_COLUMNS: Dict[str, List[Tuple[str, str]]] = {
+    'airports': [
+        ('ident', 'str'), ('name', 'str'), ('type', 'str'),
+        ('latitude_deg', 'float'), ('longitude_deg', 'float'), ('elevation_ft', 'float'),
+        ('continent', 'str'), ('iso_country', 'str'), ('iso_region', 'str'),
+        ('municipality', 'str'), ('scheduled_service', 'str'), ('gps_code', 'str'),
+        ('iata_code', 'str'), ('local_code', 'str'), ('home_link', 'str'),
+        ('wikipedia_link', 'str'), ('keywords', 'str'), ('sources', 'str'),
+    ],
+    'runways': [
+        ('airport_ident', 'str'), ('iso_country', 'str'), ('le_ident', 'str'), ('he_ident', 'str'),
+        ('length_ft', 'float'), ('width_ft', 'float'), ('surface', 'str'),
+        ('lighted', 'bool'), ('closed', 'bool'),
+        ('le_latitude_deg', 'float'), ('le_longitude_deg', 'float'), ('le_elevation_ft', 'float'),
+        ('le_heading_degT', 'float'), ('le_displaced_threshold_ft', 'float'),
+        ('he_latitude_deg', 'float'), ('he_longitude_deg', 'float'), ('he_elevation_ft', 'float'),
+        ('he_heading_degT', 'float'), ('he_displaced_threshold_ft', 'float'),
+    ],
+    'procedures': [
+        ('airport_ident', 'str'), ('iso_country', 'str'),
+        ('latitude_deg', 'float'), ('longitude_deg', 'float'),
+        ('name', 'str'), ('procedure_type', 'str'), ('approach_type', 'str'),
+        ('runway_ident', 'str'), ('runway_number', 'str'), ('runway_letter', 'str'),
+        ('source', 'str'), ('authority', 'str'), ('raw_name', 'str'),
+    ],
+    'waypoints': [
+        ('name', 'str'), ('latitude_deg', 'float'), ('longitude_deg', 'float'),
+        ('point_type', 'str'), ('fir_codes', 'str'), ('level_availability', 'str'),
+        ('source', 'str'), ('source_id', 'str'),
+    ],
+    'firs': [
+        ('icao', 'str'), ('name', 'str'), ('is_oceanic', 'bool'), ('region', 'str'),
+        ('label_lon', 'float'), ('label_lat', 'float'), ('source', 'str'), ('geometry', 'str'),
+    ],
+}
+
+# Layers with an iso_country column, which can be written one file per country
+COUNTRY_LAYERS = ('airports', 'runways', 'procedures')
+
+# File suffix of each format
+FORMATS = {'geojson': '.geojson', 'csv': '.csv', 'parquet': '.parquet'}
+
+Row = Dict[str, Any]
+
+
+def _coerce(value: Any, kind: str) -> Any:
+    """Convert a model or database value to the column type (None, NaN and 'nan' become None)."""
+    if value is None:
+        return None
+    if kind == 'float':
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+        return None if math.isnan(value) else value
+    if kind == 'bool':
+        if isinstance(value, str):
+            return value.strip().lower() in ('1', 'true', 'yes')
+        return bool(value)
+    value = str(value)
+    return None if value.lower() == 'nan' else value
+
+
+def _typed(layer: str, values: Iterable[Any]) -> Row:
+    """Row dictionary of ``layer`` from values in column order."""
+    return {name: _coerce(value, kind) for (name, kind), value in zip(LAYER_COLUMNS[layer], values)}
+
+
+def _point(longitude: Any, latitude: Any) -> str:
+    if longitude is None or latitude is None:
+        return 'null'
+    return f'{{"type": "Point", "coordinates": [{longitude!r}, {latitude!r}]}}'
+
+
+def geometry_json(layer: str, row: Row) -> str:
+    """GeoJSON geometry of a row, as JSON text ('null' when its position is unknown)."""
+    if layer == 'firs':
+        return row['geometry'] or 'null'
+    if layer == 'runways':
+        ends = (row['le_longitude_deg'], row['le_latitude_deg'], row['he_longitude_deg'], row['he_latitude_deg'])
+        if any(value is None for value in ends):
+            return 'null'
+        return '{{"type": "LineString", "coordinates": [[{!r}, {!r}], [{!r}, {!r}]]}}'.format(*ends)
+    return _point(row['longitude_deg'], row['latitude_deg'])
+
+
+def _multipolygon_json(polygons_json: str) -> str:
+    return f'{{"type": "MultiPolygon", "coordinates": {polygons_json}}}'
+
+
+class _ModelRows:
+    """Layer rows from a loaded EuroAipModel (or MappedModel)."""
+
+    def __init__(self, model: EuroAipModel):
+        self.model = model
+
+    def _airports(self, by_country: bool):
+        key = (lambda a: (a.iso_country or '', a.ident)) if by_country else (lambda a: a.ident)
+        return sorted(self.model.airports, key=key)
+
+    def airports(self, by_country: bool = False) -> Iterator[Row]:
+        for airport in self._airports(by_country):
+            yield _typed('airports', [
+                airport.ident, airport.name, airport.type, airport.latitude_deg, airport.longitude_deg,
+                airport.elevation_ft, airport.continent, airport.iso_country, airport.iso_region,
+                airport.municipality, airport.scheduled_service, airport.gps_code, airport.iata_code,
+                airport.local_code, airport.home_link, airport.wikipedia_link, airport.keywords,
+                ','.join(sorted(airport.sources)),
+            ])
+
+    def runways(self, by_country: bool = False) -> Iterator[Row]:
+        for airport in self._airports(by_country):
+            for runway in airport.runways:
+                yield _typed('runways', [airport.ident, airport.iso_country] + [
+                    getattr(runway, name) for name, _ in LAYER_COLUMNS['runways'][2:]])
+
+    def procedures(self, by_country: bool = False) -> Iterator[Row]:
+        for airport in self._airports(by_country):
+            for procedure in airport.procedures:
+                yield _typed('procedures', [
+                    airport.ident, airport.iso_country, airport.latitude_deg, airport.longitude_deg,
+                ] + [getattr(procedure, name) for name, _ in LAYER_COLUMNS['procedures'][4:]])
+
+    def waypoints(self, by_country: bool = False) -> Iterator[Row]:
+        waypoints = sorted(self.model.waypoints, key=lambda w: (w.name, w.source_id))
+        for waypoint in waypoints:
+            yield _typed('waypoints', [getattr(waypoint, name) for name, _ in LAYER_COLUMNS['waypoints']])
+
+    def firs(self, by_country: bool = False) -> Iterator[Row]:
+        for fir in sorted(self.model.firs, key=lambda f: f.icao):
+            yield _typed('firs', [fir.icao, fir.name, fir.is_oceanic, fir.region, fir.label_lon,
+                                  fir.label_lat, fir.source, _multipolygon_json(json.dumps(fir.polygons))])
+
+
+class _DatabaseRows:
+    """Layer rows read straight from a DatabaseStorage, one query per layer."""
+
+    def __init__(self, storage: DatabaseStorage, ignore_non_icao: bool = True):
+        self.storage = storage
+        self.airport_filter = 'WHERE length(a.icao_code) = 4' if ignore_non_icao else ''
+
+    def _query(self, sql: str) -> Iterator[Tuple[Any, ...]]:
+        with self.storage._get_connection(write=False) as conn:
+            # Plain tuples are much cheaper than sqlite3.Row for full-table scans
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            yield from cursor.execute(sql)
+
+    def _order(self, by_country: bool) -> str:
+        return 'ORDER BY a.iso_country, a.icao_code' if by_country else 'ORDER BY a.icao_code'
+
+    def airports(self, by_country: bool = False) -> Iterator[Row]:
+        columns = ['a.icao_code'] + [f'a.{name}' for name, _ in LAYER_COLUMNS['airports'][1:]]
+        for values in self._query(f"SELECT {', '.join(columns)} FROM airports a "
+                                  f"{self.airport_filter} {self._order(by_country)}"):
+            yield _typed('airports', values)
+
+    def runways(self, by_country: bool = False) -> Iterator[Row]:
+        columns = ['a.icao_code', 'a.iso_country'] + [f'r.{name}' for name, _ in LAYER_COLUMNS['runways'][2:]]
+        for values in self._query(f"SELECT {', '.join(columns)} FROM runways r "
+                                  f"JOIN airports a ON a.icao_code = r.airport_icao "
+                                  f"{self.airport_filter} {self._order(by_country)}, r.id"):
+            yield _typed('runways', values)
+
+    def procedures(self, by_country: bool = False) -> Iterator[Row]:
+        columns = ['a.icao_code', 'a.iso_country', 'a.latitude_deg', 'a.longitude_deg'] + [
+            f'p.{name}' for name, _ in LAYER_COLUMNS['procedures'][4:]]
+        for values in self._query(f"SELECT {', '.join(columns)} FROM procedures p "
+                                  f"JOIN airports a ON a.icao_code = p.airport_icao "
+                                  f"{self.airport_filter} {self._order(by_country)}, p.id"):
+            yield _typed('procedures', values)
+
+    def waypoints(self, by_country: bool = False) -> Iterator[Row]:
+        columns = ', '.join(name for name, _ in LAYER_COLUMNS['waypoints'])
+        for values in self._query(f"SELECT {columns} FROM waypoints ORDER BY name, source_id"):
+            yield _typed('waypoints', values)
+
+    def firs(self, by_country: bool = False) -> Iterator[Row]:
+        for values in self._query("SELECT icao, name, is_oceanic, region, label_lon, label_lat, source, "
+                                  "polygons_json FROM firs ORDER BY icao"):
+            yield _typed('firs', values[:-1] + (_multipolygon_json(values[-1]),))
+
+
+def write_geojson(layer: str, rows: Iterable[Row], out: TextIO) -> int:
+    """Write rows as a GeoJSON FeatureCollection, one feature per line. Returns the row count."""
+    count = 0
+    out.write('{"type": "FeatureCollection", "features": [\n')
+    for row in rows:
+        if count:
+            out.write(',\n')
+        properties = {name: value for name, value in row.items() if name != 'geometry'}
+        out.write(f'{{"type": "Feature", "geometry": {geometry_json(layer, row)}, '
+                  f'"properties": {json.dumps(properties)}}}')
+        count += 1
+    out.write('\n]}\n')
+    return count
+
+
+def write_csv(layer: str, rows: Iterable[Row], out: TextIO) -> int:
+    """Write rows as CSV with a header line. Returns the row count."""
+    writer = csv.writer(out)
+    writer.writerow([name for name, _ in LAYER_COLUMNS[layer]])
+    count = 0
+    for row in rows:
+        writer.writerow(row.values())
+        count += 1
+    return count
+
+
+def write_parquet(layer: str, rows: Iterable[Row], path: Union[str, Path],
+                  row_group_size: int = 65536) -> int:
+    """Write rows to a Parquet file, one row group at a time. Returns the row count."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet export needs pyarrow: pip install pyarrow") from e
+
+    types = {'str': pa.string(), 'float': pa.float64(), 'bool': pa.bool_()}
+    schema = pa.schema([(name, types[kind]) for name, kind in LAYER_COLUMNS[layer]])
+    count = 0
+    with pq.ParquetWriter(str(path), schema) as writer:
+        batch: Dict[str, List[Any]] = {name: [] for name in schema.names}
+        for row in rows:
+            for name, value in row.items():
+                batch[name].append(value)
+            count += 1
+            if count % row_group_size == 0:
+                writer.write_table(pa.Table.from_pydict(batch, schema=schema))
+                batch = {name: [] for name in schema.names}
+        if count % row_group_size or count == 0:
+            writer.write_table(pa.Table.from_pydict(batch, schema=schema))
+    return count
+
+
+def _write_file(layer: str, rows: Iterable[Row], path: Path, format: str) -> int:
+    """Write one file through a temporary file, replaced only once complete."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        if format == 'parquet':
+            os.close(fd)
+            count = write_parquet(layer, rows, tmp_name)
+        else:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as out:
+                count = (write_geojson if format == 'geojson' else write_csv)(layer, rows, out)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return count
+
+
+class ModelExporter:
+    """
+    Streaming exporter of a model's layers to GeoJSON, CSV and Parquet.
+
+    Example:
+        exporter = ModelExporter(DatabaseStorage("airports.db"))
+        exporter.export_all("dumps/", formats=("geojson", "parquet"), by_country=True)
+        for row in exporter.rows("runways"):
+            ...
+    """
+
+    LAYERS = tuple(LAYER_COLUMNS)
+
+    def __init__(self, source: Union[EuroAipModel, DatabaseStorage], ignore_non_icao: bool = True):
+        """
+        Initialize the exporter.
+
+        Args:
+            source: A loaded model, or a DatabaseStorage to read rows from
+                    without loading the model
+            ignore_non_icao: Skip database airports whose code is not 4
+                             characters, as load_model does
+        """
+        if isinstance(source, DatabaseStorage):
+            self._source: Any = _DatabaseRows(source, ignore_non_icao)
+        elif isinstance(source, EuroAipModel):
+            self._source = _ModelRows(source)
+        else:
+            raise TypeError(f"Cannot export from {type(source).__name__}, expected EuroAipModel or DatabaseStorage")
+
+    def rows(self, layer: str, by_country: bool = False) -> Iterator[Row]:
+        """
+        Iterate over the rows of a layer.
+
+        Airports (and their runways and procedures) come in ICAO order, or
+        sorted by country first with ``by_country``; waypoints by name and
+        FIRs by ICAO code.
+        """
+        if layer not in LAYER_COLUMNS:
+            raise ValueError(f"Unknown layer {layer!r}, expected one of {self.LAYERS}")
+        return getattr(self._source, layer)(by_country)
+
+    def export(self, layer: str, path: Union[str, Path], format: Optional[str] = None,
+               by_country: bool = False) -> int:
+        """
+        Write one layer to a file, or to one file per country.
+
+        Args:
+            layer: One of LAYERS
+            path: Output file; with ``by_country`` a directory, which gets
+                  one ``<ISO country>.<suffix>`` file per country
+                  (``unknown`` for airports without a country)
+            format: 'geojson', 'csv' or 'parquet'; guessed from the suffix of
+                    ``path`` if not given
+            by_country: Split the layer by country; only for COUNTRY_LAYERS
+
+        Returns:
+            Number of rows written
+        """
+        path = Path(path)
+        format = format or path.suffix.lstrip('.').lower()
+        if format not in FORMATS:
+            raise ValueError(f"Unknown export format {format!r}, expected one of {list(FORMATS)}")
+        if by_country and layer not in COUNTRY_LAYERS:
+            raise ValueError(f"Layer {layer!r} has no country, only {COUNTRY_LAYERS} can be split by country")
+
+        rows = self.rows(layer, by_country)
+        if not by_country:
+            count = _write_file(layer, rows, path, format)
+            logger.info(f"Exported {count} {layer} to {path}")
+            return count
+
+        count = 0
+        files = 0
+        for country, country_rows in groupby(rows, key=lambda row: row['iso_country'] or 'unknown'):
+            count += _write_file(layer, country_rows, path / f"{country}{FORMATS[format]}", format)
+            files += 1
+        logger.info(f"Exported {count} {layer} to {files} files in {path}")
+        return count
+
+    def export_all(self, directory: Union[str, Path], formats: Iterable[str] = ('geojson',),
+                   layers: Optional[Iterable[str]] = None, by_country: bool = False) -> Dict[str, int]:
+        """
+        Write layers in one or more formats to ``directory``.
+
+        Each layer is written to ``<layer>.<suffix>``, or with ``by_country``
+        to ``<layer>/<ISO country>.<suffix>`` for COUNTRY_LAYERS (waypoints
+        and FIRs are still written as one file).
+
+        Returns:
+            Rows written per output, keyed by the path relative to ``directory``
+        """
+        directory = Path(directory)
+        formats = list(formats)
+        unknown = [format for format in formats if format not in FORMATS]
+        if unknown:
+            raise ValueError(f"Unknown export formats {unknown}, expected some of {list(FORMATS)}")
+        written = {}
+        for layer in (self.LAYERS if layers is None else layers):
+            split = by_country and layer in COUNTRY_LAYERS
+            for format in formats:
+                if split:
+                    written[f"{layer}/*{FORMATS[format]}"] = self.export(layer, directory / layer, format, by_country=True)
+                else:
+                    name = f"{layer}{FORMATS[format]}"
+                    written[name] = self.export(layer, directory / name, format)
+        return written
@@ -0,0 +1,454 @@
+"""
+Read-only EuroAipModel over a memory-mapped snapshot.
+
+Loading the model in each worker process of a web server gives every worker
+its own copy of all airports, runways, waypoints and FIR boundaries. A
+MappedModel instead reads a snapshot file (see ``snapshot.py``) mapped
+read-only into the process: the column arrays, coordinates and FIR rings
+stay in the OS page cache, so every process mapping the same file shares one
+physical copy. Model objects are built from the mapped columns when they are
+accessed and are not kept by the model; iterating or filtering
+``model.airports``, ``model.waypoints`` or ``model.firs`` only keeps the
+objects the caller holds on to.
+
+Example:
+    storage.save_snapshot(storage.load_model(), "model.snap")   # once
+    model = MappedModel.open("model.snap")                        # per worker
+    french = model.airports.by_country("FR").with_hard_runway().all()
+"""
+
+import logging
+from collections.abc import Mapping
+from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+import numpy as np
+
+from ..models.euro_aip_model import EuroAipModel
+from ..models.airport import Airport
+from ..models.runway import Runway
+from ..models.procedure import Procedure
+from ..models.aip_entry import AIPEntry
+from ..models.waypoint import Waypoint
+from ..models.fir import FIR
+from ..models.airport_collection import AirportCollection
+from ..models.waypoint_collection import WaypointCollection
+from ..models.fir_collection import FIRCollection
+from ..utils.geometry import GridIndex, PolygonIndex, RTree
+from .snapshot import ModelSnapshot, _AIRPORT_CONVERT
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class MappedRows(Sequence[T]):
+    """
+    Read-only sequence over the rows of a snapshot table.
+
+    Items are built by ``build(start, stop)`` each time they are accessed;
+    iteration builds them in small chunks, so only the current chunk is
+    alive unless the caller keeps the items.
+    """
+
+    CHUNK_SIZE = 256
+
+    def __init__(self, count: int, build: Callable[[int, int], List[T]]):
+        self._count = count
+        self._build = build
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._count)
+            if step == 1:
+                return self._build(start, stop) if start < stop else []
+            return [self._build(row, row + 1)[0] for row in range(start, stop, step)]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("row index out of range")
+        return self._build(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[T]:
+        for start in range(0, self._count, self.CHUNK_SIZE):
+            yield from self._build(start, min(start + self.CHUNK_SIZE, self._count))
+
+    def __repr__(self):
+        return f"MappedRows(count={self._count})"
+
+
+class _KeyIndex:
+    """Finds the rows of a table by key with the snapshot's sorted ``<table>.by_<column>`` permutation."""
+
+    def __init__(self, snapshot: ModelSnapshot, table: str, column: str):
+        self._keys = snapshot.column(table, column)
+        self._order = snapshot.array(f"{table}.by_{column}")
+        self._string = snapshot.string
+
+    def _key(self, position: int) -> str:
+        return self._string(int(self._keys[self._order[position]])) or ""
+
+    def rows(self, key: Any) -> List[int]:
+        """Rows whose key equals ``key``, in table order."""
+        if not isinstance(key, str):
+            return []
+        low, high = 0, len(self._order)
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        rows = []
+        while low < len(self._order) and self._key(low) == key:
+            rows.append(int(self._order[low]))
+            low += 1
+        return rows
+
+
+class SnapshotRelationshipLoader:
+    """
+    Loads the deferred procedures and AIP entries of mapped airports.
+
+    Shared by all the airports built by a MappedAirports view, following the
+    ``load(airport, name)`` protocol of Airport.defer_relationships. Copies
+    of an airport share the loader; a pickled loader reopens the snapshot.
+    """
+
+    _TABLES = {'procedures': Procedure, 'aip_entries': AIPEntry}
+
+    def __init__(self, snapshot: ModelSnapshot, keys: _KeyIndex):
+        self._snapshot = snapshot
+        self._keys = keys
+
+    def load(self, airport: Airport, name: str) -> List[Any]:
+        """Load relationship ``name`` of ``airport``."""
+        rows = self._keys.rows(airport.ident)
+        if not rows:
+            return []
+        first, last = np.searchsorted(self._snapshot.column(name, 'airport'), [rows[0], rows[0] + 1])
+        return self._snapshot._objects(name, self._TABLES[name], skip=('airport',),
+                                       start=int(first), stop=int(last))
+
+    def __copy__(self) -> 'SnapshotRelationshipLoader':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'SnapshotRelationshipLoader':
+        return self
+
+    def __reduce__(self):
+        return (_open_relationship_loader, (str(self._snapshot.path),))
+
+
+def _open_relationship_loader(path: str) -> SnapshotRelationshipLoader:
+    return MappedAirports(ModelSnapshot.open(path)).loader
+
+
+class MappedAirports(Mapping):
+    """
+    Read-only ident -> Airport mapping over the airports of a snapshot.
+
+    Airports are built with their runways; procedures and AIP entries are
+    deferred (see Airport.defer_relationships) and read from the snapshot
+    on first access. Every lookup builds a new Airport.
+    """
+
+    def __init__(self, snapshot: ModelSnapshot):
+        self._snapshot = snapshot
+        self._keys = _KeyIndex(snapshot, 'airports', 'ident')
+        self.loader = SnapshotRelationshipLoader(snapshot, self._keys)
+        self.rows: MappedRows[Airport] = MappedRows(snapshot.rows('airports'), self._build)
+
+    def _build(self, start: int, stop: int) -> List[Airport]:
+        snapshot = self._snapshot
+        airports = snapshot._objects('airports', Airport, convert=_AIRPORT_CONVERT, start=start, stop=stop)
+        # Runways are stored in airport order: find this range's block
+        first, last = (int(row) for row in np.searchsorted(snapshot.column('runways', 'airport'), [start, stop]))
+        owners = snapshot.values('runways', 'airport', first, last)
+        runways = snapshot._objects('runways', Runway, skip=('airport',), start=first, stop=last)
+        for owner, runway in zip(owners, runways):
+            airports[owner - start].runways.append(runway)
+        for airport in airports:
+            airport.defer_relationships(Airport.LAZY_RELATIONSHIPS, self.loader)
+        return airports
+
+    def __getitem__(self, ident: str) -> Airport:
+        rows = self._keys.rows(ident)
+        if not rows:
+            raise KeyError(ident)
+        return self.rows[rows[0]]
+
+    def __contains__(self, ident: Any) -> bool:
+        return bool(self._keys.rows(ident))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshot.values('airports', 'ident'))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def values(self) -> MappedRows[Airport]:
+        return self.rows
+
+    def items(self) -> Iterator[Tuple[str, Airport]]:
+        return ((airport.ident, airport) for airport in self.rows)
+
+
+class MappedWaypoints(Mapping):
+    """
+    Read-only name -> candidate waypoints mapping over a snapshot.
+
+    ``values()`` and ``items()`` are single-pass iterators that walk the
+    waypoint rows once (candidates of a name are stored together).
+    """
+
+    def __init__(self, snapshot: ModelSnapshot):
+        self._snapshot = snapshot
+        self._keys = _KeyIndex(snapshot, 'waypoints', 'name')
+        self._length: Optional[int] = None
+        self.rows: MappedRows[Waypoint] = MappedRows(
+            snapshot.rows('waypoints'),
+            lambda start, stop: snapshot._objects('waypoints', Waypoint, start=start, stop=stop),
+        )
+
+    def __getitem__(self, name: str) -> List[Waypoint]:
+        rows = self._keys.rows(name)
+        if not rows:
+            raise KeyError(name)
+        return self.rows[rows[0]:rows[-1] + 1]
+
+    def __contains__(self, name: Any) -> bool:
+        return bool(self._keys.rows(name))
+
+    def __iter__(self) -> Iterator[str]:
+        string = self._snapshot.string
+        names = self._snapshot.column('waypoints', 'name')
+        previous = None
+        for start in range(0, len(names), MappedRows.CHUNK_SIZE):
+            for index in names[start:start + MappedRows.CHUNK_SIZE].tolist():
+                if index != previous:
+                    previous = index
+                    yield string(index)
+
+    def __len__(self) -> int:
+        if self._length is None:
+            # Equal names share a string index and are stored together
+            names = self._snapshot.column('waypoints', 'name')
+            self._length = int(np.count_nonzero(names[1:] != names[:-1])) + 1 if len(names) else 0
+        return self._length
+
+    def values(self) -> Iterator[List[Waypoint]]:
+        return (list(group) for _, group in groupby(self.rows, key=attrgetter('name')))
+
+    def items(self) -> Iterator[Tuple[str, List[Waypoint]]]:
+        return ((name, list(group)) for name, group in groupby(self.rows, key=attrgetter('name')))
+
+
+class MappedFIRs(Mapping):
+    """Read-only icao -> FIR mapping over a snapshot; boundaries are read from the map on access."""
+
+    def __init__(self, snapshot: ModelSnapshot):
+        self._snapshot = snapshot
+        self._keys = _KeyIndex(snapshot, 'firs', 'icao')
+        self.rows: MappedRows[FIR] = MappedRows(snapshot.rows('firs'), snapshot._firs)
+
+    def __getitem__(self, icao: str) -> FIR:
+        rows = self._keys.rows(icao)
+        if not rows:
+            raise KeyError(icao)
+        return self.rows[rows[0]]
+
+    def __contains__(self, icao: Any) -> bool:
+        return bool(self._keys.rows(icao))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshot.values('firs', 'icao'))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def values(self) -> MappedRows[FIR]:
+        return self.rows
+
+    def items(self) -> Iterator[Tuple[str, FIR]]:
+        return ((fir.icao, fir) for fir in self.rows)
+
+
+class MappedAirportGrid:
+    """
+    Spatial index over the airports of a snapshot, with the queries of GridIndex.
+
+    The grid is filled from the mapped latitude/longitude columns and holds
+    row numbers; queries build the Airports of the rows they return, so
+    building the index does not build every airport.
+    """
+
+    def __init__(self, airports: MappedAirports):
+        self._rows = airports.rows
+        self._keys = airports._keys
+        self._grid = GridIndex()
+        lats = airports._snapshot.column('airports', 'latitude_deg')
+        lons = airports._snapshot.column('airports', 'longitude_deg')
+        # NaN stands for None
+        located = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+        for row, lon, lat in zip(located.tolist(), lons[located].tolist(), lats[located].tolist()):
+            self._grid.insert(row, lon, lat)
+
+    def __len__(self) -> int:
+        return len(self._grid)
+
+    def __contains__(self, ident: Any) -> bool:
+        rows = self._keys.rows(ident)
+        return bool(rows) and rows[0] in self._grid
+
+    def within_radius(self, lon: float, lat: float, radius_nm: float) -> List[Tuple[float, Airport]]:
+        return [(distance, self._rows[row]) for distance, row in self._grid.within_radius(lon, lat, radius_nm)]
+
+    def nearest(self, lon: float, lat: float, count: int,
+                max_nm: Optional[float] = None) -> List[Tuple[float, Airport]]:
+        return [(distance, self._rows[row]) for distance, row in self._grid.nearest(lon, lat, count, max_nm)]
+
+    def near_polyline(self, points: Sequence[Tuple[float, float]], corridor_nm: float) -> List[Airport]:
+        return [self._rows[row] for row in self._grid.near_polyline(points, corridor_nm)]
+
+    def near_boxes(self, boxes: Iterable[Tuple[float, float, float, float]],
+                   corridor_nm: float) -> List[Airport]:
+        return [self._rows[row] for row in self._grid.near_boxes(boxes, corridor_nm)]
+
+
+class _RowTree(RTree):
+    """RTree over row numbers whose queries return ``build(row)`` for each hit."""
+
+    def __init__(self, entries: Iterable[Tuple[Tuple[float, float, float, float], int]],
+                 build: Callable[[int], Any]):
+        super().__init__(entries)
+        self._build = build
+
+    def _search(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> List[Any]:
+        return [self._build(row) for row in super()._search(min_lon, min_lat, max_lon, max_lat)]
+
+
+class MappedFIRIndex(PolygonIndex):
+    """
+    Point-location index over the FIRs of a snapshot.
+
+    The R-tree is built from the mapped bbox column. A FIR is decoded only
+    when a query reaches its bbox, and kept so that its prepared polygons
+    serve later queries.
+    """
+
+    def __init__(self, firs: MappedFIRs):
+        self._rows = firs.rows
+        self._built: Dict[int, FIR] = {}
+        bboxes = firs._snapshot.values('firs', 'bbox')
+        self._tree = _RowTree(((bbox, row) for row, bbox in enumerate(bboxes) if bbox), self._fir)
+
+    def _fir(self, row: int) -> FIR:
+        fir = self._built.get(row)
+        if fir is None:
+            fir = self._built[row] = self._rows[row]
+        return fir
+
+
+class MappedModel(EuroAipModel):
+    """
+    Read-only model backed by a memory-mapped snapshot.
+
+    Queries work as on a EuroAipModel, but airports, waypoints and FIRs are
+    built from the snapshot on access: two lookups of the same airport
+    return equal but distinct objects, and changes made to them are not
+    kept. Methods that modify the model raise TypeError. Border crossing
+    points (a few hundred entries) are decoded when the model is opened.
+
+    Indexes are built on first use as for any model. The airport spatial
+    index and the FIR index are built from the mapped coordinate and bbox
+    columns and build objects only for their hits. The waypoint spatial
+    index holds every waypoint, so ``model.waypoints`` answers ``nearest``
+    by scanning the mapped rows instead.
+    """
+
+    def __init__(self, snapshot: ModelSnapshot):
+        """
+        Wrap an open snapshot (see also ``MappedModel.open``).
+
+        Args:
+            snapshot: Snapshot the model reads from; it must stay open while
+                      the model is used
+        """
+        info = snapshot.header['model']
+        super().__init__(
+            _airports=MappedAirports(snapshot),
+            _waypoints=MappedWaypoints(snapshot),
+            _firs=MappedFIRs(snapshot),
+            created_at=datetime.fromisoformat(info['created_at']),
+            updated_at=datetime.fromisoformat(info['updated_at']),
+            sources_used=set(info['sources_used']),
+        )
+        self.snapshot = snapshot
+        snapshot._add_border_crossings(self)
+        logger.info(f"Mapped model snapshot {snapshot.path} ({len(self._airports)} airports)")
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> 'MappedModel':
+        """
+        Map the snapshot at ``path``.
+
+        Raises:
+            SnapshotError: if the file is missing, truncated or has another format version
+        """
+        return cls(ModelSnapshot.open(path))
+
+    def close(self) -> None:
+        """Release the memory map; the model must no longer be used."""
+        self.snapshot.close()
+
+    def __enter__(self) -> 'MappedModel':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def airports(self) -> AirportCollection:
+        """Queryable collection of all airports, iterating the mapped rows."""
+        return AirportCollection(self._airports.rows, index=self._airports, model=self)
+
+    @property
+    def waypoints(self) -> WaypointCollection:
+        """Queryable collection of all waypoints, iterating the mapped rows."""
+        return WaypointCollection(self._waypoints.rows)
+
+    @property
+    def firs(self) -> FIRCollection:
+        """Queryable collection of all FIRs, iterating the mapped rows."""
+        return FIRCollection(self._firs.rows)
+
+    def get_airport_spatial_index(self) -> MappedAirportGrid:
+        """Spatial index over airports with coordinates (see MappedAirportGrid)."""
+        if self._airport_spatial_index is None:
+            self._airport_spatial_index = MappedAirportGrid(self._airports)
+        return self._airport_spatial_index
+
+    def get_fir_index(self) -> MappedFIRIndex:
+        """Point-location index over FIRs (see MappedFIRIndex)."""
+        if self._fir_index is None:
+            self._fir_index = MappedFIRIndex(self._firs)
+        return self._fir_index
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only; load a EuroAipModel to modify the model")
+
+    add_airport = bulk_add_airports = airport_builder = transaction = _read_only
+    add_aip_entries_to_airport = bulk_add_aip_entries = bulk_add_procedures = _read_only
+    remove_airports_by_country = update_all_derived_fields = update_border_crossing_airports = _read_only
+    add_waypoint = bulk_add_waypoints = dedup_waypoints = add_fir = bulk_add_firs = _read_only
+    add_border_crossing_entry = add_border_crossing_points = remove_border_crossing_points_by_country = mark_airport_changed = _read_only
+
+    def __repr__(self):
+        return f"MappedModel({self.snapshot.path}, airports={len(self._airports)}, waypoints={len(self._waypoints)})"
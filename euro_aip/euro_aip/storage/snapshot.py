@@ -0,0 +1,685 @@
+"""
+Binary snapshot of a EuroAipModel for fast warm starts.
+
+A snapshot stores the whole model (airports with runways, procedures and AIP
+entries, waypoints, FIRs and border crossing points) as typed column arrays,
+with derived airport fields already computed, so a worker can reopen it
+without going through SQLite or ``update_all_derived_fields``.
+
+File layout (integers little-endian):
+
+    8 bytes   magic b"EAIPSNAP"
+    4 bytes   format version (uint32)
+    4 bytes   header length N (uint32)
+    N bytes   header, UTF-8 JSON
+    padding   to a multiple of 64 bytes
+    data      column arrays, each starting on a 64-byte boundary
+
+The header lists the tables with their columns and, for every array, its
+dtype, shape and offset in the data section. Text columns are int32 indexes
+into one shared string table (-1 for None); floats use NaN for None, integers
+and timestamps (microseconds since 1970-01-01, naive) use INT64_MIN, booleans
+-1. Aware timestamps are stored in UTC, and a timestamp column holding any
+has a ``<table>.<column>.utc_offset`` array with each value's UTC offset in
+seconds (INT32_MIN for naive values), so they are read back aware. FIR boundaries are flattened into coordinate arrays with per-FIR,
+per-polygon and per-ring offsets. Their simplified levels (``FIR.simplified``,
+tolerances listed in the firs table header) reuse the polygon and ring
+offsets with their own coordinate arrays and a per-FIR presence flag, so a
+loaded FIR does not simplify its boundary again. Airports, waypoints and FIRs also store the
+permutation of their rows sorted by key (``airports.by_ident``,
+``waypoints.by_name``, ``firs.by_icao``) so a single row can be found by
+binary search without decoding the table; waypoints are written grouped by
+name. The data section is opened with mmap and
+read through ``numpy.frombuffer``, so opening only parses the header; the
+header's ``content_hash`` is the SHA-256 of the data section.
+"""
+
+import gc
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from dataclasses import fields
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from itertools import starmap
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.euro_aip_model import EuroAipModel
+from ..models.airport import Airport
+from ..models.runway import Runway
+from ..models.procedure import Procedure
+from ..models.aip_entry import AIPEntry
+from ..models.waypoint import Waypoint
+from ..models.fir import FIR
+from ..models.border_crossing_entry import BorderCrossingEntry
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"EAIPSNAP"
+SNAPSHOT_VERSION = 4
+
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGN = 64
+_INT_NONE = np.iinfo(np.int64).min
+_OFFSET_NONE = np.iinfo(np.int32).min
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Storage dtype of each column kind
+_KIND_DTYPES = {
+    "str": "<i4",
+    "json": "<i4",
+    "float": "<f8",
+    "int": "<i8",
+    "bool": "i1",
+    "datetime": "<i8",
+}
+
+# Columns of each table as (name, kind). Relationship tables carry the row
+# number of their airport in the ``airport`` column.
+AIRPORT_COLUMNS = (
+    ("ident", "str"), ("type", "str"), ("name", "str"),
+    ("latitude_deg", "float"), ("longitude_deg", "float"), ("elevation_ft", "float"),
+    ("continent", "str"), ("iso_country", "str"), ("iso_region", "str"),
+    ("municipality", "str"), ("scheduled_service", "str"), ("gps_code", "str"),
+    ("iata_code", "str"), ("local_code", "str"), ("home_link", "str"),
+    ("wikipedia_link", "str"), ("keywords", "str"),
+    ("point_of_entry", "bool"), ("avgas", "bool"), ("jet_a", "bool"),
+    ("has_hard_runway", "bool"), ("has_lighted_runway", "bool"), ("has_soft_runway", "bool"),
+    ("has_water_runway", "bool"), ("has_snow_runway", "bool"),
+    ("longest_runway_length_ft", "float"),
+    ("sources", "json"), ("created_at", "datetime"), ("updated_at", "datetime"),
+)
+RUNWAY_COLUMNS = (
+    ("airport", "int"), ("airport_ident", "str"),
+    ("length_ft", "float"), ("width_ft", "float"), ("surface", "str"),
+    ("lighted", "bool"), ("closed", "bool"),
+    ("le_ident", "str"), ("le_latitude_deg", "float"), ("le_longitude_deg", "float"),
+    ("le_elevation_ft", "float"), ("le_heading_degT", "float"), ("le_displaced_threshold_ft", "float"),
+    ("he_ident", "str"), ("he_latitude_deg", "float"), ("he_longitude_deg", "float"),
+    ("he_elevation_ft", "float"), ("he_heading_degT", "float"), ("he_displaced_threshold_ft", "float"),
+    ("created_at", "datetime"),
+)
+PROCEDURE_COLUMNS = (
+    ("airport", "int"), ("name", "str"), ("procedure_type", "str"), ("approach_type", "str"),
+    ("runway_number", "str"), ("runway_letter", "str"), ("runway_ident", "str"),
+    ("source", "str"), ("authority", "str"), ("raw_name", "str"), ("data", "json"),
+    ("created_at", "datetime"), ("updated_at", "datetime"),
+)
+AIP_ENTRY_COLUMNS = (
+    ("airport", "int"), ("ident", "str"), ("section", "str"), ("field", "str"), ("value", "str"),
+    ("std_field", "str"), ("std_field_id", "int"), ("mapping_score", "float"),
+    ("alt_field", "str"), ("alt_value", "str"), ("source", "str"), ("created_at", "datetime"),
+)
+WAYPOINT_COLUMNS = (
+    ("name", "str"), ("latitude_deg", "float"), ("longitude_deg", "float"),
+    ("point_type", "str"), ("fir_codes", "str"), ("level_availability", "str"),
+    ("source", "str"), ("source_id", "str"), ("created_at", "datetime"), ("updated_at", "datetime"),
+)
+FIR_COLUMNS = (
+    ("icao", "str"), ("name", "str"), ("is_oceanic", "bool"), ("region", "str"),
+    ("label_lon", "float"), ("label_lat", "float"), ("source", "str"),
+    ("bbox", "json"), ("created_at", "datetime"), ("updated_at", "datetime"),
+)
+BORDER_CROSSING_COLUMNS = (
+    ("airport_name", "str"), ("country_iso", "str"), ("icao_code", "str"), ("is_airport", "bool"),
+    ("source", "str"), ("extraction_method", "str"), ("metadata", "json"),
+    ("matched_airport_icao", "str"), ("match_score", "float"),
+    ("created_at", "datetime"), ("updated_at", "datetime"),
+)
+
+
+# Conversions applied to decoded airport columns
+_AIRPORT_CONVERT = {"sources": lambda sources: set(sources or ())}
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is missing, corrupt or of another format version."""
+    pass
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _datetime_to_micros(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _utc_offset_seconds(value: Optional[datetime]) -> int:
+    offset = value.utcoffset() if value is not None else None
+    return _OFFSET_NONE if offset is None else offset // timedelta(seconds=1)
+
+
+class _SnapshotWriter:
+    """Accumulates column arrays and the shared string table of one snapshot."""
+
+    def __init__(self):
+        self.arrays: List[Tuple[str, np.ndarray]] = []
+        self.tables: Dict[str, Dict[str, Any]] = {}
+        self._strings: Dict[str, int] = {}
+
+    def string_index(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        index = self._strings.get(value)
+        if index is None:
+            index = self._strings[value] = len(self._strings)
+        return index
+
+    def add_table(self, table: str, columns: Sequence[Tuple[str, str]], rows: Sequence[Any],
+                  getters: Optional[Dict[str, Callable[[Any], Any]]] = None) -> None:
+        """Encode ``rows`` (objects, read with getattr unless a getter is given) as columns."""
+        getters = getters or {}
+        for name, kind in columns:
+            get = getters.get(name)
+            values = [get(row) for row in rows] if get else [getattr(row, name) for row in rows]
+            self.arrays.append((f"{table}.{name}", self._encode(values, kind)))
+            if kind == "datetime" and any(value is not None and value.tzinfo is not None for value in values):
+                offsets = [_utc_offset_seconds(value) for value in values]
+                self.arrays.append((f"{table}.{name}.utc_offset", np.array(offsets, dtype="<i4")))
+        self.tables[table] = {"rows": len(rows), "columns": dict(columns)}
+
+    def add_array(self, name: str, array: np.ndarray) -> None:
+        self.arrays.append((name, array))
+
+    def add_key_index(self, table: str, column: str, keys: Sequence[Optional[str]]) -> None:
+        """Add the row numbers of ``table`` sorted by their ``column`` key (stable, None as "")."""
+        order = sorted(range(len(keys)), key=lambda row: keys[row] or "")
+        self.add_array(f"{table}.by_{column}", np.array(order, dtype="<i8"))
+
+    def _encode(self, values: List[Any], kind: str) -> np.ndarray:
+        dtype = _KIND_DTYPES[kind]
+        if kind == "str":
+            encoded = [self.string_index(value) for value in values]
+        elif kind == "json":
+            encoded = [-1 if value is None else self.string_index(json.dumps(value)) for value in values]
+        elif kind == "float":
+            encoded = [np.nan if value is None else float(value) for value in values]
+        elif kind == "int":
+            encoded = [_INT_NONE if value is None else int(value) for value in values]
+        elif kind == "bool":
+            encoded = [-1 if value is None else int(bool(value)) for value in values]
+        else:
+            encoded = [_INT_NONE if value is None else _datetime_to_micros(value) for value in values]
+        return np.array(encoded, dtype=dtype)
+
+    def string_table(self) -> None:
+        """Add the string table arrays (call once every table is encoded)."""
+        encoded = [value.encode("utf-8") for value in self._strings]
+        offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        self.add_array("strings.offsets", offsets)
+        self.add_array("strings.data", np.frombuffer(b"".join(encoded), dtype="u1"))
+
+
+class ModelSnapshot:
+    """
+    A snapshot file opened for reading.
+
+    Column arrays are read-only views over a memory map of the file. Use
+    ``to_model()`` to rebuild a EuroAipModel, or ``column()`` / ``strings()``
+    to read data without building model objects.
+
+    Example:
+        ModelSnapshot.write(model, "model.snap", metadata={"database": fingerprint})
+        with ModelSnapshot.open("model.snap") as snapshot:
+            model = snapshot.to_model()
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any], buffer: mmap.mmap, data_offset: int):
+        self.path = path
+        self.header = header
+        self._buffer = buffer
+        self._data_offset = data_offset
+        self._strings: Optional[List[Optional[str]]] = None
+        self._arrays: Dict[str, np.ndarray] = {}
+        # Single strings decoded without the whole table (see string())
+        self._decode_string = lru_cache(maxsize=8192)(self._read_string)
+        # Decoded timestamps, shared by every column so equal values share one
+        # datetime; only kept while to_model() decodes the whole snapshot
+        self._datetimes: Optional[Dict[int, Optional[datetime]]] = None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def write(cls, model: EuroAipModel, path: Union[str, Path],
+              metadata: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Write a snapshot of ``model`` to ``path``.
+
+        The file is written next to ``path`` and renamed into place, so
+        readers never see a partial snapshot.
+
+        Args:
+            model: Model to write; its derived fields should be up to date
+            path: Snapshot file path
+            metadata: JSON-serialisable values stored in the header, e.g.
+                      the database fingerprint the model was loaded from
+
+        Returns:
+            The content hash of the snapshot
+        """
+        path = Path(path)
+        writer = _SnapshotWriter()
+
+        airports = list(model._airports.values())
+        writer.add_table("airports", AIRPORT_COLUMNS, airports, {
+            "sources": lambda airport: sorted(airport.sources),
+        })
+        writer.add_key_index("airports", "ident", [airport.ident for airport in airports])
+        runways, procedures, entries = [], [], []
+        for row, airport in enumerate(airports):
+            runways.extend((row, runway) for runway in airport.runways)
+            procedures.extend((row, procedure) for procedure in airport.procedures)
+            entries.extend((row, entry) for entry in airport.aip_entries)
+        for table, columns, rows in (("runways", RUNWAY_COLUMNS, runways),
+                                     ("procedures", PROCEDURE_COLUMNS, procedures),
+                                     ("aip_entries", AIP_ENTRY_COLUMNS, entries)):
+            getters = {name: (lambda pair, name=name: getattr(pair[1], name)) for name, _ in columns}
+            getters["airport"] = lambda pair: pair[0]
+            writer.add_table(table, columns, rows, getters)
+
+        waypoints = [waypoint for candidates in model._waypoints.values() for waypoint in candidates]
+        writer.add_table("waypoints", WAYPOINT_COLUMNS, waypoints)
+        writer.add_key_index("waypoints", "name", [waypoint.name for waypoint in waypoints])
+
+        firs = list(model._firs.values())
+        writer.add_table("firs", FIR_COLUMNS, firs, {
+            "bbox": lambda fir: list(fir.bbox) if fir.bbox else None,
+        })
+        writer.add_key_index("firs", "icao", [fir.icao for fir in firs])
+        polygon_offsets, ring_offsets, coord_offsets, coords = [0], [0], [0], []
+        for fir in firs:
+            for polygon in fir.polygons:
+                for ring in polygon:
+                    coords.extend(ring)
+                    coord_offsets.append(len(coords))
+                ring_offsets.append(len(coord_offsets) - 1)
+            polygon_offsets.append(len(ring_offsets) - 1)
+        writer.add_array("firs.polygon_offsets", np.array(polygon_offsets, dtype="<i8"))
+        writer.add_array("firs.ring_offsets", np.array(ring_offsets, dtype="<i8"))
+        writer.add_array("firs.coord_offsets", np.array(coord_offsets, dtype="<i8"))
+        writer.add_array("firs.coords", np.array(coords, dtype="<f8").reshape(-1, 2))
+        # Simplified levels have the rings of the full boundary, so only their
+        # coordinates are stored; a level that does not match is left out
+        levels = sorted({tolerance for fir in firs for tolerance in fir.simplified})
+        for level, tolerance in enumerate(levels):
+            present, level_offsets, level_coords = [], [0], []
+            for fir in firs:
+                polygons = fir.simplified.get(tolerance)
+                matches = polygons is not None and len(polygons) == len(fir.polygons) and all(
+                    len(simple) == len(polygon) for simple, polygon in zip(polygons, fir.polygons))
+                present.append(matches)
+                for index, polygon in enumerate(fir.polygons):
+                    for ring in range(len(polygon)):
+                        if matches:
+                            level_coords.extend(polygons[index][ring])
+                        level_offsets.append(len(level_coords))
+            writer.add_array(f"firs.simplified.{level}.present", np.array(present, dtype="i1"))
+            writer.add_array(f"firs.simplified.{level}.coord_offsets", np.array(level_offsets, dtype="<i8"))
+            writer.add_array(f"firs.simplified.{level}.coords", np.array(level_coords, dtype="<f8").reshape(-1, 2))
+        writer.tables["firs"]["simplified"] = levels
+
+        writer.add_table("border_crossings", BORDER_CROSSING_COLUMNS, model.get_all_border_crossing_points(), {
+            "metadata": lambda entry: entry.metadata or None,
+        })
+        writer.string_table()
+
+        # Lay out the data section and hash it
+        arrays, offset = {}, 0
+        digest = hashlib.sha256()
+        chunks = []
+        for name, array in writer.arrays:
+            offset = _align(offset)
+            array = np.ascontiguousarray(array)
+            arrays[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+            chunks.append((offset, array))
+            offset += array.nbytes
+        data_size = _align(offset)
+        position = 0
+        for chunk_offset, array in chunks:
+            digest.update(bytes(chunk_offset - position))
+            digest.update(array.tobytes())
+            position = chunk_offset + array.nbytes
+        digest.update(bytes(data_size - position))
+
+        header = {
+            "format": "euro_aip.snapshot",
+            "version": SNAPSHOT_VERSION,
+            "written_at": datetime.now().isoformat(),
+            "content_hash": digest.hexdigest(),
+            "data_size": data_size,
+            "metadata": metadata or {},
+            "model": {
+                "created_at": model.created_at.isoformat(),
+                "updated_at": model.updated_at.isoformat(),
+                "sources_used": sorted(model.sources_used),
+            },
+            "tables": writer.tables,
+            "arrays": arrays,
+        }
+        header_bytes = json.dumps(header).encode("utf-8")
+        data_offset = _align(_PREAMBLE.size + len(header_bytes))
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header_bytes)))
+                f.write(header_bytes)
+                f.write(bytes(data_offset - f.tell()))
+                for chunk_offset, array in chunks:
+                    f.write(bytes(data_offset + chunk_offset - f.tell()))
+                    f.write(array.tobytes())
+                f.write(bytes(data_offset + data_size - f.tell()))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Wrote model snapshot {path} ({len(airports)} airports, {len(waypoints)} waypoints, "
+                    f"{(data_offset + data_size) / 2 ** 20:.1f} MB)")
+        return header["content_hash"]
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def read_header(cls, path: Union[str, Path]) -> Dict[str, Any]:
+        """Read only the header of a snapshot file."""
+        with open(path, "rb") as f:
+            header, _ = cls._read_header(f, Path(path))
+        return header
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "ModelSnapshot":
+        """
+        Open a snapshot file.
+
+        Raises:
+            SnapshotError: if the file is missing, truncated or has another format version
+        """
+        path = Path(path)
+        try:
+            with open(path, "rb") as f:
+                header, data_offset = cls._read_header(f, path)
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError as e:
+            raise SnapshotError(f"Cannot open snapshot {path}: {e}") from e
+        if len(buffer) < data_offset + header["data_size"]:
+            buffer.close()
+            raise SnapshotError(f"Snapshot {path} is truncated")
+        return cls(path, header, buffer, data_offset)
+
+    @staticmethod
+    def _read_header(f, path: Path) -> Tuple[Dict[str, Any], int]:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise SnapshotError(f"{path} is not a model snapshot")
+        magic, version, header_size = _PREAMBLE.unpack(preamble)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"{path} is not a model snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"Snapshot {path} has format version {version}, expected {SNAPSHOT_VERSION}")
+        try:
+            header = json.loads(f.read(header_size).decode("utf-8"))
+        except ValueError as e:
+            raise SnapshotError(f"Snapshot {path} has a corrupt header") from e
+        return header, _align(_PREAMBLE.size + header_size)
+
+    def close(self) -> None:
+        """Release the memory map (arrays returned by column() must no longer be used)."""
+        self._arrays.clear()
+        try:
+            self._buffer.close()
+        except BufferError:
+            # Arrays still reference the map; it is released with them
+            pass
+
+    def __enter__(self) -> "ModelSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def content_hash(self) -> str:
+        return self.header["content_hash"]
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Values passed to write(), e.g. the source database fingerprint."""
+        return self.header["metadata"]
+
+    def verify(self) -> bool:
+        """Whether the data section matches the content hash in the header."""
+        start = self._data_offset
+        digest = hashlib.sha256(memoryview(self._buffer)[start:start + self.header["data_size"]])
+        return digest.hexdigest() == self.content_hash
+
+    def array(self, name: str) -> np.ndarray:
+        """Read-only view of a stored array, e.g. ``"firs.coords"``."""
+        array = self._arrays.get(name)
+        if array is None:
+            spec = self.header["arrays"][name]
+            dtype = np.dtype(spec["dtype"])
+            count = int(np.prod(spec["shape"]))
+            array = np.frombuffer(self._buffer, dtype=dtype, count=count, offset=self._data_offset + spec["offset"])
+            array = self._arrays[name] = array.reshape(spec["shape"])
+        return array
+
+    def column(self, table: str, name: str) -> np.ndarray:
+        """Raw encoded column of a table (see the module docstring for encodings)."""
+        return self.array(f"{table}.{name}")
+
+    def rows(self, table: str) -> int:
+        return self.header["tables"][table]["rows"]
+
+    def strings(self) -> List[Optional[str]]:
+        """The decoded string table; index -1 (None) is the last element."""
+        if self._strings is None:
+            offsets = self.array("strings.offsets").tolist()
+            data = bytes(self.array("strings.data"))
+            strings: List[Optional[str]] = [
+                data[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])
+            ]
+            strings.append(None)
+            self._strings = strings
+        return self._strings
+
+    def string(self, index: int) -> Optional[str]:
+        """
+        One entry of the string table (None for -1).
+
+        Unless strings() has decoded the whole table, only this entry is
+        read from the map; recently used entries are cached.
+        """
+        if index < 0:
+            return None
+        if self._strings is not None:
+            return self._strings[index]
+        return self._decode_string(index)
+
+    def _read_string(self, index: int) -> str:
+        offsets = self.array("strings.offsets")
+        start = self._data_offset + self.header["arrays"]["strings.data"]["offset"]
+        return self._buffer[start + int(offsets[index]):start + int(offsets[index + 1])].decode("utf-8")
+
+    def values(self, table: str, name: str, start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        """
+        Decoded values of a column (or of rows ``start:stop``) as a list of Python objects.
+
+        Text is looked up in the decoded string table once strings() has
+        been called, and decoded entry by entry otherwise.
+        """
+        kind = self.header["tables"][table]["columns"][name]
+        raw = self.column(table, name)[start:stop].tolist()
+        if kind == "str":
+            if self._strings is not None:
+                strings = self._strings
+                return [strings[i] for i in raw]
+            return [self.string(i) for i in raw]
+        if kind == "json":
+            return [None if i < 0 else json.loads(self.string(i)) for i in raw]
+        if kind == "float":
+            return [None if value != value else value for value in raw]
+        if kind == "int":
+            return [None if value == _INT_NONE else value for value in raw]
+        if kind == "bool":
+            return [None if value < 0 else bool(value) for value in raw]
+        # Timestamps: decode each distinct value once and share the datetime
+        decoded = self._datetimes if self._datetimes is not None else {_INT_NONE: None}
+        result = []
+        for value in raw:
+            dt = decoded.get(value)
+            if dt is None and value not in decoded:
+                dt = decoded[value] = _EPOCH + timedelta(microseconds=value)
+            result.append(dt)
+        offsets_name = f"{table}.{name}.utc_offset"
+        if offsets_name in self.header["arrays"]:
+            offsets = self.array(offsets_name)[start:stop].tolist()
+            result = [
+                dt if offset == _OFFSET_NONE or dt is None
+                else dt.replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(seconds=offset)))
+                for dt, offset in zip(result, offsets)
+            ]
+        return result
+
+    def _records(self, table: str, skip: Sequence[str] = (),
+                 start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Decode a table (or rows ``start:stop``) into one keyword dict per row."""
+        names = [name for name in self.header["tables"][table]["columns"] if name not in skip]
+        columns = [self.values(table, name, start, stop) for name in names]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def _objects(self, table: str, cls: type, skip: Sequence[str] = (),
+                 convert: Optional[Dict[str, Callable[[Any], Any]]] = None,
+                 start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        """
+        Decode a table (or rows ``start:stop``) into ``cls`` instances.
+
+        The columns are passed positionally when they are the leading init
+        fields of the dataclass in order (much cheaper than keywords for
+        hundreds of thousands of rows), by keyword otherwise.
+        """
+        names = [name for name in self.header["tables"][table]["columns"] if name not in skip]
+        convert = convert or {}
+        columns = []
+        for name in names:
+            values = self.values(table, name, start, stop)
+            if name in convert:
+                values = [convert[name](value) for value in values]
+            columns.append(values)
+        init_names = [f.name for f in fields(cls) if f.init]
+        if names == init_names[:len(names)]:
+            return list(starmap(cls, zip(*columns)))
+        return [cls(**dict(zip(names, row))) for row in zip(*columns)]
+
+    def to_model(self) -> EuroAipModel:
+        """
+        Rebuild the model stored in the snapshot.
+
+        Derived fields are read from the snapshot rather than recomputed.
+        """
+        # Building hundreds of thousands of objects would otherwise trigger
+        # many cyclic garbage collections over the growing model
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        self._datetimes = {_INT_NONE: None}
+        try:
+            self.strings()
+            return self._build_model()
+        finally:
+            self._datetimes = None
+            if gc_enabled:
+                gc.enable()
+
+    def _build_model(self) -> EuroAipModel:
+        info = self.header["model"]
+        model = EuroAipModel(
+            created_at=datetime.fromisoformat(info["created_at"]),
+            updated_at=datetime.fromisoformat(info["updated_at"]),
+            sources_used=set(info["sources_used"]),
+        )
+
+        airports = self._objects("airports", Airport, convert=_AIRPORT_CONVERT)
+        for airport in airports:
+            model._airports[airport.ident] = airport
+            model._adopt_airport(airport)
+        for table, cls, attribute in (("runways", Runway, "runways"),
+                                      ("procedures", Procedure, "procedures"),
+                                      ("aip_entries", AIPEntry, "aip_entries")):
+            owners = self.values(table, "airport")
+            for owner, item in zip(owners, self._objects(table, cls, skip=("airport",))):
+                getattr(airports[owner], attribute).append(item)
+
+        waypoints = model._waypoints
+        for waypoint in self._objects("waypoints", Waypoint):
+            candidates = waypoints.get(waypoint.name)
+            if candidates is None:
+                waypoints[waypoint.name] = [waypoint]
+            else:
+                candidates.append(waypoint)
+
+        for fir in self._firs():
+            model._firs[fir.icao] = fir
+        self._add_border_crossings(model)
+
+        logger.info(f"Loaded model snapshot {self.path} ({len(airports)} airports)")
+        return model
+
+    def _firs(self, start: int = 0, stop: Optional[int] = None) -> List[FIR]:
+        """Decode FIRs ``start:stop`` with their boundary polygons."""
+        stop = self.rows("firs") if stop is None else stop
+        polygon_offsets = self.array("firs.polygon_offsets")[start:stop + 1].tolist()
+        ring_offsets = self.array("firs.ring_offsets")
+        coord_offsets = self.array("firs.coord_offsets")
+        coords = self.array("firs.coords")
+        levels = [
+            (tolerance, self.array(f"firs.simplified.{level}.present")[start:stop].tolist(),
+             self.array(f"firs.simplified.{level}.coord_offsets"), self.array(f"firs.simplified.{level}.coords"))
+            for level, tolerance in enumerate(self.header["tables"]["firs"]["simplified"])
+        ]
+        firs = []
+        for index, record in enumerate(self._records("firs", start=start, stop=stop)):
+            record["bbox"] = tuple(record["bbox"]) if record["bbox"] else None
+            # Only this FIR's rings are read from the map
+            rings = ring_offsets[polygon_offsets[index]:polygon_offsets[index + 1] + 1].tolist()
+            record["polygons"] = self._fir_polygons(rings, coord_offsets, coords)
+            record["simplified"] = {
+                tolerance: self._fir_polygons(rings, level_offsets, level_coords)
+                for tolerance, present, level_offsets, level_coords in levels if present[index]
+            }
+            firs.append(FIR(**record))
+        return firs
+
+    @staticmethod
+    def _fir_polygons(rings: List[int], coord_offsets: np.ndarray, coords: np.ndarray) -> List[Any]:
+        """Polygons of one FIR from its ring offsets (``rings``) and a coordinate array."""
+        first, last = int(rings[0]), int(rings[-1])
+        ring_coords = coord_offsets[first:last + 1].tolist()
+        points = coords[ring_coords[0]:ring_coords[-1]].tolist()
+        base = ring_coords[0]
+        return [
+            [points[ring_coords[ring - first] - base:ring_coords[ring - first + 1] - base]
+             for ring in range(rings[polygon], rings[polygon + 1])]
+            for polygon in range(len(rings) - 1)
+        ]
+
+    def _add_border_crossings(self, model: EuroAipModel) -> None:
+        for record in self._records("border_crossings"):
+            entry = BorderCrossingEntry(**record)
+            icao = entry.icao_code or entry.matched_airport_icao
+            model.border_crossing_points.setdefault(entry.country_iso, {})[icao] = entry
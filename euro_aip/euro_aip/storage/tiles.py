@@ -0,0 +1,650 @@
+"""
+Pre-rendered vector tiles (MBTiles) of airports, waypoints and FIRs.
+
+TileGenerator renders a EuroAipModel into Mapbox Vector Tiles on the Web
+Mercator z/x/y grid and stores them in an MBTiles file: a SQLite database
+with ``metadata`` and ``tiles`` tables, gzip-compressed tile data and TMS
+row numbering (``tile_row = 2**zoom - 1 - y``). A web map then serves each
+viewport from precomputed tiles instead of filtering the model per request.
+
+Layers:
+
+- ``airports``: points, thinned per zoom by ``type`` and
+  ``longest_runway_length_ft`` (see TileGenerator.airport_min_zoom)
+- ``waypoints``: points, navaids from zoom 7 and other waypoints from zoom 9
+- ``firs``: polygons, simplified to about a screen pixel at each zoom
+  (starting from the FIR's stored simplified level when one is fine enough)
+  and clipped to the tile and its buffer; up to ``fir_max_zoom``, the map
+  overzooms them above that (the MBTiles ``json`` metadata gives each layer's
+  zoom range)
+
+The file also keeps an ``airport_tiles`` table of the tiles each airport is
+drawn in, so update_mbtiles() re-renders only the tiles of the airports a
+save changed (DatabaseStorage.get_airports_changed_in_last_save()).
+Waypoint and FIR changes need a full write_mbtiles().
+
+The MVT protobuf encoding is written by hand; there is no extra dependency.
+Tiles do not wrap around the antimeridian.
+"""
+
+import gzip
+import json
+import logging
+import math
+import os
+import sqlite3
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from ..models.airport import Airport
+from ..models.euro_aip_model import EuroAipModel
+from ..models.fir import FIR
+from ..models.waypoint import Waypoint
+from ..utils.geometry import NM_PER_DEGREE_LAT, simplify_polyline
+
+logger = logging.getLogger(__name__)
+
+EXTENT = 4096               # tile coordinate units per tile side
+BUFFER = 64                 # features this close to a tile edge are drawn in both tiles
+MAX_LATITUDE = 85.0511287798
+
+TileKey = Tuple[int, int, int]      # (zoom, x, y), y counted from the north
+Point = Tuple[float, float]
+
+# MVT geometry types and commands
+_POINT, _POLYGON = 1, 3
+_MOVE_TO, _LINE_TO, _CLOSE_PATH = 1, 2, 7
+
+
+def world_position(lon: float, lat: float, zoom: int) -> Point:
+    """Web Mercator position at ``zoom`` in tile units (EXTENT per tile), y down."""
+    lat = max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))
+    scale = (1 << zoom) * EXTENT
+    sin_lat = math.sin(math.radians(lat))
+    return ((lon + 180.0) / 360.0 * scale,
+            (0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * scale)
+
+
+def tile_for(lon: float, lat: float, zoom: int) -> Tuple[int, int]:
+    """(x, y) of the tile holding a point at ``zoom``."""
+    wx, wy = world_position(lon, lat, zoom)
+    last = (1 << zoom) - 1
+    return (min(max(int(wx // EXTENT), 0), last), min(max(int(wy // EXTENT), 0), last))
+
+
+def tile_bounds(zoom: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """(min_lon, min_lat, max_lon, max_lat) of a tile."""
+    n = 1 << zoom
+
+    def lat(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    return (x / n * 360.0 - 180.0, lat(y + 1), (x + 1) / n * 360.0 - 180.0, lat(y))
+
+
+# --- MVT encoding -------------------------------------------------------------
+
+def _varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def _uint_field(out: bytearray, number: int, value: int) -> None:
+    _varint(out, number << 3)
+    _varint(out, value)
+
+
+def _bytes_field(out: bytearray, number: int, payload: bytes) -> None:
+    _varint(out, number << 3 | 2)
+    _varint(out, len(payload))
+    out += payload
+
+
+def _packed(values: Iterable[int]) -> bytes:
+    out = bytearray()
+    for value in values:
+        _varint(out, value)
+    return bytes(out)
+
+
+def _value(value: Any) -> bytes:
+    """Encode a feature property as an MVT Value message."""
+    out = bytearray()
+    if isinstance(value, bool):
+        _uint_field(out, 7, int(value))
+    elif isinstance(value, int):
+        _uint_field(out, 6, _zigzag(value))
+    elif isinstance(value, float):
+        _varint(out, 3 << 3 | 1)
+        out += struct.pack('<d', value)
+    else:
+        _bytes_field(out, 1, str(value).encode('utf-8'))
+    return bytes(out)
+
+
+class _Layer:
+    """Features of one layer of a tile, with their shared key and value tables."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.features: List[bytes] = []
+        self.keys: Dict[str, int] = {}
+        self.values: Dict[Tuple[type, Any], int] = {}
+
+    def add(self, geom_type: int, geometry: List[int], properties: Dict[str, Any]) -> None:
+        tags = []
+        for key, value in properties.items():
+            if value is None or value == '':
+                continue
+            tags.append(self.keys.setdefault(key, len(self.keys)))
+            tags.append(self.values.setdefault((type(value), value), len(self.values)))
+        feature = bytearray()
+        _bytes_field(feature, 2, _packed(tags))
+        _uint_field(feature, 3, geom_type)
+        _bytes_field(feature, 4, _packed(geometry))
+        self.features.append(bytes(feature))
+
+    def encode(self) -> bytes:
+        out = bytearray()
+        _uint_field(out, 15, 2)
+        _bytes_field(out, 1, self.name.encode('utf-8'))
+        for feature in self.features:
+            _bytes_field(out, 2, feature)
+        for key in self.keys:
+            _bytes_field(out, 3, key.encode('utf-8'))
+        for _, value in self.values:
+            _bytes_field(out, 4, _value(value))
+        _uint_field(out, 5, EXTENT)
+        return bytes(out)
+
+
+def _whole(value: Optional[float]) -> Optional[int]:
+    """Lengths and elevations as integers, whether the model holds ints or floats."""
+    return None if value is None else int(round(value))
+
+
+def _point_geometry(x: int, y: int) -> List[int]:
+    return [_MOVE_TO | 1 << 3, _zigzag(x), _zigzag(y)]
+
+
+def _ring_area(ring: List[Tuple[int, int]]) -> int:
+    """Twice the signed area; positive is clockwise on screen (y down)."""
+    return sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1]))
+
+
+def _polygon_geometry(polygons: List[List[List[Point]]]) -> List[int]:
+    """
+    Encode polygons (lists of rings in tile coordinates, the first exterior).
+
+    Rings are rounded to integers and oriented as MVT requires: exterior
+    rings clockwise on screen, holes anticlockwise. Rings that collapse to
+    less than a triangle are dropped, with their holes for exterior rings.
+    """
+    geometry: List[int] = []
+    cx = cy = 0
+    for polygon in polygons:
+        for index, ring in enumerate(polygon):
+            points: List[Tuple[int, int]] = []
+            for x, y in ring:
+                point = (int(round(x)), int(round(y)))
+                if not points or points[-1] != point:
+                    points.append(point)
+            while len(points) > 1 and points[-1] == points[0]:
+                points.pop()
+            area = _ring_area(points) if len(points) >= 3 else 0
+            if area == 0:
+                if index == 0:
+                    break
+                continue
+            if (area > 0) != (index == 0):
+                points.reverse()
+            geometry.append(_MOVE_TO | 1 << 3)
+            for i, (x, y) in enumerate(points):
+                if i == 1:
+                    geometry.append(_LINE_TO | (len(points) - 1) << 3)
+                geometry += (_zigzag(x - cx), _zigzag(y - cy))
+                cx, cy = x, y
+            geometry.append(_CLOSE_PATH | 1 << 3)
+    return geometry
+
+
+def _clip_ring(ring: List[Point], low: float, high: float) -> List[Point]:
+    """Sutherland–Hodgman clip of a ring (without closing point) to the square [low, high]²."""
+    for axis in (0, 1):
+        for edge, keep_above in ((low, True), (high, False)):
+            if not ring:
+                return ring
+            clipped = []
+            previous = ring[-1]
+            previous_in = previous[axis] >= edge if keep_above else previous[axis] <= edge
+            for point in ring:
+                inside = point[axis] >= edge if keep_above else point[axis] <= edge
+                if inside != previous_in:
+                    t = (edge - previous[axis]) / (point[axis] - previous[axis])
+                    clipped.append((previous[0] + t * (point[0] - previous[0]),
+                                    previous[1] + t * (point[1] - previous[1])))
+                if inside:
+                    clipped.append(point)
+                previous, previous_in = point, inside
+            ring = clipped
+    return ring
+
+
+# --- Tile generation ----------------------------------------------------------
+
+class TileGenerator:
+    """
+    Render a model's airports, waypoints and FIRs as vector tiles.
+
+    Example:
+        generator = TileGenerator(model, max_zoom=10)
+        generator.write_mbtiles("airports.mbtiles")
+        # later, after storage.save_model(model)
+        generator.update_mbtiles("airports.mbtiles", storage.get_airports_changed_in_last_save())
+    """
+
+    # Zoom each airport type appears from, and the runway length (ft) that
+    # brings it in one zoom earlier; other types (heliports, seaplane bases,
+    # closed) only appear at max_zoom
+    AIRPORT_ZOOMS: Dict[str, Tuple[int, Optional[int]]] = {
+        'large_airport': (4, None),
+        'medium_airport': (6, 6000),
+        'small_airport': (8, 4000),
+    }
+    NAVAID_ZOOM = 7
+    WAYPOINT_ZOOM = 9
+    # FIR simplification tolerance, in tile units (a pixel of a 512 px tile)
+    FIR_TOLERANCE = EXTENT / 512
+
+    LAYER_FIELDS = {
+        'airports': {'ident': 'String', 'name': 'String', 'type': 'String', 'iso_country': 'String',
+                     'longest_runway_length_ft': 'Number', 'elevation_ft': 'Number', 'min_zoom': 'Number'},
+        'waypoints': {'name': 'String', 'point_type': 'String', 'min_zoom': 'Number'},
+        'firs': {'icao': 'String', 'name': 'String'},
+    }
+
+    def __init__(self, model: EuroAipModel, min_zoom: int = 0, max_zoom: int = 10,
+                 bounds: Optional[Tuple[float, float, float, float]] = None, fir_max_zoom: int = 8):
+        """
+        Args:
+            model: Model to render
+            min_zoom: Lowest zoom rendered
+            max_zoom: Highest zoom rendered; every airport and waypoint is drawn at it
+            bounds: (min_lon, min_lat, max_lon, max_lat) of the tiles rendered;
+                    defaults to the extent of the airports and waypoints, or
+                    for update_mbtiles() to the bounds the file was written with
+            fir_max_zoom: Highest zoom with the firs layer
+        """
+        if not 0 <= min_zoom <= max_zoom <= 22:
+            raise ValueError(f"Invalid zoom range {min_zoom}-{max_zoom}")
+        self.model = model
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.fir_max_zoom = min(fir_max_zoom, max_zoom)
+        self._default_bounds = bounds is None
+        # Rounded as in the metadata, so a file's bounds give back the same tiles
+        self.bounds = tuple(round(value, 6) for value in bounds or self._model_bounds())
+        self._fir_cache: Dict[Tuple[str, int], List[Tuple[Tuple[float, float, float, float],
+                                                          List[List[Point]]]]] = {}
+
+    def _model_bounds(self) -> Tuple[float, float, float, float]:
+        lons, lats = [], []
+        for item in list(self._airports()) + list(self.model.waypoints):
+            lons.append(item.longitude_deg)
+            lats.append(item.latitude_deg)
+        if not lons:
+            return (-180.0, -MAX_LATITUDE, 180.0, MAX_LATITUDE)
+        return (min(lons), min(lats), max(lons), max(lats))
+
+    def _airports(self) -> Iterator[Airport]:
+        for airport in self.model.airports:
+            if airport.latitude_deg is not None and airport.longitude_deg is not None:
+                yield airport
+
+    def airport_min_zoom(self, airport: Airport) -> int:
+        """Lowest zoom an airport is drawn at (between min_zoom and max_zoom)."""
+        zoom, runway_ft = self.AIRPORT_ZOOMS.get(airport.type, (self.max_zoom, None))
+        if runway_ft is not None and (airport.longest_runway_length_ft or 0) >= runway_ft:
+            zoom -= 1
+        return min(max(zoom, self.min_zoom), self.max_zoom)
+
+    def waypoint_min_zoom(self, waypoint: Waypoint) -> int:
+        """Lowest zoom a waypoint is drawn at (between min_zoom and max_zoom)."""
+        zoom = self.NAVAID_ZOOM if waypoint.is_navaid else self.WAYPOINT_ZOOM
+        return min(max(zoom, self.min_zoom), self.max_zoom)
+
+    def tile_range(self, zoom: int) -> Tuple[int, int, int, int]:
+        """(min_x, min_y, max_x, max_y) of the tiles rendered at ``zoom``."""
+        min_lon, min_lat, max_lon, max_lat = self.bounds
+        min_x, min_y = tile_for(min_lon, max_lat, zoom)
+        max_x, max_y = tile_for(max_lon, min_lat, zoom)
+        return min_x, min_y, max_x, max_y
+
+    def _covering(self, zoom: int, min_wx: float, min_wy: float,
+                  max_wx: float, max_wy: float) -> Iterator[Tuple[int, int]]:
+        """Tiles within the rendered range whose buffered area overlaps a box in world units."""
+        range_x0, range_y0, range_x1, range_y1 = self.tile_range(zoom)
+        x0, x1 = max(int((min_wx - BUFFER) // EXTENT), range_x0), min(int((max_wx + BUFFER) // EXTENT), range_x1)
+        y0, y1 = max(int((min_wy - BUFFER) // EXTENT), range_y0), min(int((max_wy + BUFFER) // EXTENT), range_y1)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                yield x, y
+
+    def _point_tiles(self, lon: float, lat: float, first_zoom: int) -> Iterator[TileKey]:
+        for zoom in range(max(first_zoom, self.min_zoom), self.max_zoom + 1):
+            wx, wy = world_position(lon, lat, zoom)
+            for x, y in self._covering(zoom, wx, wy, wx, wy):
+                yield zoom, x, y
+
+    def airport_tiles(self, airport: Airport) -> Set[TileKey]:
+        """Tiles an airport is drawn in."""
+        return set(self._point_tiles(airport.longitude_deg, airport.latitude_deg,
+                                     self.airport_min_zoom(airport)))
+
+    def _fir_polygons(self, fir: FIR, zoom: int) -> List[Tuple[Tuple[float, float, float, float],
+                                                             List[List[Point]]]]:
+        """A FIR's polygons in world units at ``zoom``, simplified, with their bounding boxes."""
+        key = (fir.icao, zoom)
+        if key not in self._fir_cache:
+            # Start from the FIR's stored simplified level when it is well
+            # under a pixel, measured where the FIR's pixels are smallest
+            max_abs_lat = max(abs(fir.bbox[1]), abs(fir.bbox[3])) if fir.bbox else 0.0
+            pixel_nm = (self.FIR_TOLERANCE / ((1 << zoom) * EXTENT) * 360.0 * NM_PER_DEGREE_LAT
+                        * math.cos(math.radians(min(max_abs_lat, MAX_LATITUDE))))
+            polygons = []
+            for polygon in fir.coarsest_polygons(pixel_nm / 2):
+                rings = []
+                for ring in polygon:
+                    points = simplify_polyline(
+                        [world_position(lon, lat, zoom) for lon, lat in ring], self.FIR_TOLERANCE)
+                    if len(points) > 1 and points[0] == points[-1]:
+                        points.pop()
+                    if len(points) >= 3:
+                        rings.append(points)
+                    elif not rings:
+                        break
+                if rings:
+                    xs = [x for x, _ in rings[0]]
+                    ys = [y for _, y in rings[0]]
+                    polygons.append(((min(xs), min(ys), max(xs), max(ys)), rings))
+            self._fir_cache[key] = polygons
+        return self._fir_cache[key]
+
+    def _fir_tiles(self, zoom: int) -> Dict[Tuple[int, int], List[FIR]]:
+        tiles: Dict[Tuple[int, int], List[FIR]] = {}
+        if zoom > self.fir_max_zoom:
+            return tiles
+        for fir in self.model.firs:
+            seen: Set[Tuple[int, int]] = set()
+            for box, _ in self._fir_polygons(fir, zoom):
+                for tile in self._covering(zoom, *box):
+                    if tile not in seen:
+                        seen.add(tile)
+                        tiles.setdefault(tile, []).append(fir)
+        return tiles
+
+    def render_tile(self, zoom: int, x: int, y: int, airports: Iterable[Airport],
+                    waypoints: Iterable[Waypoint], firs: Iterable[FIR]) -> Optional[bytes]:
+        """
+        Encode one tile (uncompressed MVT) from the features drawn in it.
+
+        Returns:
+            The tile, or None if no feature falls inside it
+        """
+        origin_x, origin_y = x * EXTENT, y * EXTENT
+
+        def local(lon: float, lat: float) -> Tuple[int, int]:
+            wx, wy = world_position(lon, lat, zoom)
+            return int(round(wx - origin_x)), int(round(wy - origin_y))
+
+        layers = []
+        firs_layer = _Layer('firs')
+        for fir in firs:
+            polygons = []
+            for (min_wx, min_wy, max_wx, max_wy), rings in self._fir_polygons(fir, zoom):
+                if (max_wx < origin_x - BUFFER or min_wx > origin_x + EXTENT + BUFFER
+                        or max_wy < origin_y - BUFFER or min_wy > origin_y + EXTENT + BUFFER):
+                    continue
+                clipped = [_clip_ring([(px - origin_x, py - origin_y) for px, py in ring],
+                                      -BUFFER, EXTENT + BUFFER) for ring in rings]
+                if len(clipped[0]) >= 3:
+                    polygons.append([ring for ring in clipped if len(ring) >= 3])
+            geometry = _polygon_geometry(polygons)
+            if geometry:
+                firs_layer.add(_POLYGON, geometry, {'icao': fir.icao, 'name': fir.name})
+        layers.append(firs_layer)
+
+        waypoints_layer = _Layer('waypoints')
+        for waypoint in sorted(waypoints, key=lambda w: (self.waypoint_min_zoom(w), w.name)):
+            waypoints_layer.add(_POINT, _point_geometry(*local(waypoint.longitude_deg, waypoint.latitude_deg)), {
+                'name': waypoint.name, 'point_type': waypoint.point_type,
+                'min_zoom': self.waypoint_min_zoom(waypoint),
+            })
+        layers.append(waypoints_layer)
+
+        # Most prominent airports first, for renderers that drop colliding labels
+        airports_layer = _Layer('airports')
+        for airport in sorted(airports, key=lambda a: (self.airport_min_zoom(a),
+                                                       -(a.longest_runway_length_ft or 0), a.ident)):
+            airports_layer.add(_POINT, _point_geometry(*local(airport.longitude_deg, airport.latitude_deg)), {
+                'ident': airport.ident, 'name': airport.name, 'type': airport.type,
+                'iso_country': airport.iso_country,
+                'longest_runway_length_ft': _whole(airport.longest_runway_length_ft),
+                'elevation_ft': _whole(airport.elevation_ft), 'min_zoom': self.airport_min_zoom(airport),
+            })
+        layers.append(airports_layer)
+
+        tile = bytearray()
+        for layer in layers:
+            if layer.features:
+                _bytes_field(tile, 3, layer.encode())
+        return bytes(tile) if tile else None
+
+    def _zoom_buckets(self, zoom: int, only: Optional[Set[Tuple[int, int]]] = None,
+                      airports: bool = True) -> Tuple[Dict[Tuple[int, int], List[Airport]],
+                                                      Dict[Tuple[int, int], List[Waypoint]]]:
+        """Airports and waypoints drawn in each tile of ``zoom`` (or of the tiles in ``only``)."""
+        airport_buckets: Dict[Tuple[int, int], List[Airport]] = {}
+        waypoint_buckets: Dict[Tuple[int, int], List[Waypoint]] = {}
+        for items, buckets, min_zoom in (
+                (self._airports() if airports else (), airport_buckets, self.airport_min_zoom),
+                (self.model.waypoints, waypoint_buckets, self.waypoint_min_zoom)):
+            for item in items:
+                if min_zoom(item) > zoom:
+                    continue
+                wx, wy = world_position(item.longitude_deg, item.latitude_deg, zoom)
+                for tile in self._covering(zoom, wx, wy, wx, wy):
+                    if only is None or tile in only:
+                        buckets.setdefault(tile, []).append(item)
+        return airport_buckets, waypoint_buckets
+
+    def tiles(self) -> Iterator[Tuple[int, int, int, bytes]]:
+        """Yield (zoom, x, y, uncompressed MVT) for every non-empty tile, zoom by zoom."""
+        for zoom in range(self.min_zoom, self.max_zoom + 1):
+            airports, waypoints = self._zoom_buckets(zoom)
+            firs = self._fir_tiles(zoom)
+            for x, y in sorted(set(airports) | set(waypoints) | set(firs)):
+                data = self.render_tile(zoom, x, y, airports.get((x, y), ()),
+                                        waypoints.get((x, y), ()), firs.get((x, y), ()))
+                if data is not None:
+                    yield zoom, x, y, data
+
+    # --- MBTiles --------------------------------------------------------------
+
+    def _metadata(self) -> Dict[str, str]:
+        min_lon, min_lat, max_lon, max_lat = self.bounds
+        center_zoom = min(max(self.min_zoom, 5), self.max_zoom)
+        layer_zooms = {
+            'airports': (self.min_zoom, self.max_zoom),
+            'waypoints': (min(max(self.NAVAID_ZOOM, self.min_zoom), self.max_zoom), self.max_zoom),
+            'firs': (self.min_zoom, self.fir_max_zoom),
+        }
+        return {
+            'name': 'euro_aip',
+            'format': 'pbf',
+            'type': 'overlay',
+            'minzoom': str(self.min_zoom),
+            'maxzoom': str(self.max_zoom),
+            'bounds': f"{min_lon:.6f},{min_lat:.6f},{max_lon:.6f},{max_lat:.6f}",
+            'center': f"{(min_lon + max_lon) / 2:.6f},{(min_lat + max_lat) / 2:.6f},{center_zoom}",
+            'json': json.dumps({'vector_layers': [
+                {'id': layer, 'fields': fields, 'minzoom': layer_zooms[layer][0],
+                 'maxzoom': layer_zooms[layer][1]}
+                for layer, fields in self.LAYER_FIELDS.items()
+            ]}),
+        }
+
+    @staticmethod
+    def _tms_row(zoom: int, y: int) -> int:
+        return (1 << zoom) - 1 - y
+
+    def write_mbtiles(self, path: Union[str, Path]) -> int:
+        """
+        Render every tile into a new MBTiles file, replacing ``path`` once complete.
+
+        Returns:
+            Number of tiles written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            conn = sqlite3.connect(tmp_name)
+            try:
+                conn.executescript('''
+                    PRAGMA journal_mode = OFF;
+                    PRAGMA synchronous = OFF;
+                    CREATE TABLE metadata (name TEXT, value TEXT);
+                    CREATE UNIQUE INDEX name ON metadata (name);
+                    CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER,
+                                        tile_row INTEGER, tile_data BLOB);
+                    CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row);
+                    CREATE TABLE airport_tiles (ident TEXT, zoom_level INTEGER, tile_column INTEGER,
+                                                tile_row INTEGER,
+                                                PRIMARY KEY (ident, zoom_level, tile_column, tile_row))
+                                                WITHOUT ROWID;
+                    CREATE INDEX airport_tiles_tile ON airport_tiles (zoom_level, tile_column, tile_row);
+                ''')
+                conn.executemany('INSERT INTO metadata (name, value) VALUES (?, ?)',
+                                 self._metadata().items())
+                count = 0
+                for zoom, x, y, data in self.tiles():
+                    conn.execute('INSERT INTO tiles VALUES (?, ?, ?, ?)',
+                                 (zoom, x, self._tms_row(zoom, y), gzip.compress(data, mtime=0)))
+                    count += 1
+                conn.executemany('INSERT INTO airport_tiles VALUES (?, ?, ?, ?)', (
+                    (airport.ident, zoom, x, self._tms_row(zoom, y))
+                    for airport in self._airports() for zoom, x, y in sorted(self.airport_tiles(airport))
+                ))
+                conn.commit()
+            finally:
+                conn.close()
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        logger.info(f"Wrote {count} tiles (zoom {self.min_zoom}-{self.max_zoom}) to {path}")
+        return count
+
+    def update_mbtiles(self, path: Union[str, Path], idents: Iterable[str]) -> int:
+        """
+        Re-render only the tiles of the given airports in an existing MBTiles file.
+
+        The tiles rewritten are those each airport was drawn in (from the
+        file's airport_tiles table) and those it is drawn in now, so moved,
+        re-typed and removed airports disappear from their old tiles. The
+        file must have been written by write_mbtiles() with the same zoom
+        range (and bounds, when given), from a model whose other airports, waypoints and
+        FIRs have not changed since.
+
+        Args:
+            path: MBTiles file to update in place
+            idents: ICAO codes of the changed airports, e.g.
+                    DatabaseStorage.get_airports_changed_in_last_save()
+
+        Returns:
+            Number of tiles rewritten or deleted
+        """
+        idents = sorted(set(idents))
+        if not idents:
+            return 0
+        conn = sqlite3.connect(str(path))
+        try:
+            metadata = dict(conn.execute('SELECT name, value FROM metadata'))
+            if self._default_bounds and metadata.get('bounds'):
+                self.bounds = tuple(float(value) for value in metadata['bounds'].split(','))
+            expected = self._metadata()
+            for name in ('minzoom', 'maxzoom', 'bounds'):
+                if metadata.get(name) != expected[name]:
+                    raise ValueError(f"{path} has {name} {metadata.get(name)}, not {expected[name]}; "
+                                     "write it again with write_mbtiles()")
+
+            # Tiles each changed airport was and is drawn in
+            dirty: Set[TileKey] = set()
+            for zoom, x, row in conn.execute('''
+                SELECT zoom_level, tile_column, tile_row FROM airport_tiles
+                WHERE ident IN (SELECT value FROM json_each(?))
+            ''', (json.dumps(idents),)):
+                dirty.add((zoom, x, self._tms_row(zoom, row)))
+            changed = {}
+            for ident in idents:
+                airport = self.model._airports.get(ident)
+                if airport is not None and airport.latitude_deg is not None and airport.longitude_deg is not None:
+                    changed[ident] = (airport, self.airport_tiles(airport))
+                    dirty |= changed[ident][1]
+
+            # The unchanged airports of those tiles, from the index
+            airports: Dict[TileKey, List[Airport]] = {}
+            conn.execute('CREATE TEMP TABLE dirty_tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER)')
+            conn.executemany('INSERT INTO dirty_tiles VALUES (?, ?, ?)',
+                             ((zoom, x, self._tms_row(zoom, y)) for zoom, x, y in dirty))
+            for ident, zoom, x, row in conn.execute('''
+                SELECT a.ident, a.zoom_level, a.tile_column, a.tile_row
+                FROM airport_tiles a JOIN dirty_tiles USING (zoom_level, tile_column, tile_row)
+                WHERE a.ident NOT IN (SELECT value FROM json_each(?))
+            ''', (json.dumps(idents),)):
+                airport = self.model._airports.get(ident)
+                if airport is not None:
+                    airports.setdefault((zoom, x, self._tms_row(zoom, row)), []).append(airport)
+            for airport, tiles in changed.values():
+                for tile in tiles:
+                    airports.setdefault(tile, []).append(airport)
+
+            count = 0
+            for zoom in sorted({zoom for zoom, _, _ in dirty}):
+                tiles = {(x, y) for z, x, y in dirty if z == zoom}
+                _, waypoints = self._zoom_buckets(zoom, only=tiles, airports=False)
+                firs = self._fir_tiles(zoom)
+                for x, y in sorted(tiles):
+                    data = self.render_tile(zoom, x, y, airports.get((zoom, x, y), ()),
+                                            waypoints.get((x, y), ()), firs.get((x, y), ()))
+                    key = (zoom, x, self._tms_row(zoom, y))
+                    if data is None:
+                        conn.execute('DELETE FROM tiles WHERE zoom_level = ? AND tile_column = ? '
+                                     'AND tile_row = ?', key)
+                    else:
+                        conn.execute('INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?)',
+                                     key + (gzip.compress(data, mtime=0),))
+                    count += 1
+
+            conn.execute('DELETE FROM airport_tiles WHERE ident IN (SELECT value FROM json_each(?))',
+                         (json.dumps(idents),))
+            conn.executemany('INSERT INTO airport_tiles VALUES (?, ?, ?, ?)', (
+                (ident, zoom, x, self._tms_row(zoom, y))
+                for ident, (_, tiles) in changed.items() for zoom, x, y in sorted(tiles)
+            ))
+            conn.execute('DROP TABLE dirty_tiles')
+            conn.commit()
+        finally:
+            conn.close()
+        logger.info(f"Updated {count} tiles of {len(idents)} airports in {path}")
+        return count
@@ -8,10 +8,26 @@ library. Geometry primitives:
 - polygon:     list of rings (rings[0] is outer, rings[1:] are holes)
 - multipolygon: list of polygons
 - bbox:        (min_lon, min_lat, max_lon, max_lat)
+
+Array kernels (`haversine_nm_array`, `haversine_matrix_nm`, `points_in_ring`,
+`points_in_multipolygon`, `points_to_segments_nm`,
+`min_distance_points_to_multipolygon_nm`) evaluate the same formulas over
+NumPy arrays of many points at once.
+
+`simplify_ring_indices` simplifies rings with a tolerance in nm, and
+`CoarseRing` uses such a simplified ring as a conservative first test.
+
+`GridIndex` is a lat/lon bucket index over point items supporting radius,
+k-nearest and corridor queries. `PreparedRing`/`PreparedMultiPolygon` answer
+point-in-polygon tests from edges bucketed by latitude band, and
+`PolygonIndex` locates points among many polygons through an `RTree` over
+their bboxes.
 """
 
 import math
-from typing import List, Sequence, Tuple
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
 
 EARTH_RADIUS_NM = 3440.065
 NM_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_NM / 180.0  # ~60.04 nm per degree
@@ -45,7 +61,10 @@ def point_in_ring(lon: float, lat: float, ring: Sequence[Tuple[float, float]]) -
     """Ray-cast point-in-polygon for a single ring of (lon, lat) vertices.
 
     Crossing-number test; works whether or not the ring is explicitly closed.
+    A ring given as a NumPy array is tested with :func:`points_in_ring`.
     """
+    if isinstance(ring, np.ndarray):
+        return bool(points_in_ring((lon,), (lat,), ring)[0])
     n = len(ring)
     if n < 3:
         return False
@@ -112,12 +131,26 @@ def bbox_contains_point(box: Tuple[float, float, float, float],
     return box[0] <= lon <= box[2] and box[1] <= lat <= box[3]
 
 
-def bbox_pad(box: Tuple[float, float, float, float], nm: float) -> Tuple[float, float, float, float]:
+def bbox_pad(box: Tuple[float, float, float, float], nm: float,
+             widest: bool = False) -> Tuple[float, float, float, float]:
     """Pad a bbox by `nm` nautical miles. Uses the bbox center latitude for the
-    longitude scale, which is accurate enough for typical FIR-sized boxes."""
+    longitude scale, which is accurate enough for typical FIR-sized boxes.
+
+    With `widest`, the longitude scale is taken at the latitude farthest from
+    the equator inside the padded box (clamped to the poles, spanning every
+    longitude when the pad reaches 180°), so the result contains every point
+    within `nm` of the box.
+    """
     if nm <= 0:
         return box
     min_lon, min_lat, max_lon, max_lat = box
+    if widest:
+        pad_lat = nm_to_degrees_lat(nm)
+        min_lat, max_lat = max(min_lat - pad_lat, -90.0), min(max_lat + pad_lat, 90.0)
+        pad_lon = nm_to_degrees_lon(nm, max(abs(min_lat), abs(max_lat)))
+        if pad_lon >= 180.0:
+            return (-180.0, min_lat, 180.0, max_lat)
+        return (min_lon - pad_lon, min_lat, max_lon + pad_lon, max_lat)
     pad_lat = nm_to_degrees_lat(nm)
     center_lat = (min_lat + max_lat) / 2.0
     pad_lon = nm_to_degrees_lon(nm, center_lat)
@@ -157,6 +190,10 @@ def min_distance_point_to_multipolygon_nm(
     there is no usable geometry. Note this is the distance to the *boundary*: a
     point strictly inside a polygon still returns a positive value, so callers
     that care about containment should test :func:`point_in_multipolygon` first.
+
+    Rings given as NumPy arrays, or with at least ``ARRAY_MIN_VERTICES``
+    vertices, are measured with the array kernel; short rings stay on the
+    scalar loop, which is cheaper below that size.
     """
     best = math.inf
     for poly in polygons:
@@ -164,6 +201,11 @@ def min_distance_point_to_multipolygon_nm(
             n = len(ring)
             if n == 0:
                 continue
+            if isinstance(ring, np.ndarray) or n >= ARRAY_MIN_VERTICES:
+                lon_arr = np.array((lon,))
+                lat_arr = np.array((lat,))
+                best = min(best, float(_min_distance_to_ring(lon_arr, lat_arr, as_coord_array(ring))[0]))
+                continue
             if n == 1:
                 best = min(best, haversine_nm(lat, lon, ring[0][1], ring[0][0]))
                 continue
@@ -176,6 +218,152 @@ def min_distance_point_to_multipolygon_nm(
     return best
 
 
+# ---------------------------------------------------------------------------
+# Array kernels
+#
+# NumPy versions of the scalar helpers above for batches of points: the same
+# formulas evaluated over (points, vertices) matrices. Coordinates go in as
+# arrays (or sequences) of degrees; rings as (n, 2) arrays of (lon, lat).
+# Work is split into blocks of about ARRAY_BLOCK_SIZE cells to bound memory.
+# ---------------------------------------------------------------------------
+
+ARRAY_BLOCK_SIZE = 1 << 20
+
+# Ring size from which the scalar distance helper hands a ring to the array
+# kernel (list-to-array conversion included); see benchmarks/bench_geometry.py
+ARRAY_MIN_VERTICES = 128
+
+CoordArray = Union[np.ndarray, Sequence[Tuple[float, float]]]
+
+
+def as_coord_array(ring: CoordArray) -> np.ndarray:
+    """Contiguous float64 (n, 2) array of (lon, lat) for a ring or point list."""
+    return np.ascontiguousarray(np.asarray(ring, dtype=np.float64).reshape(-1, 2))
+
+
+def _blocks(count: int, width: int) -> Iterator[slice]:
+    """Row slices of a (count, width) matrix holding about ARRAY_BLOCK_SIZE cells each."""
+    step = max(1, ARRAY_BLOCK_SIZE // max(width, 1))
+    for start in range(0, count, step):
+        yield slice(start, start + step)
+
+
+def haversine_nm_array(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Vectorised :func:`haversine_nm`; arguments broadcast against each other."""
+    rlat1 = np.radians(lat1)
+    rlat2 = np.radians(lat2)
+    dlat = np.radians(np.subtract(lat2, lat1))
+    dlon = np.radians(np.subtract(lon2, lon1))
+    a = np.sin(dlat / 2) ** 2 + np.cos(rlat1) * np.cos(rlat2) * np.sin(dlon / 2) ** 2
+    return EARTH_RADIUS_NM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def haversine_matrix_nm(points_a: CoordArray, points_b: Optional[CoordArray] = None) -> np.ndarray:
+    """Pairwise great-circle distances (nm) between two lists of (lon, lat) points.
+
+    Returns an (len(points_a), len(points_b)) matrix; `points_b` defaults to
+    `points_a`.
+    """
+    a = as_coord_array(points_a)
+    b = a if points_b is None else as_coord_array(points_b)
+    return haversine_nm_array(a[:, 1:2], a[:, 0:1], b[np.newaxis, :, 1], b[np.newaxis, :, 0])
+
+
+def points_in_ring(lons, lats, ring: CoordArray) -> np.ndarray:
+    """Vectorised :func:`point_in_ring`: one bool per point, same crossing rule."""
+    lon = np.asarray(lons, dtype=np.float64).reshape(-1)
+    lat = np.asarray(lats, dtype=np.float64).reshape(-1)
+    inside = np.zeros(lon.shape[0], dtype=bool)
+    coords = as_coord_array(ring)
+    if len(coords) < 3:
+        return inside
+    xi, yi = coords[:, 0], coords[:, 1]
+    # Previous vertex of each edge, as the scalar loop's j
+    xj, yj = np.roll(xi, 1), np.roll(yi, 1)
+    dy = yj - yi
+    dy[dy == 0] = 1e-15
+    for rows in _blocks(len(lon), len(xi)):
+        plat = lat[rows, np.newaxis]
+        straddles = (yi > plat) != (yj > plat)
+        x_intersect = (xj - xi) * (plat - yi) / dy + xi
+        crossings = np.count_nonzero(straddles & (lon[rows, np.newaxis] < x_intersect), axis=1)
+        inside[rows] = crossings % 2 == 1
+    return inside
+
+
+def points_in_multipolygon(lons, lats,
+                           polygons: Sequence[Sequence[CoordArray]]) -> np.ndarray:
+    """Vectorised :func:`point_in_multipolygon` (holes honoured)."""
+    lon = np.asarray(lons, dtype=np.float64).reshape(-1)
+    lat = np.asarray(lats, dtype=np.float64).reshape(-1)
+    inside = np.zeros(lon.shape[0], dtype=bool)
+    for poly in polygons:
+        if len(poly) == 0:
+            continue
+        in_poly = points_in_ring(lon, lat, poly[0])
+        for hole in poly[1:]:
+            in_poly &= ~points_in_ring(lon, lat, hole)
+        inside |= in_poly
+    return inside
+
+
+def points_to_segments_nm(lons, lats, starts: CoordArray, ends: CoordArray) -> np.ndarray:
+    """Vectorised :func:`point_to_segment_nm` for every point against every segment.
+
+    Returns a (points, segments) matrix; segment k runs from ``starts[k]`` to
+    ``ends[k]``.
+    """
+    lon = np.asarray(lons, dtype=np.float64).reshape(-1)
+    lat = np.asarray(lats, dtype=np.float64).reshape(-1)
+    a = as_coord_array(starts)
+    b = as_coord_array(ends)
+    out = np.empty((len(lon), len(a)), dtype=np.float64)
+    for rows in _blocks(len(lon), len(a)):
+        out[rows] = _points_to_segments_block(lon[rows], lat[rows], a, b)
+    return out
+
+
+def _points_to_segments_block(lon: np.ndarray, lat: np.ndarray,
+                              a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    ky = NM_PER_DEGREE_LAT
+    kx = (NM_PER_DEGREE_LAT * np.cos(np.radians(lat)))[:, np.newaxis]
+    plon = lon[:, np.newaxis]
+    plat = lat[:, np.newaxis]
+    ax, ay = (a[:, 0] - plon) * kx, (a[:, 1] - plat) * ky
+    bx, by = (b[:, 0] - plon) * kx, (b[:, 1] - plat) * ky
+    dx, dy = bx - ax, by - ay
+    seg_len2 = dx * dx + dy * dy
+    degenerate = seg_len2 <= 1e-12
+    t = np.clip(-(ax * dx + ay * dy) / np.where(degenerate, 1.0, seg_len2), 0.0, 1.0)
+    t[degenerate] = 0.0
+    return np.hypot(ax + t * dx, ay + t * dy)
+
+
+def min_distance_points_to_multipolygon_nm(
+    lons, lats, polygons: Sequence[Sequence[CoordArray]],
+) -> np.ndarray:
+    """Vectorised :func:`min_distance_point_to_multipolygon_nm`: one distance per point."""
+    lon = np.asarray(lons, dtype=np.float64).reshape(-1)
+    lat = np.asarray(lats, dtype=np.float64).reshape(-1)
+    best = np.full(lon.shape[0], np.inf)
+    for poly in polygons:
+        for ring in poly:
+            np.minimum(best, _min_distance_to_ring(lon, lat, as_coord_array(ring)), out=best)
+    return best
+
+
+def _min_distance_to_ring(lon: np.ndarray, lat: np.ndarray, coords: np.ndarray) -> np.ndarray:
+    if len(coords) == 0:
+        return np.full(lon.shape[0], np.inf)
+    if len(coords) == 1:
+        return haversine_nm_array(lat, lon, coords[0, 1], coords[0, 0])
+    ends = np.roll(coords, -1, axis=0)
+    best = np.empty(lon.shape[0], dtype=np.float64)
+    for rows in _blocks(len(lon), len(coords)):
+        best[rows] = _points_to_segments_block(lon[rows], lat[rows], coords, ends).min(axis=1)
+    return best
+
+
 def sample_polyline(points: Sequence[Tuple[float, float]], step_nm: float) -> List[Tuple[float, float]]:
     """Sample a polyline at fixed nm intervals along its great-circle distance.
 
@@ -200,3 +388,1029 @@ def sample_polyline(points: Sequence[Tuple[float, float]], step_nm: float) -> Li
             samples.append((lon1 + t * (lon2 - lon1), lat1 + t * (lat2 - lat1)))
     samples.append(points[-1])
     return samples
+
+
+def simplify_polyline(points: Sequence[Tuple[float, float]], tolerance: float) -> List[Tuple[float, float]]:
+    """Douglas–Peucker simplification in the plane of the input coordinates.
+
+    Keeps the first and last points and every point farther than `tolerance`
+    (in input units) from the simplified line, so the result stays within
+    `tolerance` of the original. Closed rings keep their closing point.
+    """
+    n = len(points)
+    if n < 3 or tolerance <= 0:
+        return list(points)
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    _douglas_peucker(points, 0, n - 1, tolerance, keep)
+    return [p for p, k in zip(points, keep) if k]
+
+
+def _douglas_peucker(points: Sequence[Tuple[float, float]], first: int, last: int,
+                     tolerance: float, keep: List[bool]) -> None:
+    """Mark in `keep` the points of ``points[first:last + 1]`` Douglas–Peucker retains."""
+    tol_sq = tolerance * tolerance
+    stack = [(first, last)]
+    while stack:
+        first, last = stack.pop()
+        x1, y1 = points[first]
+        x2, y2 = points[last]
+        dx, dy = x2 - x1, y2 - y1
+        seg_sq = dx * dx + dy * dy
+        max_sq, index = -1.0, -1
+        for i in range(first + 1, last):
+            px, py = points[i]
+            if seg_sq == 0.0:
+                d_sq = (px - x1) ** 2 + (py - y1) ** 2
+            else:
+                t = max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / seg_sq))
+                d_sq = (px - x1 - t * dx) ** 2 + (py - y1 - t * dy) ** 2
+            if d_sq > max_sq:
+                max_sq, index = d_sq, i
+        if max_sq > tol_sq:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+
+def simplify_ring_indices(ring: Sequence[Tuple[float, float]], tolerance_nm: float) -> List[int]:
+    """Indices of the vertices Douglas–Peucker keeps for a (lon, lat) ring at `tolerance_nm`.
+
+    Works in an equirectangular plane scaled at the ring's latitude nearest
+    the equator, which never understates east-west distances, so every
+    dropped vertex is within `tolerance_nm` of the simplified ring. The ring
+    is split at the vertex farthest from its first one, so at least three
+    vertices (a triangle) survive, and a closing vertex is kept.
+    """
+    n = len(ring)
+    if n <= 3 or tolerance_nm <= 0:
+        return list(range(n))
+    min_abs_lat = min(abs(lat) for _, lat in ring)
+    kx = NM_PER_DEGREE_LAT * math.cos(math.radians(min(min_abs_lat, 89.0)))
+    points = [(lon * kx, lat * NM_PER_DEGREE_LAT) for lon, lat in ring]
+    x0, y0 = points[0]
+    far = max(range(1, n), key=lambda i: (points[i][0] - x0) ** 2 + (points[i][1] - y0) ** 2)
+    # Third corner: the vertex farthest from the line through the first two
+    dx, dy = points[far][0] - x0, points[far][1] - y0
+    third = max(range(1, n - 1), key=lambda i: abs(dx * (points[i][1] - y0) - dy * (points[i][0] - x0)))
+    stops = sorted({0, far, third, n - 1})
+    keep = [False] * n
+    for first, last in zip(stops, stops[1:]):
+        keep[first] = keep[last] = True
+        _douglas_peucker(points, first, last, tolerance_nm, keep)
+    return [i for i in range(n) if keep[i]]
+
+
+def simplify_multipolygon(polygons: Sequence[Sequence[Sequence[Tuple[float, float]]]],
+                          tolerance_nm: float) -> List[List[List[Tuple[float, float]]]]:
+    """Simplify every ring of a multipolygon with :func:`simplify_ring_indices`.
+
+    The result has the same polygons and rings as the input, each ring a
+    subsequence of the original vertices.
+    """
+    return [
+        [[ring[i] for i in simplify_ring_indices(ring, tolerance_nm)] for ring in poly]
+        for poly in polygons
+    ]
+
+
+def match_ring_indices(ring: Sequence[Tuple[float, float]],
+                       simplified: Sequence[Tuple[float, float]]) -> Optional[List[int]]:
+    """Indices in `ring` of the vertices of `simplified`, a subsequence of it.
+
+    Returns None if `simplified` is not a subsequence of `ring` (for example a
+    stored level computed from an older boundary) or misses its first or
+    last vertex.
+    """
+    indices: List[int] = []
+    i = 0
+    n = len(ring)
+    for vertex in simplified:
+        vertex = tuple(vertex)
+        while i < n and tuple(ring[i]) != vertex:
+            i += 1
+        if i == n:
+            return None
+        indices.append(i)
+        i += 1
+    if not indices or indices[0] != 0 or indices[-1] != n - 1:
+        return None
+    return indices
+
+
+def intermediate_point(lat1: float, lon1: float, lat2: float, lon2: float,
+                       fraction: float) -> Tuple[float, float]:
+    """Point at `fraction` (0..1) along the great circle from 1 to 2, as (lon, lat)."""
+    rlat1, rlon1 = math.radians(lat1), math.radians(lon1)
+    rlat2, rlon2 = math.radians(lat2), math.radians(lon2)
+    delta = haversine_nm(lat1, lon1, lat2, lon2) / EARTH_RADIUS_NM
+    if delta < 1e-12:
+        return (lon1, lat1)
+    sin_delta = math.sin(delta)
+    a = math.sin((1 - fraction) * delta) / sin_delta
+    b = math.sin(fraction * delta) / sin_delta
+    x = a * math.cos(rlat1) * math.cos(rlon1) + b * math.cos(rlat2) * math.cos(rlon2)
+    y = a * math.cos(rlat1) * math.sin(rlon1) + b * math.cos(rlat2) * math.sin(rlon2)
+    z = a * math.sin(rlat1) + b * math.sin(rlat2)
+    return (math.degrees(math.atan2(y, x)), math.degrees(math.atan2(z, math.hypot(x, y))))
+
+
+class PreparedRing:
+    """A ring with its edges bucketed by latitude band, for repeated point tests.
+
+    `contains` gives the same answer as :func:`point_in_ring` but only visits
+    the edges whose latitude span overlaps the query's band, so the cost no
+    longer grows with the number of vertices. `crossings` does the same for
+    segment-vs-boundary tests.
+    """
+
+    __slots__ = ('bbox', '_min_lat', '_band_deg', '_bands', '_edges', '_band_ends')
+
+    # Average edges per band; rings get about n / EDGES_PER_BAND bands
+    EDGES_PER_BAND = 8
+
+    def __init__(self, ring: Sequence[Tuple[float, float]]):
+        n = len(ring)
+        self.bbox = bbox_of_ring(ring) if n else (0.0, 0.0, 0.0, 0.0)
+        self._min_lat = self.bbox[1]
+        self._bands: List[List[Tuple[float, float, float, float]]] = []
+        self._edges = list(_ring_edges(ring))
+        self._band_ends: List[int] = []
+        self._band_deg = 1.0
+        if n < 3:
+            return
+        count = max(1, n // self.EDGES_PER_BAND)
+        self._band_deg = (self.bbox[3] - self.bbox[1]) / count or 1.0
+        self._bands = [[] for _ in range(count)]
+        j = n - 1
+        for i in range(n):
+            xi, yi = ring[i]
+            xj, yj = ring[j]
+            j = i
+            if (xi, yi) == (xj, yj):
+                continue
+            for band in range(self._band(min(yi, yj)), self._band(max(yi, yj)) + 1):
+                self._bands[band].append((xj, yj, xi, yi))  # edge in ring order
+        # Running total of band sizes, to price a multi-band lookup
+        total = 0
+        for band in self._bands:
+            total += len(band)
+            self._band_ends.append(total)
+
+    def _band(self, lat: float) -> int:
+        return min(max(int((lat - self._min_lat) / self._band_deg), 0), len(self._bands) - 1)
+
+    def contains(self, lon: float, lat: float) -> bool:
+        """Ray-cast test of (lon, lat) against this ring."""
+        if not self._bands or not (self.bbox[1] <= lat <= self.bbox[3]):
+            return False
+        inside = False
+        for xj, yj, xi, yi in self._bands[self._band(lat)]:
+            if (yi > lat) != (yj > lat):
+                x_intersect = (xj - xi) * (lat - yi) / ((yj - yi) or 1e-15) + xi
+                if lon < x_intersect:
+                    inside = not inside
+        return inside
+
+    def crossings(self, a: Tuple[float, float], b: Tuple[float, float]) -> List[float]:
+        """Same as :func:`segment_ring_crossings`, visiting only the bands a→b spans."""
+        if not self._bands or max(a[1], b[1]) < self.bbox[1] or min(a[1], b[1]) > self.bbox[3]:
+            return []
+        first, last = self._band(min(a[1], b[1])), self._band(max(a[1], b[1]))
+        visited = self._band_ends[last] - (self._band_ends[first - 1] if first else 0)
+        if first == last:
+            edges = self._bands[first]
+        elif visited >= len(self._edges):
+            edges = self._edges
+        else:
+            # An edge spanning several bands is taken from the first one visited
+            edges = [edge for k in range(first, last + 1)
+                     for edge in self._bands[k]
+                     if k == first or self._band(min(edge[1], edge[3])) == k]
+        return _edge_crossings(a[0], a[1], b[0], b[1], edges)
+
+
+class CoarseRing:
+    """A ring tested through a simplified version of itself first.
+
+    `keep` lists the vertices of a coarse ring (see
+    :func:`simplify_ring_indices`). Each coarse edge stands for the chain of
+    full-resolution edges it replaced, and carries that chain's bbox as a
+    conservative envelope. Chains are bucketed by latitude band like
+    :class:`PreparedRing` edges.
+
+    A horizontal ray or a segment that misses a chain's envelope is decided
+    from the chain's end points alone. Only the chains whose envelope it
+    touches, near the boundary, are walked edge by edge. The answers are the
+    same as :class:`PreparedRing`.
+    """
+
+    __slots__ = ('bbox', '_min_lat', '_band_deg', '_bands', '_chains', '_band_ends')
+
+    # Average chains per band
+    CHAINS_PER_BAND = 4
+
+    def __init__(self, ring: Sequence[Tuple[float, float]], keep: Sequence[int]):
+        n = len(ring)
+        self.bbox = bbox_of_ring(ring) if n else (0.0, 0.0, 0.0, 0.0)
+        self._min_lat = self.bbox[1]
+        self._bands: List[list] = []
+        self._chains: list = []
+        self._band_ends: List[int] = []
+        self._band_deg = 1.0
+        if n < 3:
+            return
+        stops = sorted(set(keep) | {0, n - 1})
+        for start, end in zip(stops, stops[1:] + [n]):
+            # The last chain closes the ring (a single edge, empty if closed)
+            indices = list(range(start, end + 1)) if end < n else [n - 1, 0]
+            edges = tuple(
+                (x1, y1, x2, y2)
+                for (x1, y1), (x2, y2) in ((ring[i], ring[j]) for i, j in zip(indices, indices[1:]))
+                if (x1, y1) != (x2, y2)
+            )
+            if not edges:
+                continue
+            xs = [ring[i][0] for i in indices]
+            ys = [ring[i][1] for i in indices]
+            self._chains.append((min(xs), min(ys), max(xs), max(ys), ys[0], ys[-1], edges))
+        count = max(1, len(self._chains) // self.CHAINS_PER_BAND)
+        self._band_deg = (self.bbox[3] - self.bbox[1]) / count or 1.0
+        self._bands = [[] for _ in range(count)]
+        for chain in self._chains:
+            for band in range(self._band(chain[1]), self._band(chain[3]) + 1):
+                self._bands[band].append(chain)
+        total = 0
+        for band in self._bands:
+            total += len(band)
+            self._band_ends.append(total)
+
+    def _band(self, lat: float) -> int:
+        return min(max(int((lat - self._min_lat) / self._band_deg), 0), len(self._bands) - 1)
+
+    def contains(self, lon: float, lat: float) -> bool:
+        """Ray-cast test of (lon, lat) against this ring."""
+        if not self._bands or not (self.bbox[1] <= lat <= self.bbox[3]):
+            return False
+        inside = False
+        for min_x, min_y, max_x, max_y, y_first, y_last, edges in self._bands[self._band(lat)]:
+            if lat < min_y or lat >= max_y:
+                continue  # every vertex on one side: no crossing
+            if lon < min_x:
+                # The whole chain is ahead on the ray: it crosses an odd
+                # number of times exactly when its ends are on either side
+                if (y_first > lat) != (y_last > lat):
+                    inside = not inside
+            elif lon <= max_x:
+                for xj, yj, xi, yi in edges:
+                    if (yi > lat) != (yj > lat):
+                        x_intersect = (xj - xi) * (lat - yi) / ((yj - yi) or 1e-15) + xi
+                        if lon < x_intersect:
+                            inside = not inside
+        return inside
+
+    def crossings(self, a: Tuple[float, float], b: Tuple[float, float]) -> List[float]:
+        """Same as :func:`segment_ring_crossings`, walking only the chains a→b comes near."""
+        if not self._bands or max(a[1], b[1]) < self.bbox[1] or min(a[1], b[1]) > self.bbox[3]:
+            return []
+        min_x, max_x = min(a[0], b[0]), max(a[0], b[0])
+        min_y, max_y = min(a[1], b[1]), max(a[1], b[1])
+        first, last = self._band(min_y), self._band(max_y)
+        visited = self._band_ends[last] - (self._band_ends[first - 1] if first else 0)
+        if first == last:
+            chains = self._bands[first]
+        elif visited >= len(self._chains):
+            chains = self._chains
+        else:
+            chains = [chain for k in range(first, last + 1)
+                      for chain in self._bands[k]
+                      if k == first or self._band(chain[1]) == k]
+        ax, ay = a
+        dx, dy = b[0] - ax, b[1] - ay
+        edges = []
+        for chain in chains:
+            c_min_x, c_min_y, c_max_x, c_max_y = chain[:4]
+            if c_max_x < min_x or c_min_x > max_x or c_max_y < min_y or c_min_y > max_y:
+                continue
+            # Envelope wholly on one side of the line through a→b: no crossing
+            sides = [dx * (y - ay) - dy * (x - ax)
+                     for x, y in ((c_min_x, c_min_y), (c_min_x, c_max_y), (c_max_x, c_min_y), (c_max_x, c_max_y))]
+            if min(sides) > 0.0 or max(sides) < 0.0:
+                continue
+            edges.extend(chain[6])
+        return _edge_crossings(ax, ay, b[0], b[1], edges)
+
+
+class PreparedMultiPolygon:
+    """A multipolygon prepared for repeated point-in-polygon tests.
+
+    Same semantics as :func:`point_in_multipolygon` (holes honoured), with a
+    bbox check per polygon and :class:`PreparedRing` for every ring. With
+    `keep` (per polygon, per ring, the vertex indices of a simplified ring)
+    rings are prepared as :class:`CoarseRing` instead.
+    """
+
+    __slots__ = ('bbox', '_polygons')
+
+    def __init__(self, polygons: Sequence[Sequence[Sequence[Tuple[float, float]]]],
+                 keep: Optional[Sequence[Sequence[Sequence[int]]]] = None):
+        def prepare(ring, ring_keep):
+            return PreparedRing(ring) if ring_keep is None else CoarseRing(ring, ring_keep)
+
+        if keep is None:
+            keep = [[None] * len(poly) for poly in polygons]
+        self._polygons = [
+            (prepare(poly[0], poly_keep[0]),
+             [prepare(hole, hole_keep) for hole, hole_keep in zip(poly[1:], poly_keep[1:])])
+            for poly, poly_keep in zip(polygons, keep) if poly and len(poly[0]) >= 3
+        ]
+        self.bbox = (bbox_union([outer.bbox for outer, _ in self._polygons])
+                     if self._polygons else None)
+
+    def contains(self, lon: float, lat: float) -> bool:
+        """True if (lon, lat) is inside any polygon and outside its holes."""
+        for outer, holes in self._polygons:
+            if not bbox_contains_point(outer.bbox, lon, lat) or not outer.contains(lon, lat):
+                continue
+            if not any(hole.contains(lon, lat) for hole in holes):
+                return True
+        return False
+
+    def segment_intervals(self, a: Tuple[float, float], b: Tuple[float, float]) -> List[Tuple[float, float]]:
+        """Same as :func:`segment_multipolygon_intervals`, using the prepared rings."""
+        ax, ay = a
+        bx, by = b
+        box = (min(ax, bx), min(ay, by), max(ax, bx), max(ay, by))
+        rings = []
+        for poly_id, (outer, holes) in enumerate(self._polygons):
+            if not bbox_intersects(outer.bbox, box):
+                continue
+            for k, ring in enumerate([outer] + holes):
+                if k and not bbox_intersects(ring.bbox, box):
+                    continue
+                initial, events = _ring_events(ring.crossings(a, b), ring.contains, ax, ay, bx, by)
+                rings.append((poly_id, k > 0, initial, events))
+        return _sweep_intervals(rings)
+
+
+class GridIndex:
+    """Lat/lon grid bucket index over point items.
+
+    Items are stored under a caller-chosen hashable key together with their
+    (lon, lat) position, bucketed into `cell_deg` x `cell_deg` cells. Queries
+    only visit the cells that can hold a match, then apply an exact
+    great-circle test:
+
+    - `within_radius`: items within a distance of a point, nearest first
+    - `nearest`: k nearest items, expanding the search radius as needed
+    - `near_polyline`: candidate items near a route polyline (corridor prefilter)
+
+    Longitude wraps at the antimeridian. Ties are broken by insertion order,
+    so results are deterministic.
+
+    Example:
+        index = GridIndex()
+        index.insert("EGLL", -0.4614, 51.4775, airport)
+        index.within_radius(-0.1, 51.5, 30.0)  # [(distance_nm, airport), ...]
+    """
+
+    # Route legs are split into pieces of at most this length before their
+    # bbox is taken, so the bbox also covers the great-circle path between
+    # the vertices (the lon/lat chord of a short piece stays within ~1 nm).
+    CORRIDOR_PIECE_NM = 60.0
+    CORRIDOR_MARGIN_NM = 1.0
+
+    def __init__(self, cell_deg: float = 1.0):
+        if cell_deg <= 0 or 360.0 % cell_deg > 1e-9:
+            raise ValueError(f"cell_deg must divide 360, got {cell_deg}")
+        self.cell_deg = cell_deg
+        self._cols = int(round(360.0 / cell_deg))
+        self._rows = int(math.ceil(180.0 / cell_deg))
+        self._cells: Dict[Tuple[int, int], Dict[Hashable, None]] = {}
+        # key -> (lon, lat, item, cell, insertion sequence)
+        self._entries: Dict[Hashable, Tuple[float, float, Any, Tuple[int, int], int]] = {}
+        self._next_seq = 0
+
+    def _row(self, lat: float) -> int:
+        return min(max(int(math.floor((lat + 90.0) / self.cell_deg)), 0), self._rows - 1)
+
+    def _col(self, lon: float) -> int:
+        return int(math.floor((lon + 180.0) / self.cell_deg)) % self._cols
+
+    def insert(self, key: Hashable, lon: float, lat: float, item: Any = None) -> None:
+        """Add or move an item (`item` defaults to the key)."""
+        existing = self._entries.get(key)
+        seq = self._next_seq
+        if existing is not None:
+            seq = existing[4]
+            self._cells[existing[3]].pop(key, None)
+        else:
+            self._next_seq += 1
+        cell = (self._row(lat), self._col(lon))
+        self._cells.setdefault(cell, {})[key] = None
+        self._entries[key] = (lon, lat, key if item is None else item, cell, seq)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove an item by key (no-op if absent)."""
+        existing = self._entries.pop(key, None)
+        if existing is not None:
+            bucket = self._cells[existing[3]]
+            bucket.pop(key, None)
+            if not bucket:
+                del self._cells[existing[3]]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def _keys_in_bbox(self, min_lon: float, min_lat: float,
+                      max_lon: float, max_lat: float) -> Iterator[Hashable]:
+        """Keys in every cell overlapping the bbox (lon span may exceed ±180)."""
+        row_lo, row_hi = self._row(min_lat), self._row(max_lat)
+        if max_lon - min_lon >= 360.0:
+            cols = range(self._cols)
+        else:
+            col_lo = int(math.floor((min_lon + 180.0) / self.cell_deg))
+            col_hi = int(math.floor((max_lon + 180.0) / self.cell_deg))
+            cols = sorted({c % self._cols for c in range(col_lo, col_hi + 1)})
+        cells = self._cells
+        for row in range(row_lo, row_hi + 1):
+            for col in cols:
+                bucket = cells.get((row, col))
+                if bucket:
+                    yield from bucket
+
+    @staticmethod
+    def _pad(min_lon: float, min_lat: float, max_lon: float, max_lat: float,
+             nm: float) -> Tuple[float, float, float, float]:
+        """Pad a bbox by `nm`, using the widest longitude scale inside the padded box."""
+        return bbox_pad((min_lon, min_lat, max_lon, max_lat), nm, widest=True)
+
+    def within_radius(self, lon: float, lat: float, radius_nm: float) -> List[Tuple[float, Any]]:
+        """Items within `radius_nm` of (lon, lat) as (distance_nm, item), nearest first."""
+        box = self._pad(lon, lat, lon, lat, radius_nm)
+        found = []
+        entries = self._entries
+        for key in self._keys_in_bbox(*box):
+            elon, elat, item, _, seq = entries[key]
+            distance = haversine_nm(lat, lon, elat, elon)
+            if distance <= radius_nm:
+                found.append((distance, seq, item))
+        found.sort(key=lambda f: (f[0], f[1]))
+        return [(distance, item) for distance, _, item in found]
+
+    def nearest(self, lon: float, lat: float, count: int,
+                max_nm: Optional[float] = None) -> List[Tuple[float, Any]]:
+        """The `count` items nearest to (lon, lat) as (distance_nm, item), nearest first.
+
+        Searches a growing radius until enough items are found; everything
+        outside the final radius is farther than every item returned, so the
+        result is exact.
+        """
+        if count <= 0 or not self._entries:
+            return []
+        limit = max_nm if max_nm is not None else math.pi * EARTH_RADIUS_NM
+        radius = min(self.cell_deg * NM_PER_DEGREE_LAT, limit)
+        while True:
+            found = self.within_radius(lon, lat, radius)
+            if len(found) >= count or radius >= limit:
+                return found[:count]
+            radius = min(radius * 2.0, limit)
+
+    def near_polyline(self, points: Sequence[Tuple[float, float]],
+                      corridor_nm: float) -> List[Any]:
+        """Candidate items within `corridor_nm` of a (lon, lat) polyline.
+
+        Returns a superset of the items whose great-circle distance to the
+        route is within the corridor (callers apply their exact test), in
+        insertion order. A single point is treated as a radius query.
+        """
+        if not points:
+            return []
+        boxes = [(points[0][0], points[0][1], points[0][0], points[0][1])]
+        for pieces in great_circle_leg_boxes(points, self.CORRIDOR_PIECE_NM):
+            boxes.extend(pieces)
+        return self.near_boxes(boxes, corridor_nm)
+
+    def near_boxes(self, boxes: Iterable[Tuple[float, float, float, float]],
+                   corridor_nm: float) -> List[Any]:
+        """Items in the cells within `corridor_nm` (plus the piece margin) of any box.
+
+        The prefilter behind `near_polyline`, for callers that keep the boxes
+        of a route (see `great_circle_leg_boxes`). Insertion order.
+        """
+        keys: Set[Hashable] = set()
+        for box in boxes:
+            keys.update(self._keys_in_bbox(*self._pad(*box, corridor_nm + self.CORRIDOR_MARGIN_NM)))
+        entries = self._entries
+        return [entries[k][2] for k in sorted(keys, key=lambda k: entries[k][4])]
+
+
+def great_circle_leg_boxes(points: Sequence[Tuple[float, float]],
+                           piece_nm: float) -> List[List[Tuple[float, float, float, float]]]:
+    """Bboxes of each polyline leg split along its great circle, one list per leg.
+
+    Legs are cut into pieces of at most `piece_nm`, so the boxes cover the
+    great-circle path between the vertices up to the chord error of a piece.
+    A piece crossing the antimeridian is unwrapped, so its box may extend
+    past ±180.
+    """
+    legs = []
+    for (lon1, lat1), (lon2, lat2) in zip(points, points[1:]):
+        length = haversine_nm(lat1, lon1, lat2, lon2)
+        pieces = max(1, int(math.ceil(length / piece_nm)))
+        boxes = []
+        prev = (lon1, lat1)
+        for k in range(1, pieces + 1):
+            cur = (lon2, lat2) if k == pieces else intermediate_point(lat1, lon1, lat2, lon2, k / pieces)
+            (alon, alat), (blon, blat) = prev, cur
+            if abs(blon - alon) > 180.0:
+                # Piece crosses the antimeridian: unwrap the west end
+                if blon < alon:
+                    blon += 360.0
+                else:
+                    alon += 360.0
+            boxes.append((min(alon, blon), min(alat, blat), max(alon, blon), max(alat, blat)))
+            prev = cur
+        legs.append(boxes)
+    return legs
+
+
+# ---------------------------------------------------------------------------
+# Exact segment-vs-polygon geometry
+#
+# Route legs and ring edges are straight lines in (lon, lat), the same model
+# `sample_polyline` interpolates along, so crossings are computed exactly in
+# that plane. Distances use an equirectangular projection centred on each
+# ring edge, like `point_to_segment_nm`.
+# ---------------------------------------------------------------------------
+
+Edge = Tuple[float, float, float, float]  # (lon1, lat1, lon2, lat2)
+
+
+def _ring_edges(ring: Sequence[Tuple[float, float]]) -> Iterator[Edge]:
+    """Edges of a ring, closing it if needed."""
+    n = len(ring)
+    if n < 2:
+        return
+    for i in range(n):
+        (x1, y1), (x2, y2) = ring[i - 1], ring[i]
+        if (x1, y1) != (x2, y2):
+            yield (x1, y1, x2, y2)
+
+
+def _segment_crossing(ax: float, ay: float, bx: float, by: float, edge: Edge) -> Optional[float]:
+    """Parameter t in [0, 1] along A→B where it crosses `edge`, or None.
+
+    Parallel (including collinear) edges never count as crossings; the
+    neighbouring edges catch a route running along a boundary.
+    """
+    cx, cy, dx, dy = edge
+    rx, ry = bx - ax, by - ay
+    sx, sy = dx - cx, dy - cy
+    denom = rx * sy - ry * sx
+    if denom == 0.0:
+        return None
+    qx, qy = cx - ax, cy - ay
+    t = (qx * sy - qy * sx) / denom
+    u = (qx * ry - qy * rx) / denom
+    if 0.0 <= t <= 1.0 and 0.0 <= u <= 1.0:
+        return t
+    return None
+
+
+def _edge_crossings(ax: float, ay: float, bx: float, by: float, edges: Iterable[Edge]) -> List[float]:
+    """Sorted crossing parameters of A→B with the edges whose bbox meets the segment's."""
+    min_x, max_x = min(ax, bx), max(ax, bx)
+    min_y, max_y = min(ay, by), max(ay, by)
+    found = []
+    for edge in edges:
+        cx, cy, dx, dy = edge
+        if (max(cx, dx) < min_x or min(cx, dx) > max_x
+                or max(cy, dy) < min_y or min(cy, dy) > max_y):
+            continue
+        t = _segment_crossing(ax, ay, bx, by, edge)
+        if t is not None:
+            found.append(t)
+    found.sort()
+    return found
+
+
+def segment_ring_crossings(a: Tuple[float, float], b: Tuple[float, float],
+                           ring: Sequence[Tuple[float, float]]) -> List[float]:
+    """Parameters t in [0, 1] (sorted) where segment a→b crosses the ring's boundary.
+
+    Edges whose bbox does not overlap the segment's bbox are skipped.
+    """
+    return _edge_crossings(a[0], a[1], b[0], b[1], _ring_edges(ring))
+
+
+# Crossings closer than this (in t) are treated as one event, e.g. a leg
+# passing through a ring vertex hits both of its edges.
+_CROSSING_EPS = 1e-12
+
+
+def _ring_events(crossings: List[float], contains: Callable[[float, float], bool],
+                 ax: float, ay: float, bx: float, by: float) -> Tuple[bool, List[Tuple[float, bool]]]:
+    """Inside state of A→B for one ring at t=0+, and the (t, state) changes after it.
+
+    Each clean crossing flips the state; a cluster of coincident crossings
+    (a vertex hit or a tangent touch) is resolved with one containment test,
+    so `contains` runs once or twice however many times the leg crosses.
+    """
+    ts = [t for t in crossings if 0.0 < t < 1.0]
+    first = ts[0] if ts else 1.0
+    state = contains(ax + first / 2.0 * (bx - ax), ay + first / 2.0 * (by - ay))
+    initial = state
+    events: List[Tuple[float, bool]] = []
+    i = 0
+    while i < len(ts):
+        j = i
+        while j + 1 < len(ts) and ts[j + 1] - ts[i] <= _CROSSING_EPS:
+            j += 1
+        if j == i:
+            state = not state
+        else:
+            mid = (ts[i] + (ts[j + 1] if j + 1 < len(ts) else 1.0)) / 2.0
+            state = contains(ax + mid * (bx - ax), ay + mid * (by - ay))
+        events.append((ts[i], state))
+        i = j + 1
+    return initial, events
+
+
+def _sweep_intervals(rings: List[Tuple[int, bool, bool, List[Tuple[float, bool]]]]) -> List[Tuple[float, float]]:
+    """Combine per-ring events into the intervals of t inside the multipolygon.
+
+    `rings` holds ``(polygon_id, is_hole, initial, events)``; a point is
+    inside if it is inside some polygon's outer ring and none of its holes.
+    """
+    states = [initial for _, _, initial, _ in rings]
+
+    def inside() -> bool:
+        outer_in: Dict[int, bool] = {}
+        for (poly_id, is_hole, _, _), state in zip(rings, states):
+            if is_hole:
+                if state:
+                    outer_in[poly_id] = False
+            elif state:
+                outer_in.setdefault(poly_id, True)
+        return any(outer_in.values())
+
+    events = sorted((t, k, state) for k, (_, _, _, ring_events) in enumerate(rings)
+                    for t, state in ring_events)
+    intervals: List[Tuple[float, float]] = []
+    start: Optional[float] = 0.0 if inside() else None
+    i = 0
+    while i < len(events):
+        t = events[i][0]
+        while i < len(events) and events[i][0] == t:
+            states[events[i][1]] = events[i][2]
+            i += 1
+        now_inside = inside()
+        if now_inside and start is None:
+            start = t
+        elif not now_inside and start is not None:
+            if t > start:
+                intervals.append((start, t))
+            start = None
+    if start is not None and start < 1.0:
+        intervals.append((start, 1.0))
+    return intervals
+
+
+def segment_multipolygon_intervals(
+    a: Tuple[float, float], b: Tuple[float, float],
+    polygons: Sequence[Sequence[Sequence[Tuple[float, float]]]],
+) -> List[Tuple[float, float]]:
+    """Intervals of t in [0, 1] where segment a→b is inside the multipolygon.
+
+    Exact: the segment's crossings with every ring are found, and each ring's
+    inside state is tracked along the segment from a single containment
+    test. Holes are honoured.
+    """
+    ax, ay = a
+    bx, by = b
+    box = (min(ax, bx), min(ay, by), max(ax, bx), max(ay, by))
+    rings = []
+    for poly_id, poly in enumerate(polygons):
+        if not poly or len(poly[0]) < 3 or not bbox_intersects(bbox_of_ring(poly[0]), box):
+            continue
+        for k, ring in enumerate(poly):
+            if k and (len(ring) < 3 or not bbox_intersects(bbox_of_ring(ring), box)):
+                continue
+            crossings = _edge_crossings(ax, ay, bx, by, _ring_edges(ring))
+            initial, events = _ring_events(
+                crossings, lambda lon, lat, ring=ring: point_in_ring(lon, lat, ring), ax, ay, bx, by)
+            rings.append((poly_id, k > 0, initial, events))
+    return _sweep_intervals(rings)
+
+
+def _linear_range(alpha: float, beta: float, lo: float, hi: float) -> Optional[Tuple[float, float]]:
+    """t range where lo <= alpha + beta * t <= hi, or None."""
+    if beta == 0.0:
+        return (-math.inf, math.inf) if lo <= alpha <= hi else None
+    t0, t1 = (lo - alpha) / beta, (hi - alpha) / beta
+    return (t0, t1) if t0 <= t1 else (t1, t0)
+
+
+def _disk_range(px: float, py: float, rx: float, ry: float, radius: float) -> Optional[Tuple[float, float]]:
+    """t range where |P + t R| <= radius (disk centred on the origin), or None."""
+    qa = rx * rx + ry * ry
+    qb = 2.0 * (px * rx + py * ry)
+    qc = px * px + py * py - radius * radius
+    if qa == 0.0:
+        return (-math.inf, math.inf) if qc <= 0.0 else None
+    disc = qb * qb - 4.0 * qa * qc
+    if disc < 0.0:
+        return None
+    root = math.sqrt(disc)
+    return ((-qb - root) / (2.0 * qa), (-qb + root) / (2.0 * qa))
+
+
+def _segment_edge_nm(ax: float, ay: float, bx: float, by: float, edge: Edge,
+                     radius_nm: float) -> Tuple[float, Optional[Tuple[float, float]]]:
+    """Distance (nm) from segment A→B to `edge`, and the t range of A→B within `radius_nm` of it.
+
+    Projects both onto an equirectangular plane centred on the edge's first
+    vertex. The points within `radius_nm` of the edge form a capsule (two
+    disks and a strip); the segment meets a convex capsule in one interval.
+    """
+    cx, cy, dx, dy = edge
+    ky = NM_PER_DEGREE_LAT
+    kx = NM_PER_DEGREE_LAT * math.cos(math.radians(cy))
+    # Segment and edge in nm, relative to the edge start C
+    px, py = (ax - cx) * kx, (ay - cy) * ky
+    rx, ry = (bx - ax) * kx, (by - ay) * ky
+    ex, ey = (dx - cx) * kx, (dy - cy) * ky
+
+    if _segment_crossing(ax, ay, bx, by, edge) is not None:
+        distance = 0.0
+    else:
+        qx, qy = px + rx, py + ry
+        distance = min(
+            _point_segment_plane(px, py, 0.0, 0.0, ex, ey),
+            _point_segment_plane(qx, qy, 0.0, 0.0, ex, ey),
+            _point_segment_plane(0.0, 0.0, px, py, qx, qy),
+            _point_segment_plane(ex, ey, px, py, qx, qy),
+        )
+    if distance > radius_nm:
+        return distance, None
+
+    ranges = [_disk_range(px, py, rx, ry, radius_nm), _disk_range(px - ex, py - ey, rx, ry, radius_nm)]
+    length = math.hypot(ex, ey)
+    if length > 0.0:
+        nx, ny = -ey / length, ex / length
+        # Across-edge offset within ±radius, along-edge projection within the edge
+        across = _linear_range(nx * px + ny * py, nx * rx + ny * ry, -radius_nm, radius_nm)
+        along = _linear_range((ex * px + ey * py) / length, (ex * rx + ey * ry) / length, 0.0, length)
+        if across is not None and along is not None:
+            ranges.append((max(across[0], along[0]), min(across[1], along[1])))
+    ranges = [(max(t0, 0.0), min(t1, 1.0)) for t0, t1 in (r for r in ranges if r is not None)]
+    ranges = [(t0, t1) for t0, t1 in ranges if t0 <= t1]
+    if not ranges:
+        return distance, None
+    return distance, (min(t0 for t0, _ in ranges), max(t1 for _, t1 in ranges))
+
+
+def _point_segment_plane(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
+    """Planar distance from P to segment A→B."""
+    dx, dy = bx - ax, by - ay
+    seg_len2 = dx * dx + dy * dy
+    if seg_len2 <= 1e-12:
+        return math.hypot(px - ax, py - ay)
+    t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / seg_len2))
+    return math.hypot(px - ax - t * dx, py - ay - t * dy)
+
+
+def segment_to_ring_nm(a: Tuple[float, float], b: Tuple[float, float],
+                       ring: Sequence[Tuple[float, float]], max_nm: float = math.inf) -> float:
+    """Minimum distance (nm) between segment a→b and a ring's boundary.
+
+    0.0 if they cross. With `max_nm`, edges whose bbox is farther than that
+    from the segment are skipped, so any result above `max_nm` only means
+    "farther than `max_nm`".
+    """
+    best = math.inf
+    for edge in _edges_near(a, b, _ring_edges(ring), max_nm):
+        distance, _ = _segment_edge_nm(a[0], a[1], b[0], b[1], edge, 0.0)
+        best = min(best, distance)
+    return best
+
+
+def _edges_near(a: Tuple[float, float], b: Tuple[float, float], edges: Iterable[Edge],
+                nm: float) -> Iterator[Edge]:
+    """Edges whose bbox is within `nm` of the bbox of segment a→b."""
+    if math.isinf(nm):
+        yield from edges
+        return
+    min_lon, min_lat, max_lon, max_lat = bbox_pad(
+        (min(a[0], b[0]), min(a[1], b[1]), max(a[0], b[0]), max(a[1], b[1])), nm)
+    for edge in edges:
+        cx, cy, dx, dy = edge
+        if (max(cx, dx) < min_lon or min(cx, dx) > max_lon
+                or max(cy, dy) < min_lat or min(cy, dy) > max_lat):
+            continue
+        yield edge
+
+
+def segment_multipolygon_extent(
+    a: Tuple[float, float], b: Tuple[float, float],
+    polygons: Sequence[Sequence[Sequence[Tuple[float, float]]]],
+    corridor_nm: float = 0.0,
+) -> Optional[Tuple[float, float, float]]:
+    """Where segment a→b comes within `corridor_nm` of a multipolygon.
+
+    Returns ``(min_distance_nm, t_from, t_to)``: the smallest distance from
+    the segment to the polygons (0.0 if it enters them) and the first and
+    last parameters t in [0, 1] within the corridor, or None if the segment
+    stays farther away.
+    """
+    ax, ay = a
+    bx, by = b
+    inside = segment_multipolygon_intervals(a, b, polygons)
+    best = 0.0 if inside else math.inf
+    t_from = inside[0][0] if inside else math.inf
+    t_to = inside[-1][1] if inside else -math.inf
+    if corridor_nm > 0.0 or not inside:
+        edges = (edge for poly in polygons for ring in poly for edge in _ring_edges(ring))
+        for edge in _edges_near(a, b, edges, corridor_nm):
+            distance, span = _segment_edge_nm(ax, ay, bx, by, edge, corridor_nm)
+            best = min(best, distance)
+            if span is not None:
+                t_from, t_to = min(t_from, span[0]), max(t_to, span[1])
+    if t_from > t_to:
+        return None
+    return (best, t_from, t_to)
+
+
+def polyline_multipolygon_extent(
+    points: Sequence[Tuple[float, float]],
+    polygons: Sequence[Sequence[Sequence[Tuple[float, float]]]],
+    corridor_nm: float = 0.0,
+) -> Optional[Tuple[float, float, float]]:
+    """Where a (lon, lat) polyline comes within `corridor_nm` of a multipolygon.
+
+    Returns ``(min_distance_nm, from_nm, to_nm)`` with the along-track
+    distances (from the first point) at which the corridor first meets and
+    last leaves the polygons, or None if it never does. Each leg is measured
+    exactly with :func:`segment_multipolygon_extent`, so the result does not
+    depend on a sampling step.
+    """
+    if not points:
+        return None
+    if len(points) == 1:
+        lon, lat = points[0]
+        distance = (0.0 if point_in_multipolygon(lon, lat, polygons)
+                    else min_distance_point_to_multipolygon_nm(lon, lat, polygons))
+        return (distance, 0.0, 0.0) if distance <= corridor_nm else None
+
+    best = math.inf
+    from_nm: Optional[float] = None
+    to_nm: Optional[float] = None
+    cumulative = 0.0
+    for a, b in zip(points, points[1:]):
+        leg_nm = haversine_nm(a[1], a[0], b[1], b[0])
+        extent = segment_multipolygon_extent(a, b, polygons, corridor_nm)
+        if extent is not None:
+            distance, t_from, t_to = extent
+            best = min(best, distance)
+            if from_nm is None:
+                from_nm = cumulative + t_from * leg_nm
+            to_nm = cumulative + t_to * leg_nm
+        cumulative += leg_nm
+    if from_nm is None:
+        return None
+    return (best, from_nm, to_nm)
+
+
+class RTree:
+    """Static R-tree over bounding boxes, bulk-loaded with Sort-Tile-Recursive packing.
+
+    Built once from (bbox, item) pairs; queries return the items whose bbox
+    contains a point or overlaps a box, in insertion order.
+
+    Example:
+        tree = RTree([(fir.bbox, fir) for fir in firs])
+        tree.query_point(2.5, 49.0)
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Tuple[float, float, float, float], Any]],
+                 node_capacity: int = 8):
+        self._boxes: List[Tuple[float, float, float, float]] = []
+        self._items: List[Any] = []
+        for box, item in entries:
+            self._boxes.append(tuple(box))
+            self._items.append(item)
+        self.node_capacity = max(2, node_capacity)
+        # Nodes are (bbox, children, is_leaf); leaf children are entry indices
+        level = [self._node([i], True) for i in range(len(self._boxes))]
+        level = self._pack(level, leaf=True) if level else []
+        while len(level) > 1:
+            level = self._pack(level, leaf=False)
+        self._root = level[0] if level else None
+
+    def _node(self, children: List[Any], leaf: bool) -> Tuple[Tuple[float, float, float, float], List[Any], bool]:
+        boxes = [self._boxes[i] for i in children] if leaf else [child[0] for child in children]
+        return (bbox_union(boxes), children, leaf)
+
+    def _pack(self, nodes: List[Any], leaf: bool) -> List[Any]:
+        """Group nodes into parents of up to node_capacity, tiling by x then y."""
+        capacity = self.node_capacity
+        parents = math.ceil(len(nodes) / capacity)
+        slice_size = math.ceil(math.sqrt(parents)) * capacity
+        by_x = sorted(nodes, key=lambda node: node[0][0] + node[0][2])
+        packed = []
+        for start in range(0, len(by_x), slice_size):
+            tile = sorted(by_x[start:start + slice_size], key=lambda node: node[0][1] + node[0][3])
+            for group in range(0, len(tile), capacity):
+                children = tile[group:group + capacity]
+                if leaf:
+                    packed.append(self._node([child[1][0] for child in children], True))
+                else:
+                    packed.append(self._node(children, False))
+        return packed
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _search(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> List[Any]:
+        if self._root is None:
+            return []
+        hits: List[int] = []
+        boxes = self._boxes
+        stack = [self._root]
+        while stack:
+            box, children, leaf = stack.pop()
+            if box[2] < min_lon or max_lon < box[0] or box[3] < min_lat or max_lat < box[1]:
+                continue
+            if leaf:
+                for i in children:
+                    b = boxes[i]
+                    if not (b[2] < min_lon or max_lon < b[0] or b[3] < min_lat or max_lat < b[1]):
+                        hits.append(i)
+            else:
+                stack.extend(children)
+        hits.sort()
+        return [self._items[i] for i in hits]
+
+    def query_point(self, lon: float, lat: float) -> List[Any]:
+        """Items whose bbox contains (lon, lat)."""
+        return self._search(lon, lat, lon, lat)
+
+    def query_bbox(self, box: Tuple[float, float, float, float]) -> List[Any]:
+        """Items whose bbox overlaps `box` (inclusive)."""
+        return self._search(*box)
+
+
+class PolygonIndex:
+    """Point location among many polygon items.
+
+    Items need a ``bbox``, a ``contains(lon, lat)`` method and, for
+    `along_polyline`, a ``segment_intervals(a, b)`` method, like `FIR` or
+    `PreparedMultiPolygon`; items without a bbox are left out. An `RTree`
+    over the bboxes narrows each query to a few candidates before their
+    exact test.
+
+    Example:
+        index = PolygonIndex(model.firs)
+        index.containing(2.5, 49.0)  # [FIR(LFFF, ...)]
+    """
+
+    def __init__(self, items: Iterable[Any]):
+        self._tree = RTree((item.bbox, item) for item in items if item.bbox)
+
+    def __len__(self) -> int:
+        return len(self._tree)
+
+    def candidates(self, box: Tuple[float, float, float, float]) -> List[Any]:
+        """Items whose bbox overlaps `box`."""
+        return self._tree.query_bbox(box)
+
+    def containing(self, lon: float, lat: float) -> List[Any]:
+        """Items containing (lon, lat), in insertion order."""
+        return [item for item in self._tree.query_point(lon, lat) if item.contains(lon, lat)]
+
+    def along_polyline(self, points: Sequence[Tuple[float, float]]) -> List[Any]:
+        """Items the polyline passes through, in the order they are first entered.
+
+        Walks the polyline leg by leg and intersects each leg exactly with the
+        items whose bbox overlaps it (see :func:`segment_multipolygon_intervals`),
+        so an item clipped by a single leg is never missed.
+        """
+        if not points:
+            return []
+        if len(points) == 1:
+            return self.containing(*points[0])
+        found: Dict[int, Tuple[Tuple[int, float], Any]] = {}
+        for leg, (start, end) in enumerate(zip(points, points[1:])):
+            box = (min(start[0], end[0]), min(start[1], end[1]),
+                   max(start[0], end[0]), max(start[1], end[1]))
+            for item in self._tree.query_bbox(box):
+                if id(item) in found:
+                    continue
+                intervals = item.segment_intervals(start, end)
+                if intervals:
+                    found[id(item)] = ((leg, intervals[0][0]), item)
+        return [item for _, item in sorted(found.values(), key=lambda entry: entry[0])]
@@ -0,0 +1,119 @@
+"""Vectorised route corridor distances.
+
+`RouteCorridor` holds a route as NumPy arrays and measures many points against
+every leg at once, reproducing `NavPoint.distance_to_segment` (cross-track
+distance when the projection falls inside the leg, distance to the nearest
+end otherwise) without a Python loop per point and per leg.
+
+Coordinates are decimal degrees in `(lon, lat)` order, as in `utils.geometry`.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from .geometry import EARTH_RADIUS_NM
+
+# Legs shorter than this are measured as their nearest end point
+# (same threshold as NavPoint.distance_to_segment)
+SHORT_LEG_NM = 0.1
+
+
+def _haversine(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Initial bearing (degrees, 0-360) and distance (nm) between radian arrays."""
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    cos_lat1 = np.cos(lat1)
+    cos_lat2 = np.cos(lat2)
+    a = np.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * np.sin(dlon / 2) ** 2
+    distance = EARTH_RADIUS_NM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    y = np.sin(dlon) * cos_lat2
+    x = cos_lat1 * np.sin(lat2) - np.sin(lat1) * cos_lat2 * np.cos(dlon)
+    bearing = (np.degrees(np.arctan2(y, x)) + 360) % 360
+    return bearing, distance
+
+
+class RouteCorridor:
+    """
+    A route of one or more points, measured against batches of points.
+
+    Examples:
+        corridor = RouteCorridor([(-0.46, 51.48), (2.55, 49.01)])
+        distance, enroute, leg = corridor.measure(lons, lats)
+        near = distance <= 50.0
+    """
+
+    def __init__(self, route: Sequence[Tuple[float, float]]):
+        if len(route) < 1:
+            raise ValueError("Route must contain at least one point")
+        coords = np.radians(np.asarray(route, dtype=np.float64).reshape(-1, 2))
+        self._lon = coords[:, 0]
+        self._lat = coords[:, 1]
+        if len(route) > 1:
+            bearing, length = _haversine(self._lat[:-1], self._lon[:-1], self._lat[1:], self._lon[1:])
+        else:
+            bearing, length = np.empty(0), np.empty(0)
+        self._leg_bearing = bearing
+        self._leg_length = length
+        # Distance along the route to the start of each leg
+        self.cumulative_nm = np.concatenate(([0.0], np.cumsum(length)))
+
+    def __len__(self) -> int:
+        return len(self._lon)
+
+    def measure(self, lons: Sequence[float], lats: Sequence[float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Measure points against the route.
+
+        For a single-point route the distance is to that point and the enroute
+        distance is 0. Otherwise the closest leg is the first one with the
+        smallest distance, and the enroute distance is the distance along the
+        route to that leg's start plus the distance from its start to the point.
+
+        Args:
+            lons: Point longitudes in degrees
+            lats: Point latitudes in degrees
+
+        Returns:
+            Tuple of (distance_nm, enroute_distance_nm, leg_index) arrays, one
+            entry per point
+        """
+        lon = np.radians(np.asarray(lons, dtype=np.float64))[:, np.newaxis]
+        lat = np.radians(np.asarray(lats, dtype=np.float64))[:, np.newaxis]
+        count = lon.shape[0]
+
+        if len(self) == 1:
+            _, distance = _haversine(self._lat[np.newaxis, :1], self._lon[np.newaxis, :1], lat, lon)
+            return distance[:, 0], np.zeros(count), np.zeros(count, dtype=np.intp)
+
+        # (points, legs) matrices: start -> point and end -> point
+        start_lat = self._lat[np.newaxis, :-1]
+        start_lon = self._lon[np.newaxis, :-1]
+        bearing_ap, dist_ap = _haversine(start_lat, start_lon, lat, lon)
+        _, dist_bp = _haversine(self._lat[np.newaxis, 1:], self._lon[np.newaxis, 1:], lat, lon)
+        bearing_ab = self._leg_bearing[np.newaxis, :]
+        dist_ab = self._leg_length[np.newaxis, :]
+
+        angular_ap = dist_ap / EARTH_RADIUS_NM
+        cross_track = np.arcsin(
+            np.sin(angular_ap) * np.sin(np.radians(bearing_ap) - np.radians(bearing_ab))
+        ) * EARTH_RADIUS_NM
+
+        cos_cross = np.cos(cross_track / EARTH_RADIUS_NM)
+        cos_cross = np.where(np.abs(cross_track) < 0.001, np.maximum(cos_cross, 0.0001), cos_cross)
+        along_track = np.arccos(np.clip(np.cos(angular_ap) / cos_cross, -1.0, 1.0)) * EARTH_RADIUS_NM
+
+        bearing_diff = np.abs(bearing_ap - bearing_ab)
+        bearing_diff = np.where(bearing_diff > 180, 360 - bearing_diff, bearing_diff)
+        along_track = np.where(bearing_diff > 90, -along_track, along_track)
+
+        distance = np.where(
+            along_track < 0, dist_ap,
+            np.where(along_track > dist_ab, dist_bp, np.abs(cross_track)),
+        )
+        distance = np.where(dist_ab < SHORT_LEG_NM, np.minimum(dist_ap, dist_bp), distance)
+
+        leg = np.argmin(distance, axis=1)
+        rows = np.arange(count)
+        enroute = self.cumulative_nm[leg] + dist_ap[rows, leg]
+        return distance[rows, leg], enroute, leg
@@ -0,0 +1,225 @@
+"""Route geometry computed once and shared by the route queries.
+
+A briefing asks several questions of the same route: which FIRs it crosses
+(`EuroAipModel.firs_along_route`), which SIGMETs touch its corridor
+(`RouteSigmetService`), which NOTAMs lie along it
+(`NotamCollection.along_route`) and which airports are near it
+(`EuroAipModel.find_airports_near_route`). `RouteGeometry` resolves the route
+to coordinates once and keeps what those queries share:
+
+- leg lengths and cumulative along-track distance
+- leg bboxes, straight in (lon, lat) and split along the great circle
+- the vectorised `RouteCorridor`
+- per corridor width: the padded route bbox and R-trees over the padded legs
+
+Everything that depends on the corridor width is memoised per width, and
+callers can memoise their own per-route results with `memo`.
+
+Coordinates are decimal degrees in `(lon, lat)` order, as in `utils.geometry`.
+"""
+
+import math
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from ..models.navpoint import NavPoint
+from .geometry import (
+    GridIndex,
+    RTree,
+    bbox_intersects,
+    bbox_of_ring,
+    bbox_pad,
+    bbox_union,
+    great_circle_leg_boxes,
+    haversine_nm,
+    polyline_multipolygon_extent,
+    segment_multipolygon_extent,
+)
+from .route_corridor import RouteCorridor
+
+BBox = Tuple[float, float, float, float]
+
+
+def _as_navpoint(point: Any) -> Optional[NavPoint]:
+    """NavPoint for a NavPoint, Airport, RoutePoint or similar (None without coordinates)."""
+    if isinstance(point, NavPoint):
+        return point
+    navpoint = getattr(point, "navpoint", None)
+    if isinstance(navpoint, NavPoint):
+        return navpoint
+    lat = getattr(point, "latitude", None)
+    if lat is None:
+        lat = getattr(point, "latitude_deg", None)
+    lon = getattr(point, "longitude", None)
+    if lon is None:
+        lon = getattr(point, "longitude_deg", None)
+    if lat is None or lon is None:
+        return None
+    name = getattr(point, "name", None) or getattr(point, "ident", None)
+    return NavPoint(latitude=lat, longitude=lon, name=name)
+
+
+class RouteGeometry:
+    """
+    A route resolved to coordinates, with the geometry its queries share.
+
+    Build it once per route and pass it to every query; points without
+    coordinates are dropped.
+
+    Examples:
+        geometry = RouteGeometry.of(briefing.route)
+        model.firs_along_route(geometry)
+        model.find_airports_near_route(geometry, distance_nm=25)
+        notams.along_route(geometry, corridor_nm=25)
+    """
+
+    def __init__(self, points: Sequence[Any]):
+        self.navpoints: List[NavPoint] = [
+            navpoint for navpoint in map(_as_navpoint, points) if navpoint is not None
+        ]
+        self.polyline: List[Tuple[float, float]] = [(p.longitude, p.latitude) for p in self.navpoints]
+        self.leg_lengths_nm: List[float] = [
+            haversine_nm(a[1], a[0], b[1], b[0]) for a, b in zip(self.polyline, self.polyline[1:])
+        ]
+        # Distance along the route to each point
+        self.cumulative_nm: List[float] = [0.0] if self.polyline else []
+        for length in self.leg_lengths_nm:
+            self.cumulative_nm.append(self.cumulative_nm[-1] + length)
+        self.leg_bboxes: List[BBox] = [
+            (min(a[0], b[0]), min(a[1], b[1]), max(a[0], b[0]), max(a[1], b[1]))
+            for a, b in zip(self.polyline, self.polyline[1:])
+        ]
+        self.bbox: Optional[BBox] = (
+            bbox_union([(lon, lat, lon, lat) for lon, lat in self.polyline]) if self.polyline else None
+        )
+        self._great_circle_boxes: Optional[List[List[BBox]]] = None
+        self._corridor: Optional[RouteCorridor] = None
+        self._memo: Dict[Hashable, Any] = {}
+
+    @classmethod
+    def of(cls, route: Any) -> "RouteGeometry":
+        """The geometry of a RouteGeometry (itself), a briefing Route or a list of points."""
+        if isinstance(route, cls):
+            return route
+        if hasattr(route, "get_route_navpoints"):
+            return cls(route.get_route_navpoints())
+        return cls(route)
+
+    def __len__(self) -> int:
+        return len(self.polyline)
+
+    @property
+    def length_nm(self) -> float:
+        return self.cumulative_nm[-1] if self.cumulative_nm else 0.0
+
+    @property
+    def corridor(self) -> RouteCorridor:
+        """The route as a `RouteCorridor`, for measuring many points at once."""
+        if self._corridor is None:
+            self._corridor = RouteCorridor(self.polyline)
+        return self._corridor
+
+    @property
+    def great_circle_boxes(self) -> List[List[BBox]]:
+        """Bboxes of each leg split along its great circle (see `great_circle_leg_boxes`)."""
+        if self._great_circle_boxes is None:
+            self._great_circle_boxes = great_circle_leg_boxes(self.polyline, GridIndex.CORRIDOR_PIECE_NM)
+        return self._great_circle_boxes
+
+    @property
+    def crosses_antimeridian(self) -> bool:
+        return self.memo("crosses_antimeridian", lambda: any(
+            box[2] > 180.0 for pieces in self.great_circle_boxes for box in pieces
+        ))
+
+    def corridor_boxes(self) -> List[BBox]:
+        """The first point's box and every great-circle piece box, for `GridIndex.near_boxes`."""
+        if not self.polyline:
+            return []
+        lon, lat = self.polyline[0]
+        return [(lon, lat, lon, lat)] + [box for pieces in self.great_circle_boxes for box in pieces]
+
+    def memo(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Value cached on this route under `key`, computed on first use."""
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
+
+    def padded_bbox(self, corridor_nm: float) -> Optional[BBox]:
+        """The route bbox padded by `corridor_nm` (see `bbox_pad`)."""
+        if self.bbox is None:
+            return None
+        return self.memo(("padded_bbox", corridor_nm), lambda: bbox_pad(self.bbox, corridor_nm))
+
+    def _leg_tree(self, corridor_nm: float) -> RTree:
+        """R-tree over the straight leg bboxes padded by `corridor_nm`, by leg index."""
+        return self.memo(("leg_tree", corridor_nm), lambda: RTree(
+            (bbox_pad(box, corridor_nm), leg) for leg, box in enumerate(self.leg_bboxes)
+        ))
+
+    def _corridor_tree(self, corridor_nm: float) -> RTree:
+        """R-tree over the great-circle piece boxes padded to contain the corridor, by leg index."""
+        pad_nm = corridor_nm + GridIndex.CORRIDOR_MARGIN_NM
+        return self.memo(("corridor_tree", corridor_nm), lambda: RTree(
+            (bbox_pad(box, pad_nm, widest=True), leg)
+            for leg, pieces in enumerate(self.great_circle_boxes) for box in pieces
+        ))
+
+    def legs_near(self, box: BBox, corridor_nm: float) -> List[int]:
+        """Legs whose straight (lon, lat) segment may come within `corridor_nm` of `box`.
+
+        Uses the same padding as the exact polygon helpers, so a leg left out
+        here cannot meet a polygon inside `box` within the corridor.
+        """
+        return sorted(set(self._leg_tree(corridor_nm).query_bbox(box)))
+
+    def legs_near_point(self, lon: float, lat: float, corridor_nm: float) -> List[int]:
+        """Legs whose great-circle corridor of `corridor_nm` may contain (lon, lat)."""
+        tree = self._corridor_tree(corridor_nm)
+        legs = set(tree.query_point(lon, lat))
+        if self.crosses_antimeridian:
+            # Pieces across the antimeridian are boxed with their west end unwrapped
+            legs.update(tree.query_point(lon + 360.0, lat))
+        return sorted(legs)
+
+    def polygon_extent(
+        self,
+        polygons: Sequence[Sequence[Sequence[Tuple[float, float]]]],
+        corridor_nm: float = 0.0,
+        bbox: Optional[BBox] = None,
+    ) -> Optional[Tuple[float, float, float]]:
+        """Where the route comes within `corridor_nm` of a multipolygon.
+
+        Same result as :func:`polyline_multipolygon_extent`, but only the legs
+        near the polygons' bbox (`bbox` if the caller has it) are measured.
+        """
+        if len(self.polyline) < 2:
+            return polyline_multipolygon_extent(self.polyline, polygons, corridor_nm)
+        if bbox is None:
+            rings = [ring for poly in polygons for ring in poly if ring]
+            if not rings:
+                return None
+            bbox = bbox_union([bbox_of_ring(ring) for ring in rings])
+        best = math.inf
+        from_nm: Optional[float] = None
+        to_nm: Optional[float] = None
+        for leg in self.legs_near(bbox, corridor_nm):
+            extent = segment_multipolygon_extent(
+                self.polyline[leg], self.polyline[leg + 1], polygons, corridor_nm
+            )
+            if extent is None:
+                continue
+            distance, t_from, t_to = extent
+            best = min(best, distance)
+            if from_nm is None:
+                from_nm = self.cumulative_nm[leg] + t_from * self.leg_lengths_nm[leg]
+            to_nm = self.cumulative_nm[leg] + t_to * self.leg_lengths_nm[leg]
+        if from_nm is None:
+            return None
+        return (best, from_nm, to_nm)
+
+    def intersects_bbox(self, box: BBox, corridor_nm: float) -> bool:
+        """Cheap test: does the padded route bbox overlap `box` padded by `corridor_nm`?"""
+        padded = self.padded_bbox(corridor_nm)
+        return padded is not None and bbox_intersects(bbox_pad(box, corridor_nm), padded)
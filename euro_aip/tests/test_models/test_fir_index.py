@@ -0,0 +1,50 @@
+"""Tests for FIR point location through the model's FIR index."""
+
+from euro_aip.models import EuroAipModel
+from euro_aip.models.fir import FIR
+from euro_aip.models.navpoint import NavPoint
+
+
+def _square(icao, min_lon, min_lat, size=5.0):
+    ring = [(min_lon, min_lat), (min_lon + size, min_lat), (min_lon + size, min_lat + size),
+            (min_lon, min_lat + size), (min_lon, min_lat)]
+    return FIR(icao=icao, polygons=[[ring]])
+
+
+def _model():
+    model = EuroAipModel()
+    model.bulk_add_firs([_square("LFFF", 0.0, 45.0), _square("EDGG", 5.0, 45.0), _square("LIMM", 5.0, 40.0)])
+    return model
+
+
+def test_containing_point_uses_index():
+    model = _model()
+    assert [f.icao for f in model.firs.containing_point(lon=2.0, lat=47.0)] == ["LFFF"]
+    # Filtered collections fall back to testing each FIR
+    assert model.firs.by_region("EMEA").containing_point(lon=2.0, lat=47.0).count() == 0
+    assert model.firs.lazy().containing_point(lon=7.0, lat=42.0).first().icao == "LIMM"
+
+
+def test_index_rebuilt_after_add_fir():
+    model = _model()
+    assert model.firs.containing_point(lon=12.0, lat=47.0).count() == 0
+    model.add_fir(_square("LOVV", 10.0, 45.0))
+    assert [f.icao for f in model.firs.containing_point(lon=12.0, lat=47.0)] == ["LOVV"]
+
+
+def test_firs_along_route():
+    model = _model()
+    route = [NavPoint(latitude=47.0, longitude=2.0), NavPoint(latitude=47.0, longitude=7.0),
+             NavPoint(latitude=42.0, longitude=7.0)]
+    assert model.firs_along_route(route) == ["EDGG", "LFFF", "LIMM"]
+    assert model.firs_along_route(route[:1]) == ["LFFF"]
+    assert model.firs_along_route([]) == []
+
+
+def test_prepared_polygons_follow_replaced_geometry():
+    fir = _square("LFFF", 0.0, 45.0)
+    assert fir.contains(2.0, 47.0)
+    fir.polygons = _square("LFFF", 20.0, 45.0).polygons
+    fir.bbox = fir._compute_bbox()
+    assert not fir.contains(2.0, 47.0)
+    assert fir.contains(22.0, 47.0)
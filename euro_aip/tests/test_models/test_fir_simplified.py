@@ -0,0 +1,111 @@
+"""Tests for FIR simplified levels and their storage."""
+
+import json
+import math
+import sqlite3
+
+from euro_aip.models import EuroAipModel
+from euro_aip.models.fir import FIR
+from euro_aip.storage import DatabaseStorage, MappedModel, ModelSnapshot
+from euro_aip.utils.geometry import point_in_ring
+
+
+def _circle(cx, cy, radius, points=400):
+    ring = [(cx + radius * math.cos(2 * math.pi * k / points) / math.cos(math.radians(cy)),
+             cy + radius * math.sin(2 * math.pi * k / points)) for k in range(points)]
+    return [list(p) for p in ring + ring[:1]]
+
+
+def _fir(icao="LFFF"):
+    return FIR(icao=icao, polygons=[[_circle(2.0, 47.0, 3.0)]])
+
+
+def test_levels_get_coarser():
+    fir = _fir()
+    fir.build_simplified()
+    sizes = [len(fir.simplified[t][0][0]) for t in FIR.SIMPLIFY_TOLERANCES_NM]
+    assert sizes == sorted(sizes, reverse=True)
+    assert sizes[0] < len(fir.polygons[0][0])
+
+
+def test_coarsest_polygons():
+    fir = _fir()
+    assert fir.coarsest_polygons(10.0) is fir.polygons
+    fir.build_simplified()
+    assert fir.coarsest_polygons(10.0) is fir.simplified[5.0]
+    assert fir.coarsest_polygons(0.5) is fir.polygons
+
+
+def test_contains_uses_stored_level():
+    fir = _fir()
+    fir.build_simplified()
+    level = fir.simplified[FIR.PREPARED_TOLERANCE_NM]
+    ring = fir.polygons[0][0]
+    for lon, lat in [(2.0, 47.0), (2.0, 49.99), (2.0, 50.01), (6.5, 47.0), (-3.0, 47.0)]:
+        assert fir.contains(lon, lat) == point_in_ring(lon, lat, ring)
+    # The stored level was reused, not recomputed
+    assert fir.simplified[FIR.PREPARED_TOLERANCE_NM] is level
+
+
+def test_stale_level_is_recomputed():
+    fir = _fir()
+    fir.simplified[FIR.PREPARED_TOLERANCE_NM] = [[[[50.0, 10.0], [51.0, 10.0], [51.0, 11.0]]]]
+    assert fir.contains(2.0, 47.0)
+    assert fir.simplified[FIR.PREPARED_TOLERANCE_NM][0][0][0] == fir.polygons[0][0][0]
+
+
+def test_levels_persisted(tmp_path):
+    model = EuroAipModel()
+    model.add_fir(_fir())
+    storage = DatabaseStorage(str(tmp_path / "firs.db"))
+    storage.save_model(model)
+
+    loaded = storage.load_model().get_fir("LFFF")
+    assert sorted(loaded.simplified) == sorted(FIR.SIMPLIFY_TOLERANCES_NM)
+    assert loaded.simplified[5.0] == [[[list(p) for p in ring] for ring in poly]
+                                      for poly in model.get_fir("LFFF").simplified[5.0]]
+    assert loaded.contains(2.0, 47.0)
+
+
+def test_levels_in_snapshot(tmp_path, monkeypatch):
+    model = EuroAipModel()
+    model.add_fir(_fir())
+    model.add_fir(FIR(icao="EGTT", polygons=[[_circle(-1.0, 52.0, 2.0)], [_circle(-6.0, 54.0, 1.0)]]))
+    model.add_fir(FIR(icao="EBBU"))
+    for fir in model._firs.values():
+        fir.build_simplified()
+    model.get_fir("LFFF").simplified[0.5] = model.get_fir("LFFF").simplified_polygons(0.5)
+    path = tmp_path / "model.snap"
+    ModelSnapshot.write(model, path)
+
+    # Loaded levels are read back, not simplified again
+    monkeypatch.setattr("euro_aip.models.fir.simplify_multipolygon", None)
+    with ModelSnapshot.open(path) as snapshot:
+        loaded = snapshot.to_model()
+    with MappedModel.open(path) as mapped:
+        mapped_egtt = mapped.get_fir("EGTT")
+    for icao, fir in model._firs.items():
+        other = loaded.get_fir(icao)
+        assert sorted(other.simplified) == sorted(fir.simplified), icao
+        for tolerance, level in fir.simplified.items():
+            assert other.simplified[tolerance] == [[[list(p) for p in ring] for ring in poly] for poly in level]
+    assert mapped_egtt.simplified == loaded.get_fir("EGTT").simplified
+    assert loaded.get_fir("EGTT").coarsest_polygons(10.0) is loaded.get_fir("EGTT").simplified[5.0]
+    assert loaded.get_fir("LFFF").contains(2.0, 47.0)
+
+
+def test_firs_table_migrated(tmp_path):
+    path = tmp_path / "old.db"
+    storage = DatabaseStorage(str(path))
+    storage.close()
+    with sqlite3.connect(path) as conn:
+        conn.execute("ALTER TABLE firs DROP COLUMN simplified_json")
+        conn.execute(
+            "INSERT INTO firs (icao, polygons_json, bbox_min_lon, bbox_min_lat, bbox_max_lon, bbox_max_lat)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            ("LFFF", json.dumps(_fir().polygons), -2.4, 44.0, 6.4, 50.0))
+
+    model = DatabaseStorage(str(path)).load_model()
+    fir = model.get_fir("LFFF")
+    assert fir.simplified == {}
+    assert fir.contains(2.0, 47.0)
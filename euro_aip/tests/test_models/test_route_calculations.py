@@ -184,4 +184,31 @@ def test_distance_boundary_conditions():
     if found_test1:
         algo_dist = found_test1[0]['distance_nm']
         print(f"Algorithm distance EGLL to TEST1: {algo_dist:.2f}nm")
-        assert abs(manual_dist - algo_dist) < 0.1, "Distance calculation mismatch" 
\ No newline at end of file
+        assert abs(manual_dist - algo_dist) < 0.1, "Distance calculation mismatch" 
+
+def test_spatial_index_follows_moved_airports():
+    """Test route and radius queries see airports whose coordinates change after insertion."""
+    model = EuroAipModel()
+    for ap in [make_airport('EGLL', 51.4706, -0.461941), make_airport('LFRN', 48.0695, -1.73456),
+               make_airport('TEST1', 55.0, 10.0), make_airport('TEST2', 49.0, -1.0)]:
+        model.add_airport(ap)
+    index = model.get_airport_spatial_index()
+    assert {item['airport'].ident for item in model.find_airports_near_route(['EGLL', 'LFRN'], 5)} == {'EGLL', 'LFRN'}
+
+    # A source correcting the position in place, by field and through the navpoint
+    test1 = model.airports['TEST1']
+    assert test1.navpoint.latitude == 55.0
+    test1.latitude_deg = 50.0
+    test1.longitude_deg = -1.0
+    model.mark_airport_changed('TEST1')
+    model.airports['TEST2'].navpoint = NavPoint(60.0, 20.0, 'TEST2')
+    assert (test1.navpoint.latitude, test1.navpoint.longitude) == (50.0, -1.0)
+
+    found = {item['airport'].ident for item in model.find_airports_near_route(['EGLL', 'LFRN'], 5)}
+    assert found == {'EGLL', 'LFRN', 'TEST1'}
+    assert [ap.ident for _, ap in index.within_radius(lon=20.0, lat=60.0, radius_nm=5)] == ['TEST2']
+
+    # Losing its coordinates drops the airport from the index
+    model.airports['TEST1'].latitude_deg = None
+    model.mark_airport_changed('TEST1')
+    assert 'TEST1' not in index
@@ -196,6 +196,31 @@ class TestWaypoint:
         assert "REM" in repr(wp)
         assert "VOR" in repr(wp)
 
+    def test_compact_instances(self):
+        wp = Waypoint(name="REM", latitude_deg=49.3, longitude_deg=3.1)
+        assert not hasattr(wp, "__dict__")
+        assert not hasattr(wp.navpoint, "__dict__")
+        # One datetime object for both timestamps unless given separately
+        assert wp.updated_at is wp.created_at
+        later = datetime(2026, 1, 2)
+        assert Waypoint(name="REM", latitude_deg=0, longitude_deg=0, updated_at=later).updated_at == later
+
+    def test_loaded_waypoints_share_values(self, tmp_path):
+        model = EuroAipModel()
+        created = datetime(2026, 1, 1, 12, 0)
+        model.bulk_add_waypoints([
+            Waypoint(name=name, latitude_deg=48.0, longitude_deg=2.0, point_type="5LNC",
+                     fir_codes="LFFF", created_at=created)
+            for name in ("BILGO", "ABADI")
+        ])
+        DatabaseStorage(str(tmp_path / "wp.db")).save_model(model)
+
+        loaded = DatabaseStorage(str(tmp_path / "wp.db")).load_model()
+        first, second = (loaded.get_waypoint_candidates(name)[0] for name in ("BILGO", "ABADI"))
+        assert first.created_at == created
+        assert first.created_at is second.created_at is first.updated_at
+        assert first.fir_codes is second.fir_codes
+
 
 # ========================================================================
 # WaypointCollection Tests
@@ -305,6 +330,28 @@ class TestEuroAipModelWaypoints:
         assert result["updated"] == 0
         assert model.waypoints.count() == 2
 
+    def test_nearest_uses_model_spatial_index(self):
+        model = EuroAipModel()
+        model.bulk_add_waypoints([
+            Waypoint(name="BILGO", latitude_deg=48.5, longitude_deg=2.3, source_id="fra:LFFF"),
+            Waypoint(name="REM", latitude_deg=49.3, longitude_deg=4.0, source_id="fra:LFEE"),
+            Waypoint(name="ALG", latitude_deg=40.6, longitude_deg=8.2, source_id="fra:LIMM"),
+        ])
+        point = NavPoint(latitude=48.0, longitude=3.0, name="REF")
+        index = model.get_waypoint_spatial_index()
+        assert len(index) == 3
+
+        nearest = model.waypoints.nearest(point, count=2)
+        assert [w.name for w in nearest] == ["BILGO", "REM"]
+        assert [w.name for w in nearest] == [
+            w.name for w in WaypointCollection(model.waypoints.all()).nearest(point, count=2)
+        ]
+
+        # Merging a candidate that moves it keeps the index in step
+        model.add_waypoint(Waypoint(name="ALG", latitude_deg=48.1, longitude_deg=3.0, source_id="fra:LIMM"))
+        assert len(index) == 3
+        assert model.waypoints.nearest(point, count=1).first().name == "ALG"
+
     def test_waypoints_in_statistics(self):
         model = EuroAipModel()
         model.add_waypoint(Waypoint(name="A", latitude_deg=0, longitude_deg=0))
@@ -512,6 +559,27 @@ class TestRouteResolver:
         assert route.destination == "LSGS"
         assert route.waypoints == ["VESAN"]
 
+    def test_resolve_many_matches_resolve(self, model):
+        resolver = RouteResolver(model)
+        routes = resolver.resolve_many(["EGTF VESAN POGOL LSGS", "LSGS REM EGTF"])
+        assert [r.waypoints for r in routes] == [["VESAN", "POGOL"], ["REM"]]
+        fresh = RouteResolver(model).resolve("LSGS REM EGTF")
+        assert routes[1].waypoint_coords == fresh.waypoint_coords
+
+    def test_lookups_memoised_until_cleared(self, model):
+        resolver = RouteResolver(model)
+        assert resolver.resolve_point("BILGO") is None
+        model.add_waypoint(Waypoint(name="BILGO", latitude_deg=50.0, longitude_deg=1.5))
+        assert resolver.resolve_point("BILGO") is None
+        resolver.clear_cache()
+        assert resolver.resolve_point("BILGO") is not None
+
+    def test_memoised_point_not_shared_with_callers(self, model):
+        resolver = RouteResolver(model)
+        point = resolver.resolve_point("EGTF")
+        point.point_type = "departure"
+        assert resolver.resolve_point("EGTF").point_type == "airport"
+
     # --- Inline ICAO coordinates (FPL field 15 GPS waypoints) ---
 
     def test_resolve_point_inline_coordinate_dm(self, model):
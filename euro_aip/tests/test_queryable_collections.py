@@ -8,6 +8,7 @@ that it works correctly with the Euro AIP model.
 import pytest
 from euro_aip.models.euro_aip_model import EuroAipModel
 from euro_aip.models.airport import Airport
+from euro_aip.models.navpoint import NavPoint
 from euro_aip.models.procedure import Procedure
 from euro_aip.models.runway import Runway
 from euro_aip.models.airport_collection import AirportCollection
@@ -325,6 +326,74 @@ class TestAirportCollection:
         with pytest.raises(KeyError):
             _ = french['EGLL']  # UK airport not in French filter
 
+    def test_model_airports_shares_model_index(self):
+        """Test model.airports looks up through the model dict without copying."""
+        model = EuroAipModel()
+        model.add_airport(Airport(ident="EGLL", name="Heathrow", iso_country="GB"))
+        model.add_airport(Airport(ident="LFPG", name="Charles de Gaulle", iso_country="FR"))
+
+        airports = model.airports
+        assert airports._ident_index() is model._airports
+        assert airports._list is None  # Lookups do not materialise the list
+
+        assert 'EGLL' in airports
+        assert airports['LFPG'].name == "Charles de Gaulle"
+        assert airports.get('ZZZZ') is None
+        assert len(airports) == 2
+        assert airports._list is None
+
+        # Filters and iteration still see every airport
+        assert [a.ident for a in airports.by_country("FR")] == ["LFPG"]
+        assert sorted(a.ident for a in airports) == ["EGLL", "LFPG"]
+
+    def test_model_airports_view_follows_model(self):
+        """Test a held model.airports view agrees with the model after it changes."""
+        model = EuroAipModel()
+        model.add_airport(Airport(ident="EGLL", name="Heathrow", iso_country="GB"))
+        airports = model.airports
+        assert [a.ident for a in airports] == ["EGLL"]
+
+        model.add_airport(Airport(ident="LFPG", name="Charles de Gaulle", iso_country="FR"))
+        assert len(airports) == 2
+        assert [a.ident for a in airports] == ["EGLL", "LFPG"]
+
+        model.remove_airports_by_country("GB")
+        assert len(airports) == 1
+        assert 'EGLL' not in airports
+        assert [a.ident for a in airports] == ["LFPG"]
+        assert airports.count() == 1
+
+    def test_model_airports_positional_access_reads_dict(self, monkeypatch):
+        """Test first(), last(), [i] and repr() on a live view do not copy the model's airports."""
+        model = EuroAipModel()
+        for ident in ("EGLL", "LFPG", "EDDF", "EHAM", "LEMD"):
+            model.add_airport(Airport(ident=ident))
+        airports = model.airports
+
+        def no_copy(self):
+            raise AssertionError("live view copied its airports")
+        monkeypatch.setattr(AirportCollection, "_items", property(no_copy))
+
+        assert airports.first().ident == "EGLL"
+        assert airports.last().ident == "LEMD"
+        assert [airports[i].ident for i in (0, 2, -1, -2)] == ["EGLL", "EDDF", "LEMD", "EHAM"]
+        with pytest.raises(IndexError):
+            airports[5]
+        with pytest.raises(IndexError):
+            airports[-6]
+        assert repr(airports) == "AirportCollection(['EGLL', 'LFPG', 'EDDF', ...], count=5)"
+        assert repr(EuroAipModel().airports) == "AirportCollection([])"
+        assert EuroAipModel().airports.first() is None
+
+    def test_dict_style_duplicate_ident_returns_first(self):
+        """Test the lazy index keeps the first airport for a repeated ident."""
+        first = Airport(ident="EGLL", name="First")
+        second = Airport(ident="EGLL", name="Second")
+
+        collection = AirportCollection([first, second])
+        assert collection['EGLL'] is first
+        assert collection.get('EGLL') is first
+
     def test_set_union_operator(self):
         """Test union operator (|) for combining collections."""
         airports_fr = [
@@ -554,6 +623,191 @@ class TestProcedureCollection:
         assert result[0].name == "ILS 09L"
 
 
+class TestModelAttributeIndex:
+    """Test model-backed airport filters answered from the attribute index."""
+
+    def _model(self):
+        model = EuroAipModel()
+        model.add_airport(Airport(ident="LFPG", iso_country="FR", iso_region="FR-IDF",
+                                  type="large_airport", has_hard_runway=True,
+                                  avgas=True, jet_a=True, sources={"worldairports"}))
+        model.add_airport(Airport(ident="LFAT", iso_country="FR", iso_region="FR-HDF",
+                                  type="small_airport", has_hard_runway=True,
+                                  avgas=True, sources={"france_eaip"}))
+        model.add_airport(Airport(ident="LFGRASS", iso_country="FR", type="small_airport",
+                                  has_hard_runway=False, avgas=True))
+        model.add_airport(Airport(ident="EGLL", iso_country="GB", type="large_airport",
+                                  has_hard_runway=True, jet_a=True, point_of_entry=True,
+                                  sources={"uk_eaip"}))
+        return model
+
+    def test_indexed_filters_match_scan(self):
+        """Test index-backed filters return the same airports, in model order, as a scan."""
+        model = self._model()
+        scanned = AirportCollection(list(model._airports.values()))
+        indexed = model.airports
+
+        def idents(collection):
+            return [a.ident for a in collection]
+
+        assert idents(indexed.by_country("FR")) == idents(scanned.by_country("FR"))
+        assert idents(indexed.by_countries(["GB", "FR"])) == idents(scanned.by_countries(["GB", "FR"]))
+        assert idents(indexed.by_source("uk_eaip")) == ["EGLL"]
+        assert idents(indexed.by_sources(["uk_eaip", "france_eaip"])) == ["LFAT", "EGLL"]
+        assert idents(indexed.by_type("large_airport")) == ["LFPG", "EGLL"]
+        assert idents(indexed.in_region("FR-IDF")) == ["LFPG"]
+        assert idents(indexed.border_crossings()) == ["EGLL"]
+        assert idents(indexed.with_fuel()) == idents(scanned)
+
+        chain = indexed.by_country("FR").with_hard_runway().with_fuel(avgas=True, jet_a=True)
+        assert idents(chain) == ["LFPG"]
+        assert chain['LFPG'].ident == "LFPG"
+        assert 'LFAT' not in chain
+
+    def test_index_follows_model_updates(self):
+        """Test add/remove keep the index current and derived updates rebuild it."""
+        model = self._model()
+        assert model.airports.by_country("GB").count() == 1
+        index = model.get_airport_index()
+
+        model.add_airport(Airport(ident="EGKB", iso_country="GB"))
+        assert [a.ident for a in model.airports.by_country("GB")] == ["EGLL", "EGKB"]
+
+        # Updating an existing airport moves it between index buckets
+        model.add_airport(Airport(ident="EGKB", iso_country="IE"))
+        assert model.airports.by_country("IE").count() == 1
+        assert model.airports.by_country("GB").count() == 1
+
+        model.remove_airports_by_country("FR")
+        assert model.airports.by_country("FR").count() == 0
+        assert model.get_airport_index() is index
+
+        # Derived field updates invalidate the index
+        model.update_all_derived_fields()
+        assert model._airport_index is None
+        assert model.airports.with_hard_runway().count() == 0  # No runways -> no hard runway
+
+    def test_index_follows_direct_airport_edits(self):
+        """Test airports edited the way sources do are re-indexed at once."""
+        model = self._model()
+        scanned = lambda: AirportCollection(list(model._airports.values()))  # noqa: E731
+        assert model.airports.border_crossings().count() == 1  # Index built
+
+        # point_de_passage style: set the flag, then record the source
+        lfat = model.airports['LFAT']
+        lfat.point_of_entry = True
+        lfat.add_source('point_de_passage')
+        assert model.airports.border_crossings().count() == scanned().border_crossings().count() == 2
+        assert [a.ident for a in model.airports.by_source('point_de_passage')] == ['LFAT']
+
+        # eAIP web style: add a source to an existing airport
+        model.airports['EGLL'].add_source('uk_eaip_html')
+        assert model.airports.by_source('uk_eaip_html').count() == 1
+
+        # A bare field assignment is re-indexed through mark_airport_changed
+        model.airports['LFGRASS'].iso_country = 'DE'
+        model.mark_airport_changed('LFGRASS')
+        assert [a.ident for a in model.airports.by_country('FR')] == ['LFPG', 'LFAT']
+        assert [a.ident for a in model.airports.by_country('DE')] == ['LFGRASS']
+
+        # Removed airports no longer report to the model
+        grass = model.airports['LFGRASS']
+        model.remove_airports_by_country('DE')
+        grass.add_source('late')
+        assert model.airports.by_country('DE').count() == 0
+        assert model.airports.by_source('late').count() == 0
+        assert model.airports.by_country('FR').count() == scanned().by_country('FR').count() == 2
+
+    def test_airport_copies_do_not_report(self):
+        """Test copies of an airport held by a model compare equal but do not report to it."""
+        import copy
+        import dataclasses
+        import pickle
+
+        model = self._model()
+        egll = model.airports['EGLL']
+        model.clear_changed_airports()
+        for clone in (copy.deepcopy(egll), pickle.loads(pickle.dumps(egll)), dataclasses.replace(egll)):
+            assert type(clone) is Airport
+            assert clone == egll
+            assert '_model' not in clone.__dict__
+            clone.navpoint = NavPoint(10.0, 10.0)  # Does not touch the model
+        assert model.changed_airports() == set()
+        assert model.get_airport_spatial_index().within_radius(lon=10.0, lat=10.0, radius_nm=5) == []
+
+
+class TestLazyQuery:
+    """Test lazy collections built from query plans."""
+
+    def test_lazy_chain_defers_and_fuses(self):
+        """Test filters only run on the terminal, in a single pass."""
+        calls = []
+
+        def tracked(name, predicate):
+            def wrapper(item):
+                calls.append((name, item.ident))
+                return predicate(item)
+            return wrapper
+
+        airports = [
+            Airport(ident="EGLL", iso_country="GB", longest_runway_length_ft=12000),
+            Airport(ident="LFPG", iso_country="FR", longest_runway_length_ft=13000),
+            Airport(ident="LFAT", iso_country="FR", longest_runway_length_ft=2000),
+        ]
+        lazy = AirportCollection(airports).lazy() \
+            .filter(tracked("country", lambda a: a.iso_country == "FR")) \
+            .filter(tracked("length", lambda a: a.longest_runway_length_ft > 5000))
+        assert calls == []
+
+        assert [a.ident for a in lazy.all()] == ["LFPG"]
+        # Each item visits the predicates in turn; failed items stop early
+        assert calls == [
+            ("country", "EGLL"),
+            ("country", "LFPG"), ("length", "LFPG"),
+            ("country", "LFAT"), ("length", "LFAT"),
+        ]
+
+    def test_lazy_first_and_exists_short_circuit(self):
+        """Test first/exists stop at the first match."""
+        seen = []
+        airports = [Airport(ident=f"TST{i}", iso_country="FR") for i in range(5)]
+        lazy = AirportCollection(airports).lazy().filter(
+            lambda a: seen.append(a.ident) or a.iso_country == "FR"
+        )
+
+        assert lazy.first().ident == "TST0"
+        assert seen == ["TST0"]
+        assert lazy.exists()
+        assert seen == ["TST0", "TST0"]
+        assert lazy.where(iso_country="XX").first() is None
+        assert lazy.count() == 5
+        assert len(list(lazy)) == 5
+
+    def test_lazy_matches_eager_on_model(self):
+        """Test lazy model chains push indexed filters down and match eager results."""
+        model = EuroAipModel()
+        model.add_airport(Airport(ident="LFPG", iso_country="FR", has_hard_runway=True,
+                                  longest_runway_length_ft=13000, avgas=True))
+        model.add_airport(Airport(ident="LFAT", iso_country="FR", has_hard_runway=True,
+                                  longest_runway_length_ft=2000, avgas=True))
+        model.add_airport(Airport(ident="EGLL", iso_country="GB", has_hard_runway=True,
+                                  longest_runway_length_ft=12000, avgas=True))
+
+        def chain(collection):
+            return collection.by_country("FR") \
+                             .with_hard_runway() \
+                             .with_min_runway_length(3000) \
+                             .with_fuel(avgas=True)
+
+        lazy = chain(model.airports.lazy())
+        assert repr(lazy._plan) == "QueryPlan(steps=4, indexed=3)"
+        assert [a.ident for a in lazy] == [a.ident for a in chain(model.airports)] == ["LFPG"]
+
+        # Without a model, indexed steps fall back to their predicates
+        plain = chain(AirportCollection(list(model._airports.values())).lazy())
+        assert [a.ident for a in plain.all()] == ["LFPG"]
+
+
 class TestBackwardCompatibility:
     """Test that legacy methods still work with deprecation warnings."""
 
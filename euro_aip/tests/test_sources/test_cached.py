@@ -1,8 +1,13 @@
 import pytest
 from pathlib import Path
 import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pandas as pd
 from euro_aip.sources.cached import CachedSource
+from euro_aip.sources.fetcher import HttpFetcher
 
 class MockSource(CachedSource):
     """Mock implementation of CachedSource for testing."""
@@ -41,4 +46,138 @@ def test_cached_source_force_refresh(test_cache_dir):
     result2 = source.get_data('test', 'json', 'param1')
     
     # Results should be equal but from different fetches
-    assert result1 == result2 
\ No newline at end of file
+    assert result1 == result2 
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """Serves server.body with an ETag, answering 304 when it matches."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = self.server.body
+        etag = f'"{len(body)}-{hash(body)}"'
+        self.server.requests.append(dict(self.headers))
+        if self.server.use_etag and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def etag_server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _ETagHandler)
+    httpd.body = b'<html>AD 2</html>'
+    httpd.requests = []
+    httpd.use_etag = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/page.html"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class UrlSource(CachedSource):
+    """CachedSource fetching one URL and counting how often it parses it."""
+
+    def __init__(self, cache_dir, url):
+        super().__init__(cache_dir)
+        self.url = url
+        self.fetcher = HttpFetcher(requests_per_second=None, retries=0)
+        self.parses = 0
+
+    def page(self):
+        cache_file = self.cache_path / 'page.html'
+        content = self._fetch_url(self.url, cache_file, max_age_days=7)
+        return self._parse_cached(cache_file, 'words', lambda: self._parse(content))
+
+    def _parse(self, content):
+        self.parses += 1
+        return content.decode().split()
+
+
+def _expire(source):
+    old = time.time() - 30 * 86400
+    os.utime(source.cache_path / 'page.html', (old, old))
+
+
+def test_expired_cache_is_revalidated(test_cache_dir, etag_server):
+    """An expired entry sends If-None-Match and keeps its file and parse on 304."""
+    source = UrlSource(str(test_cache_dir), etag_server.url)
+    assert source.page() == ['<html>AD', '2</html>']
+
+    # Fresh: no request at all
+    source.page()
+    assert len(etag_server.requests) == 1
+
+    _expire(source)
+    assert source.page() == ['<html>AD', '2</html>']
+    assert 'If-None-Match' in etag_server.requests[-1]
+    assert source.parses == 1
+    # The fresh re-read in the same run is not a hit
+    assert source.cache_stats.to_dict() == {
+        'hits': 0, 'misses': 1, 'revalidated': 1, 'unchanged': 0, 'changed': 0, 'parse_skipped': 2,
+    }
+
+
+def test_changed_content_is_parsed_again(test_cache_dir, etag_server):
+    """A refetch parses again only when the content hash changed."""
+    source = UrlSource(str(test_cache_dir), etag_server.url)
+    source.page()
+
+    # Server ignores the ETag but serves the same bytes
+    etag_server.use_etag = False
+    _expire(source)
+    source.page()
+    assert len(etag_server.requests) == 2
+    assert source.parses == 1
+
+    etag_server.body = b'<html>AD 2 updated</html>'
+    _expire(source)
+    assert source.page()[-1] == 'updated</html>'
+    assert source.parses == 2
+    assert source.cache_stats.unchanged == 1 and source.cache_stats.changed == 1
+
+
+def test_cache_manifest_records_runs(test_cache_dir, etag_server):
+    """write_cache_manifest appends one entry per run and resets the counts."""
+    source = UrlSource(str(test_cache_dir), etag_server.url)
+    source.page()
+    source.write_cache_manifest()
+    source.page()
+    manifest_file = source.write_cache_manifest()
+
+    runs = json.loads(manifest_file.read_text())['runs']
+    assert [(run['misses'], run['hits']) for run in runs] == [(1, 0), (0, 1)]
+    assert source.cache_stats.hits == 0
+
+
+def test_rereads_count_once_per_run(test_cache_dir, etag_server):
+    """A page prefetched and read again by each parser is one miss; the next run counts one hit."""
+    source = UrlSource(str(test_cache_dir), etag_server.url)
+    for _ in range(3):
+        source.page()
+    assert (source.cache_stats.misses, source.cache_stats.hits) == (1, 0)
+
+    source.write_cache_manifest()
+    for _ in range(3):
+        source.page()
+    assert (source.cache_stats.misses, source.cache_stats.hits) == (0, 1)
+    assert len(etag_server.requests) == 1
+
+
+def test_get_data_records_content_hash(test_cache_dir):
+    """get_data keeps a content hash for each cached file."""
+    source = MockSource(str(test_cache_dir))
+    source.get_data('test', 'json', 'param1')
+    source.set_force_refresh()
+    source.get_data('test', 'json', 'param1')
+
+    meta = source._read_cache_meta(source._get_cache_file('test_param1', 'json'))
+    assert len(meta['sha256']) == 64
+    assert source.cache_stats.misses == 1 and source.cache_stats.unchanged == 1
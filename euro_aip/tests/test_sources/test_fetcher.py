@@ -0,0 +1,156 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from euro_aip.models import EuroAipModel
+from euro_aip.sources.fetcher import HttpFetcher
+from euro_aip.sources.opennav import OpenNavSource
+
+OPENNAV_PAGE = (
+    '<table><tr><td><a href="/waypoint/{c}/ABCDE">ABCDE</a></td><td class="layout_col50">&nbsp;</td>'
+    '<td>48°51\'24"N</td><td>&nbsp;</td><td>002°21\'08"E</td></tr></table>'
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves the paths the tests ask for and records what it saw."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            hits = server.hits[self.path]
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            if self.path.startswith('/flaky') and hits <= 2:
+                self.send_response(503)
+                self.send_header('Retry-After', '0')
+                self.end_headers()
+            elif self.path.startswith('/missing'):
+                self.send_response(404)
+                self.end_headers()
+            elif self.path.startswith('/waypoint/'):
+                body = OPENNAV_PAGE.format(c=self.path.rsplit('/', 1)[-1]).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            else:
+                body = self.path.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.lock = threading.Lock()
+    httpd.hits = {}
+    httpd.in_flight = 0
+    httpd.max_in_flight = 0
+    httpd.delay = 0.0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHttpFetcher:
+    """Test the shared fetch layer against a local HTTP server."""
+
+    def test_map_keeps_order_and_caps_per_host(self, server):
+        server.delay = 0.05
+        fetcher = HttpFetcher(max_workers=8, max_per_host=3, requests_per_second=None)
+        urls = [f"{server.url}/page/{i}" for i in range(12)]
+
+        pages = fetcher.map(fetcher.fetch, urls)
+
+        assert pages == [f"/page/{i}".encode() for i in range(12)]
+        assert 1 < server.max_in_flight <= 3
+        fetcher.close()
+
+    def test_map_reuses_threads_and_sessions(self, server):
+        fetcher = HttpFetcher(max_workers=4, requests_per_second=None)
+        for i in range(50):
+            fetcher.map(fetcher.fetch, [f"{server.url}/again/{i}/{j}" for j in range(4)])
+        assert len(fetcher._sessions) <= 4
+
+        # A session is closed once its thread has exited
+        caller = threading.Thread(target=fetcher.fetch, args=(f"{server.url}/caller",))
+        caller.start()
+        caller.join()
+        assert caller in fetcher._sessions
+        fetcher.fetch(f"{server.url}/main")
+        assert caller not in fetcher._sessions
+        assert all(thread.is_alive() for thread in fetcher._sessions)
+
+        fetcher.close()
+        assert fetcher._sessions == {}
+        assert fetcher.map(fetcher.fetch, [f"{server.url}/reopened/{i}" for i in range(3)]) == \
+            [f"/reopened/{i}".encode() for i in range(3)]
+        fetcher.close()
+
+    def test_nested_map_runs_inline(self, server):
+        fetcher = HttpFetcher(max_workers=2, requests_per_second=None)
+
+        def pages(group):
+            return fetcher.map(fetcher.fetch, [f"{server.url}/nested/{group}/{i}" for i in range(3)])
+
+        assert fetcher.map(pages, [0, 1, 2]) == \
+            [[f"/nested/{group}/{i}".encode() for i in range(3)] for group in range(3)]
+        fetcher.close()
+
+    def test_retries_with_backoff(self, server):
+        fetcher = HttpFetcher(retries=3, backoff=0.01, requests_per_second=None)
+
+        assert fetcher.fetch(f"{server.url}/flaky") == b'/flaky'
+        assert server.hits['/flaky'] == 3
+
+    def test_gives_up_after_retries(self, server):
+        fetcher = HttpFetcher(retries=1, backoff=0.01, requests_per_second=None)
+
+        assert fetcher.get(f"{server.url}/flaky").status_code == 503
+        assert server.hits['/flaky'] == 2
+
+    def test_client_errors_are_not_retried(self, server):
+        fetcher = HttpFetcher(retries=3, backoff=0.01, requests_per_second=None)
+
+        with pytest.raises(requests.HTTPError):
+            fetcher.fetch(f"{server.url}/missing")
+        assert server.hits['/missing'] == 1
+
+    def test_rate_limit_per_host(self, server):
+        fetcher = HttpFetcher(max_workers=4, rate_limits={'127.0.0.1': 20})
+        start = time.monotonic()
+        fetcher.map(fetcher.fetch, [f"{server.url}/rate/{i}" for i in range(6)])
+
+        # Six requests at 20/s are spread over at least 0.25s
+        assert time.monotonic() - start >= 0.25
+
+    def test_opennav_fetches_countries_through_fetcher(self, server, tmp_path, monkeypatch):
+        monkeypatch.setattr('euro_aip.sources.opennav.BASE_URL', f"{server.url}/waypoint")
+        fetcher = HttpFetcher(max_workers=4, requests_per_second=None)
+        source = OpenNavSource(str(tmp_path), countries=['FR', 'DE', 'UK'], fetcher=fetcher)
+
+        model = EuroAipModel()
+        source.update_model(model)
+
+        waypoints = source.get_waypoints()
+        assert [w.source_id for w in waypoints] == ['opennav:FR', 'opennav:DE', 'opennav:UK']
+        # Second call is served from the cache
+        assert all(count == 1 for count in server.hits.values())
@@ -0,0 +1,123 @@
+import os
+
+from euro_aip.models import EuroAipModel
+from euro_aip.sources import AutorouterSource, FranceEAIPSource, IngestReport
+from euro_aip.sources.parallel import parse_airports
+
+
+class StubFranceSource(FranceEAIPSource):
+    """France eAIP source parsing generated data instead of PDFs."""
+
+    def fetch_airport_aip(self, icao: str) -> dict:
+        if icao == 'LFXX':
+            raise FileNotFoundError(f"No airport PDF found for {icao}")
+        if icao == 'LFER':
+            raise ValueError("table extraction failed")
+        return {'icao': icao, 'authority': 'LFC', 'parsed_data': [
+            {'section': 'admin', 'field': 'Fuel and oil types', 'value': f'AVGAS {icao}'},
+            {'section': 'admin', 'field': 'pid', 'value': str(os.getpid())},
+        ]}
+
+    def fetch_procedures(self, icao: str) -> list:
+        if icao == 'LFKO':
+            os._exit(1)  # A worker killed by a crash in the PDF stack
+        if icao == 'LFPR':
+            raise ValueError("procedure table failed")
+        return [{'name': f'RNP 09 {icao}', 'type': 'approach', 'approach_type': 'RNP', 'runway_ident': '09'}]
+
+
+class StubAutorouterSource(AutorouterSource):
+    """Autorouter source returning generated documents instead of downloading them."""
+
+    def fetch_airport_aip(self, icao: str) -> dict:
+        if icao == 'EGNO':
+            raise FileNotFoundError(f"No AIP document for {icao}")
+        return {'icao': icao, 'parsed_data': [
+            {'section': 'admin', 'field': 'Fuel and oil types', 'value': f'AVGAS {icao}'},
+        ]}
+
+    def get_procedures(self, icao: str) -> list:
+        if icao == 'EGKB':
+            raise ValueError("procedures download failed")
+        return [{'type': 'approach', 'heading': 'RNP RWY 21'}]
+
+
+AIRPORTS = ['LFPO', 'LFXX', 'LFPG', 'LFER', 'LFMN', 'LFLL']
+
+
+def _snapshot(model):
+    return [(a.ident, [(e.field, e.value) for e in a.aip_entries if e.field != 'pid'],
+             [p.name for p in a.procedures]) for a in model.airports]
+
+
+class TestParallelIngestion:
+    """Test parsing airports in worker processes and merging them in order."""
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        """Workers give the same model, in the same order, as the sequential run."""
+        sequential, parallel = EuroAipModel(), EuroAipModel()
+        StubFranceSource(str(tmp_path / 'seq'), str(tmp_path)).update_model(sequential, AIRPORTS)
+        report = StubFranceSource(str(tmp_path / 'par'), str(tmp_path)).update_model(
+            parallel, AIRPORTS, workers=3)
+
+        assert _snapshot(parallel) == _snapshot(sequential)
+        assert [a.ident for a in parallel.airports] == AIRPORTS
+        assert parallel.airports['LFPG'].procedures[0].approach_type == 'RNP'
+        # The parsing really happened in other processes
+        pids = {e.value for a in parallel.airports for e in a.aip_entries if e.field == 'pid'}
+        assert pids and str(os.getpid()) not in pids
+
+        assert isinstance(report, IngestReport)
+        assert report.workers == 3
+        assert [r.icao for r in report.results] == AIRPORTS
+        assert [r.icao for r in report.missing] == ['LFXX']
+        assert [(r.icao, r.error) for r in report.failed] == [('LFER', 'table extraction failed')]
+        assert all(r.seconds > 0 for r in report.results)
+        assert report.parse_seconds > 0 and report.seconds > 0
+
+    def test_failed_airports_are_left_empty(self, tmp_path):
+        """Missing and failing airports are still added, without data, as before."""
+        model = EuroAipModel()
+        report = StubFranceSource(str(tmp_path / 'cache'), str(tmp_path)).update_model(model, ['LFER', 'LFXX'])
+        assert report.workers == 1
+        assert not model.airports['LFER'].aip_entries and not model.airports['LFXX'].procedures
+
+    def test_parse_airports_keeps_order(self, tmp_path):
+        source = StubFranceSource(str(tmp_path / 'cache'), str(tmp_path))
+        results = list(parse_airports(source, AIRPORTS, workers=2))
+        assert [r.icao for r in results] == AIRPORTS
+        assert [r.ok for r in results] == [True, False, True, False, True, True]
+
+    def test_failed_part_keeps_the_others(self, tmp_path):
+        """An airport whose procedures fail still gets its AIP data, and the error is reported."""
+        model = EuroAipModel()
+        report = StubFranceSource(str(tmp_path / 'cache'), str(tmp_path)).update_model(model, ['LFPR', 'LFPG'])
+        lfpr = model.airports['LFPR']
+        assert [e.value for e in lfpr.aip_entries if e.field != 'pid'] == ['AVGAS LFPR']
+        assert 'france_eaip' in lfpr.sources and not lfpr.procedures
+        assert [(r.icao, r.error) for r in report.failed] == [('LFPR', 'procedures: procedure table failed')]
+        assert report.missing == []
+
+    def test_autorouter_parts_fail_separately(self, tmp_path):
+        """Autorouter keeps each part that parsed; a missing document is an error, not a missing airport."""
+        model = EuroAipModel()
+        report = StubAutorouterSource(str(tmp_path)).update_model(model, ['EGKB', 'EGNO'])
+        assert [e.value for e in model.airports['EGKB'].aip_entries] == ['AVGAS EGKB']
+        assert not model.airports['EGKB'].procedures
+        assert not model.airports['EGNO'].aip_entries and len(model.airports['EGNO'].procedures) == 1
+        assert [(r.icao, r.error) for r in report.failed] == [
+            ('EGKB', 'procedures: procedures download failed'),
+            ('EGNO', 'aip: No AIP document for EGNO'),
+        ]
+        assert report.missing == []
+
+    def test_dead_worker_fails_only_its_airport(self, tmp_path):
+        """A worker process dying fails the airport it was parsing; the others are parsed and merged."""
+        model = EuroAipModel()
+        airports = ['LFPO', 'LFPG', 'LFKO', 'LFMN', 'LFLL', 'LFBO']
+        report = StubFranceSource(str(tmp_path / 'cache'), str(tmp_path)).update_model(model, airports, workers=2)
+
+        assert [r.icao for r in report.results] == airports
+        assert [r.icao for r in report.failed] == ['LFKO']
+        assert report.failed[0].error.startswith('worker process died')
+        assert [a.ident for a in model.airports if a.procedures] == ['LFPO', 'LFPG', 'LFMN', 'LFLL', 'LFBO']
@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
 
+import copy
+import pickle
+import sqlite3
+import threading
 import pytest
 import tempfile
 import shutil
@@ -8,7 +12,7 @@ from datetime import datetime
 import json
 
 from euro_aip.storage import DatabaseStorage
-from euro_aip.models import EuroAipModel, Airport, Runway, Procedure, AIPEntry
+from euro_aip.models import EuroAipModel, Airport, Runway, Procedure, AIPEntry, BorderCrossingEntry
 from euro_aip.utils.field_standardization_service import FieldStandardizationService
 from euro_aip.sources.worldairports import WorldAirportsSource
 
@@ -257,7 +261,135 @@ class TestDatabaseStorage:
         if elevation_change['old_value'] is not None:
             assert elevation_change['old_value'] == '13.0'
         assert elevation_change['new_value'] == '20.0'
-    
+
+    def test_change_tracking_across_airports_in_one_save(self, storage, sample_model):
+        """Changes to several airports and tables in one save are all recorded."""
+        storage.save_model(sample_model)
+
+        sample_model.airports['EBOS'].runways[0].length_ft = 10000
+        sample_model.airports['EGKB'].name = 'Biggin Hill'
+        sample_model.airports['EGKB'].aip_entries[0].value = 'AVGAS'
+        storage.save_model(sample_model)
+
+        ebos = storage.get_changes_for_airport('EBOS', days=1)
+        egkb = storage.get_changes_for_airport('EGKB', days=1)
+        assert [(c['field_name'], c['new_value']) for c in ebos['runways']] == [('length_ft', '10000.0')]
+        assert ebos['airport'] == [] and ebos['aip_entries'] == []
+        assert [(c['field_name'], c['new_value']) for c in egkb['airport']] == [('name', 'Biggin Hill')]
+        assert [(c['old_value'], c['new_value']) for c in egkb['aip_entries']] == [('AVGAS, Jet A-1', 'AVGAS')]
+
+        # Updated in place rather than duplicated
+        loaded = storage.load_model()
+        assert len(loaded.airports['EBOS'].runways) == 1
+        assert loaded.airports['EBOS'].runways[0].length_ft == 10000
+        assert len(loaded.airports['EGKB'].aip_entries) == 1
+
+    def test_change_history(self, storage, sample_model):
+        """Change history can be filtered by AIRAC cycle, country, field and paged by id."""
+        storage.save_model(sample_model)
+        storage.airac_date = '2026-09-04'
+        sample_model.airports['EBOS'].name = 'Ostend'
+        sample_model.airports['EGKB'].name = 'Biggin Hill'
+        biggin_hill = BorderCrossingEntry(airport_name='Biggin Hill', country_iso='GB',
+                                          icao_code='EGKB', source='uk_gen')
+        sample_model.add_border_crossing_entry(biggin_hill)
+        storage.save_model(sample_model)
+        storage.airac_date = '2026-10-02'
+        sample_model.airports['EBOS'].elevation_ft = 20
+        sample_model.airports['EGKB'].runways[0].length_ft = 6000
+        sample_model.airports['EGKB'].aip_entries[0].value = 'AVGAS'
+        storage.save_model(sample_model)
+        storage.save_border_crossing_data([biggin_hill, BorderCrossingEntry(
+            airport_name='Heathrow', country_iso='GB', icao_code='EGLL', source='uk_gen')])
+
+        october_gb = storage.iter_change_history(airac_date='2026-10-02', country='gb')
+        assert [(c['table'], c.get('airport_icao') or c.get('icao_code')) for c in october_gb] == [
+            ('runways', 'EGKB'), ('aip_entries', 'EGKB'), ('border_crossing_points', 'EGLL')]
+        september = storage.get_change_history('airports', airac_date='2026-09-04')
+        assert [(c['airport_icao'], c['new_value']) for c in september] == [('EBOS', 'Ostend'), ('EGKB', 'Biggin Hill')]
+        assert [c['airport_icao'] for c in storage.get_change_history('airports', field='elevation_ft')] == ['EBOS']
+        assert storage.get_change_history('airports', airac_date='2026-10-02', ident='EGKB') == []
+
+        # Keyset pagination returns every change once
+        pages, after_id = [], 0
+        while True:
+            page = storage.get_change_history('airports', after_id=after_id, limit=1)
+            if not page:
+                break
+            pages.extend(page)
+            after_id = page[-1]['id']
+        assert pages == storage.get_change_history('airports') and len(pages) == 3
+        assert list(storage.iter_change_history(page_size=1)) == list(storage.iter_change_history())
+
+        with pytest.raises(ValueError):
+            storage.get_change_history('waypoints', country='FR')
+        with pytest.raises(ValueError):
+            storage.get_change_history('metars')
+
+    def test_change_history_migration(self, temp_db_path):
+        """Opening an older database adds the change history indexes and columns."""
+        DatabaseStorage(temp_db_path).close()
+        conn = sqlite3.connect(temp_db_path)
+        for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type='index' AND name LIKE '%_airac'").fetchall():
+            conn.execute(f'DROP INDEX {name}')
+        conn.execute('ALTER TABLE border_crossing_points_changes DROP COLUMN airac_date')
+        conn.close()
+
+        storage = DatabaseStorage(temp_db_path)
+        with storage._get_connection(write=False) as conn:
+            indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+            columns = [row[1] for row in conn.execute('PRAGMA table_info(border_crossing_points_changes)')]
+        assert {f'idx_{table}_airac' for table in storage._CHANGE_HISTORY_INDEXES} <= indexes
+        assert 'airac_date' in columns
+
+    def test_connection_pragmas(self, temp_db_path):
+        """journal_mode and synchronous are applied to the writer connection."""
+        storage = DatabaseStorage(temp_db_path, journal_mode='wal', synchronous='normal')
+        with storage._get_connection() as conn:
+            assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+            assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+
+        with pytest.raises(ValueError):
+            DatabaseStorage(temp_db_path, journal_mode='wal; DROP TABLE airports')
+        with pytest.raises(ValueError):
+            DatabaseStorage(temp_db_path, pragmas={'cache_size': '1; DROP TABLE airports'})
+
+    def test_connection_pool(self, temp_db_path, sample_model):
+        """Connections are reused: one writer, one read-only connection per thread."""
+        storage = DatabaseStorage(temp_db_path, journal_mode='wal', pragmas={'cache_size': -1000})
+        with storage._get_connection() as writer, storage._get_connection() as nested:
+            assert nested is writer
+        with storage._get_connection(write=False) as reader:
+            assert reader is not writer
+            assert reader.execute('PRAGMA cache_size').fetchone()[0] == -1000
+            assert reader.execute('PRAGMA temp_store').fetchone()[0] == 2  # MEMORY
+            with pytest.raises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM airports")
+        with storage._get_connection(write=False) as again:
+            assert again is reader
+
+        other = []
+        def read():
+            with storage._get_connection(write=False) as conn:
+                other.append((conn, conn.execute('SELECT COUNT(*) FROM airports').fetchone()[0]))
+        storage.save_model(sample_model)
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+        assert other[0][0] is not reader
+        assert other[0][1] == 2  # committed writes are visible to readers
+
+        # Changes left uncommitted are rolled back when the connection is released
+        with storage._get_connection() as conn:
+            conn.execute("DELETE FROM airports")
+        assert storage.get_database_info()['tables']['airports'] == 2
+
+        storage.close()
+        with storage._get_connection(write=False) as reopened:
+            assert reopened is not reader
+        copied = pickle.loads(pickle.dumps(storage))
+        assert copied.load_model().airports.count() == 2
+
     def test_procedure_change_tracking(self, storage, sample_model):
         """Test that procedure changes are tracked at the procedure level (ADDED/REMOVED)."""
         # Save initial model (EGKB has one procedure: 'ILS 03')
@@ -370,6 +502,252 @@ class TestDatabaseStorage:
         assert len(model.airports) == 0
         assert len(model.sources_used) == 0
 
+    def test_bulk_load_matches_per_airport_load(self, storage, sample_model):
+        """Loading all tables in bulk gives the same airports as per-airport queries."""
+        ebos = sample_model.airports['EBOS']
+        ebos.add_aip_entry(AIPEntry(ident='EBOS', section='admin', field='Customs', value='H24', std_field_id=302, source='ukeaip'))
+        # Same section/field from another source: stored as a separate row, merged on load
+        ebos.aip_entries.append(AIPEntry(ident='EBOS', section='admin', field='Customs', value='O/R', std_field_id=302, source='beaip'))
+        storage.save_model(sample_model)
+
+        def snapshot(airport):
+            data = airport.to_dict()
+            for key in ('created_at', 'updated_at'):
+                data.pop(key, None)
+            for child in ('runways', 'procedures', 'aip_entries'):
+                data[child] = [
+                    {k: v for k, v in item.items() if k not in ('created_at', 'updated_at')}
+                    for item in data.get(child, [])
+                ]
+            data['sources'] = sorted(data['sources'])
+            return data
+
+        with storage._get_connection() as conn:
+            bulk = storage._load_airports(conn)
+            single = [storage._load_airport(conn, airport.ident) for airport in bulk]
+
+        assert [a.ident for a in bulk] == ['EBOS', 'EGKB']
+        assert [snapshot(a) for a in bulk] == [snapshot(a) for a in single]
+        customs = [e for e in bulk[0].aip_entries if e.field == 'Customs']
+        assert len(customs) == 1
+
+    def test_load_model_include_and_filters(self, storage, sample_model):
+        """load_model can skip relationships and filter airports by country or bbox."""
+        storage.save_model(sample_model)
+
+        model = storage.load_model(include={'runways'})
+        egkb = model.airports['EGKB']
+        assert len(egkb.runways) == 1
+        assert egkb.procedures == []
+        assert egkb.aip_entries == []
+
+        assert [a.ident for a in storage.load_model(countries=['gb']).airports] == ['EGKB']
+        assert [a.ident for a in storage.load_model(bbox=(2.0, 50.0, 4.0, 52.0)).airports] == ['EBOS']
+        assert storage.load_model(countries=['GB'], bbox=(2.0, 50.0, 4.0, 52.0)).airports.count() == 0
+
+        with pytest.raises(ValueError):
+            storage.load_model(include={'notams'})
+
+    def test_load_model_lazy_relationships(self, storage, sample_model):
+        """Lazy relationships load on first access and match an eager load."""
+        storage.save_model(sample_model)
+        eager = storage.load_model()
+        lazy = storage.load_model(lazy=True)
+
+        egkb = lazy.airports['EGKB']
+        assert not egkb.is_loaded('procedures')
+        assert not egkb.is_loaded('aip_entries')
+        # Fuel fields are derived at load time without loading the entries
+        assert (egkb.avgas, egkb.jet_a) == (eager.airports['EGKB'].avgas, eager.airports['EGKB'].jet_a)
+        assert not egkb.is_loaded('aip_entries')
+
+        assert [p.name for p in egkb.procedures] == ['ILS 03']
+        assert egkb.is_loaded('procedures')
+        assert [e.value for e in egkb.aip_entries] == [e.value for e in eager.airports['EGKB'].aip_entries]
+
+        # Copies share the loader and still load on access
+        ebos = copy.deepcopy(lazy.airports['EBOS'])
+        assert not ebos.is_loaded('aip_entries')
+        assert len(ebos.aip_entries) == len(eager.airports['EBOS'].aip_entries)
+
+    def test_save_partial_model_keeps_unloaded_parts(self, storage, sample_model):
+        """Saving a model loaded with include or countries leaves what it did not load alone."""
+        storage.save_model(sample_model)
+        eager = storage.load_model()
+
+        partial = storage.load_model(include={'runways'}, countries=['GB'])
+        partial.airports['EGKB'].name = 'Biggin Hill'
+        partial.add_airport(Airport(ident='EGLL', name='Heathrow', iso_country='GB',
+                                    procedures=[Procedure(name='ILS 27L', procedure_type='approach')]))
+        storage.save_model(partial)
+
+        model = storage.load_model()
+        assert model.airports['EGKB'].name == 'Biggin Hill'
+        assert [p.name for p in model.airports['EGKB'].procedures] == ['ILS 03']
+        assert len(model.airports['EGKB'].aip_entries) == len(eager.airports['EGKB'].aip_entries)
+        # A new airport is saved with everything it has
+        assert [p.name for p in model.airports['EGLL'].procedures] == ['ILS 27L']
+        assert self._table_rows(storage, 'procedures_changes') == []
+        # The statistics still describe the full save, not the partial model
+        with storage._get_connection() as conn:
+            stats = json.loads(conn.execute(
+                "SELECT value FROM model_metadata WHERE key = 'statistics'").fetchone()[0])
+        assert stats['total_procedures'] == eager.get_statistics()['total_procedures']
+
+    def test_save_lazy_model_loads_deferred_in_bulk(self, storage, sample_model, monkeypatch):
+        """Saving a lazy model reads its deferred relationships in one scan, not per airport."""
+        from euro_aip.storage.database_storage import AirportRelationshipLoader
+        storage.save_model(sample_model)
+        procedures = self._table_rows(storage, 'procedures')
+        lazy = storage.load_model(lazy=True)
+
+        def per_airport(loader, airport, name):
+            raise AssertionError(f'{airport.ident} {name} loaded on its own')
+        monkeypatch.setattr(AirportRelationshipLoader, 'load', per_airport)
+        lazy.airports['EBOS'].name = 'Ostend'
+        storage.save_model(lazy)
+
+        assert lazy.airports['EGKB'].is_loaded('procedures')
+        assert self._table_rows(storage, 'procedures') == procedures
+        assert self._table_rows(storage, 'procedures_changes') == []
+        assert storage.load_model().airports['EBOS'].name == 'Ostend'
+
+    @staticmethod
+    def _table_rows(storage, table, skip=('id', 'created_at', 'updated_at', 'changed_at')):
+        """Rows of a table without ids and timestamps, for comparing databases."""
+        with storage._get_connection() as conn:
+            rows = [{k: v for k, v in dict(row).items() if k not in skip} for row in conn.execute(f'SELECT * FROM {table}')]
+        return sorted(rows, key=lambda row: json.dumps(row, sort_keys=True, default=str))
+
+    def test_model_tracks_changed_airports(self, storage, sample_model):
+        """Airports added or changed through the model are recorded until saved or loaded."""
+        assert sample_model.changed_airports() == {'EBOS', 'EGKB'}
+        storage.save_model(sample_model)
+        assert sample_model.changed_airports() == set()
+
+        model = storage.load_model()
+        assert model.changed_airports() == set()
+        model.add_airport(Airport(ident='EGKB', name='Biggin Hill'))
+        model.bulk_add_procedures({'EBOS': [Procedure(name='VOR 26', procedure_type='approach')]})
+        assert model.changed_airports() == {'EGKB', 'EBOS'}
+        with pytest.raises(RuntimeError):
+            with model.transaction() as txn:
+                txn.add_airport(Airport(ident='LFPG', name='Charles de Gaulle'))
+                raise RuntimeError('rollback')
+        assert model.changed_airports() == {'EGKB', 'EBOS'}
+
+    def test_model_tracks_airports_updated_in_place(self, storage, sample_model):
+        """Airports updated directly, the way sources do, are recorded and saved."""
+        storage.save_model(sample_model)
+        model = storage.load_model()
+        egkb = model.airports['EGKB']
+        loaded_at = egkb.updated_at
+
+        # UK eAIP web style: entries and the source added to the held airport
+        egkb.add_aip_entries([AIPEntry(ident='EGKB', section='admin', field='Remarks',
+                                       value='PPR', source='uk_eaip_html')])
+        egkb.add_source('uk_eaip_html')
+        assert model.changed_airports() == {'EGKB'}
+        assert egkb.updated_at > loaded_at
+        assert storage.save_airports(model) == 1
+        assert model.changed_airports() == set()
+        assert 'uk_eaip_html' in storage.load_model().airports['EGKB'].sources
+
+        model.airports['EBOS'].add_procedure(Procedure(name='RNP 08', procedure_type='approach'))
+        model.airports['EBOS'].point_of_entry = True
+        assert model.changed_airports() == {'EBOS'}
+        # The country is selected from the model's airports, not a cached view
+        assert storage.save_country(model, 'be') == 1
+        assert [p.name for p in storage.load_model().airports['EBOS'].procedures if p.name == 'RNP 08'] == ['RNP 08']
+
+    def test_save_airports_matches_full_save(self, temp_db_path, sample_model, tmp_path):
+        """Saving only the changed airports writes the same rows and history as save_model."""
+        full = DatabaseStorage(str(tmp_path / 'full.db'))
+        incremental = DatabaseStorage(temp_db_path)
+        for storage in (full, incremental):
+            storage.save_model(sample_model)
+
+        model = incremental.load_model()
+        egkb = model.airports['EGKB']
+        egkb.name = 'Biggin Hill'
+        egkb.runways[0].length_ft = 6000
+        egkb.aip_entries[0].value = 'AVGAS'
+        egkb.procedures.append(Procedure(name='RNP 21', procedure_type='approach', runway_ident='21'))
+        model.mark_airport_changed('EGKB')
+
+        assert incremental.save_airports(model) == 1
+        assert model.changed_airports() == set()
+        assert incremental.save_airports(model) == 0
+        full.save_model(model)
+
+        for table in ('airports', 'runways', 'procedures', 'aip_entries', 'airports_changes',
+                      'runways_changes', 'procedures_changes', 'aip_entries_changes'):
+            assert self._table_rows(incremental, table) == self._table_rows(full, table), table
+        changes = incremental.get_changes_for_airport('EGKB')
+        assert {c['field_name'] for c in changes['airport']} == {'name'}
+        assert incremental.get_changes_for_airport('EBOS')['airport'] == []
+
+    def test_save_airports_selection(self, storage, sample_model):
+        """Airports to save can be given by ident, by update time or by country."""
+        storage.save_model(sample_model)
+        fingerprint = storage.model_fingerprint()
+        model = storage.load_model()
+        marker = datetime.now()
+
+        model.airports['EBOS'].name = 'Ostend'
+        assert storage.save_airports(model, idents=['EBOS', 'XXXX']) == 1
+        assert storage.load_model().airports['EBOS'].name == 'Ostend'
+        # Snapshots written before the save are stale
+        assert storage.model_fingerprint() != fingerprint
+
+        model.add_airport(Airport(ident='EGKB', name='Biggin Hill'))
+        assert storage.save_airports(model, since=marker) == 1
+        assert storage.save_country(model, 'gb') == 1
+        assert storage.load_model().airports['EGKB'].name == 'Biggin Hill'
+
+    def test_save_airports_country_coverage(self, storage, sample_model):
+        """An incremental save with an AIRAC date only refreshes the saved countries."""
+        storage.save_model(sample_model)
+        storage.airac_date = '2026-03-19'
+        model = storage.load_model()
+        model.add_aip_entries_to_airport('EGKB', [AIPEntry(ident='EGKB', section='handling', field='Fuel and oil types',
+                                                           value='AVGAS', std_field_id=402, source='ukeaip')])
+        storage.save_airports(model)
+        assert [row['country_iso'] for row in storage.get_country_coverage()] == ['GB']
+        assert {row['source'] for row in storage.get_airac_updates()} == {'worldairports', 'ukeaip'}
+
+    def test_save_country_adds_to_airac_update(self, storage, sample_model):
+        """A per-country save adds to the cycle's airac_updates row instead of replacing it."""
+        storage.airac_date = '2026-03-19'
+        storage.save_model(sample_model)
+        full = {row['source']: row for row in storage.get_airac_updates()}
+        assert full['worldairports']['airports_updated'] == 2
+
+        sample_model.airports['EGKB'].name = 'Biggin Hill'
+        assert storage.save_country(sample_model, 'GB') == 1
+        rows = {row['source']: row for row in storage.get_airac_updates()}
+        assert len(storage.get_airac_updates()) == len(full)
+        assert rows['worldairports']['airports_updated'] == 3
+        assert rows['worldairports']['changes_count'] == full['worldairports']['changes_count'] + 1
+
+    def test_load_country(self, storage, sample_model):
+        """load_country replaces one country's airports and leaves the others alone."""
+        storage.save_model(sample_model)
+        model = storage.load_model()
+        ebos = model.airports['EBOS']
+        model.add_airport(Airport(ident='EGKB', name='Unsaved', iso_country='GB'))
+        model.add_airport(Airport(ident='EGLL', name='Heathrow', iso_country='GB'))
+
+        assert storage.load_country(model, 'gb') == 1
+        assert [a.ident for a in model.airports.by_country('GB')] == ['EGKB']
+        egkb = model.airports['EGKB']
+        assert egkb.name == 'London Biggin Hill Airport'
+        assert [p.name for p in egkb.procedures] == ['ILS 03']
+        assert egkb.avgas is True
+        assert model.airports['EBOS'] is ebos
+        # EGLL was only in memory; it stays marked as changed
+        assert model.changed_airports() == {'EGLL'}
+
     def test_country_coverage_with_airac(self, storage, sample_model):
         """Test that saving with airac_date records per-country AIP coverage."""
         storage.airac_date = "2026-03-19"
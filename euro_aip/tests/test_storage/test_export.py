@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import csv
+import json
+
+import pytest
+
+from euro_aip.models import EuroAipModel, Airport, Runway, Procedure, Waypoint
+from euro_aip.models.fir import FIR
+from euro_aip.storage import DatabaseStorage, ModelExporter
+from euro_aip.storage.export import LAYER_COLUMNS
+
+
+@pytest.fixture
+def model():
+    """A small model with every exported layer."""
+    model = EuroAipModel()
+    egkb = Airport(ident='EGKB', name='Biggin Hill', type='medium_airport', iso_country='GB',
+                   latitude_deg=51.3308, longitude_deg=0.0325, elevation_ft=598)
+    egkb.add_source('worldairports')
+    egkb.add_runway(Runway(airport_ident='EGKB', le_ident='03', he_ident='21', length_ft=5925,
+                           surface='ASP', lighted=True, closed=False,
+                           le_latitude_deg=51.3236, le_longitude_deg=0.0271,
+                           he_latitude_deg=51.3383, he_longitude_deg=0.0381))
+    egkb.add_procedure(Procedure(name='ILS 03', procedure_type='approach', approach_type='ILS',
+                                 runway_ident='03', source='uk_eaip'))
+    model.add_airport(egkb)
+    lfpg = Airport(ident='LFPG', name='Charles de Gaulle', iso_country='FR',
+                   latitude_deg=49.0097, longitude_deg=2.5479)
+    lfpg.add_runway(Runway(airport_ident='LFPG', le_ident='09L', he_ident='27R', length_ft=8858))
+    model.add_airport(lfpg)
+    model.add_airport(Airport(ident='XXXX', name='No country'))
+    model.bulk_add_waypoints([
+        Waypoint(name='BILGO', latitude_deg=48.5, longitude_deg=2.3, point_type='5LNC', source_id='fra:LFFF'),
+    ])
+    model.add_fir(FIR(icao='LFFF', name='Paris', polygons=[
+        [[[0.0, 45.0], [5.0, 45.0], [5.0, 50.0], [0.0, 45.0]]],
+    ]))
+    return model
+
+
+@pytest.fixture
+def storage(model, tmp_path):
+    storage = DatabaseStorage(str(tmp_path / 'model.db'))
+    storage.save_model(model)
+    return storage
+
+
+class TestModelExporter:
+    """Test streaming exports from a model and from the database."""
+
+    def test_database_rows_match_model(self, model, storage, monkeypatch):
+        """Rows read straight from the database are the same as from the loaded model."""
+        loaded = storage.load_model()
+        monkeypatch.setattr(storage, 'load_model', lambda *args, **kwargs: pytest.fail('model loaded'))
+        from_database = ModelExporter(storage)
+        for layer in ModelExporter.LAYERS:
+            for by_country in (False, True):
+                rows = list(from_database.rows(layer, by_country))
+                assert rows == list(ModelExporter(loaded).rows(layer, by_country)), layer
+                assert rows == list(ModelExporter(model).rows(layer, by_country)), layer
+                assert all(list(row) == [name for name, _ in LAYER_COLUMNS[layer]] for row in rows)
+
+        assert [row['ident'] for row in from_database.rows('airports', by_country=True)] == ['XXXX', 'LFPG', 'EGKB']
+        runway = next(from_database.rows('runways'))
+        assert (runway['airport_ident'], runway['iso_country'], runway['lighted'], runway['length_ft']) == \
+            ('EGKB', 'GB', True, 5925.0)
+
+    def test_geojson_and_csv(self, storage, tmp_path):
+        exporter = ModelExporter(storage)
+        assert exporter.export('runways', tmp_path / 'runways.geojson') == 2
+        features = json.loads((tmp_path / 'runways.geojson').read_text())['features']
+        assert features[0]['geometry'] == {'type': 'LineString', 'coordinates': [[0.0271, 51.3236], [0.0381, 51.3383]]}
+        assert features[1]['geometry'] is None  # LFPG runway ends are unknown
+        assert features[0]['properties']['le_ident'] == '03'
+
+        exporter.export('firs', tmp_path / 'firs.geojson')
+        fir = json.loads((tmp_path / 'firs.geojson').read_text())['features'][0]
+        assert fir['geometry']['type'] == 'MultiPolygon'
+        assert fir['geometry']['coordinates'][0][0][1] == [5.0, 45.0]
+        assert 'geometry' not in fir['properties']
+
+        exporter.export('airports', tmp_path / 'airports.csv')
+        with open(tmp_path / 'airports.csv', newline='') as f:
+            rows = list(csv.DictReader(f))
+        assert [row['ident'] for row in rows] == ['EGKB', 'LFPG', 'XXXX']
+        assert rows[0]['latitude_deg'] == '51.3308' and rows[2]['iso_country'] == ''
+
+    def test_export_by_country(self, model, tmp_path):
+        written = ModelExporter(model).export_all(tmp_path, formats=('geojson', 'csv'), by_country=True)
+        assert written['airports/*.geojson'] == 3 and written['waypoints.csv'] == 1
+        assert sorted(p.name for p in (tmp_path / 'airports').iterdir()) == [
+            'FR.csv', 'FR.geojson', 'GB.csv', 'GB.geojson', 'unknown.csv', 'unknown.geojson']
+        gb = json.loads((tmp_path / 'procedures' / 'GB.geojson').read_text())['features']
+        assert gb[0]['geometry'] == {'type': 'Point', 'coordinates': [0.0325, 51.3308]}
+        # No temporary files left behind
+        assert not list(tmp_path.rglob('*.tmp'))
+
+        with pytest.raises(ValueError):
+            ModelExporter(model).export('waypoints', tmp_path / 'waypoints', 'csv', by_country=True)
+        with pytest.raises(ValueError):
+            ModelExporter(model).export('airports', tmp_path / 'airports.xml')
+        with pytest.raises(TypeError):
+            ModelExporter([])
+
+    def test_parquet(self, storage, tmp_path):
+        pq = pytest.importorskip('pyarrow.parquet')
+        exporter = ModelExporter(storage)
+        assert exporter.export('runways', tmp_path / 'runways.parquet') == 2
+        table = pq.read_table(tmp_path / 'runways.parquet')
+        assert table.column_names == [name for name, _ in LAYER_COLUMNS['runways']]
+        assert table.to_pylist() == list(exporter.rows('runways'))
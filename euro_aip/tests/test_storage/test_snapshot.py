@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+
+import pickle
+import struct
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from euro_aip.models import EuroAipModel, Airport, Runway, Procedure, AIPEntry, Waypoint
+from euro_aip.models.fir import FIR
+from euro_aip.models.navpoint import NavPoint
+from euro_aip.models.border_crossing_entry import BorderCrossingEntry
+from euro_aip.storage import DatabaseStorage, MappedModel, ModelSnapshot, SnapshotError
+from euro_aip.storage.mapped_model import MappedRows
+from euro_aip.storage import snapshot as snapshot_module
+
+
+@pytest.fixture
+def model():
+    """A small model touching every table of the snapshot."""
+    model = EuroAipModel()
+    airport = Airport(ident='EGKB', name='Biggin Hill', type='medium_airport',
+                      latitude_deg=51.3308, longitude_deg=0.0325, elevation_ft=598,
+                      iso_country='GB')
+    airport.add_source('worldairports')
+    airport.add_runway(Runway(airport_ident='EGKB', le_ident='03', he_ident='21',
+                              length_ft=5925, surface='ASP', lighted=True, closed=False))
+    airport.add_procedure(Procedure(name='ILS 03', procedure_type='approach', approach_type='ILS',
+                                    runway_ident='03', source='uk_eaip', data={'page': 3}))
+    airport.add_aip_entry(AIPEntry(ident='EGKB', section='handling', field='Fuel and oil types',
+                                   value='AVGAS 100LL, JET A-1', std_field_id=402, source='uk_eaip'))
+    model.add_airport(airport)
+    model.add_airport(Airport(ident='LFPG', name='Charles de Gaulle', iso_country='FR',
+                              latitude_deg=49.0097, longitude_deg=2.5479))
+    model.bulk_add_waypoints([
+        Waypoint(name='BILGO', latitude_deg=48.5, longitude_deg=2.3, point_type='5LNC', fir_codes='LFFF'),
+        Waypoint(name='BILGO', latitude_deg=10.0, longitude_deg=20.0, source_id='other'),
+    ])
+    model.add_fir(FIR(icao='LFFF', name='Paris', polygons=[
+        [[[0.0, 45.0], [5.0, 45.0], [5.0, 50.0], [0.0, 45.0]]],
+        [[[10.0, 40.0], [12.0, 40.0], [12.0, 42.0], [10.0, 40.0]],
+         [[10.5, 40.5], [11.0, 40.5], [11.0, 41.0], [10.5, 40.5]]],
+    ]))
+    model.add_border_crossing_entry(BorderCrossingEntry(
+        airport_name='Biggin Hill', country_iso='GB', icao_code='EGKB', is_airport=True,
+        source='uk_gen', metadata={'page': 1}))
+    model.update_all_derived_fields()
+    return model
+
+
+class TestModelSnapshot:
+    """Test writing and reading binary model snapshots."""
+
+    def test_round_trip(self, model, tmp_path):
+        """A snapshot rebuilds the same model, derived fields included."""
+        path = tmp_path / 'model.snap'
+        content_hash = ModelSnapshot.write(model, path, metadata={'fingerprint': 'abc'})
+
+        with ModelSnapshot.open(path) as snapshot:
+            assert snapshot.content_hash == content_hash
+            assert snapshot.metadata == {'fingerprint': 'abc'}
+            assert snapshot.verify()
+            loaded = snapshot.to_model()
+
+        assert list(loaded._airports) == list(model._airports)
+        for ident, airport in model._airports.items():
+            other = loaded._airports[ident]
+            # to_dict lists sources in set order, compared as sets below
+            assert dict(other.to_dict(), sources=None) == dict(airport.to_dict(), sources=None)
+            assert other.sources == airport.sources
+            assert (other.point_of_entry, other.avgas, other.jet_a, other.has_hard_runway) == \
+                (airport.point_of_entry, airport.avgas, airport.jet_a, airport.has_hard_runway)
+        assert loaded.airports['EGKB'].point_of_entry is True
+        assert loaded.airports['EGKB'].procedures[0].data == {'page': 3}
+
+        assert [w.to_dict() for w in loaded.get_waypoint_candidates('BILGO')] == \
+            [w.to_dict() for w in model.get_waypoint_candidates('BILGO')]
+        assert loaded.get_fir('LFFF').to_dict() == model.get_fir('LFFF').to_dict()
+        assert loaded.get_fir('LFFF').contains(11.8, 40.2)
+        assert not loaded.get_fir('LFFF').contains(10.8, 40.8)  # in the hole
+        assert [e.to_dict() for e in loaded.get_all_border_crossing_points()] == \
+            [e.to_dict() for e in model.get_all_border_crossing_points()]
+        assert loaded.sources_used == model.sources_used
+        assert loaded.airports.with_fuel(avgas=True).count() == 1
+
+    def test_aware_timestamps_round_trip(self, model, tmp_path):
+        """Aware timestamps keep their UTC offset; naive ones stay naive."""
+        cest = timezone(timedelta(hours=2))
+        egkb = model.airports['EGKB']
+        egkb.updated_at = datetime(2026, 3, 19, 10, 30, 15, 250, tzinfo=cest)
+        egkb.procedures[0].created_at = datetime(2026, 3, 19, 8, 0, tzinfo=timezone.utc)
+        naive = model.airports['LFPG'].updated_at
+        path = tmp_path / 'model.snap'
+        ModelSnapshot.write(model, path)
+
+        with ModelSnapshot.open(path) as snapshot:
+            loaded = snapshot.to_model()
+        with MappedModel.open(path) as mapped:
+            mapped_updated_at = mapped.airports['EGKB'].updated_at
+        for updated_at in (loaded.airports['EGKB'].updated_at, mapped_updated_at):
+            assert updated_at == egkb.updated_at
+            assert updated_at.utcoffset() == timedelta(hours=2)
+            assert updated_at.isoformat() == '2026-03-19T10:30:15.000250+02:00'
+        assert loaded.airports['EGKB'].procedures[0].created_at.isoformat() == '2026-03-19T08:00:00+00:00'
+        assert loaded.airports['LFPG'].updated_at == naive
+        assert loaded.airports['LFPG'].updated_at.tzinfo is None
+
+    def test_loaded_airports_report_edits(self, model, tmp_path):
+        """Airports rebuilt from a snapshot are held like added ones."""
+        path = tmp_path / 'model.snap'
+        ModelSnapshot.write(model, path)
+        with ModelSnapshot.open(path) as snapshot:
+            loaded = snapshot.to_model()
+        assert loaded.changed_airports() == set()
+        assert loaded.airports.by_country('FR').count() == 1
+
+        egkb = loaded.airports['EGKB']
+        egkb.add_source('manual')
+        assert loaded.changed_airports() == {'EGKB'}
+
+        egkb.iso_country = 'FR'
+        loaded.mark_airport_changed('EGKB')
+        assert loaded.airports.by_country('GB').count() == 0
+        assert {a.ident for a in loaded.airports.by_country('FR')} == {'EGKB', 'LFPG'}
+
+    def test_empty_model(self, tmp_path):
+        path = tmp_path / 'empty.snap'
+        ModelSnapshot.write(EuroAipModel(), path)
+        with ModelSnapshot.open(path) as snapshot:
+            loaded = snapshot.to_model()
+        assert loaded.airports.count() == 0
+        assert loaded._waypoints == {}
+
+    def test_columns_match_dataclass_fields(self):
+        """Columns follow the init field order so rows are built positionally."""
+        for cls, columns in ((Airport, snapshot_module.AIRPORT_COLUMNS),
+                             (Runway, snapshot_module.RUNWAY_COLUMNS[1:]),
+                             (Procedure, snapshot_module.PROCEDURE_COLUMNS[1:]),
+                             (AIPEntry, snapshot_module.AIP_ENTRY_COLUMNS[1:]),
+                             (Waypoint, snapshot_module.WAYPOINT_COLUMNS)):
+            init_names = [f.name for f in fields(cls) if f.init]
+            assert [name for name, _ in columns] == init_names[:len(columns)], cls.__name__
+
+    def test_rejects_other_files(self, model, tmp_path):
+        not_snapshot = tmp_path / 'other.snap'
+        not_snapshot.write_bytes(b'SQLite format 3\x00' + bytes(100))
+        with pytest.raises(SnapshotError):
+            ModelSnapshot.open(not_snapshot)
+        with pytest.raises(SnapshotError):
+            ModelSnapshot.open(tmp_path / 'missing.snap')
+
+        path = tmp_path / 'model.snap'
+        ModelSnapshot.write(model, path)
+        data = bytearray(path.read_bytes())
+        struct.pack_into('<I', data, 8, snapshot_module.SNAPSHOT_VERSION + 1)
+        path.write_bytes(bytes(data))
+        with pytest.raises(SnapshotError):
+            ModelSnapshot.open(path)
+
+    def test_verify_detects_corruption(self, model, tmp_path):
+        path = tmp_path / 'model.snap'
+        ModelSnapshot.write(model, path)
+        data = bytearray(path.read_bytes())
+        data[-70] ^= 0xFF
+        path.write_bytes(bytes(data))
+        with ModelSnapshot.open(path) as snapshot:
+            assert not snapshot.verify()
+
+
+class TestMappedModel:
+    """Test the read-only model over a memory-mapped snapshot."""
+
+    @pytest.fixture
+    def mapped(self, model, tmp_path):
+        path = tmp_path / 'model.snap'
+        ModelSnapshot.write(model, path)
+        with MappedModel.open(path) as mapped:
+            yield mapped
+
+    def test_matches_model(self, model, mapped):
+        """Lookups and queries give the same results as the model the snapshot was written from."""
+        assert list(mapped._airports) == list(model._airports)
+        assert len(mapped.airports) == 2
+        for airport in model.airports:
+            other = mapped.airports[airport.ident]
+            assert dict(other.to_dict(), sources=None) == dict(airport.to_dict(), sources=None)
+            assert other.sources == airport.sources
+        egkb = mapped.airports['EGKB']
+        # Procedures and AIP entries are read from the snapshot on first access
+        assert not egkb.is_loaded('procedures')
+        assert egkb.procedures[0].data == {'page': 3}
+        assert egkb.aip_entries[0].std_field_id == 402
+        assert 'LFPG' in mapped.airports and 'XXXX' not in mapped.airports
+        assert mapped.airports.get('XXXX') is None
+        assert [a.ident for a in mapped.airports.by_country('GB')] == ['EGKB']
+        assert mapped.airports.with_fuel(avgas=True).count() == 1
+        assert mapped.airports.lazy().filter(lambda a: a.iso_country == 'FR').first().ident == 'LFPG'
+
+        assert [w.to_dict() for w in mapped.get_waypoint_candidates('BILGO')] == \
+            [w.to_dict() for w in model.get_waypoint_candidates('BILGO')]
+        assert mapped.get_waypoint('NOPE') is None
+        assert list(mapped._waypoints) == ['BILGO'] and len(mapped._waypoints) == 1
+        assert mapped.waypoints.by_fir('LFFF').count() == 1
+        assert mapped.waypoints.get('BILGO').latitude_deg == 48.5
+
+        assert mapped.get_fir('lfff').to_dict() == model.get_fir('LFFF').to_dict()
+        assert [f.icao for f in mapped.firs.containing_point(11.8, 40.2)] == ['LFFF']
+        assert mapped.firs.containing_point(10.8, 40.8).count() == 0
+        assert mapped.get_border_crossing_entry('GB', 'EGKB') is not None
+        assert mapped.get_statistics()['total_airports'] == model.get_statistics()['total_airports']
+
+    def test_collections_stream_rows(self, mapped, monkeypatch):
+        """Collections wrap the mapped rows and build objects chunk by chunk."""
+        monkeypatch.setattr(MappedRows, 'CHUNK_SIZE', 1)
+        built = []
+        rows = mapped._airports.rows
+        original = rows._build
+        monkeypatch.setattr(rows, '_build', lambda start, stop: built.append((start, stop)) or original(start, stop))
+
+        airports = mapped.airports
+        assert isinstance(airports._list, MappedRows)
+        assert built == []
+        assert [a.ident for a in airports.filter(lambda a: a.iso_country == 'FR')] == ['LFPG']
+        assert built == [(0, 1), (1, 2)]
+        assert isinstance(airports.all(), list)
+        assert [a.ident for a in rows[::-1]] == ['LFPG', 'EGKB']
+
+    def test_spatial_indexes_build_only_hits(self, model, mapped, monkeypatch):
+        """The airport and FIR indexes are built from mapped columns and build objects for hits only."""
+        built = {'airports': [], 'firs': []}
+        for name, rows in (('airports', mapped._airports.rows), ('firs', mapped._firs.rows)):
+            original = rows._build
+            monkeypatch.setattr(rows, '_build', lambda start, stop, name=name, original=original:
+                                built[name].append((start, stop)) or original(start, stop))
+
+        airports = mapped.get_airport_spatial_index()
+        firs = mapped.get_fir_index()
+        assert (len(airports), len(firs)) == (2, 1)
+        assert 'EGKB' in airports and 'XXXX' not in airports
+        assert built == {'airports': [], 'firs': []}
+
+        expected = model.get_airport_spatial_index().within_radius(0.0, 51.3, 30.0)
+        found = airports.within_radius(0.0, 51.3, 30.0)
+        assert [(d, a.ident) for d, a in found] == [(d, a.ident) for d, a in expected] != []
+        assert built['airports'] == [(0, 1)]
+        assert [a.ident for _, a in airports.nearest(2.5, 49.0, 1)] == ['LFPG']
+        assert [a.ident for a in airports.near_polyline([(0.0, 51.3), (2.5, 49.0)], 5.0)] == ['EGKB', 'LFPG']
+
+        assert firs.containing(30.0, 30.0) == [] and built['firs'] == []
+        assert [f.icao for f in firs.containing(11.8, 40.2)] == ['LFFF']
+        assert firs.containing(10.8, 40.8) == []
+        # The decoded FIR is kept for later queries
+        assert built['firs'] == [(0, 1)]
+        route = [NavPoint(latitude=41.0, longitude=9.0), NavPoint(latitude=41.0, longitude=13.0)]
+        assert mapped.firs_along_route(route) == model.firs_along_route(route) == ['LFFF']
+
+    def test_read_only(self, mapped):
+        with pytest.raises(TypeError):
+            mapped.add_airport(Airport(ident='LFPO'))
+        with pytest.raises(TypeError):
+            mapped.bulk_add_waypoints([])
+        # Objects are built on access, changes to them are not kept
+        mapped.airports['EGKB'].name = 'Changed'
+        assert mapped.airports['EGKB'].name == 'Biggin Hill'
+
+    def test_pickled_airport_reopens_snapshot(self, mapped):
+        airport = pickle.loads(pickle.dumps(mapped.airports['EGKB']))
+        assert not airport.is_loaded('procedures')
+        assert [p.name for p in airport.procedures] == ['ILS 03']
+
+
+class TestDatabaseStorageSnapshot:
+    """Test snapshot warm starts through DatabaseStorage."""
+
+    def test_fresh_snapshot_skips_database(self, tmp_path, monkeypatch):
+        storage = DatabaseStorage(str(tmp_path / 'model.db'))
+        model = EuroAipModel()
+        model.add_airport(Airport(ident='EGKB', name='Biggin Hill', latitude_deg=51.33, longitude_deg=0.03))
+        storage.save_model(model)
+        snapshot_path = str(tmp_path / 'model.snap')
+
+        # No snapshot yet: loaded from the database and written
+        loaded = storage.load_model_snapshot(snapshot_path)
+        assert [a.ident for a in loaded.airports] == ['EGKB']
+        assert ModelSnapshot.read_header(snapshot_path)['metadata']['fingerprint'] == storage.model_fingerprint()
+
+        def fail():
+            raise AssertionError('database should not be read')
+        monkeypatch.setattr(storage, 'load_model', fail)
+        assert [a.ident for a in storage.load_model_snapshot(snapshot_path).airports] == ['EGKB']
+
+    def test_stale_snapshot_falls_back_to_database(self, tmp_path):
+        storage = DatabaseStorage(str(tmp_path / 'model.db'))
+        model = EuroAipModel()
+        model.add_airport(Airport(ident='EGKB', name='Biggin Hill'))
+        storage.save_model(model)
+        snapshot_path = str(tmp_path / 'model.snap')
+        storage.save_snapshot(storage.load_model(), snapshot_path)
+
+        model.add_airport(Airport(ident='LFPG', name='Charles de Gaulle'))
+        storage.save_model(model)
+
+        loaded = storage.load_model_snapshot(snapshot_path)
+        assert sorted(a.ident for a in loaded.airports) == ['EGKB', 'LFPG']
+        # The snapshot was refreshed for the new database state
+        with ModelSnapshot.open(snapshot_path) as snapshot:
+            assert snapshot.metadata['fingerprint'] == storage.model_fingerprint()
+            assert snapshot.rows('airports') == 2
+
+    def test_mapped_model(self, tmp_path):
+        storage = DatabaseStorage(str(tmp_path / 'model.db'))
+        model = EuroAipModel()
+        model.add_airport(Airport(ident='EGKB', name='Biggin Hill', latitude_deg=51.33, longitude_deg=0.03))
+        storage.save_model(model)
+        snapshot_path = str(tmp_path / 'model.snap')
+
+        # Written on first use even without refresh, then mapped
+        for _ in range(2):
+            mapped = storage.load_model_snapshot(snapshot_path, refresh=False, mapped=True)
+            assert isinstance(mapped, MappedModel)
+            assert [a.ident for a in mapped.airports] == ['EGKB']
+            mapped.close()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+import gzip
+import json
+import sqlite3
+import struct
+
+import pytest
+
+from euro_aip.models import EuroAipModel, Airport, Runway, Waypoint
+from euro_aip.models.fir import FIR
+from euro_aip.storage import DatabaseStorage, TileGenerator
+from euro_aip.storage.tiles import BUFFER, EXTENT, tile_bounds, tile_for
+
+
+def _read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, pos
+
+
+def _fields(data):
+    """(field number, value) pairs of a protobuf message."""
+    pos = 0
+    while pos < len(data):
+        key, pos = _read_varint(data, pos)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, pos = _read_varint(data, pos)
+        elif wire_type == 1:
+            value, pos = struct.unpack('<d', data[pos:pos + 8])[0], pos + 8
+        else:
+            length, pos = _read_varint(data, pos)
+            value, pos = data[pos:pos + length], pos + length
+        yield number, value
+
+
+def _packed(data):
+    pos, values = 0, []
+    while pos < len(data):
+        value, pos = _read_varint(data, pos)
+        values.append(value)
+    return values
+
+
+def _unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def decode_tile(data):
+    """Decode an MVT tile to {layer: [(properties, rings or point), ...]}."""
+    layers = {}
+    for _, layer_data in _fields(data):
+        name, keys, values, features = None, [], [], []
+        for number, value in _fields(layer_data):
+            if number == 1:
+                name = value.decode()
+            elif number == 2:
+                features.append(dict(_fields(value)))
+            elif number == 3:
+                keys.append(value.decode())
+            elif number == 4:
+                kind, raw = next(_fields(value))
+                values.append(raw.decode() if kind == 1 else _unzigzag(raw) if kind == 6 else raw)
+        decoded = []
+        for feature in features:
+            tags = _packed(feature.get(2, b''))
+            properties = {keys[k]: values[v] for k, v in zip(tags[::2], tags[1::2])}
+            commands = _packed(feature[4])
+            rings, x, y, pos = [], 0, 0, 0
+            while pos < len(commands):
+                command, count = commands[pos] & 7, commands[pos] >> 3
+                pos += 1
+                if command == 1:
+                    rings.append([])
+                for _ in range(count if command != 7 else 0):
+                    x += _unzigzag(commands[pos])
+                    y += _unzigzag(commands[pos + 1])
+                    pos += 2
+                    rings[-1].append((x, y))
+            decoded.append((properties, rings[0][0] if feature[3] == 1 else rings))
+        layers[name] = decoded
+    return layers
+
+
+def _read_tiles(path):
+    with sqlite3.connect(str(path)) as conn:
+        return {(z, x, (1 << z) - 1 - row): gzip.decompress(data)
+                for z, x, row, data in conn.execute('SELECT * FROM tiles')}
+
+
+@pytest.fixture
+def model():
+    """Airports of each thinning class, waypoints and a FIR around them."""
+    model = EuroAipModel()
+    for ident, kind, runway_ft, lat, lon in [
+        ('EGLL', 'large_airport', 12799, 51.4706, -0.4619),
+        ('EGKB', 'medium_airport', 5925, 51.3308, 0.0325),
+        ('EGTF', 'small_airport', 2700, 51.3481, -0.5589),
+        ('EGLM', 'small_airport', 4500, 51.4053, -0.7214),
+        ('EGLW', 'heliport', None, 51.4697, -0.1797),
+    ]:
+        airport = Airport(ident=ident, name=ident.title(), type=kind, iso_country='GB',
+                          latitude_deg=lat, longitude_deg=lon)
+        if runway_ft:
+            airport.add_runway(Runway(airport_ident=ident, le_ident='09', he_ident='27', length_ft=runway_ft))
+            airport.update_all_derived_fields()
+        model.add_airport(airport)
+    model.bulk_add_waypoints([
+        Waypoint(name='BIG', latitude_deg=51.3308, longitude_deg=0.0325, point_type='VOR'),
+        Waypoint(name='DETLI', latitude_deg=51.3, longitude_deg=-0.3, point_type='5LNC'),
+    ])
+    model.add_fir(FIR(icao='EGTT', name='London', polygons=[
+        [[[-2.0, 50.5], [1.5, 50.5], [1.5, 52.5], [-2.0, 52.5], [-2.0, 50.5]]],
+    ]))
+    return model
+
+
+class TestTileGenerator:
+    """Test vector tile rendering and MBTiles output."""
+
+    def test_tile_math(self):
+        """Tiles follow the Web Mercator z/x/y scheme."""
+        assert tile_for(0.0, 0.0, 0) == (0, 0)
+        assert tile_for(-0.4619, 51.4706, 10) == (510, 340)
+        min_lon, min_lat, max_lon, max_lat = tile_bounds(10, 510, 340)
+        assert min_lon <= -0.4619 <= max_lon and min_lat <= 51.4706 <= max_lat
+
+    def test_thinning_by_type_and_runway(self, model):
+        """Airports appear from a zoom that depends on their type and longest runway."""
+        generator = TileGenerator(model, max_zoom=10)
+        zooms = {airport.ident: generator.airport_min_zoom(airport) for airport in model.airports}
+        assert zooms == {'EGLL': 4, 'EGKB': 6, 'EGTF': 8, 'EGLM': 7, 'EGLW': 10}
+
+        tiles = {(z, x, y): decode_tile(data) for z, x, y, data in generator.tiles()}
+        for zoom in range(0, 11):
+            drawn = {props['ident'] for (z, _, _), layers in tiles.items() if z == zoom
+                     for props, _ in layers.get('airports', [])}
+            assert drawn == {ident for ident, min_zoom in zooms.items() if min_zoom <= zoom}
+            waypoints = {props['name'] for (z, _, _), layers in tiles.items() if z == zoom
+                         for props, _ in layers.get('waypoints', [])}
+            assert waypoints == ({'BIG', 'DETLI'} if zoom >= 9 else {'BIG'} if zoom >= 7 else set())
+
+    def test_features_and_fir_polygons(self, model):
+        """Points land at their tile position, FIR rings are clipped and oriented."""
+        generator = TileGenerator(model, min_zoom=10, max_zoom=10, fir_max_zoom=10)
+        x, y = tile_for(-0.4619, 51.4706, 10)
+        layers = decode_tile(dict(((z, tx, ty), data) for z, tx, ty, data in generator.tiles())[(10, x, y)])
+        egll = next((props, point) for props, point in layers['airports'] if props['ident'] == 'EGLL')
+        assert egll[0] == {'ident': 'EGLL', 'name': 'Egll', 'type': 'large_airport', 'iso_country': 'GB',
+                           'longest_runway_length_ft': 12799, 'min_zoom': 10}
+        assert all(0 <= coordinate < EXTENT for coordinate in egll[1])
+
+        # The tile is inside the FIR: its polygon is the buffered tile square
+        (fir_props, rings), = layers['firs']
+        assert fir_props == {'icao': 'EGTT', 'name': 'London'}
+        ring = rings[0]
+        assert {min(p[0] for p in ring), max(p[0] for p in ring)} == {-BUFFER, EXTENT + BUFFER}
+        area = sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1]))
+        assert area > 0
+
+    def test_write_mbtiles(self, model, tmp_path):
+        """The MBTiles file has metadata, TMS rows and an airport tile index."""
+        path = tmp_path / 'map.mbtiles'
+        count = TileGenerator(model, max_zoom=8).write_mbtiles(path)
+        with sqlite3.connect(str(path)) as conn:
+            metadata = dict(conn.execute('SELECT name, value FROM metadata'))
+            assert conn.execute('SELECT COUNT(*) FROM tiles').fetchone()[0] == count
+            egll_rows = conn.execute(
+                "SELECT tile_column, tile_row FROM airport_tiles WHERE ident = 'EGLL' AND zoom_level = 4"
+            ).fetchall()
+        assert metadata['format'] == 'pbf' and metadata['minzoom'] == '0' and metadata['maxzoom'] == '8'
+        layers = {layer['id']: layer for layer in json.loads(metadata['json'])['vector_layers']}
+        assert set(layers) == {'airports', 'waypoints', 'firs'}
+        x, y = tile_for(-0.4619, 51.4706, 4)
+        assert egll_rows == [(x, (1 << 4) - 1 - y)]
+        assert (4, x, y) in _read_tiles(path)
+
+    def test_incremental_update_matches_full_write(self, model, tmp_path):
+        """Updating the tiles of the airports changed by a save gives the same file as a full write."""
+        storage = DatabaseStorage(str(tmp_path / 'model.db'))
+        storage.save_model(model)
+        assert sorted(storage.get_airports_changed_in_last_save()) == sorted(a.ident for a in model.airports)
+        path = tmp_path / 'map.mbtiles'
+        TileGenerator(model, max_zoom=10).write_mbtiles(path)
+
+        # Move EGTF, upgrade its runway so it shows earlier, and remove the heliport
+        model = storage.load_model()
+        egtf = model.airports['EGTF']
+        egtf.latitude_deg, egtf.longitude_deg = 51.2, -0.9
+        egtf.runways[0].length_ft = 4200
+        egtf.update_all_derived_fields()
+        storage.save_model(model)
+        assert storage.get_airports_changed_in_last_save() == ['EGTF']
+        storage.save_model(model)
+        assert storage.get_airports_changed_in_last_save() == []
+        del model._airports['EGLW']
+
+        generator = TileGenerator(model, max_zoom=10)
+        rewritten = generator.update_mbtiles(path, ['EGTF', 'EGLW'])
+        assert rewritten > 0
+        full = tmp_path / 'full.mbtiles'
+        TileGenerator(model, max_zoom=10, bounds=generator.bounds).write_mbtiles(full)
+        assert _read_tiles(path) == _read_tiles(full)
+        with sqlite3.connect(str(path)) as conn, sqlite3.connect(str(full)) as full_conn:
+            query = 'SELECT * FROM airport_tiles ORDER BY 1, 2, 3, 4'
+            assert conn.execute(query).fetchall() == full_conn.execute(query).fetchall()
+
+    def test_update_rejects_other_zoom_range(self, model, tmp_path):
+        path = tmp_path / 'map.mbtiles'
+        TileGenerator(model, max_zoom=6).write_mbtiles(path)
+        with pytest.raises(ValueError, match='maxzoom'):
+            TileGenerator(model, max_zoom=8).update_mbtiles(path, ['EGLL'])
@@ -1,12 +1,39 @@
 """Tests for spatial geometry helpers."""
 
 import math
+import random
+
+import pytest
 
 from euro_aip.utils.geometry import (
     NM_PER_DEGREE_LAT,
+    CoarseRing,
+    GridIndex,
+    PolygonIndex,
+    PreparedMultiPolygon,
+    PreparedRing,
+    RTree,
+    as_coord_array,
+    haversine_matrix_nm,
     haversine_nm,
+    haversine_nm_array,
+    match_ring_indices,
     min_distance_point_to_multipolygon_nm,
+    min_distance_points_to_multipolygon_nm,
+    point_in_multipolygon,
+    point_in_ring,
     point_to_segment_nm,
+    points_in_multipolygon,
+    points_in_ring,
+    points_to_segments_nm,
+    polyline_multipolygon_extent,
+    sample_polyline,
+    segment_multipolygon_extent,
+    segment_multipolygon_intervals,
+    segment_ring_crossings,
+    segment_to_ring_nm,
+    simplify_polyline,
+    simplify_ring_indices,
 )
 
 
@@ -57,3 +84,344 @@ class TestMinDistancePointToMultipolygon:
 
     def test_empty_geometry_is_inf(self):
         assert min_distance_point_to_multipolygon_nm(0.0, 0.0, []) == math.inf
+
+
+class TestSimplifyPolyline:
+    def test_drops_points_within_tolerance(self):
+        # A near-straight line with a 0.1 wobble and one 2.0 spike.
+        line = [(0.0, 0.0), (1.0, 0.1), (2.0, 0.0), (3.0, 2.0), (4.0, 0.0), (5.0, -0.1), (6.0, 0.0)]
+        assert simplify_polyline(line, 0.5) == [(0.0, 0.0), (2.0, 0.0), (3.0, 2.0), (4.0, 0.0), (6.0, 0.0)]
+        assert simplify_polyline(line, 0.05) == line
+
+    def test_closed_ring_keeps_shape(self):
+        ring = [(0.0, 0.0), (5.0, 0.01), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0), (0.0, 0.0)]
+        assert simplify_polyline(ring, 0.1) == [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0), (0.0, 0.0)]
+
+
+class TestGridIndex:
+    def _index(self):
+        index = GridIndex()
+        index.insert("EGLL", -0.4614, 51.4775)
+        index.insert("EGKK", -0.1903, 51.1481)
+        index.insert("LFPG", 2.5479, 49.0097)
+        index.insert("NZAA", 174.7917, -37.0081)
+        index.insert("NFFN", 177.4433, -17.7554)
+        return index
+
+    def test_rejects_cell_size_not_dividing_360(self):
+        with pytest.raises(ValueError):
+            GridIndex(cell_deg=7.0)
+
+    def test_within_radius_sorted_by_distance(self):
+        index = self._index()
+        found = index.within_radius(-0.3, 51.3, 40.0)
+        assert [key for _, key in found] == ["EGKK", "EGLL"]
+        assert found[0][0] <= found[1][0] <= 40.0
+
+    def test_nearest_expands_search(self):
+        index = self._index()
+        found = index.nearest(2.0, 49.0, 3)
+        assert [key for _, key in found] == ["LFPG", "EGKK", "EGLL"]
+        assert len(index.nearest(2.0, 49.0, 10)) == 5
+        assert index.nearest(2.0, 49.0, 5, max_nm=100.0)[0][1] == "LFPG"
+        assert len(index.nearest(2.0, 49.0, 5, max_nm=100.0)) == 1
+
+    def test_nearest_across_antimeridian(self):
+        index = self._index()
+        # Just east of the antimeridian: Fiji is nearer than Auckland
+        assert index.nearest(-179.5, -17.0, 1)[0][1] == "NFFN"
+
+    def test_insert_moves_and_remove(self):
+        index = self._index()
+        index.insert("EGLL", 2.6, 49.0)
+        assert len(index) == 5
+        assert [key for _, key in index.within_radius(2.5, 49.0, 10.0)] == ["LFPG", "EGLL"]
+        index.remove("EGLL")
+        index.remove("EGLL")
+        assert "EGLL" not in index
+        assert len(index) == 4
+
+    def test_near_polyline_candidates_include_corridor(self):
+        index = self._index()
+        # London -> Paris leg: both London airports and CDG are candidates
+        candidates = index.near_polyline([(-0.4614, 51.4775), (2.5479, 49.0097)], 10.0)
+        assert candidates == ["EGLL", "EGKK", "LFPG"]
+        assert index.near_polyline([], 10.0) == []
+
+
+def _star(cx, cy, radius, points=400, seed=1):
+    """Irregular star-shaped ring with many vertices, like a FIR boundary."""
+    rng = random.Random(seed)
+    ring = []
+    for k in range(points):
+        angle = 2 * math.pi * k / points
+        r = radius * (0.6 + 0.4 * rng.random())
+        ring.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+    return ring
+
+
+class TestArrayKernels:
+    """The array kernels agree with the scalar helpers they vectorise."""
+
+    def _points(self, count=300, seed=5):
+        rng = random.Random(seed)
+        lons = [rng.uniform(5.0, 15.0) for _ in range(count)]
+        lats = [rng.uniform(45.0, 55.0) for _ in range(count)]
+        return lons, lats
+
+    def test_haversine(self):
+        lons, lats = self._points(20)
+        points = list(zip(lons, lats))
+        matrix = haversine_matrix_nm(points)
+        assert matrix.shape == (20, 20)
+        for i, (alon, alat) in enumerate(points):
+            for j, (blon, blat) in enumerate(points):
+                assert matrix[i, j] == pytest.approx(haversine_nm(alat, alon, blat, blon), abs=1e-9)
+        assert haversine_nm_array(51.47, -0.46, 49.01, 2.55) == pytest.approx(haversine_nm(51.47, -0.46, 49.01, 2.55))
+
+    def test_points_in_ring_matches_scalar(self):
+        ring = _star(10.0, 50.0, 3.0, points=500)
+        lons, lats = self._points()
+        expected = [point_in_ring(lon, lat, ring) for lon, lat in zip(lons, lats)]
+        assert list(points_in_ring(lons, lats, ring)) == expected
+        # Scalar helper dispatches on array rings
+        assert [point_in_ring(lon, lat, as_coord_array(ring)) for lon, lat in zip(lons, lats)] == expected
+        assert not points_in_ring(lons, lats, ring[:2]).any()
+
+    def test_points_in_multipolygon_honours_holes(self):
+        polygons = [[[(0.0, 45.0), (2.0, 45.0), (2.0, 47.0), (0.0, 47.0)],
+                     [(0.5, 45.5), (1.5, 45.5), (1.5, 46.5), (0.5, 46.5)]],
+                    [[(5.0, 45.0), (6.0, 45.0), (6.0, 46.0)]]]
+        lons = [0.2, 1.0, 5.8, 3.0]
+        lats = [46.0, 46.0, 45.5, 46.0]
+        expected = [point_in_multipolygon(lon, lat, polygons) for lon, lat in zip(lons, lats)]
+        assert list(points_in_multipolygon(lons, lats, polygons)) == expected == [True, False, True, False]
+
+    def test_points_to_segments_matches_scalar(self):
+        lons, lats = self._points(30)
+        starts = [(6.0, 46.0), (10.0, 50.0), (12.0, 52.0)]
+        ends = [(8.0, 49.0), (10.0, 50.0), (14.0, 47.0)]
+        matrix = points_to_segments_nm(lons, lats, starts, ends)
+        for i, (lon, lat) in enumerate(zip(lons, lats)):
+            for k, (a, b) in enumerate(zip(starts, ends)):
+                assert matrix[i, k] == pytest.approx(point_to_segment_nm(lon, lat, *a, *b), abs=1e-9)
+
+    def test_min_distance_matches_scalar(self, monkeypatch):
+        polygons = [[_star(10.0, 50.0, 3.0, points=300)], [[(14.0, 54.0)]]]
+        lons, lats = self._points(50)
+        actual = min_distance_points_to_multipolygon_nm(lons, lats, polygons)
+        # Force the scalar loop for the reference values
+        monkeypatch.setattr('euro_aip.utils.geometry.ARRAY_MIN_VERTICES', 10 ** 9)
+        expected = [min_distance_point_to_multipolygon_nm(lon, lat, polygons) for lon, lat in zip(lons, lats)]
+        assert actual == pytest.approx(expected, abs=1e-9)
+        monkeypatch.undo()
+        assert [min_distance_point_to_multipolygon_nm(lon, lat, polygons)
+                for lon, lat in zip(lons, lats)] == pytest.approx(expected, abs=1e-9)
+        assert min_distance_points_to_multipolygon_nm(lons, lats, []).tolist() == [math.inf] * 50
+
+
+class TestPreparedPolygons:
+    def test_prepared_ring_matches_ray_cast(self):
+        ring = _star(5.0, 48.0, 4.0)
+        prepared = PreparedRing(ring)
+        rng = random.Random(2)
+        for _ in range(2000):
+            lon, lat = rng.uniform(0.0, 10.0), rng.uniform(43.0, 53.0)
+            assert prepared.contains(lon, lat) == point_in_ring(lon, lat, ring)
+        # Vertices and points on horizontal lines through them
+        for lon, lat in ring[:50]:
+            assert prepared.contains(lon, lat) == point_in_ring(lon, lat, ring)
+            assert prepared.contains(lon - 0.01, lat) == point_in_ring(lon - 0.01, lat, ring)
+
+    def test_prepared_multipolygon_honours_holes(self):
+        square = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]
+        hole = [(4.0, 4.0), (6.0, 4.0), (6.0, 6.0), (4.0, 6.0)]
+        polygons = [[square, hole], [[(20.0, 0.0), (22.0, 0.0), (22.0, 2.0), (20.0, 2.0)]]]
+        prepared = PreparedMultiPolygon(polygons)
+        assert prepared.bbox == (0.0, 0.0, 22.0, 10.0)
+        for lon, lat in [(1.0, 1.0), (5.0, 5.0), (21.0, 1.0), (15.0, 1.0), (-1.0, 5.0)]:
+            assert prepared.contains(lon, lat) == point_in_multipolygon(lon, lat, polygons)
+        assert PreparedMultiPolygon([]).bbox is None
+
+    def test_degenerate_ring_contains_nothing(self):
+        assert not PreparedRing([(0.0, 0.0), (1.0, 1.0)]).contains(0.5, 0.5)
+
+
+class TestSegmentPolygon:
+    SQUARE = [(0.0, 45.0), (2.0, 45.0), (2.0, 47.0), (0.0, 47.0)]
+    # Square with a hole through the middle third of its width
+    HOLED = [[SQUARE, [(0.5, 45.5), (1.5, 45.5), (1.5, 46.5), (0.5, 46.5)]]]
+
+    def test_crossings(self):
+        assert segment_ring_crossings((-1.0, 46.0), (3.0, 46.0), self.SQUARE) == [0.25, 0.75]
+        assert segment_ring_crossings((0.5, 46.0), (1.5, 46.0), self.SQUARE) == []
+        assert segment_ring_crossings((-1.0, 48.0), (3.0, 48.0), self.SQUARE) == []
+
+    def test_intervals_honour_holes(self):
+        intervals = segment_multipolygon_intervals((-1.0, 46.0), (3.0, 46.0), self.HOLED)
+        assert intervals == [(0.25, 0.375), (0.625, 0.75)]
+        assert segment_multipolygon_intervals((0.2, 45.2), (1.8, 45.2), self.HOLED) == [(0.0, 1.0)]
+        assert segment_multipolygon_intervals((3.0, 45.0), (4.0, 46.0), self.HOLED) == []
+
+    def test_prepared_intervals_match(self):
+        rng = random.Random(7)
+        star = [[_star(10.0, 50.0, 3.0, points=300)]]
+        prepared = PreparedMultiPolygon(star)
+        for _ in range(200):
+            a = (rng.uniform(5.0, 15.0), rng.uniform(45.0, 55.0))
+            b = (rng.uniform(5.0, 15.0), rng.uniform(45.0, 55.0))
+            assert prepared.segment_intervals(a, b) == segment_multipolygon_intervals(a, b, star)
+        horizontal = ((-1.0, 46.0), (3.0, 46.0))
+        assert PreparedMultiPolygon(self.HOLED).segment_intervals(*horizontal) == \
+            segment_multipolygon_intervals(*horizontal, self.HOLED)
+
+    def test_segment_to_ring_distance(self):
+        # One degree of latitude north of the square's top edge
+        assert segment_to_ring_nm((0.5, 48.0), (1.5, 48.0), self.SQUARE) == pytest.approx(NM_PER_DEGREE_LAT)
+        assert segment_to_ring_nm((-1.0, 46.0), (3.0, 46.0), self.SQUARE) == 0.0
+        assert segment_to_ring_nm((0.5, 48.0), (1.5, 48.0), self.SQUARE, max_nm=10.0) == math.inf
+
+    def test_extent_within_corridor(self):
+        # Leg passes 30 nm north of the square's top edge
+        lat = 47.0 + 30.0 / NM_PER_DEGREE_LAT
+        assert segment_multipolygon_extent((-3.0, lat), (5.0, lat), [[self.SQUARE]], 20.0) is None
+        distance, t0, t1 = segment_multipolygon_extent((-3.0, lat), (5.0, lat), [[self.SQUARE]], 50.0)
+        assert distance == pytest.approx(30.0, abs=0.01)
+        # Corridor reaches 40 nm beyond each corner (sqrt(50² - 30²))
+        beyond = 40.0 / (NM_PER_DEGREE_LAT * math.cos(math.radians(47.0))) / 8.0
+        assert t0 == pytest.approx(3.0 / 8.0 - beyond, abs=1e-3)
+        assert t1 == pytest.approx(5.0 / 8.0 + beyond, abs=1e-3)
+
+    def test_polyline_extent_matches_dense_sampling(self):
+        rng = random.Random(3)
+        polygons = [[_star(10.0, 50.0, 2.0, points=60)]]
+        for _ in range(30):
+            route = [(rng.uniform(4.0, 16.0), rng.uniform(44.0, 56.0)) for _ in range(3)]
+            exact = polyline_multipolygon_extent(route, polygons, 10.0)
+            samples = sample_polyline(route, 0.5)
+            near = [
+                0.0 if point_in_multipolygon(lon, lat, polygons)
+                else min_distance_point_to_multipolygon_nm(lon, lat, polygons)
+                for lon, lat in samples
+            ]
+            if min(near) <= 9.0:
+                assert exact is not None
+                assert exact[0] <= min(near) + 0.5
+            elif min(near) > 10.5:
+                assert exact is None
+
+    def test_polyline_extent_along_track(self):
+        route = [(-2.0, 46.0), (-1.0, 46.0), (3.0, 46.0)]
+        distance, d_from, d_to = polyline_multipolygon_extent(route, [[self.SQUARE]])
+        first_leg = haversine_nm(46.0, -2.0, 46.0, -1.0)
+        second_leg = haversine_nm(46.0, -1.0, 46.0, 3.0)
+        assert distance == 0.0
+        assert d_from == pytest.approx(first_leg + 0.25 * second_leg)
+        assert d_to == pytest.approx(first_leg + 0.75 * second_leg)
+        assert polyline_multipolygon_extent([(1.0, 46.0)], [[self.SQUARE]]) == (0.0, 0.0, 0.0)
+        assert polyline_multipolygon_extent([], [[self.SQUARE]]) is None
+
+
+class TestCoarseRing:
+    def _ring(self):
+        ring = _star(10.0, 50.0, 3.0, points=600, seed=4)
+        return ring + ring[:1]
+
+    def test_simplified_ring_stays_within_tolerance(self):
+        ring = self._ring()
+        keep = simplify_ring_indices(ring, 2.0)
+        assert keep[0] == 0 and keep[-1] == len(ring) - 1
+        assert 3 < len(keep) < len(ring)
+        coarse = [ring[i] for i in keep]
+        for lon, lat in ring:
+            # Planar distance, slightly more forgiving than the scaling DP used
+            assert min_distance_point_to_multipolygon_nm(lon, lat, [[coarse]]) <= 2.0 * 1.05
+        assert simplify_ring_indices(ring[:3], 2.0) == [0, 1, 2]
+
+    def test_small_ring_keeps_a_triangle(self):
+        square = [(0.0, 45.0), (0.001, 45.0), (0.001, 45.001), (0.0, 45.001), (0.0, 45.0)]
+        assert len(simplify_ring_indices(square, 50.0)) == 4
+
+    def test_match_ring_indices(self):
+        ring = self._ring()
+        keep = simplify_ring_indices(ring, 5.0)
+        assert match_ring_indices(ring, [list(ring[i]) for i in keep]) == keep
+        assert match_ring_indices(ring, [(99.0, 99.0)]) is None
+        assert match_ring_indices(ring, [ring[0], ring[5]]) is None
+
+    @pytest.mark.parametrize("tolerance", [0.5, 5.0, 50.0])
+    def test_matches_full_resolution(self, tolerance):
+        ring = self._ring()
+        coarse = CoarseRing(ring, simplify_ring_indices(ring, tolerance))
+        rng = random.Random(9)
+        for _ in range(2000):
+            lon, lat = rng.uniform(4.0, 16.0), rng.uniform(46.0, 54.0)
+            assert coarse.contains(lon, lat) == point_in_ring(lon, lat, ring)
+        for _ in range(300):
+            a = (rng.uniform(4.0, 16.0), rng.uniform(46.0, 54.0))
+            b = (rng.uniform(4.0, 16.0), rng.uniform(46.0, 54.0))
+            assert coarse.crossings(a, b) == segment_ring_crossings(a, b, ring)
+
+    def test_prepared_multipolygon_with_levels(self):
+        outer = self._ring()
+        hole = [(9.5, 49.5), (10.5, 49.5), (10.5, 50.5), (9.5, 50.5)]
+        polygons = [[outer, hole]]
+        keep = [[simplify_ring_indices(ring, 5.0) for ring in polygons[0]]]
+        coarse = PreparedMultiPolygon(polygons, keep=keep)
+        rng = random.Random(2)
+        for _ in range(500):
+            lon, lat = rng.uniform(4.0, 16.0), rng.uniform(46.0, 54.0)
+            assert coarse.contains(lon, lat) == point_in_multipolygon(lon, lat, polygons)
+        assert not coarse.contains(10.0, 50.0)
+        a, b = (4.0, 50.0), (16.0, 50.0)
+        assert coarse.segment_intervals(a, b) == segment_multipolygon_intervals(a, b, polygons)
+
+
+class TestRTree:
+    def test_queries_match_brute_force(self):
+        rng = random.Random(3)
+        boxes = []
+        for i in range(300):
+            lon, lat = rng.uniform(-30.0, 40.0), rng.uniform(30.0, 70.0)
+            boxes.append(((lon, lat, lon + rng.uniform(0.1, 8.0), lat + rng.uniform(0.1, 6.0)), i))
+        tree = RTree(boxes, node_capacity=4)
+        assert len(tree) == 300
+        for _ in range(100):
+            lon, lat = rng.uniform(-30.0, 45.0), rng.uniform(30.0, 75.0)
+            expected = [i for b, i in boxes if b[0] <= lon <= b[2] and b[1] <= lat <= b[3]]
+            assert tree.query_point(lon, lat) == expected
+            query = (lon, lat, lon + 3.0, lat + 2.0)
+            expected = [i for b, i in boxes
+                        if not (b[2] < query[0] or query[2] < b[0] or b[3] < query[1] or query[3] < b[1])]
+            assert tree.query_bbox(query) == expected
+
+    def test_empty_tree(self):
+        assert RTree([]).query_point(0.0, 0.0) == []
+
+
+class TestPolygonIndex:
+    def _index(self):
+        self.west = PreparedMultiPolygon([[[(0.0, 45.0), (5.0, 45.0), (5.0, 50.0), (0.0, 50.0)]]])
+        self.east = PreparedMultiPolygon([[[(5.0, 45.0), (10.0, 45.0), (10.0, 50.0), (5.0, 50.0)]]])
+        self.far = PreparedMultiPolygon([[[(20.0, 45.0), (25.0, 45.0), (25.0, 50.0), (20.0, 50.0)]]])
+        return PolygonIndex([self.west, self.east, self.far, PreparedMultiPolygon([])])
+
+    def test_containing(self):
+        index = self._index()
+        assert len(index) == 3
+        assert index.containing(2.0, 47.0) == [self.west]
+        assert index.containing(12.0, 47.0) == []
+
+    def test_along_polyline_in_entry_order(self):
+        index = self._index()
+        route = [(9.0, 47.0), (7.0, 47.5), (1.0, 48.0)]
+        assert index.along_polyline(route) == [self.east, self.west]
+        assert index.along_polyline(route[:1]) == [self.east]
+        assert index.along_polyline([]) == []
+
+    def test_along_polyline_catches_clipped_corner(self):
+        # The leg clips the far square's corner over ~0.1°, far shorter than
+        # any sampling step the old implementation used.
+        index = self._index()
+        route = [(19.0, 50.95), (21.0, 48.95)]
+        assert index.along_polyline(route) == [self.far]
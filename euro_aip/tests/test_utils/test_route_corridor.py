@@ -0,0 +1,56 @@
+"""Tests for vectorised route corridor distances."""
+
+import math
+import random
+
+import pytest
+
+from euro_aip.models.navpoint import NavPoint
+from euro_aip.utils.route_corridor import RouteCorridor
+
+
+class TestRouteCorridor:
+    def test_empty_route_rejected(self):
+        with pytest.raises(ValueError):
+            RouteCorridor([])
+
+    def test_single_point_route_is_point_distance(self):
+        corridor = RouteCorridor([(2.5479, 49.0097)])
+        distance, enroute, leg = corridor.measure([-0.4614], [51.4775])
+        expected = NavPoint(49.0097, 2.5479).haversine_distance(NavPoint(51.4775, -0.4614))[1]
+        assert math.isclose(distance[0], expected, rel_tol=1e-9)
+        assert enroute[0] == 0.0
+        assert leg[0] == 0
+
+    def test_matches_navpoint_distance_to_segment(self):
+        """Every point/leg combination agrees with the scalar NavPoint implementation."""
+        rng = random.Random(7)
+        route = [NavPoint(rng.uniform(40, 60), rng.uniform(-10, 20)) for _ in range(5)]
+        # Include a degenerate leg shorter than the short-leg threshold
+        route.insert(2, NavPoint(route[1].latitude + 1e-4, route[1].longitude))
+        points = [NavPoint(rng.uniform(35, 65), rng.uniform(-15, 25)) for _ in range(200)]
+
+        corridor = RouteCorridor([(p.longitude, p.latitude) for p in route])
+        distance, enroute, leg = corridor.measure(
+            [p.longitude for p in points], [p.latitude for p in points]
+        )
+
+        cumulative = [0.0]
+        for start, end in zip(route, route[1:]):
+            cumulative.append(cumulative[-1] + start.haversine_distance(end)[1])
+
+        for i, point in enumerate(points):
+            segment_distances = [
+                point.distance_to_segment(start, end) for start, end in zip(route, route[1:])
+            ]
+            best = min(range(len(segment_distances)), key=segment_distances.__getitem__)
+            assert leg[i] == best
+            assert math.isclose(distance[i], segment_distances[best], rel_tol=1e-9, abs_tol=1e-9)
+            expected_enroute = cumulative[best] + route[best].haversine_distance(point)[1]
+            assert math.isclose(enroute[i], expected_enroute, rel_tol=1e-9)
+
+    def test_cumulative_distance_along_route(self):
+        corridor = RouteCorridor([(0.0, 50.0), (1.0, 50.0), (2.0, 50.0)])
+        assert len(corridor) == 3
+        assert corridor.cumulative_nm[0] == 0.0
+        assert math.isclose(corridor.cumulative_nm[2], 2 * corridor.cumulative_nm[1], rel_tol=1e-9)
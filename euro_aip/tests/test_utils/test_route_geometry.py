@@ -0,0 +1,108 @@
+"""Tests for the shared route geometry."""
+
+import math
+import random
+
+from euro_aip.briefing.collections.notam_collection import NotamCollection
+from euro_aip.briefing.models.notam import Notam
+from euro_aip.briefing.models.route import Route, RoutePoint
+from euro_aip.models.airport import Airport
+from euro_aip.models.euro_aip_model import EuroAipModel
+from euro_aip.models.fir import FIR
+from euro_aip.models.navpoint import NavPoint
+from euro_aip.utils.geometry import polyline_multipolygon_extent
+from euro_aip.utils.route_geometry import RouteGeometry
+
+
+def _box(lon_min, lat_min, lon_max, lat_max):
+    return [[[(lon_min, lat_min), (lon_max, lat_min), (lon_max, lat_max),
+              (lon_min, lat_max), (lon_min, lat_min)]]]
+
+
+ROUTE = [NavPoint(49.0, 2.5, "LFPG"), NavPoint(50.0, 1.0, "BIBAX"),
+         NavPoint(51.5, -0.5, "EGLL"), NavPoint(53.4, -2.3, "EGCC")]
+
+
+class TestRouteGeometry:
+    def test_resolves_points_and_distances(self):
+        airport = Airport(ident="EHAM", latitude_deg=52.31, longitude_deg=4.76)
+        geometry = RouteGeometry([ROUTE[0], airport, Airport(ident="XXXX")])
+
+        assert [p.name for p in geometry.navpoints] == ["LFPG", "EHAM"]
+        assert geometry.polyline == [(2.5, 49.0), (4.76, 52.31)]
+        assert math.isclose(geometry.length_nm, ROUTE[0].haversine_distance(airport.navpoint)[1])
+        assert geometry.cumulative_nm[0] == 0.0
+
+    def test_of_route_and_reuse(self):
+        route = Route(
+            departure="LFPG", destination="EGLL",
+            departure_coords=(49.0, 2.5), destination_coords=(51.5, -0.5),
+            waypoint_coords=[RoutePoint(name="BIBAX", latitude=50.0, longitude=1.0, point_type="waypoint")],
+        )
+        geometry = RouteGeometry.of(route)
+
+        assert [p.name for p in geometry.navpoints] == ["LFPG", "BIBAX", "EGLL"]
+        assert RouteGeometry.of(geometry) is geometry
+        assert geometry.padded_bbox(25) is geometry.padded_bbox(25)
+
+    def test_polygon_extent_matches_polyline_extent(self):
+        geometry = RouteGeometry(ROUTE)
+        rng = random.Random(3)
+        for _ in range(100):
+            lon, lat = rng.uniform(-4, 5), rng.uniform(48, 55)
+            polygons = _box(lon, lat, lon + rng.uniform(0.1, 1.5), lat + rng.uniform(0.1, 1.0))
+            for corridor_nm in (0.0, 20.0):
+                assert geometry.polygon_extent(polygons, corridor_nm) == \
+                    polyline_multipolygon_extent(geometry.polyline, polygons, corridor_nm)
+
+    def test_legs_near_point_covers_corridor(self):
+        geometry = RouteGeometry(ROUTE)
+        rng = random.Random(5)
+        for _ in range(500):
+            point = NavPoint(rng.uniform(47, 55), rng.uniform(-5, 6))
+            near = [
+                leg for leg, (a, b) in enumerate(zip(ROUTE, ROUTE[1:]))
+                if point.distance_to_segment(a, b) <= 30.0
+            ]
+            assert set(near) <= set(geometry.legs_near_point(point.longitude, point.latitude, 30.0))
+
+    def test_legs_near_point_across_antimeridian(self):
+        geometry = RouteGeometry([NavPoint(-17.0, 178.0), NavPoint(-17.0, -178.0)])
+
+        assert geometry.legs_near_point(179.5, -17.0, 10.0) == [0]
+        assert geometry.legs_near_point(-179.5, -17.0, 10.0) == [0]
+        assert geometry.legs_near_point(170.0, -17.0, 10.0) == []
+
+
+class TestRouteGeometryConsumers:
+    def test_notams_along_route_geometry(self):
+        notams = NotamCollection([
+            Notam(id="A0001/24", raw_text="", location="LFFF", coordinates=(50.0, 1.0)),
+            Notam(id="A0002/24", raw_text="", location="LFFF", coordinates=(45.0, 5.0)),
+            Notam(id="A0003/24", raw_text="", location="EGTT", coordinates=(50.9, 0.0)),
+            Notam(id="A0004/24", raw_text="", location="EGTT"),
+        ])
+        geometry = RouteGeometry(ROUTE)
+
+        result = notams.along_route(geometry, corridor_nm=25).all()
+
+        assert [n.id for n in result] == ["A0001/24", "A0003/24"]
+
+    def test_model_queries_share_geometry(self):
+        model = EuroAipModel()
+        for ident, lat, lon in [("LFPG", 49.0, 2.5), ("EGLL", 51.5, -0.5),
+                                ("LFAT", 50.5, 1.6), ("LFML", 43.4, 5.2)]:
+            model.add_airport(Airport(ident=ident, latitude_deg=lat, longitude_deg=lon))
+        model.add_fir(FIR(icao="LFFF", polygons=_box(-1.0, 48.0, 1.5, 51.0)))
+        model.add_fir(FIR(icao="EGTT", polygons=_box(-3.0, 51.0, 2.0, 53.0)))
+        geometry = RouteGeometry(ROUTE[:3])
+
+        nearby = model.find_airports_near_route(geometry, distance_nm=40)
+        assert nearby == model.find_airports_near_route(ROUTE[:3], distance_nm=40)
+        assert {entry["airport"].ident for entry in nearby} == {"LFPG", "EGLL", "LFAT"}
+        assert model.find_airports_near_route(geometry, distance_nm=40) == nearby
+
+        assert model.firs_along_route(geometry) == ["EGTT", "LFFF"]
+        # Memoised per FIR index: adding a FIR rebuilds the index and the answer
+        model.add_fir(FIR(icao="EBBU", polygons=_box(1.8, 48.8, 3.0, 49.5)))
+        assert model.firs_along_route(geometry) == ["EBBU", "EGTT", "LFFF"]